@@ -122,6 +122,12 @@ namespace RobotSimulation.Bootstrap
                 case CommandType.Configuration:
                     HandleConfigurationCommand(receivedCommand);
                     break;
+                case CommandType.NewTarget:
+                    HandleNewTargetCommand();
+                    break;
+                case CommandType.SetTarget:
+                    HandleSetTargetCommand(receivedCommand);
+                    break;
             }
         }
 
@@ -177,6 +183,35 @@ namespace RobotSimulation.Bootstrap
             RobotEvents.RaiseRobotResetCompleted();
         }
 
+        private void HandleNewTargetCommand()
+        {
+            // Continuing task: only the target moves, the arm keeps its current state
+            _targetService.SpawnNewRandomTarget();
+
+            ObservationModel observation = BuildObservationModel(false);
+            _networkService.SendObservation(observation);
+        }
+
+        private void HandleSetTargetCommand(CommandModel command)
+        {
+            // Target placement chosen by Python (scheduler or control panel); the arm is left as is
+            if (command.TargetPosition != null && command.TargetPosition.Length == 3)
+            {
+                Vector3 targetPosition = new Vector3(
+                    command.TargetPosition[0],
+                    command.TargetPosition[1],
+                    command.TargetPosition[2]);
+                _targetService.SpawnTargetAt(targetPosition);
+            }
+            else
+            {
+                Debug.LogWarning("GameManager: SET_TARGET without a 3-element TargetPosition ignored");
+            }
+
+            ObservationModel observation = BuildObservationModel(false);
+            _networkService.SendObservation(observation);
+        }
+
         private void HandleConfigurationCommand(CommandModel command)
         {
             _currentControlMode = command.SimulationModeEnabled
@@ -199,9 +234,11 @@ namespace RobotSimulation.Bootstrap
 
             Vector3 directionToTarget = Vector3.zero;
             float distanceToTarget = 0.0f;
+            Vector3 targetPosition = Vector3.zero;
 
             if (targetTransform != null)
             {
+                targetPosition = targetTransform.position;
                 directionToTarget = (targetTransform.position - robotState.ToolCenterPointPosition).normalized;
                 distanceToTarget = Vector3.Distance(robotState.ToolCenterPointPosition, targetTransform.position);
             }
@@ -212,6 +249,7 @@ namespace RobotSimulation.Bootstrap
                 ToolCenterPointPosition = ConvertVector3ToFloatArray(robotState.ToolCenterPointPosition),
                 DirectionToTarget = ConvertVector3ToFloatArray(directionToTarget),
                 DistanceToTarget = distanceToTarget,
+                TargetPosition = ConvertVector3ToFloatArray(targetPosition),
                 GripperState = robotState.GripperOpenPercentage,
                 IsGrippingObject = robotState.IsGrippingObject,
                 LaserSensorHit = _sensorService.HasDetectedObject,
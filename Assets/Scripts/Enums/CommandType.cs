@@ -4,6 +4,8 @@ namespace RobotSimulation.Enums
     {
         Step = 0,
         Reset = 1,
-        Configuration = 2
+        Configuration = 2,
+        NewTarget = 3,
+        SetTarget = 4
     }
 }
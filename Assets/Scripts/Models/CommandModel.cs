@@ -11,6 +11,7 @@ namespace RobotSimulation.Models
         public float GripperCloseValue;
         public float Axis6Orientation;
         public bool SimulationModeEnabled;
+        public float[] TargetPosition;
 
         public CommandType GetCommandType()
         {
@@ -22,6 +23,10 @@ namespace RobotSimulation.Models
                     return CommandType.Reset;
                 case "CONFIG":
                     return CommandType.Configuration;
+                case "NEW_TARGET":
+                    return CommandType.NewTarget;
+                case "SET_TARGET":
+                    return CommandType.SetTarget;
                 default:
                     return CommandType.Step;
             }
@@ -9,6 +9,7 @@ namespace RobotSimulation.Models
         public float[] ToolCenterPointPosition;
         public float[] DirectionToTarget;
         public float DistanceToTarget;
+        public float[] TargetPosition;
         public float GripperState;
         public bool IsGrippingObject;
         public bool LaserSensorHit;
@@ -23,6 +24,7 @@ namespace RobotSimulation.Models
             JointAngles = new float[6];
             ToolCenterPointPosition = new float[3];
             DirectionToTarget = new float[3];
+            TargetPosition = new float[3];
             TargetOrientationOneHot = new float[2];
             JointAngleLimits = null;  // Only populated on reset frames
         }
@@ -9,6 +9,7 @@ namespace RobotSimulation.Services.Interfaces
 
         void Initialize(GameObject targetPrefab, Transform robotBaseTransform);
         void SpawnNewRandomTarget();
+        void SpawnTargetAt(Vector3 position);
         void DestroyCurrentTarget();
     }
 }
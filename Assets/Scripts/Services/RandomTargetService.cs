@@ -56,6 +56,25 @@ namespace RobotSimulation.Services
             _currentTargetInstance.tag = TARGET_TAG;
         }
 
+        public void SpawnTargetAt(Vector3 position)
+        {
+            DestroyCurrentTarget();
+
+            if (_targetPrefab == null)
+            {
+                Debug.LogWarning("RandomTargetService: Missing prefab");
+                return;
+            }
+
+            Quaternion spawnRotation = CalculateRandomSpawnRotation();
+
+            _currentTargetInstance = Object.Instantiate(
+                _targetPrefab,
+                position,
+                spawnRotation);
+            _currentTargetInstance.tag = TARGET_TAG;
+        }
+
         public void DestroyCurrentTarget()
         {
             if (_currentTargetInstance != null)
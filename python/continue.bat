@@ -1 +1 @@
-python train.py --resume --model-path ./models/robot_policy_touch
\ No newline at end of file
+python -m robot_arm.train --resume --model-path ./models/robot_policy_touch
\ No newline at end of file
@@ -1,3 +0,0 @@
-from controllers.training_controller import TrainingController
-
-__all__ = ["TrainingController"]
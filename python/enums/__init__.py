@@ -1,3 +0,0 @@
-from enums.command_type import CommandType
-
-__all__ = ["CommandType"]
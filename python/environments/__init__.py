@@ -1,2 +0,0 @@
-# Environments package - lazy imports to avoid dependency issues during testing
-__all__ = ["UnityRobotEnvironment"]
@@ -1,5 +0,0 @@
-from models.observation_model import ObservationModel
-from models.command_model import CommandModel
-from models.reward_components import RewardComponents
-
-__all__ = ["ObservationModel", "CommandModel", "RewardComponents"]
@@ -0,0 +1 @@
+# Robot arm tools - subpackages and command scripts are imported on demand, so this stays empty
@@ -0,0 +1,261 @@
+"""Benchmarks: policy inference latency, step-path micro-benchmarks gated against a baseline,
+and end-to-end training throughput against mock simulators."""
+
+import sys
+import os
+import argparse
+import time
+
+from .services.benchmark_service import BenchmarkService
+from .services.step_path_benchmark_service import StepPathBenchmarkService
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the robot arm Python stack")
+    benchmark_parsers = parser.add_subparsers(dest="benchmark", metavar="<benchmark>", required=True)
+
+    policy_parser = benchmark_parsers.add_parser("policy", help="Policy inference latency per batch size")
+    policy_parser.add_argument(
+        "model_path",
+        type=str,
+        help="Model file (.npz export or SB3 .zip)"
+    )
+    policy_parser.add_argument(
+        "--calls",
+        type=int,
+        default=2000,
+        help="Timed predict calls per batch size"
+    )
+    policy_parser.add_argument(
+        "--warmup-calls",
+        type=int,
+        default=200,
+        help="Untimed predict calls before measuring"
+    )
+    policy_parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[1, 16, 64],
+        help="Observations per predict call"
+    )
+
+    step_parser = benchmark_parsers.add_parser(
+        "step", help="Micro-benchmarks of the environment step path, compared with a stored baseline")
+    step_parser.add_argument(
+        "--rounds",
+        type=int,
+        default=BenchmarkService.DEFAULT_ROUNDS,
+        help="Timed rounds per benchmark"
+    )
+    step_parser.add_argument(
+        "--warmup-rounds",
+        type=int,
+        default=BenchmarkService.DEFAULT_WARMUP_ROUNDS,
+        help="Untimed rounds per benchmark"
+    )
+    step_parser.add_argument(
+        "--min-round-ms",
+        type=float,
+        default=BenchmarkService.DEFAULT_MINIMUM_ROUND_SECONDS * 1000.0,
+        help="Shortest round; the loop count per round is calibrated to reach it"
+    )
+    step_parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Write the results to this JSON file"
+    )
+    step_parser.add_argument(
+        "--baseline",
+        type=str,
+        default=StepPathBenchmarkService.BASELINE_PATH,
+        help="Baseline JSON to compare against"
+    )
+    step_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=BenchmarkService.DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative median slowdown that counts as a regression (0.25 = 25%%)"
+    )
+    step_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Overwrite the baseline with these results instead of comparing"
+    )
+
+    training_parser = benchmark_parsers.add_parser(
+        "training", help="Training throughput against local mock simulators, for sizing hardware")
+    training_parser.add_argument(
+        "--environment-counts",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Numbers of parallel environments, one mock simulator each"
+    )
+    training_parser.add_argument(
+        "--vec-env-types",
+        type=str,
+        nargs="+",
+        choices=["dummy", "subprocess"],
+        default=["dummy", "subprocess"],
+        help="Vectorized environment types: in-process (dummy) or one process per environment"
+    )
+    training_parser.add_argument(
+        "--steps-per-update",
+        type=int,
+        nargs="+",
+        default=[256],
+        help="PPO rollout steps per environment between updates"
+    )
+    training_parser.add_argument(
+        "--latency-ms",
+        type=float,
+        nargs="+",
+        default=[0.0, 2.0],
+        help="Response latency injected into every simulator command"
+    )
+    training_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=64,
+        help="PPO minibatch size"
+    )
+    training_parser.add_argument(
+        "--rollouts",
+        type=int,
+        default=3,
+        help="Timed rollouts per setting, after one untimed rollout"
+    )
+    training_parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Write the results to this JSON file"
+    )
+    return parser.parse_args()
+
+
+def run_policy_benchmark(args) -> None:
+    """Time deterministic predict calls of a saved policy per batch size."""
+    import numpy as np
+    from .services.policy_export_service import PolicyExportService
+
+    policy = PolicyExportService().load_numpy_policy(args.model_path)
+    random_generator: np.random.Generator = np.random.default_rng(0)
+
+    print(f"{os.path.basename(args.model_path)}: {policy.parameter_bytes / 1024:.1f} KiB of parameters")
+    print(f"{'Batch':>6} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9} {'Obs/s':>11}")
+
+    for batch_size in args.batch_sizes:
+        observations: np.ndarray = random_generator.normal(
+            size=(batch_size, policy.observation_dimension)).astype(np.float32)
+        if batch_size == 1:
+            observations = observations[0]
+
+        for _ in range(args.warmup_calls):
+            policy.predict(observations, deterministic=True)
+
+        durations: np.ndarray = np.empty(args.calls)
+        for call_index in range(args.calls):
+            start_time: float = time.perf_counter()
+            policy.predict(observations, deterministic=True)
+            durations[call_index] = time.perf_counter() - start_time
+
+        latency_percentiles: np.ndarray = np.percentile(durations * 1e6, [50.0, 95.0, 99.0])
+        print(f"{batch_size:>6} {latency_percentiles[0]:>9.1f} {latency_percentiles[1]:>9.1f} "
+              f"{latency_percentiles[2]:>9.1f} {batch_size / np.median(durations):>11.0f}")
+
+
+def run_step_benchmark(args) -> bool:
+    """Run the step-path suite and compare it with the baseline; False if anything regressed."""
+    benchmark_service: BenchmarkService = BenchmarkService(
+        warmup_rounds=args.warmup_rounds,
+        rounds=args.rounds,
+        minimum_round_seconds=args.min_round_ms / 1000.0
+    )
+
+    def print_result(benchmark_name: str, result: dict) -> None:
+        print(f"{benchmark_name:<28} {result['median_microseconds']:>10.2f} "
+              f"{result['interquartile_range_microseconds']:>9.2f} {result['minimum_microseconds']:>9.2f} "
+              f"{result['loops_per_round']:>7.0f}")
+
+    with StepPathBenchmarkService.create_benchmarks() as benchmark_functions:
+        print(f"{'Benchmark':<28} {'Median us':>10} {'IQR us':>9} {'Min us':>9} {'Loops':>7}")
+        results = benchmark_service.run_suite(benchmark_functions, progress_callback=print_result)
+
+    if args.output is not None:
+        BenchmarkService.save_results(results, args.output)
+
+    if args.update_baseline:
+        BenchmarkService.save_results(results, args.baseline)
+        print(f"\nBaseline updated: {args.baseline}")
+        return True
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to create one")
+        return True
+
+    comparisons = BenchmarkService.compare_to_baseline(
+        results, BenchmarkService.load_results(args.baseline), args.threshold)
+
+    print(f"\n{'Benchmark':<28} {'Baseline us':>12} {'Now us':>9} {'Change':>8}")
+    for benchmark_name, comparison in comparisons.items():
+        marker: str = "  REGRESSION" if comparison["is_regression"] else ""
+        print(f"{benchmark_name:<28} {comparison['baseline_median_microseconds']:>12.2f} "
+              f"{comparison['median_microseconds']:>9.2f} {comparison['relative_change']:>+8.0%}{marker}")
+
+    regressed_names = [name for name, comparison in comparisons.items() if comparison["is_regression"]]
+    if regressed_names:
+        print(f"\n{len(regressed_names)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+
+    return not regressed_names
+
+
+def run_training_benchmark(args) -> None:
+    """Sweep short training sessions and print their throughput."""
+    from .controllers.throughput_benchmark_controller import ThroughputBenchmarkController
+    from .enums.vectorized_environment_type import VectorizedEnvironmentType
+
+    benchmark_controller: ThroughputBenchmarkController = ThroughputBenchmarkController(
+        environment_counts=args.environment_counts,
+        vectorized_environment_types=[
+            VectorizedEnvironmentType(environment_type) for environment_type in args.vec_env_types],
+        steps_per_update_values=args.steps_per_update,
+        response_latencies_seconds=[latency_milliseconds / 1000.0 for latency_milliseconds in args.latency_ms],
+        batch_size=args.batch_size,
+        measured_rollouts=args.rollouts
+    )
+
+    results = benchmark_controller.run(progress_callback=lambda result: print(
+        f"Measured {result['environment_count']} x {result['vectorized_environment_type']}, "
+        f"{result['steps_per_update']} steps/update, {result['response_latency_milliseconds']:.1f} ms latency"))
+
+    print(f"\n{'Envs':>5} {'VecEnv':<11} {'Steps':>6} {'Lat ms':>7} {'Collect/s':>10} {'Total/s':>9} "
+          f"{'Update':>7} {'Sim util':>9}")
+    for result in results:
+        print(f"{result['environment_count']:>5} {result['vectorized_environment_type']:<11} "
+              f"{result['steps_per_update']:>6} {result['response_latency_milliseconds']:>7.1f} "
+              f"{result['collection_steps_per_second']:>10.0f} {result['steps_per_second']:>9.0f} "
+              f"{result['update_time_fraction']:>7.0%} {result['simulator_utilization']:>9.0%}")
+
+    if args.output is not None:
+        ThroughputBenchmarkController.save_results(results, args.output)
+        print(f"\nResults saved to {args.output}")
+
+
+def main() -> None:
+    """Main entry point for the benchmarks."""
+    args = parse_arguments()
+
+    if args.benchmark == "policy":
+        run_policy_benchmark(args)
+    elif args.benchmark == "training":
+        run_training_benchmark(args)
+    elif not run_step_benchmark(args):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
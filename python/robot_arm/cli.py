@@ -0,0 +1,66 @@
+"""Single entry point for the robot arm tools: robot-arm <command> [options].
+
+Only this module and argparse load for --help. A command's script module
+is imported when the command runs, so a connection probe or load test
+never pays for numpy, gymnasium, torch or Stable Baselines3.
+"""
+
+import sys
+import argparse
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+PROGRAM_NAME: str = "robot-arm"
+
+# Command name -> (script module within this package with main(), one-line help)
+COMMANDS: Dict[str, Tuple[str, str]] = {
+    "train": ("train", "Train the curriculum policy against the simulator"),
+    "evaluate": ("evaluate", "Evaluate saved checkpoints in parallel and rank them"),
+    "probe": ("probe", "Check a simulator's protocol conformance and latency under load"),
+    "loadtest": ("loadtest", "Ramp concurrent clients against a simulator host until latency collapses"),
+    "serve": ("serve_policy", "Serve policy predictions over TCP with batching and hot-swap"),
+    "record": ("record_states", "Record the states a trained policy visits to an .npz dataset"),
+    "benchmark": ("benchmark", "Benchmark policy inference, the step path or training throughput"),
+    "distill": ("distill_policy", "Distill a trained policy into a smaller network"),
+    "export": ("export_policy", "Export a PPO policy for NumPy inference"),
+    "sweep": ("sweep", "Sweep PPO hyperparameters"),
+    "worker": ("rollout_worker", "Stream rollouts to an asynchronous learner"),
+    "panel": ("ui.control_panel", "Open the robot control panel")
+}
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Top-level parser listing the commands; each command parses its own options."""
+    parser = argparse.ArgumentParser(
+        prog=PROGRAM_NAME,
+        description="Train, evaluate, serve and probe the 6-DOF robot arm",
+        epilog=f"Run '{PROGRAM_NAME} <command> --help' for a command's options."
+    )
+    command_parsers = parser.add_subparsers(dest="command", metavar="<command>")
+
+    for command_name, (_, command_help) in COMMANDS.items():
+        command_parsers.add_parser(command_name, help=command_help, add_help=False)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Dispatch to a command's script, importing it only now."""
+    arguments: List[str] = list(sys.argv[1:] if argv is None else argv)
+
+    if not arguments or arguments[0] not in COMMANDS:
+        parser: argparse.ArgumentParser = create_parser()
+        parser.parse_args(arguments)
+        parser.print_help()
+        sys.exit(2)
+
+    command_name: str = arguments[0]
+    module_name, _ = COMMANDS[command_name]
+
+    # Scripts parse sys.argv themselves; present the command as the program name in their usage text
+    sys.argv = [f"{PROGRAM_NAME} {command_name}"] + arguments[1:]
+    importlib.import_module(f".{module_name}", __package__).main()
+
+
+if __name__ == "__main__":
+    main()
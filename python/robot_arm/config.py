@@ -0,0 +1,43 @@
+"""Configuration constants for the Python robot control system."""
+
+from .models.training_configuration_model import TrainingConfigurationModel
+
+# Network Configuration
+UNITY_SERVER_ADDRESS: str = "tcp://localhost:5555"
+NETWORK_TIMEOUT_MILLISECONDS: int = 5000
+
+# Robot Configuration (6-DOF)
+NUMBER_OF_JOINTS: int = 6
+JOINT_ANGLE_LIMITS: list = [90.0, 90.0, 90.0, 180.0, 90.0, 90.0]
+MAXIMUM_DELTA_DEGREES: float = 10.0
+
+# Observation Space
+OBSERVATION_DIMENSION: int = 17
+WORKSPACE_RADIUS_METERS: float = 0.6
+LASER_MAXIMUM_RANGE_METERS: float = 1.0
+
+# Action Space
+ACTION_DIMENSION: int = 7
+GRIPPER_CLOSE_THRESHOLD: float = 0.5
+
+# Episode Configuration
+DEFAULT_MAXIMUM_EPISODE_STEPS: int = 500
+
+# Reward Configuration
+DISTANCE_REWARD_SCALE: float = 10.0
+ALIGNMENT_REWARD_SCALE: float = 0.5
+GRASP_SUCCESS_REWARD: float = 100.0
+COLLISION_PENALTY_VALUE: float = -100.0
+GRASP_DISTANCE_THRESHOLD: float = 0.05
+
+# Training Configuration - defaults come from TrainingConfigurationModel, the one source for sweeps and run configs
+_DEFAULT_TRAINING_CONFIGURATION: TrainingConfigurationModel = TrainingConfigurationModel()
+LEARNING_RATE: float = _DEFAULT_TRAINING_CONFIGURATION.learning_rate
+STEPS_PER_UPDATE: int = _DEFAULT_TRAINING_CONFIGURATION.steps_per_update
+BATCH_SIZE: int = _DEFAULT_TRAINING_CONFIGURATION.batch_size
+TRAINING_EPOCHS: int = _DEFAULT_TRAINING_CONFIGURATION.training_epochs
+DISCOUNT_FACTOR: float = _DEFAULT_TRAINING_CONFIGURATION.discount_factor
+GAE_LAMBDA: float = _DEFAULT_TRAINING_CONFIGURATION.gae_lambda
+CLIP_RANGE: float = _DEFAULT_TRAINING_CONFIGURATION.clip_range
+ENTROPY_COEFFICIENT: float = _DEFAULT_TRAINING_CONFIGURATION.entropy_coefficient
+# Checkpoint frequency and curriculum phases are defined by TrainingController
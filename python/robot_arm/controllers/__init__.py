@@ -0,0 +1,9 @@
+from .training_controller import TrainingController
+from .evaluation_controller import EvaluationController
+from .sweep_controller import SweepController
+from .distillation_controller import DistillationController
+from .throughput_benchmark_controller import ThroughputBenchmarkController
+from .auto_tune_controller import AutoTuneController
+
+__all__ = ["TrainingController", "EvaluationController", "SweepController", "DistillationController",
+           "ThroughputBenchmarkController", "AutoTuneController"]
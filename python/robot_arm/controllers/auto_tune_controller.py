@@ -0,0 +1,239 @@
+import json
+import math
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+import os
+
+from .throughput_benchmark_controller import ThroughputBenchmarkController
+from ..enums.vectorized_environment_type import VectorizedEnvironmentType
+from ..models.run_configuration_model import RunConfigurationModel
+from ..models.training_configuration_model import TrainingConfigurationModel
+
+
+class AutoTuneController:
+    """Chooses the environment count, vectorized environment type, steps per update and batch size of a run.
+
+    One short ThroughputBenchmarkController session is calibrated per
+    environment count, vectorized environment type and batch size, against
+    mock simulators answering with the real simulator's latency. Collection
+    speed depends only on the environments and the cost of a minibatch
+    update only on the batch size, so every steps-per-update candidate is
+    predicted from those windows rather than run. The chosen setting keeps
+    the largest share of the simulator pool busy among those whose estimated
+    memory fits the budget; near-ties go to longer rollouts, then smaller
+    batches, which stay closest to the hand-tuned PPO defaults.
+    """
+
+    DEFAULT_ENVIRONMENT_COUNTS: List[int] = [1, 2, 4]
+    DEFAULT_VECTORIZED_ENVIRONMENT_TYPES: List[VectorizedEnvironmentType] = [
+        VectorizedEnvironmentType.DUMMY, VectorizedEnvironmentType.SUBPROCESS]
+    DEFAULT_STEPS_PER_UPDATE_VALUES: List[int] = [512, 1024, 2048]
+    DEFAULT_BATCH_SIZES: List[int] = [64, 128, 256]
+    DEFAULT_MEMORY_BUDGET_BYTES: int = 4 * 1024 ** 3
+    DEFAULT_CALIBRATION_STEPS_PER_UPDATE: int = 128
+    DEFAULT_CALIBRATION_ROLLOUTS: int = 2
+    UTILIZATION_TOLERANCE: float = 0.02
+
+    # Memory estimate: float32 rollout buffer plus a per-environment overhead
+    BYTES_PER_SCALAR: int = 4
+    # Reward, return, episode start, value, log probability and advantage
+    ROLLOUT_SCALARS_PER_STEP: int = 6
+    DUMMY_ENVIRONMENT_BYTES: int = 8 * 1024 ** 2
+    # A worker process imports torch through Stable Baselines3 (about 0.5 GiB resident on Linux)
+    SUBPROCESS_ENVIRONMENT_BYTES: int = 512 * 1024 ** 2
+
+    def __init__(
+        self,
+        environment_counts: Optional[List[int]] = None,
+        vectorized_environment_types: Optional[List[VectorizedEnvironmentType]] = None,
+        steps_per_update_values: Optional[List[int]] = None,
+        batch_sizes: Optional[List[int]] = None,
+        response_latency_seconds: float = 0.0,
+        memory_budget_bytes: int = DEFAULT_MEMORY_BUDGET_BYTES,
+        calibration_steps_per_update: int = DEFAULT_CALIBRATION_STEPS_PER_UPDATE,
+        calibration_rollouts: int = DEFAULT_CALIBRATION_ROLLOUTS,
+        training_configuration: Optional[TrainingConfigurationModel] = None
+    ) -> None:
+        self._environment_counts: List[int] = sorted(set(environment_counts or self.DEFAULT_ENVIRONMENT_COUNTS))
+        self._vectorized_environment_types: List[VectorizedEnvironmentType] = list(
+            vectorized_environment_types or self.DEFAULT_VECTORIZED_ENVIRONMENT_TYPES)
+        self._steps_per_update_values: List[int] = sorted(
+            set(steps_per_update_values or self.DEFAULT_STEPS_PER_UPDATE_VALUES))
+        self._batch_sizes: List[int] = sorted(set(batch_sizes or self.DEFAULT_BATCH_SIZES))
+        self._response_latency_seconds: float = response_latency_seconds
+        self._memory_budget_bytes: int = memory_budget_bytes
+        self._calibration_steps_per_update: int = calibration_steps_per_update
+        self._training_configuration: TrainingConfigurationModel = (
+            training_configuration or TrainingConfigurationModel())
+
+        if min(self._batch_sizes) < 2:
+            raise ValueError("Batch sizes must be at least 2")
+
+        self._throughput_benchmark: ThroughputBenchmarkController = ThroughputBenchmarkController(
+            environment_counts=self._environment_counts,
+            measured_rollouts=calibration_rollouts,
+            training_configuration=self._training_configuration
+        )
+
+    def run(
+        self,
+        progress_callback: Optional[Callable[[dict], None]] = None
+    ) -> Tuple[RunConfigurationModel, List[dict]]:
+        """Calibrate, predict every candidate and select one.
+
+        Returns:
+            The chosen run configuration and all candidate predictions.
+        """
+        predictions: List[dict] = self.predict(self.calibrate(progress_callback))
+
+        return self.select(predictions), predictions
+
+    def calibrate(self, progress_callback: Optional[Callable[[dict], None]] = None) -> List[dict]:
+        """One throughput measurement per environment count, vectorized environment type and batch size."""
+        calibration_results: List[dict] = []
+
+        for vectorized_environment_type in self._vectorized_environment_types:
+            for environment_count in self._environment_counts:
+                for batch_size in self._batch_sizes:
+                    # The calibration rollout must hold at least one full minibatch
+                    steps_per_update: int = max(
+                        self._calibration_steps_per_update, math.ceil(batch_size / environment_count))
+                    result: dict = self._throughput_benchmark.measure(
+                        environment_count, vectorized_environment_type, steps_per_update,
+                        self._response_latency_seconds, batch_size=batch_size)
+                    calibration_results.append(result)
+
+                    if progress_callback is not None:
+                        progress_callback(result)
+
+        return calibration_results
+
+    def predict(self, calibration_results: List[dict]) -> List[dict]:
+        """Throughput, simulator pool utilization and memory of every candidate setting.
+
+        Returns:
+            One prediction per candidate with "environment_count",
+            "vectorized_environment_type", "steps_per_update", "batch_size",
+            "steps_per_second", "update_time_fraction",
+            "simulator_utilization" (busy share of a pool of as many
+            simulators as the largest environment count), "memory_bytes" and
+            "fits_memory_budget".
+        """
+        simulator_pool_size: int = max(self._environment_counts)
+        predictions: List[dict] = []
+
+        for calibration_result in calibration_results:
+            environment_count: int = calibration_result["environment_count"]
+            vectorized_environment_type: VectorizedEnvironmentType = VectorizedEnvironmentType(
+                calibration_result["vectorized_environment_type"])
+            batch_size: int = calibration_result["batch_size"]
+
+            calibration_rollout_steps: int = calibration_result["steps_per_update"] * environment_count
+            calibration_update_count: int = (
+                self._training_configuration.training_epochs * math.ceil(calibration_rollout_steps / batch_size)
+                * (calibration_result["measured_steps"] // calibration_rollout_steps))
+            seconds_per_minibatch_update: float = (
+                calibration_result["wall_seconds"] * calibration_result["update_time_fraction"]
+                / calibration_update_count)
+            busy_seconds_per_step: float = (
+                calibration_result["simulator_busy_seconds"] / calibration_result["measured_steps"])
+            collection_steps_per_second: float = calibration_result["collection_steps_per_second"]
+
+            if collection_steps_per_second <= 0.0:
+                continue
+
+            for steps_per_update in self._steps_per_update_values:
+                rollout_steps: int = steps_per_update * environment_count
+                if rollout_steps < batch_size:
+                    continue
+
+                collection_seconds: float = rollout_steps / collection_steps_per_second
+                update_seconds: float = (
+                    self._training_configuration.training_epochs * math.ceil(rollout_steps / batch_size)
+                    * seconds_per_minibatch_update)
+                rollout_seconds: float = collection_seconds + update_seconds
+                memory_bytes: int = self.estimate_memory_bytes(
+                    environment_count, vectorized_environment_type, steps_per_update)
+
+                predictions.append({
+                    "environment_count": environment_count,
+                    "vectorized_environment_type": vectorized_environment_type.value,
+                    "steps_per_update": steps_per_update,
+                    "batch_size": batch_size,
+                    "steps_per_second": rollout_steps / rollout_seconds,
+                    "update_time_fraction": update_seconds / rollout_seconds,
+                    "simulator_utilization": min(
+                        1.0, rollout_steps * busy_seconds_per_step / (simulator_pool_size * rollout_seconds)),
+                    "memory_bytes": memory_bytes,
+                    "fits_memory_budget": memory_bytes <= self._memory_budget_bytes
+                })
+
+        return predictions
+
+    def select(self, predictions: List[dict]) -> RunConfigurationModel:
+        """Run configuration of the best prediction that fits the memory budget."""
+        fitting_predictions: List[dict] = [
+            prediction for prediction in predictions if prediction["fits_memory_budget"]]
+
+        if not fitting_predictions:
+            raise ValueError(
+                f"No candidate fits the memory budget of {self._memory_budget_bytes / 1024 ** 2:.0f} MiB")
+
+        best_utilization: float = max(prediction["simulator_utilization"] for prediction in fitting_predictions)
+        chosen_prediction: dict = max(
+            (prediction for prediction in fitting_predictions
+             if prediction["simulator_utilization"] >= best_utilization - self.UTILIZATION_TOLERANCE),
+            key=lambda prediction: (
+                prediction["steps_per_update"], -prediction["batch_size"], prediction["simulator_utilization"]))
+
+        return RunConfigurationModel(
+            training_configuration=replace(
+                self._training_configuration,
+                steps_per_update=chosen_prediction["steps_per_update"],
+                batch_size=chosen_prediction["batch_size"]),
+            environment_count=chosen_prediction["environment_count"],
+            vectorized_environment_type=VectorizedEnvironmentType(chosen_prediction["vectorized_environment_type"])
+        )
+
+    @classmethod
+    def estimate_memory_bytes(
+        cls,
+        environment_count: int,
+        vectorized_environment_type: VectorizedEnvironmentType,
+        steps_per_update: int
+    ) -> int:
+        """Rollout buffer plus environment overhead of one setting."""
+        from ..environments.unity_robot_environment import UnityRobotEnvironment
+
+        scalars_per_step: int = (
+            UnityRobotEnvironment.OBSERVATION_DIMENSION + UnityRobotEnvironment.ACTION_DIMENSION
+            + cls.ROLLOUT_SCALARS_PER_STEP)
+        environment_bytes: int = (
+            cls.SUBPROCESS_ENVIRONMENT_BYTES if vectorized_environment_type == VectorizedEnvironmentType.SUBPROCESS
+            else cls.DUMMY_ENVIRONMENT_BYTES)
+
+        return (steps_per_update * environment_count * scalars_per_step * cls.BYTES_PER_SCALAR
+                + environment_count * environment_bytes)
+
+    def save_run_configuration(
+        self,
+        run_configuration: RunConfigurationModel,
+        predictions: List[dict],
+        json_path: str
+    ) -> str:
+        """Write the run configuration, with the tuning inputs and predictions it was chosen from."""
+        directory: str = os.path.dirname(json_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        run_configuration_dictionary: Dict[str, object] = run_configuration.to_dictionary()
+        run_configuration_dictionary["AutoTune"] = {
+            "ResponseLatencyMilliseconds": self._response_latency_seconds * 1000.0,
+            "MemoryBudgetBytes": self._memory_budget_bytes,
+            "Predictions": predictions
+        }
+
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump(run_configuration_dictionary, json_file, indent=2)
+
+        return json_path
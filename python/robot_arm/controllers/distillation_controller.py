@@ -0,0 +1,123 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..models.evaluation_result_model import EvaluationResultModel
+
+
+class DistillationController:
+    """Controller for distilling a trained phase policy into a small deployment network.
+
+    States are recorded by rolling out the teacher with its exploration noise,
+    so the dataset also covers states just off the deterministic trajectory.
+    The student is exported next to the teacher as <teacher>_student.npz and
+    compared with the teacher by EvaluationController on the same simulators.
+    """
+
+    STUDENT_SUFFIX: str = "_student"
+    DEFAULT_RECORDING_EPISODES: int = 50
+    DEFAULT_MAXIMUM_EPISODE_STEPS: int = 500
+
+    def __init__(
+        self,
+        teacher_path: str,
+        server_address: str = "tcp://localhost:5555",
+        maximum_episode_steps: int = DEFAULT_MAXIMUM_EPISODE_STEPS
+    ) -> None:
+        from ..services.policy_export_service import PolicyExportService
+
+        self._teacher_path: str = teacher_path
+        self._server_address: str = server_address
+        self._maximum_episode_steps: int = maximum_episode_steps
+        self._teacher = PolicyExportService().load_numpy_policy(teacher_path)
+
+    @property
+    def default_student_path(self) -> str:
+        """Export path of the student next to the teacher."""
+        from ..services.policy_export_service import PolicyExportService
+
+        return (PolicyExportService.strip_model_extension(self._teacher_path)
+                + self.STUDENT_SUFFIX + PolicyExportService.EXPORT_FILE_EXTENSION)
+
+    def record_states(self, episode_count: int, output_path: str) -> str:
+        """Roll out the teacher with exploration noise and save every raw observation."""
+        import numpy as np
+        from ..environments.unity_robot_environment import UnityRobotEnvironment
+        from ..services.policy_distillation_service import PolicyDistillationService
+
+        environment = UnityRobotEnvironment(
+            server_address=self._server_address,
+            maximum_episode_steps=self._maximum_episode_steps
+        )
+        random_generator: np.random.Generator = np.random.default_rng()
+        observations: List[np.ndarray] = []
+
+        try:
+            for _ in range(episode_count):
+                observation, _ = environment.reset()
+
+                while True:
+                    observations.append(observation)
+                    action, _ = self._teacher.predict(
+                        observation, deterministic=False, random_generator=random_generator)
+                    observation, _, terminated, truncated, _ = environment.step(action)
+
+                    if terminated or truncated:
+                        break
+        finally:
+            environment.close()
+
+        print(f"Recorded {len(observations)} states over {episode_count} episodes")
+
+        return PolicyDistillationService.save_states(np.array(observations), output_path)
+
+    def distill(
+        self,
+        states_path: str,
+        output_path: Optional[str] = None,
+        hidden_layer_sizes: Sequence[int] = (64, 64)
+    ) -> Tuple[str, Dict[str, float]]:
+        """Train and export a student on a recorded state dataset.
+
+        Returns:
+            Path of the exported student and the distillation statistics.
+        """
+        from ..services.policy_distillation_service import PolicyDistillationService
+        from ..services.policy_export_service import PolicyExportService
+
+        distillation_service: PolicyDistillationService = PolicyDistillationService(
+            hidden_layer_sizes=hidden_layer_sizes)
+        student, statistics = distillation_service.distill(
+            self._teacher, PolicyDistillationService.load_states(states_path))
+
+        student_path: str = PolicyExportService.save_parameters(
+            student.parameters, output_path or self.default_student_path)
+
+        return student_path, statistics
+
+    def evaluate_parity(
+        self,
+        student_path: str,
+        server_ports: List[int],
+        episodes: int,
+        cache_path: str
+    ) -> Dict[str, Optional[EvaluationResultModel]]:
+        """Evaluate teacher and student over the same number of deterministic episodes.
+
+        Returns:
+            Results keyed by "teacher" and "student"; None where evaluation failed.
+        """
+        from .evaluation_controller import EvaluationController
+
+        evaluation_controller: EvaluationController = EvaluationController(
+            server_ports=server_ports,
+            episodes_per_checkpoint=episodes,
+            maximum_episode_steps=self._maximum_episode_steps,
+            cache_path=cache_path
+        )
+        results_by_path: Dict[str, EvaluationResultModel] = {
+            result.checkpoint_path: result
+            for result in evaluation_controller.evaluate([self._teacher_path, student_path])
+        }
+
+        teacher_file: str = EvaluationController.find_checkpoint_files([self._teacher_path])[0]
+
+        return {"teacher": results_by_path.get(teacher_file), "student": results_by_path.get(student_path)}
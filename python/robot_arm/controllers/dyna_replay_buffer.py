@@ -0,0 +1,108 @@
+from typing import Any, Optional
+import numpy as np
+import torch
+from gymnasium import spaces
+from stable_baselines3.common.type_aliases import ReplayBufferSamples
+from stable_baselines3.common.vec_env import VecNormalize
+
+from .memory_mapped_replay_buffer import MemoryMappedReplayBuffer
+
+
+class DynaReplayBuffer(MemoryMappedReplayBuffer):
+    """Memory-mapped replay buffer that mixes imagined transitions into every sampled batch.
+
+    Real transitions stay on disk as in MemoryMappedReplayBuffer. Transitions
+    generated by a learned dynamics model go to a small in-memory ring and
+    make up synthetic_fraction of each batch once any exist, with the
+    termination the rollout predicted for them. They are cheap to
+    regenerate, so they are neither flushed nor resumed.
+    """
+
+    DEFAULT_SYNTHETIC_FRACTION: float = 0.5
+    DEFAULT_SYNTHETIC_BUFFER_SIZE: int = 100_000
+
+    def __init__(
+        self,
+        buffer_size: int,
+        observation_space: spaces.Space,
+        action_space: spaces.Space,
+        device: Any = "auto",
+        n_envs: int = 1,
+        optimize_memory_usage: bool = False,
+        handle_timeout_termination: bool = True,
+        storage_directory: str = "./replay_buffer",
+        resume_existing: bool = True,
+        synthetic_fraction: float = DEFAULT_SYNTHETIC_FRACTION,
+        synthetic_buffer_size: int = DEFAULT_SYNTHETIC_BUFFER_SIZE
+    ) -> None:
+        if not 0.0 <= synthetic_fraction < 1.0:
+            raise ValueError("synthetic_fraction must be in [0, 1)")
+
+        super().__init__(
+            buffer_size, observation_space, action_space, device, n_envs, optimize_memory_usage,
+            handle_timeout_termination, storage_directory, resume_existing)
+
+        self.synthetic_fraction: float = synthetic_fraction
+        self._synthetic_observations: np.ndarray = np.zeros(
+            (synthetic_buffer_size,) + tuple(self.obs_shape), dtype=np.float32)
+        self._synthetic_next_observations: np.ndarray = np.zeros_like(self._synthetic_observations)
+        self._synthetic_actions: np.ndarray = np.zeros((synthetic_buffer_size, self.action_dim), dtype=np.float32)
+        self._synthetic_rewards: np.ndarray = np.zeros(synthetic_buffer_size, dtype=np.float32)
+        self._synthetic_dones: np.ndarray = np.zeros(synthetic_buffer_size, dtype=np.float32)
+        self._synthetic_position: int = 0
+        self._synthetic_count: int = 0
+
+    @property
+    def synthetic_size(self) -> int:
+        """Number of imagined transitions currently stored."""
+        return self._synthetic_count
+
+    def add_synthetic(
+        self,
+        observations: np.ndarray,
+        next_observations: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        dones: Optional[np.ndarray] = None
+    ) -> None:
+        """Store a batch of imagined transitions, overwriting the oldest when full.
+
+        Observations and rewards are unnormalized like real transitions;
+        actions are in the policy's scaled [-1, 1] range. dones marks
+        transitions predicted to end the episode; none do when omitted.
+        """
+        capacity: int = len(self._synthetic_rewards)
+        indices: np.ndarray = (self._synthetic_position + np.arange(len(rewards))) % capacity
+
+        self._synthetic_observations[indices] = observations
+        self._synthetic_next_observations[indices] = next_observations
+        self._synthetic_actions[indices] = actions
+        self._synthetic_rewards[indices] = rewards
+        self._synthetic_dones[indices] = 0.0 if dones is None else dones
+
+        self._synthetic_position = int((self._synthetic_position + len(rewards)) % capacity)
+        self._synthetic_count = min(self._synthetic_count + len(rewards), capacity)
+
+    def sample(self, batch_size: int, env: Optional[VecNormalize] = None) -> ReplayBufferSamples:
+        """Sample real transitions, replacing synthetic_fraction of the batch with imagined ones."""
+        synthetic_batch_size: int = 0
+        if self._synthetic_count > 0:
+            synthetic_batch_size = min(int(round(batch_size * self.synthetic_fraction)), batch_size - 1)
+
+        real_samples: ReplayBufferSamples = super().sample(batch_size - synthetic_batch_size, env)
+
+        if synthetic_batch_size == 0:
+            return real_samples
+
+        indices: np.ndarray = np.random.randint(0, self._synthetic_count, size=synthetic_batch_size)
+        synthetic_data = tuple(map(self.to_torch, (
+            self._normalize_obs(self._synthetic_observations[indices], env),
+            self._synthetic_actions[indices],
+            self._normalize_obs(self._synthetic_next_observations[indices], env),
+            self._synthetic_dones[indices].reshape(-1, 1),
+            self._normalize_reward(self._synthetic_rewards[indices].reshape(-1, 1), env)
+        )))
+
+        return ReplayBufferSamples(*(
+            torch.cat([real_tensor, synthetic_tensor])
+            for real_tensor, synthetic_tensor in zip(real_samples[:5], synthetic_data)))
@@ -0,0 +1,269 @@
+import hashlib
+import json
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+import os
+
+from ..models.evaluation_result_model import EvaluationResultModel
+
+
+class EvaluationController:
+    """Controller for evaluating saved checkpoints in parallel simulators.
+
+    Each pool worker owns one simulator port for its lifetime and evaluates
+    whole checkpoints with deterministic actions. Results are cached by the
+    checkpoint's content hash plus the evaluation settings, so re-running over
+    a growing checkpoint directory only evaluates files not seen before.
+    """
+
+    DEFAULT_EPISODES_PER_CHECKPOINT: int = 20
+    DEFAULT_MAXIMUM_EPISODE_STEPS: int = 500
+    DEFAULT_CACHE_PATH: str = "./checkpoints/evaluation_cache.json"
+    CHECKPOINT_PREFIX: str = "robot_policy"
+    OUTCOME_NAMES: List[str] = ["success", "collision", "underground", "timeout"]
+    HASH_CHUNK_BYTES: int = 1 << 20
+
+    # Set in each pool worker by _initialize_worker
+    _worker_server_address: Optional[str] = None
+
+    def __init__(
+        self,
+        server_ports: List[int],
+        server_host: str = "localhost",
+        episodes_per_checkpoint: int = DEFAULT_EPISODES_PER_CHECKPOINT,
+        maximum_episode_steps: int = DEFAULT_MAXIMUM_EPISODE_STEPS,
+        cache_path: str = DEFAULT_CACHE_PATH
+    ) -> None:
+        if not server_ports:
+            raise ValueError("At least one simulator port is required")
+
+        self._server_ports: List[int] = list(server_ports)
+        self._server_host: str = server_host
+        self._episodes_per_checkpoint: int = episodes_per_checkpoint
+        self._maximum_episode_steps: int = maximum_episode_steps
+        self._cache_path: str = cache_path
+
+    def evaluate(self, checkpoint_paths: List[str]) -> List[EvaluationResultModel]:
+        """Evaluate checkpoints, reusing cached results where possible.
+
+        Args:
+            checkpoint_paths: Model files, or directories searched for robot_policy checkpoints.
+
+        Returns:
+            One result per checkpoint, ordered best first.
+        """
+        model_files: List[str] = self.find_checkpoint_files(checkpoint_paths)
+        cache: Dict[str, dict] = self._load_cache()
+
+        results: List[EvaluationResultModel] = []
+        pending_files: Dict[str, str] = {}
+
+        for model_file in model_files:
+            cache_key: str = self.compute_cache_key(model_file)
+
+            if cache_key in cache:
+                cached_result = EvaluationResultModel.from_dictionary(cache[cache_key])
+                cached_result.checkpoint_path = model_file
+                results.append(cached_result)
+            else:
+                pending_files[model_file] = cache_key
+
+        print(f"Evaluating {len(pending_files)} checkpoint(s), "
+              f"{len(model_files) - len(pending_files)} cached")
+
+        if pending_files:
+            for result in self._evaluate_in_pool(pending_files):
+                cache[result.cache_key] = result.to_dictionary()
+                self._save_cache(cache)
+                results.append(result)
+
+        return sorted(results, key=lambda result: (-result.success_rate, -result.mean_return))
+
+    def compute_cache_key(self, model_file: str) -> str:
+        """Hash the checkpoint contents, its normalizer and the evaluation settings."""
+        from ..services.policy_export_service import PolicyExportService
+
+        content_hash = hashlib.sha256()
+        hashed_files: List[str] = [model_file]
+
+        # Exported .npz files already embed the normalizer statistics
+        if not model_file.endswith(PolicyExportService.EXPORT_FILE_EXTENSION):
+            normalizer_path: Optional[str] = PolicyExportService.find_normalizer_path(model_file)
+            if normalizer_path is not None:
+                hashed_files.append(normalizer_path)
+
+        for hashed_file in hashed_files:
+            with open(hashed_file, "rb") as checkpoint_file:
+                for chunk in iter(lambda: checkpoint_file.read(self.HASH_CHUNK_BYTES), b""):
+                    content_hash.update(chunk)
+
+        evaluation_settings: dict = {
+            "episodes_per_checkpoint": self._episodes_per_checkpoint,
+            "maximum_episode_steps": self._maximum_episode_steps
+        }
+        content_hash.update(json.dumps(evaluation_settings, sort_keys=True).encode("utf-8"))
+
+        return content_hash.hexdigest()
+
+    @classmethod
+    def find_checkpoint_files(cls, checkpoint_paths: List[str]) -> List[str]:
+        """Expand directories into checkpoint files, preferring .npz exports over .zip models."""
+        model_files: Dict[str, str] = {}
+
+        for checkpoint_path in checkpoint_paths:
+            if os.path.isdir(checkpoint_path):
+                candidate_files: List[str] = [
+                    os.path.join(checkpoint_path, file_name)
+                    for file_name in sorted(os.listdir(checkpoint_path))
+                    if file_name.startswith(cls.CHECKPOINT_PREFIX) and file_name.endswith((".npz", ".zip"))
+                ]
+            elif os.path.isfile(checkpoint_path):
+                candidate_files = [checkpoint_path]
+            elif os.path.isfile(checkpoint_path + ".zip"):
+                candidate_files = [checkpoint_path + ".zip"]
+            else:
+                raise FileNotFoundError(f"No checkpoint found at: {checkpoint_path}")
+
+            for candidate_file in candidate_files:
+                base_path: str = os.path.splitext(candidate_file)[0]
+                if base_path not in model_files or candidate_file.endswith(".npz"):
+                    model_files[base_path] = candidate_file
+
+        return sorted(model_files.values())
+
+    def _evaluate_in_pool(self, pending_files: Dict[str, str]) -> List[EvaluationResultModel]:
+        """Evaluate checkpoints across one worker process per simulator port."""
+        # Spawn rather than fork: distillation evaluates parity right after torch training in this process
+        process_context = multiprocessing.get_context("spawn")
+        port_queue = process_context.Queue()
+        for server_port in self._server_ports:
+            port_queue.put(server_port)
+
+        results: List[EvaluationResultModel] = []
+
+        with ProcessPoolExecutor(
+            max_workers=len(self._server_ports),
+            mp_context=process_context,
+            initializer=self._initialize_worker,
+            initargs=(port_queue, self._server_host)
+        ) as executor:
+            futures: Dict[Future, str] = {
+                executor.submit(
+                    self._evaluate_checkpoint,
+                    model_file,
+                    self._episodes_per_checkpoint,
+                    self._maximum_episode_steps
+                ): model_file
+                for model_file in pending_files
+            }
+
+            for future in as_completed(futures):
+                model_file: str = futures[future]
+
+                try:
+                    result_dictionary: dict = future.result()
+                except (OSError, RuntimeError, ValueError) as evaluation_error:
+                    print(f"Evaluation failed for {model_file}: {evaluation_error}")
+                    continue
+
+                result_dictionary["CacheKey"] = pending_files[model_file]
+                result: EvaluationResultModel = EvaluationResultModel.from_dictionary(result_dictionary)
+                print(f"Evaluated {model_file}: success {result.success_rate:.0%}, "
+                      f"return {result.mean_return:.1f}")
+                results.append(result)
+
+        return results
+
+    @classmethod
+    def _initialize_worker(cls, port_queue, server_host: str) -> None:
+        """Claim a simulator port for this worker process."""
+        cls._worker_server_address = f"tcp://{server_host}:{port_queue.get()}"
+
+    @classmethod
+    def _evaluate_checkpoint(
+        cls,
+        model_file: str,
+        episode_count: int,
+        maximum_episode_steps: int
+    ) -> dict:
+        """Run deterministic episodes for one checkpoint on this worker's simulator."""
+        import numpy as np
+        from ..environments.unity_robot_environment import UnityRobotEnvironment
+        from ..services.policy_export_service import PolicyExportService
+
+        start_time: float = time.perf_counter()
+        policy = PolicyExportService().load_numpy_policy(model_file)
+        environment = UnityRobotEnvironment(
+            server_address=cls._worker_server_address,
+            maximum_episode_steps=maximum_episode_steps
+        )
+
+        outcome_counts: Dict[str, int] = {outcome_name: 0 for outcome_name in cls.OUTCOME_NAMES}
+        episode_returns: List[float] = []
+        steps_to_target: List[int] = []
+
+        try:
+            for _ in range(episode_count):
+                observation, _ = environment.reset()
+                episode_return: float = 0.0
+                step_count: int = 0
+
+                while True:
+                    action, _ = policy.predict(observation, deterministic=True)
+                    observation, reward, terminated, truncated, information = environment.step(action)
+                    episode_return += reward
+                    step_count += 1
+
+                    # Reaching the target does not terminate the environment, so stop here
+                    if information.get("success", False):
+                        outcome_counts["success"] += 1
+                        steps_to_target.append(step_count)
+                        break
+
+                    if terminated or truncated:
+                        if information.get("collision", False):
+                            outcome_counts["collision"] += 1
+                        elif information.get("underground", False):
+                            outcome_counts["underground"] += 1
+                        else:
+                            outcome_counts["timeout"] += 1
+                        break
+
+                episode_returns.append(episode_return)
+        finally:
+            environment.close()
+
+        return {
+            "CheckpointPath": model_file,
+            "CacheKey": "",
+            "EpisodeCount": episode_count,
+            "SuccessRate": outcome_counts["success"] / max(episode_count, 1),
+            "MeanReturn": float(np.mean(episode_returns)) if episode_returns else 0.0,
+            "MeanStepsToTarget": float(np.mean(steps_to_target)) if steps_to_target else None,
+            "OutcomeCounts": outcome_counts,
+            "EvaluationSeconds": time.perf_counter() - start_time
+        }
+
+    def _load_cache(self) -> Dict[str, dict]:
+        """Load cached results keyed by cache key."""
+        if not os.path.exists(self._cache_path):
+            return {}
+
+        try:
+            with open(self._cache_path, "r", encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, json.JSONDecodeError) as cache_error:
+            print(f"Ignoring unreadable evaluation cache: {cache_error}")
+            return {}
+
+    def _save_cache(self, cache: Dict[str, dict]) -> None:
+        """Write the cache atomically so an interrupted run keeps completed results."""
+        cache_directory: str = os.path.dirname(os.path.abspath(self._cache_path))
+        os.makedirs(cache_directory, exist_ok=True)
+
+        temporary_path: str = self._cache_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file, indent=2, sort_keys=True)
+        os.replace(temporary_path, self._cache_path)
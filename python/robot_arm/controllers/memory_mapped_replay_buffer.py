@@ -0,0 +1,139 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.buffers import BaseBuffer, ReplayBuffer
+
+
+class MemoryMappedReplayBuffer(ReplayBuffer):
+    """SB3 replay buffer whose arrays are float32 files memory-mapped from a directory.
+
+    Only the pages being written or sampled are held in RAM, so the capacity
+    is bounded by disk rather than memory. The write position is recorded in
+    a small metadata file after the arrays are flushed; reopening the same
+    directory with the same shapes resumes where the last flush left off,
+    unless resume_existing is False.
+    """
+
+    METADATA_FILE_NAME: str = "metadata.json"
+    METADATA_FLUSH_INTERVAL: int = 10000
+    ARRAY_NAMES: Tuple[str, ...] = ("observations", "next_observations", "actions", "rewards", "dones", "timeouts")
+
+    def __init__(
+        self,
+        buffer_size: int,
+        observation_space: spaces.Space,
+        action_space: spaces.Space,
+        device: Any = "auto",
+        n_envs: int = 1,
+        optimize_memory_usage: bool = False,
+        handle_timeout_termination: bool = True,
+        storage_directory: str = "./replay_buffer",
+        resume_existing: bool = True
+    ) -> None:
+        if optimize_memory_usage:
+            raise ValueError("MemoryMappedReplayBuffer stores next observations explicitly")
+
+        # Skip ReplayBuffer.__init__, which would allocate the arrays in RAM
+        BaseBuffer.__init__(self, buffer_size, observation_space, action_space, device, n_envs=n_envs)
+        self.buffer_size = max(buffer_size // n_envs, 1)
+        self.optimize_memory_usage = False
+        self.handle_timeout_termination = handle_timeout_termination
+        self.storage_directory: str = storage_directory
+        self._adds_since_flush: int = 0
+
+        os.makedirs(storage_directory, exist_ok=True)
+        metadata: Optional[dict] = self._read_metadata() if resume_existing else None
+        expected_metadata: dict = self._create_metadata()
+
+        is_resuming: bool = metadata is not None
+        if is_resuming:
+            for key in ("BufferSize", "EnvironmentCount", "ObservationShape", "ActionDimension"):
+                if metadata[key] != expected_metadata[key]:
+                    raise ValueError(
+                        f"Replay buffer in {storage_directory} has {key}={metadata[key]}, "
+                        f"expected {expected_metadata[key]}")
+
+        for array_name, shape in self._compute_array_shapes().items():
+            setattr(self, array_name, self._open_array(array_name, shape, is_resuming))
+
+        if is_resuming:
+            self.pos = metadata["Position"]
+            self.full = metadata["Full"]
+            print(f"Resumed replay buffer with {self.size() * self.n_envs} transitions from {storage_directory}")
+        else:
+            # Replace any stale metadata before the first transition is written
+            self.flush()
+
+    def add(
+        self,
+        obs: np.ndarray,
+        next_obs: np.ndarray,
+        action: np.ndarray,
+        reward: np.ndarray,
+        done: np.ndarray,
+        infos: List[Dict[str, Any]]
+    ) -> None:
+        """Store one transition per environment, flushing periodically so a crash loses little."""
+        super().add(obs, next_obs, action, reward, done, infos)
+
+        self._adds_since_flush += 1
+        if self._adds_since_flush >= self.METADATA_FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write dirty pages to disk, then record the write position."""
+        for array_name in self.ARRAY_NAMES:
+            getattr(self, array_name).flush()
+
+        metadata: dict = self._create_metadata()
+        metadata_path: str = os.path.join(self.storage_directory, self.METADATA_FILE_NAME)
+        temporary_path: str = metadata_path + ".tmp"
+
+        with open(temporary_path, "w") as metadata_file:
+            json.dump(metadata, metadata_file)
+        os.replace(temporary_path, metadata_path)
+
+        self._adds_since_flush = 0
+
+    def _compute_array_shapes(self) -> Dict[str, Tuple[int, ...]]:
+        """Shapes of every stored array, matching the in-memory ReplayBuffer."""
+        transition_shape: Tuple[int, int] = (self.buffer_size, self.n_envs)
+
+        return {
+            "observations": transition_shape + tuple(self.obs_shape),
+            "next_observations": transition_shape + tuple(self.obs_shape),
+            "actions": transition_shape + (self.action_dim,),
+            "rewards": transition_shape,
+            "dones": transition_shape,
+            "timeouts": transition_shape
+        }
+
+    def _open_array(self, array_name: str, shape: Tuple[int, ...], is_resuming: bool) -> np.memmap:
+        """Open an existing array file for update, or create a zero-filled sparse one."""
+        array_path: str = os.path.join(self.storage_directory, f"{array_name}.float32")
+        mode: str = "r+" if is_resuming and os.path.exists(array_path) else "w+"
+
+        return np.memmap(array_path, dtype=np.float32, mode=mode, shape=shape)
+
+    def _read_metadata(self) -> Optional[dict]:
+        """Metadata of a previously flushed buffer, if any."""
+        metadata_path: str = os.path.join(self.storage_directory, self.METADATA_FILE_NAME)
+
+        if not os.path.exists(metadata_path):
+            return None
+
+        with open(metadata_path) as metadata_file:
+            return json.load(metadata_file)
+
+    def _create_metadata(self) -> dict:
+        """Shapes and write position describing the stored arrays."""
+        return {
+            "BufferSize": self.buffer_size,
+            "EnvironmentCount": self.n_envs,
+            "ObservationShape": list(self.obs_shape),
+            "ActionDimension": self.action_dim,
+            "Position": self.pos,
+            "Full": self.full
+        }
@@ -0,0 +1,249 @@
+import json
+import math
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+import os
+
+from ..models.training_configuration_model import TrainingConfigurationModel
+
+
+class SweepController:
+    """Controller for hyperparameter sweeps with successive-halving pruning.
+
+    Trials are sampled from a search space and trained in worker processes,
+    each owning one simulator port. After every rung the trials are ranked by
+    success rate (then mean return) and only the best 1/reduction_factor train
+    on, for reduction_factor times the budget, resuming from their saved model.
+    Every rung result is appended to a JSON-lines results file.
+    """
+
+    DEFAULT_TRIAL_COUNT: int = 9
+    DEFAULT_MINIMUM_TIMESTEPS: int = 20_000
+    DEFAULT_REDUCTION_FACTOR: int = 3
+    DEFAULT_RUNG_COUNT: int = 3
+    RESULTS_FILE_NAME: str = "results.jsonl"
+
+    # Each entry is a list of choices or a {"low", "high", "log"} range
+    DEFAULT_SEARCH_SPACE: Dict[str, Any] = {
+        "learning_rate": {"low": 1e-5, "high": 1e-3, "log": True},
+        "entropy_coefficient": {"low": 1e-4, "high": 2e-2, "log": True},
+        "steps_per_update": [1024, 2048, 4096],
+        "batch_size": [64, 128, 256],
+        "clip_range": {"low": 0.1, "high": 0.3},
+        "gae_lambda": {"low": 0.9, "high": 0.99}
+    }
+
+    # Set in each pool worker by _initialize_worker
+    _worker_server_address: Optional[str] = None
+
+    def __init__(
+        self,
+        server_ports: List[int],
+        output_directory: str,
+        search_space: Optional[Dict[str, Any]] = None,
+        server_host: str = "localhost",
+        trial_count: int = DEFAULT_TRIAL_COUNT,
+        minimum_timesteps: int = DEFAULT_MINIMUM_TIMESTEPS,
+        reduction_factor: int = DEFAULT_REDUCTION_FACTOR,
+        rung_count: int = DEFAULT_RUNG_COUNT,
+        seed: Optional[int] = None
+    ) -> None:
+        if not server_ports:
+            raise ValueError("At least one simulator port is required")
+
+        if reduction_factor < 2:
+            raise ValueError("Reduction factor must be at least 2")
+
+        self._server_ports: List[int] = list(server_ports)
+        self._output_directory: str = output_directory
+        self._search_space: Dict[str, Any] = search_space if search_space is not None else self.DEFAULT_SEARCH_SPACE
+        self._server_host: str = server_host
+        self._trial_count: int = trial_count
+        self._minimum_timesteps: int = minimum_timesteps
+        self._reduction_factor: int = reduction_factor
+        self._rung_count: int = rung_count
+        self._seed: Optional[int] = seed
+        self._results_path: str = os.path.join(output_directory, self.RESULTS_FILE_NAME)
+
+    @property
+    def results_path(self) -> str:
+        """JSON-lines file receiving one record per trial and rung."""
+        return self._results_path
+
+    def sample_configurations(self) -> List[Dict[str, Any]]:
+        """Sample one training configuration dictionary per trial."""
+        import numpy as np
+
+        random_generator: np.random.Generator = np.random.default_rng(self._seed)
+        configurations: List[Dict[str, Any]] = []
+
+        for _ in range(self._trial_count):
+            configuration: Dict[str, Any] = {
+                parameter_name: self._sample_parameter(parameter_space, random_generator)
+                for parameter_name, parameter_space in self._search_space.items()
+            }
+            # Fail fast on names TrainingController would not understand
+            TrainingConfigurationModel.from_dictionary(configuration)
+            configurations.append(configuration)
+
+        return configurations
+
+    def compute_rung_timesteps(self) -> List[int]:
+        """Cumulative training timesteps a trial has reached at the end of each rung."""
+        return [
+            self._minimum_timesteps * self._reduction_factor ** rung_index
+            for rung_index in range(self._rung_count)
+        ]
+
+    def select_promoted_trials(self, rung_results: List[dict]) -> List[int]:
+        """Rank rung results and return the trial numbers that continue."""
+        promoted_count: int = max(1, math.ceil(len(rung_results) / self._reduction_factor))
+        ranked_results: List[dict] = sorted(
+            rung_results,
+            key=lambda result: (-result["success_rate"], -result["mean_return"], result["trial_number"]))
+
+        return [result["trial_number"] for result in ranked_results[:promoted_count]]
+
+    def run(self) -> List[dict]:
+        """Run the sweep and return the final rung's results, best first."""
+        os.makedirs(self._output_directory, exist_ok=True)
+
+        configurations: List[Dict[str, Any]] = self.sample_configurations()
+        rung_timesteps: List[int] = self.compute_rung_timesteps()
+        active_trials: List[int] = list(range(len(configurations)))
+        model_paths: Dict[int, Optional[str]] = {trial_number: None for trial_number in active_trials}
+        rung_results: List[dict] = []
+
+        # Spawn rather than fork so workers never inherit torch thread pools mid-use
+        process_context = multiprocessing.get_context("spawn")
+        port_queue = process_context.Queue()
+        for server_port in self._server_ports:
+            port_queue.put(server_port)
+
+        with ProcessPoolExecutor(
+            max_workers=len(self._server_ports),
+            mp_context=process_context,
+            initializer=self._initialize_worker,
+            initargs=(port_queue, self._server_host)
+        ) as executor:
+            for rung_index, cumulative_timesteps in enumerate(rung_timesteps):
+                previous_timesteps: int = rung_timesteps[rung_index - 1] if rung_index > 0 else 0
+                print(f"\n{'=' * 60}")
+                print(f"SWEEP RUNG {rung_index}: {len(active_trials)} trial(s) to {cumulative_timesteps} steps")
+                print(f"{'=' * 60}\n")
+
+                futures: Dict[Future, int] = {
+                    executor.submit(
+                        self._run_trial_rung,
+                        self._get_trial_directory(trial_number),
+                        configurations[trial_number],
+                        rung_index,
+                        cumulative_timesteps - previous_timesteps,
+                        model_paths[trial_number]
+                    ): trial_number
+                    for trial_number in active_trials
+                }
+
+                rung_results = []
+                for future in as_completed(futures):
+                    trial_number: int = futures[future]
+
+                    try:
+                        trial_statistics: dict = future.result()
+                    except (OSError, RuntimeError, ValueError) as trial_error:
+                        print(f"Trial {trial_number} failed: {trial_error}")
+                        continue
+
+                    model_paths[trial_number] = trial_statistics["model_path"]
+                    rung_results.append({
+                        "trial_number": trial_number,
+                        "rung": rung_index,
+                        "timesteps": cumulative_timesteps,
+                        "configuration": configurations[trial_number],
+                        **trial_statistics
+                    })
+
+                if not rung_results:
+                    raise RuntimeError(f"Every trial failed in rung {rung_index}")
+
+                is_last_rung: bool = rung_index == len(rung_timesteps) - 1
+                active_trials = (
+                    [result["trial_number"] for result in rung_results] if is_last_rung
+                    else self.select_promoted_trials(rung_results))
+
+                for result in sorted(rung_results, key=lambda result: result["trial_number"]):
+                    result["status"] = (
+                        "completed" if is_last_rung
+                        else "promoted" if result["trial_number"] in active_trials
+                        else "pruned")
+                    self._append_result(result)
+                    print(f"Trial {result['trial_number']}: success {result['success_rate']:.0%}, "
+                          f"return {result['mean_return']:.1f} -> {result['status']}")
+
+        return sorted(rung_results, key=lambda result: (-result["success_rate"], -result["mean_return"]))
+
+    @classmethod
+    def _initialize_worker(cls, port_queue, server_host: str) -> None:
+        """Claim a simulator port for this worker process."""
+        cls._worker_server_address = f"tcp://{server_host}:{port_queue.get()}"
+
+    @classmethod
+    def _run_trial_rung(
+        cls,
+        trial_directory: str,
+        configuration: Dict[str, Any],
+        rung_index: int,
+        additional_timesteps: int,
+        resume_model_path: Optional[str]
+    ) -> dict:
+        """Train one trial through one rung on this worker's simulator."""
+        from .training_controller import TrainingController
+
+        start_time: float = time.perf_counter()
+        training_controller: TrainingController = TrainingController(
+            server_address=cls._worker_server_address,
+            resume_from_model=resume_model_path,
+            training_configuration=TrainingConfigurationModel.from_dictionary(configuration),
+            output_directory=trial_directory
+        )
+
+        try:
+            training_controller.initialize_training()
+            trial_statistics: dict = training_controller.execute_training_steps(additional_timesteps)
+            trial_statistics["model_path"] = training_controller.save_policy(f"rung_{rung_index}")
+        finally:
+            training_controller.shutdown()
+
+        trial_statistics["wall_seconds"] = time.perf_counter() - start_time
+
+        return trial_statistics
+
+    @staticmethod
+    def _sample_parameter(parameter_space: Any, random_generator) -> Any:
+        """Sample one value from a list of choices, a numeric range or a constant."""
+        if isinstance(parameter_space, list):
+            return parameter_space[int(random_generator.integers(len(parameter_space)))]
+
+        if not isinstance(parameter_space, dict):
+            return parameter_space
+
+        low, high = parameter_space["low"], parameter_space["high"]
+
+        if parameter_space.get("log", False):
+            return float(math.exp(random_generator.uniform(math.log(low), math.log(high))))
+
+        if isinstance(low, int) and isinstance(high, int):
+            return int(random_generator.integers(low, high + 1))
+
+        return float(random_generator.uniform(low, high))
+
+    def _get_trial_directory(self, trial_number: int) -> str:
+        """Directory holding one trial's models and logs."""
+        return os.path.join(self._output_directory, f"trial_{trial_number:03d}")
+
+    def _append_result(self, result: dict) -> None:
+        """Append one record to the results file."""
+        with open(self._results_path, "a", encoding="utf-8") as results_file:
+            results_file.write(json.dumps(result) + "\n")
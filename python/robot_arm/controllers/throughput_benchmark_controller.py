@@ -0,0 +1,169 @@
+import itertools
+import json
+import platform
+import tempfile
+from dataclasses import replace
+from typing import Callable, List, Optional
+import os
+
+from ..enums.vectorized_environment_type import VectorizedEnvironmentType
+from ..models.training_configuration_model import TrainingConfigurationModel
+
+
+class ThroughputBenchmarkController:
+    """Measures PPO training throughput against local mock simulators.
+
+    Every setting of the sweep (environment count, vectorized environment
+    type, steps per update and injected simulator latency) runs a short
+    TrainingController session with one MockSimulatorService per environment.
+    One untimed rollout absorbs connection and start-up costs, then a few
+    rollouts are timed. Simulator utilization is the simulators' summed busy
+    time over the time they were available (simulator count times wall time).
+    """
+
+    DEFAULT_ENVIRONMENT_COUNTS: List[int] = [1, 2, 4]
+    DEFAULT_VECTORIZED_ENVIRONMENT_TYPES: List[VectorizedEnvironmentType] = [
+        VectorizedEnvironmentType.DUMMY, VectorizedEnvironmentType.SUBPROCESS]
+    DEFAULT_STEPS_PER_UPDATE_VALUES: List[int] = [256]
+    DEFAULT_RESPONSE_LATENCIES_SECONDS: List[float] = [0.0, 0.002]
+    DEFAULT_BATCH_SIZE: int = 64
+    DEFAULT_MEASURED_ROLLOUTS: int = 3
+    MOCK_EPISODE_LENGTH: int = 200
+
+    def __init__(
+        self,
+        environment_counts: Optional[List[int]] = None,
+        vectorized_environment_types: Optional[List[VectorizedEnvironmentType]] = None,
+        steps_per_update_values: Optional[List[int]] = None,
+        response_latencies_seconds: Optional[List[float]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        measured_rollouts: int = DEFAULT_MEASURED_ROLLOUTS,
+        training_configuration: Optional[TrainingConfigurationModel] = None
+    ) -> None:
+        if measured_rollouts < 1:
+            raise ValueError("At least one measured rollout is required")
+
+        self._environment_counts: List[int] = list(environment_counts or self.DEFAULT_ENVIRONMENT_COUNTS)
+        self._vectorized_environment_types: List[VectorizedEnvironmentType] = list(
+            vectorized_environment_types or self.DEFAULT_VECTORIZED_ENVIRONMENT_TYPES)
+        self._steps_per_update_values: List[int] = list(
+            steps_per_update_values or self.DEFAULT_STEPS_PER_UPDATE_VALUES)
+        self._response_latencies_seconds: List[float] = list(
+            response_latencies_seconds if response_latencies_seconds is not None
+            else self.DEFAULT_RESPONSE_LATENCIES_SECONDS)
+        self._batch_size: int = batch_size
+        self._measured_rollouts: int = measured_rollouts
+        self._training_configuration: TrainingConfigurationModel = (
+            training_configuration or TrainingConfigurationModel())
+
+        if min(self._environment_counts) < 1:
+            raise ValueError("Environment counts must be at least 1")
+
+    def run(self, progress_callback: Optional[Callable[[dict], None]] = None) -> List[dict]:
+        """Measure every combination of the swept settings, in sweep order."""
+        results: List[dict] = []
+
+        for response_latency_seconds, steps_per_update, vectorized_environment_type, environment_count in (
+                itertools.product(
+                    self._response_latencies_seconds, self._steps_per_update_values,
+                    self._vectorized_environment_types, self._environment_counts)):
+            result: dict = self.measure(
+                environment_count, vectorized_environment_type, steps_per_update, response_latency_seconds)
+            results.append(result)
+
+            if progress_callback is not None:
+                progress_callback(result)
+
+        return results
+
+    def measure(
+        self,
+        environment_count: int,
+        vectorized_environment_type: VectorizedEnvironmentType,
+        steps_per_update: int,
+        response_latency_seconds: float,
+        batch_size: Optional[int] = None
+    ) -> dict:
+        """Throughput of one short training session; batch_size defaults to the sweep's.
+
+        Returns:
+            The setting plus "wall_seconds", "collection_steps_per_second"
+            (environment steps per second while collecting, summed over
+            environments), "steps_per_second" (including updates),
+            "update_time_fraction", "simulator_busy_seconds" (summed over
+            simulators) and "simulator_utilization".
+        """
+        from .training_controller import TrainingController
+        from ..services.mock_simulator_service import MockSimulatorService
+
+        rollout_steps: int = steps_per_update * environment_count
+        configuration: TrainingConfigurationModel = replace(
+            self._training_configuration,
+            steps_per_update=steps_per_update,
+            batch_size=min(batch_size or self._batch_size, rollout_steps))
+
+        simulators: List[MockSimulatorService] = [
+            MockSimulatorService(
+                response_latency_seconds=response_latency_seconds, episode_length=self.MOCK_EPISODE_LENGTH)
+            for _ in range(environment_count)]
+        training_controller: Optional[TrainingController] = None
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="throughput_benchmark_") as output_directory:
+                training_controller = TrainingController(
+                    server_addresses=[f"tcp://localhost:{simulator.port}" for simulator in simulators],
+                    training_configuration=configuration,
+                    output_directory=output_directory,
+                    vectorized_environment_type=vectorized_environment_type
+                )
+                training_controller.initialize_training()
+                training_controller.execute_training_steps(rollout_steps)
+
+                busy_seconds_before: float = sum(simulator.busy_seconds for simulator in simulators)
+                statistics: dict = training_controller.execute_training_steps(
+                    rollout_steps * self._measured_rollouts)
+                busy_seconds: float = sum(simulator.busy_seconds for simulator in simulators) - busy_seconds_before
+
+                training_controller.shutdown()
+                training_controller = None
+        finally:
+            if training_controller is not None:
+                training_controller.shutdown()
+            for simulator in simulators:
+                simulator.close()
+
+        wall_seconds: float = statistics["wall_seconds"]
+
+        return {
+            "environment_count": environment_count,
+            "vectorized_environment_type": vectorized_environment_type.value,
+            "steps_per_update": steps_per_update,
+            "batch_size": configuration.batch_size,
+            "response_latency_milliseconds": response_latency_seconds * 1000.0,
+            "measured_steps": rollout_steps * self._measured_rollouts,
+            "wall_seconds": wall_seconds,
+            "collection_steps_per_second": statistics["collection_steps_per_second"],
+            "steps_per_second": rollout_steps * self._measured_rollouts / wall_seconds if wall_seconds > 0.0 else 0.0,
+            "update_time_fraction": statistics["update_time_fraction"],
+            "simulator_busy_seconds": busy_seconds,
+            "simulator_utilization": (
+                busy_seconds / (environment_count * wall_seconds) if wall_seconds > 0.0 else 0.0)
+        }
+
+    @staticmethod
+    def save_results(results: List[dict], json_path: str) -> str:
+        """Write results with the interpreter and machine they were measured on."""
+        directory: str = os.path.dirname(json_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump({
+                "Python": platform.python_version(),
+                "Machine": platform.machine(),
+                "Processor": platform.processor(),
+                "CpuCount": os.cpu_count(),
+                "Results": results
+            }, json_file, indent=2)
+
+        return json_path
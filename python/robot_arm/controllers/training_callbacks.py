@@ -0,0 +1,269 @@
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+import numpy as np
+from stable_baselines3.common.callbacks import BaseCallback
+
+
+class SuccessRateCallback(BaseCallback):
+    """Tracks success rate and undiscounted return over recently finished episodes.
+
+    An episode counts as a success if the target was reached at any step,
+    since reaching it does not terminate the environment.
+    """
+
+    DEFAULT_WINDOW_EPISODES: int = 100
+
+    def __init__(self, window_episodes: int = DEFAULT_WINDOW_EPISODES, verbose: int = 0) -> None:
+        super().__init__(verbose)
+        self._episode_successes: Deque[bool] = deque(maxlen=window_episodes)
+        self._episode_returns: Deque[float] = deque(maxlen=window_episodes)
+        self._is_success_in_progress: List[bool] = []
+        self._returns_in_progress: List[float] = []
+        self._finished_episode_count: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of windowed episodes that reached the target."""
+        return float(np.mean(self._episode_successes)) if self._episode_successes else 0.0
+
+    @property
+    def mean_return(self) -> float:
+        """Mean unnormalized return of windowed episodes."""
+        return float(np.mean(self._episode_returns)) if self._episode_returns else 0.0
+
+    @property
+    def finished_episode_count(self) -> int:
+        """Number of episodes finished since the callback was created."""
+        return self._finished_episode_count
+
+    def _on_training_start(self) -> None:
+        """Size the per-environment trackers."""
+        self._is_success_in_progress = [False] * self.training_env.num_envs
+        self._returns_in_progress = [0.0] * self.training_env.num_envs
+
+    def _on_step(self) -> bool:
+        """Accumulate outcomes of the step just taken in every environment."""
+        # VecNormalize exposes the raw rewards; fall back to what PPO saw otherwise
+        if hasattr(self.training_env, "get_original_reward"):
+            rewards = self.training_env.get_original_reward()
+        else:
+            rewards = self.locals["rewards"]
+
+        for environment_index, (information, is_done) in enumerate(zip(self.locals["infos"], self.locals["dones"])):
+            self._returns_in_progress[environment_index] += float(rewards[environment_index])
+            self._is_success_in_progress[environment_index] |= bool(information.get("success", False))
+
+            if is_done:
+                self._episode_successes.append(self._is_success_in_progress[environment_index])
+                self._episode_returns.append(self._returns_in_progress[environment_index])
+                self._is_success_in_progress[environment_index] = False
+                self._returns_in_progress[environment_index] = 0.0
+                self._finished_episode_count += 1
+
+        return True
+
+
+class ThroughputTimingCallback(BaseCallback):
+    """Splits a learn() call's wall time into rollout collection and policy updates.
+
+    Collection is timed from the start to the end of every rollout; the rest
+    of the call is spent updating the policy (and, for off-policy
+    algorithms, in the gradient steps between rollouts).
+    """
+
+    def __init__(self, verbose: int = 0) -> None:
+        super().__init__(verbose)
+        self._training_start_time: float = 0.0
+        self._rollout_start_time: float = 0.0
+        self._wall_seconds: float = 0.0
+        self._collection_seconds: float = 0.0
+        self._collected_step_count: int = 0
+
+    @property
+    def wall_seconds(self) -> float:
+        """Duration of the learn() call."""
+        return self._wall_seconds
+
+    @property
+    def collection_seconds(self) -> float:
+        """Time spent stepping the environments."""
+        return self._collection_seconds
+
+    @property
+    def collected_step_count(self) -> int:
+        """Environment steps collected, summed over environments."""
+        return self._collected_step_count
+
+    @property
+    def collection_steps_per_second(self) -> float:
+        """Environment steps per second of collection time."""
+        return self._collected_step_count / self._collection_seconds if self._collection_seconds > 0.0 else 0.0
+
+    @property
+    def update_time_fraction(self) -> float:
+        """Share of the wall time not spent collecting."""
+        if self._wall_seconds <= 0.0:
+            return 0.0
+        return max(0.0, 1.0 - self._collection_seconds / self._wall_seconds)
+
+    def _on_training_start(self) -> None:
+        """Start the wall clock."""
+        self._training_start_time = time.perf_counter()
+
+    def _on_rollout_start(self) -> None:
+        """Start timing a rollout."""
+        self._rollout_start_time = time.perf_counter()
+
+    def _on_step(self) -> bool:
+        """Count the step taken in every environment."""
+        self._collected_step_count += self.training_env.num_envs
+        return True
+
+    def _on_rollout_end(self) -> None:
+        """Add the rollout to the collection time."""
+        self._collection_seconds += time.perf_counter() - self._rollout_start_time
+
+    def _on_training_end(self) -> None:
+        """Stop the wall clock."""
+        self._wall_seconds = time.perf_counter() - self._training_start_time
+
+
+class DynaRolloutCallback(BaseCallback):
+    """Periodically fits a dynamics ensemble on real transitions and adds short imagined rollouts.
+
+    Rollouts start from non-terminal states recorded in the simulator and
+    follow the current policy through the ensemble. A rollout stops at the
+    first state where the members disagree more than they do on most real
+    states; those states are left to the real simulator instead of being
+    imagined. It also stops at a transition termination_function (next
+    observations, rewards -> boolean array) marks terminal, which is stored
+    as done so the critic does not bootstrap through it. The model's replay
+    buffer must be a DynaReplayBuffer.
+    """
+
+    DEFAULT_MODEL_TRAINING_INTERVAL: int = 1000
+    DEFAULT_ROLLOUT_HORIZON: int = 3
+    DEFAULT_ROLLOUT_START_COUNT: int = 400
+    MAXIMUM_FIT_TRANSITIONS: int = 50_000
+    # Imagined states less certain than this percentile of real states are cut off
+    UNCERTAINTY_PERCENTILE: float = 90.0
+
+    def __init__(
+        self,
+        dynamics_ensemble,
+        model_training_interval: int = DEFAULT_MODEL_TRAINING_INTERVAL,
+        rollout_horizon: int = DEFAULT_ROLLOUT_HORIZON,
+        rollout_start_count: int = DEFAULT_ROLLOUT_START_COUNT,
+        termination_function: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = None,
+        verbose: int = 0
+    ) -> None:
+        super().__init__(verbose)
+        self._dynamics_ensemble = dynamics_ensemble
+        self._termination_function: Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]] = termination_function
+        self._model_training_interval: int = model_training_interval
+        self._rollout_horizon: int = rollout_horizon
+        self._rollout_start_count: int = rollout_start_count
+        self._steps_since_model_training: int = 0
+        self._imagined_transition_count: int = 0
+        self._truncated_rollout_count: int = 0
+        self._started_rollout_count: int = 0
+
+    @property
+    def imagined_transition_count(self) -> int:
+        """Number of imagined transitions added to the replay buffer."""
+        return self._imagined_transition_count
+
+    @property
+    def truncated_rollout_fraction(self) -> float:
+        """Fraction of started rollouts cut short by ensemble disagreement."""
+        return self._truncated_rollout_count / self._started_rollout_count if self._started_rollout_count else 0.0
+
+    def _on_step(self) -> bool:
+        """Refit and imagine once every model_training_interval real steps after learning starts."""
+        self._steps_since_model_training += 1
+
+        if self._steps_since_model_training < self._model_training_interval:
+            return True
+        if self.num_timesteps < self.model.learning_starts:
+            return True
+
+        self._steps_since_model_training = 0
+        model_loss: float = self._fit_dynamics_ensemble()
+        self._generate_imagined_rollouts()
+
+        self.logger.record("dyna/model_loss", model_loss)
+        self.logger.record("dyna/imagined_transitions", self._imagined_transition_count)
+        self.logger.record("dyna/truncated_rollout_fraction", self.truncated_rollout_fraction)
+
+        return True
+
+    def _sample_real_transitions(self, count: int):
+        """Random unnormalized transitions from the replay buffer, flattened across environments.
+
+        Returns:
+            Observations, actions, next observations, rewards and whether each
+            transition ended its episode (time limits excluded).
+        """
+        replay_buffer = self.model.replay_buffer
+        stored_count: int = replay_buffer.size() * replay_buffer.n_envs
+        indices: np.ndarray = np.random.randint(0, stored_count, size=min(count, stored_count))
+
+        observation_dimension: int = replay_buffer.observations.shape[-1]
+
+        def flat_rows(array: np.ndarray, row_shape: tuple) -> np.ndarray:
+            return np.asarray(array[:replay_buffer.size()].reshape((stored_count,) + row_shape)[indices])
+
+        return (
+            flat_rows(replay_buffer.observations, (observation_dimension,)),
+            flat_rows(replay_buffer.actions, (replay_buffer.action_dim,)),
+            flat_rows(replay_buffer.next_observations, (observation_dimension,)),
+            flat_rows(replay_buffer.rewards, ()),
+            (flat_rows(replay_buffer.dones, ()) * (1.0 - flat_rows(replay_buffer.timeouts, ()))) > 0.0)
+
+    def _fit_dynamics_ensemble(self) -> float:
+        """Train the ensemble on a sample of the real transitions."""
+        observations, actions, next_observations, rewards, _ = self._sample_real_transitions(
+            self.MAXIMUM_FIT_TRANSITIONS)
+
+        return self._dynamics_ensemble.fit(observations, actions, next_observations, rewards)
+
+    def _generate_imagined_rollouts(self) -> None:
+        """Roll the policy through the ensemble from real states and store the confident steps."""
+        observations, actions, _, _, is_terminal = self._sample_real_transitions(self._rollout_start_count)
+        # States whose real transition ended the episode have no successor to imagine
+        observations, actions = observations[~is_terminal], actions[~is_terminal]
+        if len(observations) == 0:
+            return
+
+        _, _, real_uncertainties = self._dynamics_ensemble.predict(observations, actions)
+        uncertainty_threshold: float = float(np.percentile(real_uncertainties, self.UNCERTAINTY_PERCENTILE))
+
+        self._started_rollout_count += len(observations)
+        normalizer = self.model.get_vec_normalize_env()
+
+        for _ in range(self._rollout_horizon):
+            if len(observations) == 0:
+                break
+
+            policy_observations: np.ndarray = (
+                normalizer.normalize_obs(observations) if normalizer is not None else observations)
+            unscaled_actions, _ = self.model.predict(policy_observations, deterministic=False)
+            scaled_actions: np.ndarray = self.model.policy.scale_action(unscaled_actions).astype(np.float32)
+
+            next_observations, rewards, uncertainties = self._dynamics_ensemble.predict(
+                observations, scaled_actions)
+            next_observations = np.clip(
+                next_observations, self.model.observation_space.low, self.model.observation_space.high)
+            is_confident: np.ndarray = uncertainties <= uncertainty_threshold
+            is_terminal: np.ndarray = (
+                self._termination_function(next_observations, rewards) if self._termination_function is not None
+                else np.zeros(len(rewards), dtype=bool))
+
+            self._truncated_rollout_count += int(np.count_nonzero(~is_confident))
+            self.model.replay_buffer.add_synthetic(
+                observations[is_confident], next_observations[is_confident],
+                scaled_actions[is_confident], rewards[is_confident], is_terminal[is_confident])
+            self._imagined_transition_count += int(np.count_nonzero(is_confident))
+
+            observations = next_observations[is_confident & ~is_terminal]
@@ -0,0 +1,582 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import List, Optional
+import os
+
+from ..enums.training_algorithm import TrainingAlgorithm
+from ..enums.vectorized_environment_type import VectorizedEnvironmentType
+from ..models.training_configuration_model import TrainingConfigurationModel
+
+
+@dataclass
+class CurriculumPhase:
+    """Definition of a curriculum learning phase."""
+    name: str
+    training_steps: int
+    reward_threshold: float
+
+
+class TrainingController:
+    """Controller for RL training with PPO, SAC or TD3 and curriculum learning."""
+
+    CHECKPOINT_FREQUENCY: int = 10000
+    MAXIMUM_EPISODE_STEPS: int = 500
+
+    # Behavior cloning pretraining
+    KINEMATICS_CALIBRATION_STEPS: int = 600
+    CALIBRATION_ACTION_MAGNITUDE: float = 0.5
+    BEHAVIOR_CLONING_EPOCHS: int = 20
+    BEHAVIOR_CLONING_BATCH_SIZE: int = 256
+
+    # Asynchronous training: short segments keep the acting policy at most a few updates stale
+    ASYNCHRONOUS_SEGMENT_STEPS: int = 256
+    ASYNCHRONOUS_QUEUED_SEGMENTS: int = 2
+    ASYNCHRONOUS_LOG_INTERVAL: int = 10
+
+    # Off-policy training
+    TD3_ACTION_NOISE_STANDARD_DEVIATION: float = 0.1
+    HINDSIGHT_GOALS_PER_TRANSITION: int = 4
+    HINDSIGHT_GOAL_SELECTION_STRATEGY: str = "future"
+    DYNAMICS_MODEL_TRAINING_INTERVAL: int = 1000
+
+    def __init__(
+        self,
+        server_address: str = "tcp://localhost:5555",
+        resume_from_model: Optional[str] = None,
+        use_action_safety_filter: bool = False,
+        training_configuration: Optional[TrainingConfigurationModel] = None,
+        output_directory: str = ".",
+        use_asynchronous_training: bool = False,
+        rollout_server_port: Optional[int] = None,
+        training_algorithm: TrainingAlgorithm = TrainingAlgorithm.PPO,
+        use_goal_relabeling: bool = False,
+        use_continuing_targets: bool = False,
+        use_target_scheduler: bool = False,
+        use_model_based_rollouts: bool = False,
+        observation_history_length: int = 1,
+        include_observation_deltas: bool = False,
+        server_addresses: Optional[List[str]] = None,
+        vectorized_environment_type: VectorizedEnvironmentType = VectorizedEnvironmentType.DUMMY
+    ) -> None:
+        # One environment per simulator; a single address keeps the original one-environment setup
+        self._server_addresses: List[str] = list(server_addresses) if server_addresses else [server_address]
+        self._vectorized_environment_type: VectorizedEnvironmentType = vectorized_environment_type
+        self._resume_from_model: Optional[str] = resume_from_model
+        self._use_action_safety_filter: bool = use_action_safety_filter
+        # Remote rollout workers feed the asynchronous learner, so they imply that mode
+        self._use_asynchronous_training: bool = use_asynchronous_training or rollout_server_port is not None
+        self._rollout_server_port: Optional[int] = rollout_server_port
+        self._training_algorithm: TrainingAlgorithm = training_algorithm
+        self._use_goal_relabeling: bool = use_goal_relabeling
+        self._use_continuing_targets: bool = use_continuing_targets
+        self._use_target_scheduler: bool = use_target_scheduler
+        self._use_model_based_rollouts: bool = use_model_based_rollouts
+        self._observation_history_length: int = observation_history_length
+        self._include_observation_deltas: bool = include_observation_deltas
+
+        if self._use_asynchronous_training and training_algorithm != TrainingAlgorithm.PPO:
+            raise ValueError("Asynchronous training and rollout workers require PPO")
+
+        if use_goal_relabeling and training_algorithm == TrainingAlgorithm.PPO:
+            raise ValueError("Hindsight goal relabeling requires an off-policy algorithm (SAC or TD3)")
+
+        if use_model_based_rollouts and (training_algorithm == TrainingAlgorithm.PPO or use_goal_relabeling):
+            raise ValueError(
+                "Model-based rollouts require an off-policy algorithm (SAC or TD3) without goal relabeling")
+
+        if use_goal_relabeling and (observation_history_length > 1 or include_observation_deltas):
+            raise ValueError("Observation history cannot be combined with goal-conditioned observations")
+
+        self._asynchronous_learner = None
+        self._segment_queue = None
+        self._rollout_server = None
+        self._dyna_rollout_callback = None
+        self._training_configuration: TrainingConfigurationModel = (
+            training_configuration or TrainingConfigurationModel())
+        self._models_directory: str = os.path.join(output_directory, "models")
+        self._checkpoints_directory: str = os.path.join(output_directory, "checkpoints")
+        self._tensorboard_directory: str = os.path.join(output_directory, "tensorboard_logs")
+        self._replay_buffer_directory: str = os.path.join(output_directory, "replay_buffer")
+        self._environment = None
+        self._model = None
+        self._curriculum_phases: List[CurriculumPhase] = self._create_curriculum_phases()
+
+    def initialize_training(self) -> None:
+        """Initialize training environment and model."""
+        # Import here to avoid dependency issues when not training
+        from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecNormalize
+
+        environment_factories: list = [
+            partial(self._create_environment, server_address) for server_address in self._server_addresses]
+
+        if self._vectorized_environment_type == VectorizedEnvironmentType.SUBPROCESS:
+            vectorized_environment = SubprocVecEnv(environment_factories)
+        else:
+            vectorized_environment = DummyVecEnv(environment_factories)
+
+        # Create directories for models and logs
+        os.makedirs(self._models_directory, exist_ok=True)
+        os.makedirs(self._checkpoints_directory, exist_ok=True)
+        os.makedirs(self._tensorboard_directory, exist_ok=True)
+
+        # Load existing model or create new one
+        if self._resume_from_model is not None:
+            # Restore the normalizer statistics onto the raw environment before attaching the model
+            normalizer_path = self._resume_from_model.replace("robot_policy", "normalizer") + ".pkl"
+            if os.path.exists(normalizer_path):
+                print(f"Loading normalizer from: {normalizer_path}")
+                self._environment = VecNormalize.load(normalizer_path, vectorized_environment)
+                print("Normalizer loaded successfully!")
+            else:
+                self._environment = VecNormalize(vectorized_environment, norm_obs=True, norm_reward=True)
+
+            print(f"Loading model from: {self._resume_from_model}")
+            # Off-policy models reopen the replay buffer stored under this output directory
+            custom_objects: dict = {}
+            if self._training_algorithm != TrainingAlgorithm.PPO and not self._use_goal_relabeling:
+                custom_objects.update(self._create_replay_buffer_arguments(resume_existing=True))
+
+            self._model = self._get_algorithm_class().load(
+                self._resume_from_model,
+                env=self._environment,
+                tensorboard_log=self._tensorboard_directory,
+                custom_objects=custom_objects
+            )
+            print("Model loaded successfully!")
+        else:
+            self._environment = VecNormalize(
+                vectorized_environment,
+                norm_obs=True,
+                norm_reward=True
+            )
+
+            self._model = self._create_model()
+
+        if self._use_model_based_rollouts:
+            from .training_callbacks import DynaRolloutCallback
+            from ..environments.unity_robot_environment import UnityRobotEnvironment
+            from ..services.dynamics_ensemble_service import DynamicsEnsembleService
+
+            observation_dimension: int = self._environment.observation_space.shape[0]
+            # With observation history the newest stacked entry (plus its deltas) comes last
+            entry_dimension: int = UnityRobotEnvironment.OBSERVATION_DIMENSION * (
+                2 if self._include_observation_deltas else 1)
+
+            self._dyna_rollout_callback = DynaRolloutCallback(
+                DynamicsEnsembleService(observation_dimension, self._environment.action_space.shape[0]),
+                model_training_interval=self.DYNAMICS_MODEL_TRAINING_INTERVAL,
+                rollout_horizon=self._training_configuration.imagined_rollout_horizon,
+                termination_function=partial(
+                    UnityRobotEnvironment.predict_terminations,
+                    latest_entry_start=observation_dimension - entry_dimension))
+
+    def execute_behavior_cloning_pretraining(self, number_of_trajectories: int) -> None:
+        """Pretrain the PPO actor on inverse-kinematics reaching demonstrations."""
+        import numpy as np
+        import torch
+        from ..services.demonstration_service import DemonstrationService
+
+        if self._training_algorithm != TrainingAlgorithm.PPO:
+            raise ValueError("Behavior cloning pretraining requires PPO")
+
+        if self._observation_history_length > 1 or self._include_observation_deltas:
+            raise ValueError("Behavior cloning demonstrations are single observations without history")
+
+        kinematics_service = self._calibrate_kinematics()
+        joint_angle_limits = np.array(self._environment.get_attr("JOINT_ANGLE_LIMITS")[0])
+
+        demonstrations = DemonstrationService(kinematics_service, joint_angle_limits).generate(
+            number_of_trajectories)
+        observations = demonstrations["observations"]
+        actions = demonstrations["actions"]
+        print(f"Generated {int(demonstrations['episode_starts'].sum())} demonstrations "
+              f"({len(observations)} steps)")
+
+        # Seed the observation normalizer with the demonstration states
+        self._environment.obs_rms.update(observations)
+        normalized_observations = self._environment.normalize_obs(observations)
+
+        policy = self._model.policy
+        policy.set_training_mode(True)
+        observation_tensor = torch.as_tensor(normalized_observations, dtype=torch.float32, device=policy.device)
+        action_tensor = torch.as_tensor(actions, dtype=torch.float32, device=policy.device)
+
+        for epoch in range(self.BEHAVIOR_CLONING_EPOCHS):
+            permutation = torch.randperm(len(observation_tensor), device=policy.device)
+            epoch_losses = []
+
+            for batch_start in range(0, len(permutation), self.BEHAVIOR_CLONING_BATCH_SIZE):
+                batch_indices = permutation[batch_start:batch_start + self.BEHAVIOR_CLONING_BATCH_SIZE]
+
+                # Match the distribution mean only, leaving the exploration std untouched
+                distribution = policy.get_distribution(observation_tensor[batch_indices])
+                predicted_actions = distribution.distribution.mean
+                loss = torch.nn.functional.mse_loss(predicted_actions, action_tensor[batch_indices])
+
+                policy.optimizer.zero_grad()
+                loss.backward()
+                torch.nn.utils.clip_grad_norm_(policy.parameters(), self._model.max_grad_norm)
+                policy.optimizer.step()
+                epoch_losses.append(loss.item())
+
+            print(f"Behavior cloning epoch {epoch + 1}/{self.BEHAVIOR_CLONING_EPOCHS}: "
+                  f"loss={np.mean(epoch_losses):.4f}")
+
+        policy.set_training_mode(False)
+
+    def execute_curriculum_training(self) -> None:
+        """Execute curriculum learning through all phases."""
+        from stable_baselines3.common.callbacks import CheckpointCallback
+
+        checkpoint_callback: CheckpointCallback = CheckpointCallback(
+            save_freq=self.CHECKPOINT_FREQUENCY,
+            save_path=self._checkpoints_directory,
+            name_prefix="robot_policy",
+            save_vecnormalize=True
+        )
+
+        for phase in self._curriculum_phases:
+            print(f"\n{'=' * 60}")
+            print(f"CURRICULUM PHASE: {phase.name}")
+            print(f"Training Steps: {phase.training_steps}")
+            print(f"{'=' * 60}\n")
+
+            if self._use_asynchronous_training:
+                self._learn_asynchronously(phase.training_steps)
+            else:
+                self._model.learn(
+                    total_timesteps=phase.training_steps,
+                    callback=self._add_dyna_callback(checkpoint_callback),
+                    reset_num_timesteps=False
+                )
+
+            self.save_policy(phase.name)
+            self._export_policy(os.path.join(self._models_directory, f"robot_policy_{phase.name}.npz"))
+
+            print(f"Phase '{phase.name}' completed. Model saved.")
+
+    def execute_training_steps(self, total_timesteps: int) -> dict:
+        """Train for a fixed number of steps and report recent episode outcomes.
+
+        Returns:
+            Dictionary with "success_rate", "mean_return" and "episode_count"
+            over the episodes finished during this call, plus its
+            "wall_seconds", "collection_steps_per_second" and
+            "update_time_fraction".
+        """
+        from stable_baselines3.common.callbacks import CallbackList
+        from .training_callbacks import SuccessRateCallback, ThroughputTimingCallback
+
+        success_rate_callback: SuccessRateCallback = SuccessRateCallback()
+        throughput_timing_callback: ThroughputTimingCallback = ThroughputTimingCallback()
+
+        self._model.learn(
+            total_timesteps=total_timesteps,
+            callback=self._add_dyna_callback(CallbackList([success_rate_callback, throughput_timing_callback])),
+            reset_num_timesteps=False
+        )
+
+        return {
+            "success_rate": success_rate_callback.success_rate,
+            "mean_return": success_rate_callback.mean_return,
+            "episode_count": success_rate_callback.finished_episode_count,
+            "wall_seconds": throughput_timing_callback.wall_seconds,
+            "collection_steps_per_second": throughput_timing_callback.collection_steps_per_second,
+            "update_time_fraction": throughput_timing_callback.update_time_fraction
+        }
+
+    def _add_dyna_callback(self, callback):
+        """Chain the imagined-rollout callback after the given one when model-based rollouts are enabled."""
+        from stable_baselines3.common.callbacks import CallbackList
+
+        if self._dyna_rollout_callback is None:
+            return callback
+
+        return CallbackList([callback, self._dyna_rollout_callback])
+
+    def save_policy(self, name: str) -> str:
+        """Save the model and its normalizer under models/ and return the model path.
+
+        Off-policy replay buffers live on disk already; they are only flushed.
+        """
+        model_save_path: str = os.path.join(self._models_directory, f"robot_policy_{name}")
+        normalizer_save_path: str = os.path.join(self._models_directory, f"normalizer_{name}.pkl")
+
+        self._model.save(model_save_path)
+        self._environment.save(normalizer_save_path)
+
+        self._flush_replay_buffer()
+
+        return model_save_path
+
+    def _learn_asynchronously(self, total_timesteps: int) -> None:
+        """Train while a rollout actor thread keeps the simulator stepping.
+
+        The actor acts with a NumPy snapshot of the policy and queues short
+        segments; the learner corrects them with V-trace, updates, and
+        broadcasts a fresh snapshot after every segment. With a rollout
+        server port, remote workers feed the same queue and receive the
+        snapshot (plus normalization statistics) with their acknowledgements.
+        """
+        import queue
+        from ..services.asynchronous_learner_service import AsynchronousLearnerService
+        from ..services.rollout_actor_service import RolloutActorService
+        from ..services.rollout_server_service import RolloutServerService
+
+        # Learner, queue and server outlive a phase so remote workers stay connected
+        if self._asynchronous_learner is None:
+            self._asynchronous_learner = AsynchronousLearnerService(self._model, normalizer=self._environment)
+            self._segment_queue = queue.Queue(maxsize=self.ASYNCHRONOUS_QUEUED_SEGMENTS)
+
+        learner = self._asynchronous_learner
+        actor = RolloutActorService(
+            self._environment,
+            segment_steps=self.ASYNCHRONOUS_SEGMENT_STEPS,
+            segment_queue=self._segment_queue
+        )
+        self._broadcast_policy(actor)
+
+        if self._rollout_server_port is not None and self._rollout_server is None:
+            self._rollout_server = RolloutServerService(
+                self._segment_queue, port=self._rollout_server_port, environment_options=self.environment_options)
+            self._broadcast_policy(None)
+            self._rollout_server.start()
+
+        target_timesteps: int = self._model.num_timesteps + total_timesteps
+        next_checkpoint_timesteps: int = (
+            self._model.num_timesteps // self.CHECKPOINT_FREQUENCY + 1) * self.CHECKPOINT_FREQUENCY
+
+        actor.start()
+
+        try:
+            while self._model.num_timesteps < target_timesteps:
+                try:
+                    segment = self._segment_queue.get(timeout=1.0)
+                except queue.Empty:
+                    actor.raise_if_failed()
+                    continue
+
+                statistics = learner.train_on_segment(segment)
+                self._broadcast_policy(actor)
+
+                if learner.policy_version % self.ASYNCHRONOUS_LOG_INTERVAL == 0:
+                    remote_text: str = ""
+                    if self._rollout_server is not None:
+                        remote_text = (f", remote workers={self._rollout_server.connected_worker_count} "
+                                       f"({self._rollout_server.received_segment_count} segments)")
+
+                    print(f"Async update {learner.policy_version}: steps={self._model.num_timesteps}, "
+                          f"lag={statistics['policy_lag']:.0f}, "
+                          f"rho={statistics['mean_importance_weight']:.3f}, "
+                          f"value_loss={statistics['value_loss']:.4f}, "
+                          f"episodes={actor.finished_episode_count} "
+                          f"(success {actor.successful_episode_count}), "
+                          f"simulator busy {actor.environment_busy_fraction:.0%}{remote_text}")
+
+                if self._model.num_timesteps >= next_checkpoint_timesteps:
+                    checkpoint_path: str = os.path.join(
+                        self._checkpoints_directory, f"robot_policy_{self._model.num_timesteps}_steps")
+                    self._model.save(checkpoint_path)
+                    self._environment.save(os.path.join(
+                        self._checkpoints_directory,
+                        f"robot_policy_vecnormalize_{self._model.num_timesteps}_steps.pkl"))
+                    next_checkpoint_timesteps += self.CHECKPOINT_FREQUENCY
+        finally:
+            actor.stop()
+
+    def _broadcast_policy(self, actor) -> None:
+        """Hand the learner's current weights to the local actor and remote workers."""
+        learner = self._asynchronous_learner
+
+        if actor is not None:
+            actor.set_policy(learner.create_policy_snapshot(), learner.policy_version)
+
+        if self._rollout_server is not None:
+            self._rollout_server.publish_policy(
+                learner.create_policy_snapshot(include_normalization=True).parameters,
+                learner.policy_version)
+
+    def shutdown(self) -> None:
+        """Shutdown training and close environment."""
+        if self._rollout_server is not None:
+            self._rollout_server.stop()
+
+        self._flush_replay_buffer()
+
+        if self._environment is not None:
+            self._environment.close()
+
+    def _flush_replay_buffer(self) -> None:
+        """Persist a disk-backed replay buffer; in-memory buffers (hindsight relabeling) are not kept."""
+        replay_buffer = getattr(self._model, "replay_buffer", None)
+
+        if hasattr(replay_buffer, "flush"):
+            replay_buffer.flush()
+
+    def _export_policy(self, output_path: str) -> None:
+        """Export the current actor and normalizer for torch-free inference."""
+        from ..services.policy_export_service import PolicyExportService
+
+        try:
+            PolicyExportService().export_policy(self._model.policy, self._environment, output_path)
+        except ValueError as export_error:
+            print(f"Policy export skipped: {export_error}")
+
+    def _calibrate_kinematics(self):
+        """Fit the forward kinematics model to joint angles and TCP positions seen under random motion."""
+        import numpy as np
+        from ..services.kinematics_service import KinematicsService
+
+        joint_angle_samples = []
+        position_samples = []
+        self._environment.reset()
+
+        for _ in range(self.KINEMATICS_CALIBRATION_STEPS):
+            random_actions = np.random.uniform(
+                -self.CALIBRATION_ACTION_MAGNITUDE,
+                self.CALIBRATION_ACTION_MAGNITUDE,
+                size=(self._environment.num_envs, self._environment.action_space.shape[0]))
+            self._environment.step(random_actions)
+
+            for observation in self._environment.get_attr("last_observation"):
+                joint_angle_samples.append(observation.joint_angles)
+                position_samples.append(observation.tool_center_point_position)
+
+        kinematics_service = KinematicsService(
+            joint_rotation_axes=KinematicsService.JOINT_ROTATION_AXES[:len(joint_angle_samples[0])])
+        calibration_error = kinematics_service.calibrate(
+            np.array(joint_angle_samples), np.array(position_samples))
+        print(f"Kinematics calibrated: RMS error {calibration_error * 1000:.1f} mm")
+
+        return kinematics_service
+
+    def _create_model(self):
+        """Create a new model for the selected algorithm from the training configuration."""
+        import numpy as np
+
+        configuration: TrainingConfigurationModel = self._training_configuration
+        common_arguments: dict = dict(
+            policy="MultiInputPolicy" if self._use_goal_relabeling else "MlpPolicy",
+            env=self._environment,
+            learning_rate=configuration.learning_rate,
+            batch_size=configuration.batch_size,
+            gamma=configuration.discount_factor,
+            policy_kwargs=dict(net_arch=list(configuration.network_layer_sizes)),
+            verbose=1,
+            tensorboard_log=self._tensorboard_directory
+        )
+
+        if self._training_algorithm == TrainingAlgorithm.PPO:
+            return self._get_algorithm_class()(
+                n_steps=configuration.steps_per_update,
+                n_epochs=configuration.training_epochs,
+                gae_lambda=configuration.gae_lambda,
+                clip_range=configuration.clip_range,
+                ent_coef=configuration.entropy_coefficient,
+                **common_arguments
+            )
+
+        off_policy_arguments: dict = dict(
+            buffer_size=configuration.replay_buffer_size,
+            learning_starts=configuration.learning_starts,
+            **self._create_replay_buffer_arguments(resume_existing=False)
+        )
+
+        if self._use_goal_relabeling:
+            from stable_baselines3 import HerReplayBuffer
+
+            # Info dictionaries are kept so relabeled rewards still include collision penalties
+            off_policy_arguments["replay_buffer_class"] = HerReplayBuffer
+            off_policy_arguments["replay_buffer_kwargs"] = dict(
+                n_sampled_goal=self.HINDSIGHT_GOALS_PER_TRANSITION,
+                goal_selection_strategy=self.HINDSIGHT_GOAL_SELECTION_STRATEGY,
+                copy_info_dict=True
+            )
+
+        if self._training_algorithm == TrainingAlgorithm.TD3:
+            from stable_baselines3.common.noise import NormalActionNoise
+
+            action_dimension: int = self._environment.action_space.shape[0]
+            off_policy_arguments["action_noise"] = NormalActionNoise(
+                mean=np.zeros(action_dimension),
+                sigma=self.TD3_ACTION_NOISE_STANDARD_DEVIATION * np.ones(action_dimension))
+
+        return self._get_algorithm_class()(**off_policy_arguments, **common_arguments)
+
+    def _create_replay_buffer_arguments(self, resume_existing: bool) -> dict:
+        """Disk-backed replay buffer class and arguments, mixing in imagined transitions if enabled."""
+        from .dyna_replay_buffer import DynaReplayBuffer
+        from .memory_mapped_replay_buffer import MemoryMappedReplayBuffer
+
+        replay_buffer_kwargs: dict = dict(
+            storage_directory=self._replay_buffer_directory, resume_existing=resume_existing)
+
+        if not self._use_model_based_rollouts:
+            return dict(replay_buffer_class=MemoryMappedReplayBuffer, replay_buffer_kwargs=replay_buffer_kwargs)
+
+        replay_buffer_kwargs["synthetic_fraction"] = self._training_configuration.synthetic_data_fraction
+
+        return dict(replay_buffer_class=DynaReplayBuffer, replay_buffer_kwargs=replay_buffer_kwargs)
+
+    def _get_algorithm_class(self):
+        """Stable-Baselines3 class implementing the selected algorithm."""
+        from stable_baselines3 import PPO, SAC, TD3
+
+        return {
+            TrainingAlgorithm.PPO: PPO,
+            TrainingAlgorithm.SAC: SAC,
+            TrainingAlgorithm.TD3: TD3
+        }[self._training_algorithm]
+
+    @property
+    def environment_options(self) -> dict:
+        """Options that shape the environment, shared with remote rollout workers."""
+        return {
+            "MaximumEpisodeSteps": self.MAXIMUM_EPISODE_STEPS,
+            "ActionSafetyFilter": self._use_action_safety_filter,
+            "GoalConditioned": self._use_goal_relabeling,
+            "ContinuingTask": self._use_continuing_targets,
+            "TargetScheduler": self._use_target_scheduler,
+            "ObservationHistoryLength": self._observation_history_length,
+            "ObservationDeltas": self._include_observation_deltas
+        }
+
+    def _create_environment(self, server_address: str):
+        """Factory method for creating an environment connected to one simulator."""
+        return self.create_configured_environment(server_address, self.environment_options)
+
+    @staticmethod
+    def create_configured_environment(server_address: str, environment_options: dict):
+        """Environment connected to one simulator and built from environment_options."""
+        from ..environments.unity_robot_environment import UnityRobotEnvironment
+        from ..services.action_safety_service import ActionSafetyService
+        from ..services.target_scheduler_service import TargetSchedulerService
+
+        action_safety_service = ActionSafetyService() if environment_options["ActionSafetyFilter"] else None
+        target_scheduler = TargetSchedulerService() if environment_options["TargetScheduler"] else None
+
+        environment = UnityRobotEnvironment(
+            server_address=server_address,
+            maximum_episode_steps=environment_options["MaximumEpisodeSteps"],
+            action_safety_service=action_safety_service,
+            goal_conditioned=environment_options["GoalConditioned"],
+            continuing_task=environment_options["ContinuingTask"],
+            target_scheduler=target_scheduler
+        )
+
+        observation_history_length: int = environment_options["ObservationHistoryLength"]
+        if observation_history_length > 1 or environment_options["ObservationDeltas"]:
+            from ..environments.observation_history_wrapper import ObservationHistoryWrapper
+
+            return ObservationHistoryWrapper(
+                environment, observation_history_length, include_deltas=environment_options["ObservationDeltas"])
+
+        return environment
+
+    def _create_curriculum_phases(self) -> List[CurriculumPhase]:
+        """Define curriculum learning phases."""
+        return [
+            CurriculumPhase(name="touch", training_steps=100_000, reward_threshold=50.0),
+            CurriculumPhase(name="grasp", training_steps=200_000, reward_threshold=100.0),
+            CurriculumPhase(name="pick_and_place", training_steps=500_000, reward_threshold=200.0)
+        ]
@@ -0,0 +1,99 @@
+"""Distill a trained policy into a small student network for real-time inference."""
+
+import os
+import argparse
+
+from .controllers.distillation_controller import DistillationController
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Distill a robot arm policy into a smaller network")
+    parser.add_argument(
+        "teacher_path",
+        type=str,
+        help="Trained policy (.zip model or .npz export, e.g. ./models/robot_policy_pick_and_place)"
+    )
+    parser.add_argument(
+        "--states",
+        type=str,
+        default="./models/distillation_states.npz",
+        help="State dataset; recorded with the teacher first if the file does not exist"
+    )
+    parser.add_argument(
+        "--record-episodes",
+        type=int,
+        default=DistillationController.DEFAULT_RECORDING_EPISODES,
+        help="Teacher episodes to record when the state dataset is missing"
+    )
+    parser.add_argument(
+        "--hidden-layers",
+        type=int,
+        nargs="+",
+        default=[64, 64],
+        help="Student hidden layer sizes"
+    )
+    parser.add_argument(
+        "--output-path",
+        type=str,
+        default=None,
+        help="Destination .npz file (default: teacher path with _student.npz)"
+    )
+    parser.add_argument(
+        "--ports",
+        type=int,
+        nargs="+",
+        default=[5555],
+        help="Simulator ports; the first one is used for recording"
+    )
+    parser.add_argument(
+        "--evaluation-episodes",
+        type=int,
+        default=20,
+        help="Deterministic episodes per policy for the success parity check (0 to skip)"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for policy distillation."""
+    args = parse_arguments()
+
+    distillation_controller: DistillationController = DistillationController(
+        args.teacher_path,
+        server_address=f"tcp://localhost:{args.ports[0]}"
+    )
+
+    if not os.path.exists(args.states):
+        print(f"Recording {args.record_episodes} teacher episodes to {args.states}...")
+        distillation_controller.record_states(args.record_episodes, args.states)
+
+    student_path, statistics = distillation_controller.distill(
+        args.states, output_path=args.output_path, hidden_layer_sizes=args.hidden_layers)
+
+    print(f"\nExported student to: {student_path}")
+    print(f"Action error (held-out states): mean {statistics['mean_absolute_action_error']:.4f}, "
+          f"max {statistics['maximum_absolute_action_error']:.4f}")
+    print(f"Parameters: teacher {statistics['teacher_parameter_bytes'] / 1024:.1f} KiB, "
+          f"student {statistics['student_parameter_bytes'] / 1024:.1f} KiB")
+    print(f"Inference: teacher {statistics['teacher_inference_microseconds']:.1f} us, "
+          f"student {statistics['student_inference_microseconds']:.1f} us")
+
+    if args.evaluation_episodes > 0:
+        results = distillation_controller.evaluate_parity(
+            student_path,
+            server_ports=args.ports,
+            episodes=args.evaluation_episodes,
+            cache_path=os.path.join(os.path.dirname(os.path.abspath(student_path)), "distillation_evaluation.json")
+        )
+
+        for role in ("teacher", "student"):
+            result = results[role]
+            if result is None:
+                print(f"{role.capitalize()} evaluation failed")
+            else:
+                print(f"{role.capitalize()} success: {result.success_rate:.0%}, return {result.mean_return:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+from .command_type import CommandType
+from .training_algorithm import TrainingAlgorithm
+from .vectorized_environment_type import VectorizedEnvironmentType
+
+__all__ = ["CommandType", "TrainingAlgorithm", "VectorizedEnvironmentType"]
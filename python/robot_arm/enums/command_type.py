@@ -5,3 +5,5 @@ class CommandType(Enum):
     STEP = "STEP"
     RESET = "RESET"
     CONFIGURATION = "CONFIG"
+    NEW_TARGET = "NEW_TARGET"
+    SET_TARGET = "SET_TARGET"
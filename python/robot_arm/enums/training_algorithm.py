@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class TrainingAlgorithm(Enum):
+    PPO = "ppo"
+    SAC = "sac"
+    TD3 = "td3"
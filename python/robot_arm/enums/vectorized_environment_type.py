@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class VectorizedEnvironmentType(Enum):
+    DUMMY = "dummy"
+    SUBPROCESS = "subprocess"
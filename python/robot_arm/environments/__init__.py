@@ -0,0 +1,17 @@
+# Environments package - lazy imports to avoid dependency issues during testing
+import importlib
+
+_MODULE_NAMES = {
+    "UnityRobotEnvironment": "unity_robot_environment",
+    "ObservationHistoryWrapper": "observation_history_wrapper"
+}
+
+__all__ = list(_MODULE_NAMES)
+
+
+def __getattr__(name):
+    """Import the environment's module on first access."""
+    if name not in _MODULE_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(f"{__name__}.{_MODULE_NAMES[name]}"), name)
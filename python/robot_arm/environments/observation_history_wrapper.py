@@ -0,0 +1,91 @@
+import numpy as np
+import gymnasium as gym
+from gymnasium import spaces
+from typing import Any, Dict, Optional, Tuple
+
+
+class ObservationHistoryWrapper(gym.ObservationWrapper):
+    """Stacks the last history_length observations of a Box environment.
+
+    Entries live in a preallocated ring of 2 * history_length rows and every
+    entry is written twice, at slot i and i + history_length. The stacked
+    observation is then always one contiguous slice of the ring, oldest
+    first, so a step costs O(observation size) for any history length.
+    With include_deltas each entry also carries its change from the
+    previous observation, giving the policy per-field velocities.
+
+    The returned array is a view into the ring and is overwritten by later
+    steps; vectorized environments copy it into their own buffers, and
+    VecNormalize then normalizes every stacked position separately. Each
+    reset switches to a second ring, so the terminal observation a
+    vectorized environment keeps across its automatic reset stays intact.
+    """
+
+    def __init__(self, environment: gym.Env, history_length: int, include_deltas: bool = False) -> None:
+        super().__init__(environment)
+
+        if not isinstance(environment.observation_space, spaces.Box):
+            raise ValueError("Observation history needs a Box observation space")
+        if history_length < 1:
+            raise ValueError("history_length must be at least 1")
+
+        base_space: spaces.Box = environment.observation_space
+        low: np.ndarray = base_space.low.reshape(-1).astype(np.float32)
+        high: np.ndarray = base_space.high.reshape(-1).astype(np.float32)
+
+        if include_deltas:
+            low, high = np.concatenate([low, low - high]), np.concatenate([high, high - low])
+
+        self._history_length: int = history_length
+        self._include_deltas: bool = include_deltas
+        self._observation_dimension: int = base_space.shape[0]
+        self._rings: Tuple[np.ndarray, np.ndarray] = (
+            np.zeros((2 * history_length, len(low)), dtype=np.float32),
+            np.zeros((2 * history_length, len(low)), dtype=np.float32))
+        self._history: np.ndarray = self._rings[0]
+        self._write_index: int = 0
+
+        self.observation_space = spaces.Box(
+            low=np.tile(low, history_length), high=np.tile(high, history_length), dtype=np.float32)
+
+    @property
+    def history_length(self) -> int:
+        """Number of stacked entries."""
+        return self._history_length
+
+    def reset(
+        self,
+        *,
+        seed: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[np.ndarray, dict]:
+        """Reset and fill the whole history with the first observation (zero deltas)."""
+        observation, information = self.env.reset(seed=seed, options=options)
+
+        self._history = self._rings[1] if self._history is self._rings[0] else self._rings[0]
+        self._history[:, :self._observation_dimension] = observation
+        self._history[:, self._observation_dimension:] = 0.0
+        self._write_index = 0
+
+        return self._stacked_view(), information
+
+    def observation(self, observation: np.ndarray) -> np.ndarray:
+        """Append one observation to the ring and return the stacked view."""
+        newest_row: np.ndarray = self._history[(self._write_index - 1) % self._history_length]
+        mirror_index: int = self._write_index + self._history_length
+
+        if self._include_deltas:
+            delta: np.ndarray = observation - newest_row[:self._observation_dimension]
+            self._history[self._write_index, self._observation_dimension:] = delta
+            self._history[mirror_index, self._observation_dimension:] = delta
+
+        self._history[self._write_index, :self._observation_dimension] = observation
+        self._history[mirror_index, :self._observation_dimension] = observation
+        self._write_index = (self._write_index + 1) % self._history_length
+
+        return self._stacked_view()
+
+    def _stacked_view(self) -> np.ndarray:
+        """Flat view of the history_length newest entries, oldest first."""
+        # The newest entry was mirrored to write_index + history_length - 1, which ends the window
+        return self._history[self._write_index:self._write_index + self._history_length].reshape(-1)
@@ -0,0 +1,478 @@
+import numpy as np
+import gymnasium as gym
+from gymnasium import spaces
+from typing import Tuple, Dict, Any, Optional, Sequence, Union
+
+from ..models.command_model import CommandModel
+from ..models.observation_model import ObservationModel
+from ..enums.command_type import CommandType
+from ..services.network_service import NetworkService
+from ..services.reward_calculation_service import RewardCalculationService
+from ..services.action_safety_service import ActionSafetyService
+from ..services.target_scheduler_service import TargetSchedulerService
+
+
+class UnityRobotEnvironment(gym.Env):
+    """Gymnasium environment for Unity 6-DOF robot simulation.
+
+    In goal-conditioned mode observations are dictionaries with the TCP
+    position as achieved_goal and the target position as desired_goal, and
+    rewards come from compute_reward so they can be recomputed for
+    substitute goals (hindsight relabeling).
+
+    In continuing-task mode reaching the target spawns a new one without
+    resetting the arm, so one reset yields many reach attempts. With a
+    target scheduler, every target is placed from Python via SET_TARGET and
+    its outcome is reported back to the scheduler.
+    """
+
+    OBSERVATION_DIMENSION: int = 17
+    GOAL_DIMENSION: int = 3
+    # Goal-conditioned observations drop the direction to the target, which depends on the goal
+    DIRECTION_TO_TARGET_INDICES: slice = slice(10, 13)
+    TOOL_CENTER_POINT_HEIGHT_INDEX: int = 8
+    GOAL_OBSERVATION_DIMENSION: int = OBSERVATION_DIMENSION - 3
+    ACTION_DIMENSION: int = 7
+    MAXIMUM_DELTA_DEGREES: float = 10.0
+    GRIPPER_CLOSE_THRESHOLD: float = 0.5
+    DEFAULT_MAXIMUM_EPISODE_STEPS: int = 500
+
+    # Joint angle limits for normalization (6 joints)
+    JOINT_ANGLE_LIMITS: np.ndarray = np.array([90.0, 90.0, 90.0, 180.0, 90.0, 90.0])
+    WORKSPACE_RADIUS_METERS: float = 0.6
+    LASER_MAXIMUM_RANGE_METERS: float = 1.0
+
+    metadata: Dict[str, Any] = {"render_modes": ["human"], "render_fps": 50}
+
+    def __init__(
+        self,
+        server_address: str = "tcp://localhost:5555",
+        maximum_episode_steps: int = DEFAULT_MAXIMUM_EPISODE_STEPS,
+        render_mode: Optional[str] = None,
+        action_safety_service: Optional[ActionSafetyService] = None,
+        goal_conditioned: bool = False,
+        continuing_task: bool = False,
+        target_scheduler: Optional[TargetSchedulerService] = None
+    ) -> None:
+        super().__init__()
+
+        self._server_address: str = server_address
+        self._maximum_episode_steps: int = maximum_episode_steps
+        self._render_mode: Optional[str] = render_mode
+        self._current_step_count: int = 0
+        self._num_joints: Optional[int] = None  # Will be detected on first reset
+        self._action_safety_service: Optional[ActionSafetyService] = action_safety_service
+        self._current_joint_angles: Optional[np.ndarray] = None
+        self._last_observation_model: Optional[ObservationModel] = None
+        self._is_goal_conditioned: bool = goal_conditioned
+        self._is_continuing_task: bool = continuing_task
+        self._targets_reached_count: int = 0
+        self._target_scheduler: Optional[TargetSchedulerService] = target_scheduler
+        self._scheduled_target_position: Optional[np.ndarray] = None
+        self._is_scheduled_target_reached: bool = False
+        
+        # Logging stats
+        self._episode_count: int = 0
+        self._log_frequency: int = 50
+        self._stats: Dict[str, int] = {
+            "success": 0,
+            "collision": 0,
+            "underground": 0,
+            "timeout": 0
+        }
+
+        # Parse server address (format: "tcp://host:port")
+        host, port = self._parse_server_address(server_address)
+        self._network_service: NetworkService = NetworkService(host, port)
+        self._reward_calculation_service: RewardCalculationService = RewardCalculationService()
+
+        # 17-dimensional observation space (normalized to [-1, 1])
+        self.observation_space: spaces.Space = spaces.Box(
+            low=-1.0,
+            high=1.0,
+            shape=(self.OBSERVATION_DIMENSION,),
+            dtype=np.float32
+        )
+
+        if goal_conditioned:
+            # Goals are positions in meters so the success threshold applies directly
+            goal_space: spaces.Box = spaces.Box(
+                low=-np.inf, high=np.inf, shape=(self.GOAL_DIMENSION,), dtype=np.float32)
+            self.observation_space = spaces.Dict({
+                "observation": spaces.Box(
+                    low=-1.0, high=1.0, shape=(self.GOAL_OBSERVATION_DIMENSION,), dtype=np.float32),
+                "achieved_goal": goal_space,
+                "desired_goal": goal_space
+            })
+
+        # 7-dimensional action space: 5 continuous joint deltas + 1 axis6 orientation + 1 gripper
+        self.action_space: spaces.Box = spaces.Box(
+            low=-1.0,
+            high=1.0,
+            shape=(self.ACTION_DIMENSION,),
+            dtype=np.float32
+        )
+
+        self._network_service.connect()
+
+    @property
+    def last_observation(self) -> Optional[ObservationModel]:
+        """Raw observation received from Unity on the last step or reset."""
+        return self._last_observation_model
+
+    def step(
+        self,
+        action: np.ndarray
+    ) -> Tuple[Union[np.ndarray, Dict[str, np.ndarray]], float, bool, bool, Dict[str, Any]]:
+        """Execute one environment step."""
+        self._current_step_count += 1
+
+        num_action_joints = min(5, self._num_joints) if self._num_joints else 5
+        scaled_joint_deltas: np.ndarray = action[:num_action_joints] * self.MAXIMUM_DELTA_DEGREES
+
+        axis_6_orientation: float = 0.0 if action[5] < 0 else 1.0
+        gripper_action_value: float = float(action[6])
+
+        is_action_filtered: bool = False
+        if self._action_safety_service is not None and self._current_joint_angles is not None:
+            scaled_joint_deltas, is_action_filtered = self._filter_joint_deltas(
+                scaled_joint_deltas, axis_6_orientation)
+
+        step_command: CommandModel = CommandModel(
+            command_type=CommandType.STEP,
+            actions=scaled_joint_deltas.tolist(),
+            axis_6_orientation=axis_6_orientation,
+            gripper_close_value=gripper_action_value
+        )
+
+        observation_model: ObservationModel = self._network_service.send_command(step_command)
+        self._record_joint_state(observation_model)
+        normalized_observation: np.ndarray = self._normalize_observation(observation_model)
+
+        reward: float
+        terminated: bool
+        information: Dict[str, Any]
+        reward, terminated, information = self._reward_calculation_service.calculate_reward(
+            observation_model)
+
+        truncated: bool = self._current_step_count >= self._maximum_episode_steps
+
+        if is_action_filtered:
+            information["action_filtered"] = True
+
+        if self._is_goal_conditioned:
+            goal_observation: Dict[str, np.ndarray] = self._build_goal_observation(
+                observation_model, normalized_observation)
+            reward = float(self.compute_reward(
+                goal_observation["achieved_goal"], goal_observation["desired_goal"], information))
+
+        if information.get("success", False):
+            self._is_scheduled_target_reached = True
+
+        if self._is_continuing_task and information.get("success", False) and not (terminated or truncated):
+            observation_model = self._request_new_target()
+            normalized_observation = self._normalize_observation(observation_model)
+            information["new_target"] = True
+
+            if self._is_goal_conditioned:
+                goal_observation = self._build_goal_observation(observation_model, normalized_observation)
+
+        if self._is_continuing_task:
+            self._targets_reached_count += int(information.get("success", False))
+            information["targets_reached"] = self._targets_reached_count
+
+        # Update stats and log summary
+        if terminated or truncated:
+            self._record_scheduled_target_outcome()
+            self._episode_count += 1
+            
+            if information.get("success", False) or self._targets_reached_count > 0:
+                self._stats["success"] += 1
+                # Keep immediate log for success
+                print(f"✅ Episode {self._episode_count}: SUCCESS! (Step {self._current_step_count})")
+            elif information.get("collision", False):
+                self._stats["collision"] += 1
+            elif information.get("underground", False):
+                self._stats["underground"] += 1
+            elif truncated:
+                self._stats["timeout"] += 1
+
+            # Print summary every N episodes
+            if self._episode_count % self._log_frequency == 0:
+                print(f"\n📊 Stats (Last {self._log_frequency} Episodes):")
+                print(f"   ✅ Success: {self._stats['success']}")
+                print(f"   💥 Collisions: {self._stats['collision']}")
+                print(f"   ⚠️ Underground: {self._stats['underground']}")
+                print(f"   ⏱️ Timeouts: {self._stats['timeout']}")
+                print(f"   Total Episodes: {self._episode_count}\n")
+                
+                # Reset stats for next cycle
+                self._stats = {k: 0 for k in self._stats}
+
+        if self._is_goal_conditioned:
+            return goal_observation, reward, terminated, truncated, information
+
+        return normalized_observation, reward, terminated, truncated, information
+
+    def reset(
+        self,
+        seed: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Union[np.ndarray, Dict[str, np.ndarray]], Dict[str, Any]]:
+        """Reset the environment."""
+        super().reset(seed=seed)
+
+        self._current_step_count = 0
+        self._targets_reached_count = 0
+
+        reset_command: CommandModel = CommandModel(command_type=CommandType.RESET)
+        observation_model: ObservationModel = self._network_service.send_command(reset_command)
+
+        if observation_model.joint_angle_limits is not None:
+            self.JOINT_ANGLE_LIMITS = np.array(observation_model.joint_angle_limits)
+
+        self._record_joint_state(observation_model)
+
+        if self._target_scheduler is not None:
+            # Outcomes of episodes abandoned without ending are not counted
+            self._scheduled_target_position = None
+            observation_model = self._send_scheduled_target()
+
+        self._reward_calculation_service.reset_state(observation_model)
+
+        return self._format_observation(observation_model), {}
+
+    def set_target_position(
+        self,
+        target_position: Sequence[float]
+    ) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+        """Move the target to a world position, keeping the arm where it is, and return the new observation."""
+        observation_model: ObservationModel = self._send_target_position(target_position)
+        self._reward_calculation_service.rebaseline_target(observation_model)
+
+        return self._format_observation(observation_model)
+
+    def compute_reward(
+        self,
+        achieved_goal: np.ndarray,
+        desired_goal: np.ndarray,
+        info: Union[Dict[str, Any], Sequence[Dict[str, Any]], None]
+    ) -> np.ndarray:
+        """Reward for reaching achieved_goal when aiming at desired_goal; vectorized over leading axes."""
+        informations: Optional[Sequence[Dict[str, Any]]] = [info] if isinstance(info, dict) else info
+
+        return self._reward_calculation_service.calculate_goal_rewards(achieved_goal, desired_goal, informations)
+
+    @classmethod
+    def predict_terminations(
+        cls,
+        next_observations: np.ndarray,
+        rewards: np.ndarray,
+        latest_entry_start: int = 0
+    ) -> np.ndarray:
+        """Which predicted transitions would end a real episode, for imagined rollouts.
+
+        Applies the reward calculation's rules to model predictions: the TCP
+        below the base, or a reward carrying the collision penalty. With
+        observation history, latest_entry_start is where the newest stacked
+        observation begins.
+
+        Returns:
+            Boolean array, true for terminal transitions.
+        """
+        tool_center_point_heights: np.ndarray = next_observations[
+            :, latest_entry_start + cls.TOOL_CENTER_POINT_HEIGHT_INDEX]
+        # Only the penalty outweighs the other reward components, so half of it marks a collision
+        has_collision_penalty: np.ndarray = rewards <= RewardCalculationService.COLLISION_PENALTY_VALUE / 2.0
+
+        return (tool_center_point_heights < 0.0) | has_collision_penalty
+
+    def close(self) -> None:
+        """Close the environment and disconnect from Unity."""
+        self._network_service.disconnect()
+
+    def set_simulation_mode(self, enable_smooth_movement: bool) -> None:
+        """Switch between training mode (instant) and simulation mode (smooth)."""
+        configuration_command: CommandModel = CommandModel(
+            command_type=CommandType.CONFIGURATION,
+            simulation_mode_enabled=enable_smooth_movement
+        )
+        self._network_service.send_command(configuration_command)
+
+    def _request_new_target(self) -> ObservationModel:
+        """Ask for a new target, placed by the scheduler if there is one, and re-baseline the reward."""
+        if self._target_scheduler is not None:
+            self._record_scheduled_target_outcome()
+            observation_model: ObservationModel = self._send_scheduled_target()
+        else:
+            new_target_command: CommandModel = CommandModel(command_type=CommandType.NEW_TARGET)
+            observation_model = self._network_service.send_command(new_target_command)
+            self._record_joint_state(observation_model)
+
+        self._reward_calculation_service.rebaseline_target(observation_model)
+
+        return observation_model
+
+    def _send_scheduled_target(self) -> ObservationModel:
+        """Place the next target drawn by the scheduler."""
+        self._scheduled_target_position = self._target_scheduler.sample_target()
+        self._is_scheduled_target_reached = False
+
+        return self._send_target_position(self._scheduled_target_position)
+
+    def _send_target_position(self, target_position: Sequence[float]) -> ObservationModel:
+        """Send SET_TARGET and record the resulting state."""
+        set_target_command: CommandModel = CommandModel(
+            command_type=CommandType.SET_TARGET,
+            target_position=[float(coordinate) for coordinate in target_position]
+        )
+        observation_model: ObservationModel = self._network_service.send_command(set_target_command)
+        self._record_joint_state(observation_model)
+
+        return observation_model
+
+    def _record_scheduled_target_outcome(self) -> None:
+        """Report whether the current scheduled target was reached."""
+        if self._target_scheduler is None or self._scheduled_target_position is None:
+            return
+
+        self._target_scheduler.record_outcome(self._scheduled_target_position, self._is_scheduled_target_reached)
+        self._scheduled_target_position = None
+
+    def _parse_server_address(self, address: str) -> Tuple[str, int]:
+        """Parse server address from 'tcp://host:port' format."""
+        if address.startswith("tcp://"):
+            address = address[6:]
+        elif address.startswith("://"):
+            address = address[3:]
+
+        if ":" in address:
+            host, port_str = address.rsplit(":", 1)
+            port = int(port_str)
+        else:
+            host = address
+            port = NetworkService.DEFAULT_PORT
+
+        return host, port
+
+    def _record_joint_state(self, observation: ObservationModel) -> None:
+        """Track current joint angles and feed the safety filter calibration."""
+        self._last_observation_model = observation
+        self._current_joint_angles = np.array(observation.joint_angles, dtype=np.float64)
+
+        if self._action_safety_service is not None:
+            self._action_safety_service.record_observation(
+                observation.joint_angles, observation.tool_center_point_position)
+
+    def _filter_joint_deltas(
+        self,
+        joint_deltas: np.ndarray,
+        axis_6_orientation: float
+    ) -> Tuple[np.ndarray, bool]:
+        """Scale back joint deltas the kinematics model predicts end underground."""
+        next_joint_angles: np.ndarray = self._current_joint_angles.copy()
+
+        # Axis 6 is set directly to 0° (vertical) or 90° (horizontal) by Unity
+        if len(next_joint_angles) >= 6:
+            next_joint_angles[5] = 90.0 * axis_6_orientation
+
+        return self._action_safety_service.filter_joint_deltas(
+            next_joint_angles,
+            joint_deltas,
+            self.JOINT_ANGLE_LIMITS[:len(next_joint_angles)]
+        )
+
+    def _normalize_observation(self, observation: ObservationModel) -> np.ndarray:
+        """Normalize observation to [-1, 1] range."""
+        if self._num_joints is None:
+            self._num_joints = len(observation.joint_angles)
+            print(f"Detected {self._num_joints} joints from Unity")
+
+        joint_angles_array: np.ndarray = np.array(observation.joint_angles)
+        joint_limits = self.JOINT_ANGLE_LIMITS[:self._num_joints]
+        normalized_joint_angles: np.ndarray = joint_angles_array / joint_limits
+
+        if self._num_joints < 6:
+            padding = np.zeros(6 - self._num_joints)
+            normalized_joint_angles = np.concatenate([normalized_joint_angles, padding])
+
+        gripper_state_array: np.ndarray = np.array([observation.gripper_state])
+
+        normalized_tool_position: np.ndarray = (
+            np.array(observation.tool_center_point_position) / self.WORKSPACE_RADIUS_METERS
+        )
+
+        direction_to_target: np.ndarray = np.array(observation.direction_to_target)
+
+        normalized_laser_distance: np.ndarray = np.array([
+            observation.laser_sensor_distance / self.LASER_MAXIMUM_RANGE_METERS
+        ])
+
+        is_gripping_array: np.ndarray = np.array([
+            1.0 if observation.is_gripping_object else 0.0
+        ])
+
+        target_orientation: np.ndarray = np.array(observation.target_orientation_one_hot)
+
+        concatenated_observation: np.ndarray = np.concatenate([
+            normalized_joint_angles,
+            gripper_state_array,
+            normalized_tool_position,
+            direction_to_target,
+            normalized_laser_distance,
+            is_gripping_array,
+            target_orientation
+        ])
+
+        clipped_observation: np.ndarray = np.clip(
+            concatenated_observation, -1.0, 1.0
+        ).astype(np.float32)
+
+        return clipped_observation
+
+    def _format_observation(
+        self,
+        observation_model: ObservationModel
+    ) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+        """Normalized observation in the configured (flat or goal-conditioned) format."""
+        normalized_observation: np.ndarray = self._normalize_observation(observation_model)
+
+        if self._is_goal_conditioned:
+            return self._build_goal_observation(observation_model, normalized_observation)
+
+        return normalized_observation
+
+    def _build_goal_observation(
+        self,
+        observation: ObservationModel,
+        normalized_observation: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Split an observation into goal-independent features, achieved goal and desired goal."""
+        return {
+            "observation": np.delete(normalized_observation, self.DIRECTION_TO_TARGET_INDICES),
+            "achieved_goal": np.array(observation.tool_center_point_position, dtype=np.float32),
+            "desired_goal": self._compute_target_position(observation)
+        }
+
+    def _compute_target_position(self, observation: ObservationModel) -> np.ndarray:
+        """Target position as reported, or reconstructed from direction and distance for older builds."""
+        if observation.target_position is not None:
+            return np.array(observation.target_position, dtype=np.float32)
+
+        return (
+            np.array(observation.tool_center_point_position)
+            + np.array(observation.direction_to_target) * observation.distance_to_target
+        ).astype(np.float32)
+
+    def _determine_reset_reason(self, info: Dict[str, Any], truncated: bool) -> str:
+        """Determine the reason for episode reset based on info dictionary."""
+        if info.get("success", False):
+            return "✅ SUCCESS - Target reached"
+        elif info.get("collision", False):
+            return "💥 COLLISION - Hit environment"
+        elif info.get("underground", False):
+            return "⚠️ UNDERGROUND - TCP below base"
+        elif truncated:
+            return "⏱️ TIMEOUT - Max steps reached"
+        else:
+            return "❓ UNKNOWN"
@@ -0,0 +1,84 @@
+"""Evaluate saved checkpoints in parallel and rank them."""
+
+import os
+import argparse
+
+from .controllers.evaluation_controller import EvaluationController
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Evaluate robot arm checkpoints")
+    parser.add_argument(
+        "checkpoint_paths",
+        type=str,
+        nargs="*",
+        default=["./checkpoints/"],
+        help="Checkpoint files or directories (default: ./checkpoints/)"
+    )
+    parser.add_argument(
+        "--ports",
+        type=int,
+        nargs="+",
+        default=[5555],
+        help="Simulator ports; one worker process is started per port"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="localhost",
+        help="Simulator host"
+    )
+    parser.add_argument(
+        "--episodes",
+        type=int,
+        default=EvaluationController.DEFAULT_EPISODES_PER_CHECKPOINT,
+        help="Deterministic evaluation episodes per checkpoint"
+    )
+    parser.add_argument(
+        "--max-episode-steps",
+        type=int,
+        default=EvaluationController.DEFAULT_MAXIMUM_EPISODE_STEPS,
+        help="Steps before an episode counts as a timeout"
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=str,
+        default=EvaluationController.DEFAULT_CACHE_PATH,
+        help="JSON file caching results by checkpoint content and settings"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for checkpoint evaluation."""
+    args = parse_arguments()
+
+    evaluation_controller: EvaluationController = EvaluationController(
+        server_ports=args.ports,
+        server_host=args.host,
+        episodes_per_checkpoint=args.episodes,
+        maximum_episode_steps=args.max_episode_steps,
+        cache_path=args.cache_path
+    )
+    results = evaluation_controller.evaluate(args.checkpoint_paths)
+
+    print("\n" + "=" * 100)
+    print(f"{'Checkpoint':<44} {'Success':>8} {'Return':>9} {'Steps':>7} "
+          f"{'Collide':>8} {'Under':>6} {'Timeout':>8}")
+    print("=" * 100)
+
+    for result in results:
+        steps_text: str = f"{result.mean_steps_to_target:.1f}" if result.mean_steps_to_target is not None else "-"
+        print(f"{os.path.basename(result.checkpoint_path):<44} {result.success_rate:>8.0%} "
+              f"{result.mean_return:>9.1f} {steps_text:>7} "
+              f"{result.outcome_counts.get('collision', 0):>8} "
+              f"{result.outcome_counts.get('underground', 0):>6} "
+              f"{result.outcome_counts.get('timeout', 0):>8}")
+
+    if results:
+        print(f"\nBest checkpoint: {results[0].checkpoint_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Export a trained PPO policy to a torch-free NumPy .npz file."""
+
+import os
+import argparse
+
+from .services.policy_export_service import PolicyExportService
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Export PPO policy for NumPy inference")
+    parser.add_argument(
+        "model_path",
+        type=str,
+        help="Path to the saved model (e.g., ./models/robot_policy_touch)"
+    )
+    parser.add_argument(
+        "--normalizer-path",
+        type=str,
+        default=None,
+        help="VecNormalize pickle (default: found next to the model by naming convention)"
+    )
+    parser.add_argument(
+        "--output-path",
+        type=str,
+        default=None,
+        help="Destination .npz file (default: model path with .npz extension)"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for policy export."""
+    args = parse_arguments()
+
+    output_path: str = PolicyExportService().export_checkpoint(
+        args.model_path,
+        output_path=args.output_path,
+        normalizer_path=args.normalizer_path
+    )
+
+    print(f"Exported policy to: {output_path} ({os.path.getsize(output_path) / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
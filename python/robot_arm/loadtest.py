@@ -0,0 +1,158 @@
+"""Ramp concurrent training clients against a simulator host and report per-stage latency and errors."""
+
+import argparse
+import json
+
+from .services.load_test_service import LoadTestService
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Load test a simulator host with many concurrent clients")
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=LoadTestService.DEFAULT_HOST,
+        help="Simulator host"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=LoadTestService.DEFAULT_PORT,
+        help="Simulator port"
+    )
+    parser.add_argument(
+        "--mock",
+        action="store_true",
+        help="Start a local mock simulator and test it instead of --host/--port"
+    )
+    parser.add_argument(
+        "--mock-latency-ms",
+        type=float,
+        default=0.0,
+        help="Response latency of the local mock simulator"
+    )
+    parser.add_argument(
+        "--stages",
+        type=int,
+        nargs="+",
+        default=list(LoadTestService.DEFAULT_CONCURRENCY_STAGES),
+        help="Concurrent connections in each stage, in order"
+    )
+    parser.add_argument(
+        "--stage-seconds",
+        type=float,
+        default=LoadTestService.DEFAULT_STAGE_SECONDS,
+        help="Duration of each stage"
+    )
+    parser.add_argument(
+        "--episode-length",
+        type=int,
+        default=LoadTestService.DEFAULT_EPISODE_LENGTH,
+        help="STEP commands between RESETs unless the simulator reports a collision first"
+    )
+    parser.add_argument(
+        "--think-ms",
+        type=float,
+        default=LoadTestService.DEFAULT_THINK_TIME_SECONDS * 1000.0,
+        help="Pause after each response, standing in for policy inference"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=LoadTestService.DEFAULT_TIMEOUT_SECONDS,
+        help="Seconds to wait for a connection or a response before counting a timeout"
+    )
+    parser.add_argument(
+        "--max-p99-ms",
+        type=float,
+        default=LoadTestService.DEFAULT_MAXIMUM_P99_MILLISECONDS,
+        help="p99 latency above which a stage counts as collapsed"
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=LoadTestService.DEFAULT_MAXIMUM_ERROR_RATE,
+        help="Failed command fraction above which a stage counts as collapsed"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for actions and episode offsets"
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        default=None,
+        help="Also write the stage results to this JSON file"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for the load test."""
+    args = parse_arguments()
+
+    mock_simulator = None
+    host: str = args.host
+    port: int = args.port
+    if args.mock:
+        from .services.mock_simulator_service import MockSimulatorService
+
+        mock_simulator = MockSimulatorService(
+            response_latency_seconds=args.mock_latency_ms / 1000.0, episode_length=args.episode_length)
+        host, port = MockSimulatorService.DEFAULT_HOST, mock_simulator.port
+
+    load_test_service: LoadTestService = LoadTestService(
+        host=host,
+        port=port,
+        concurrency_stages=args.stages,
+        stage_seconds=args.stage_seconds,
+        episode_length=args.episode_length,
+        think_time_seconds=args.think_ms / 1000.0,
+        timeout_seconds=args.timeout,
+        seed=args.seed
+    )
+
+    print(f"Load testing {host}:{port} in {len(args.stages)} stage(s) of {args.stage_seconds:g} s")
+    print(f"\n{'Clients':>7} {'Cmd/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Max ms':>8} "
+          f"{'Err %':>6} {'Timeout':>8} {'Conn fail':>9} {'Conn p99':>9}")
+
+    def print_stage(stage_result: dict) -> None:
+        summary: dict = stage_result["commands"]["ALL"]
+        print(f"{stage_result['concurrency']:>7} {summary['commands_per_second']:>9.0f} "
+              f"{summary['p50_milliseconds']:>8.2f} {summary['p95_milliseconds']:>8.2f} "
+              f"{summary['p99_milliseconds']:>8.2f} {summary['maximum_milliseconds']:>8.2f} "
+              f"{summary['error_rate'] * 100.0:>6.2f} {summary['timeouts']:>8.0f} "
+              f"{stage_result['connection_failures']:>9} {stage_result['connect_p99_milliseconds']:>9.2f}")
+
+    try:
+        stage_results = load_test_service.run(progress_callback=print_stage)
+    finally:
+        if mock_simulator is not None:
+            mock_simulator.close()
+
+    capacity: int = LoadTestService.find_capacity(stage_results, args.max_p99_ms, args.max_error_rate)
+    if capacity == 0:
+        print(f"\nEven {args.stages[0]} client(s) exceeded p99 {args.max_p99_ms:g} ms "
+              f"or {args.max_error_rate:.0%} errors")
+    else:
+        print(f"\nServed up to {capacity} concurrent client(s) within p99 {args.max_p99_ms:g} ms "
+              f"and {args.max_error_rate:.0%} errors")
+
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump({
+                "Host": host,
+                "Port": port,
+                "StageSeconds": args.stage_seconds,
+                "EpisodeLength": args.episode_length,
+                "ThinkMilliseconds": args.think_ms,
+                "Capacity": capacity,
+                "Stages": stage_results
+            }, json_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
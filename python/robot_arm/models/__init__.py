@@ -0,0 +1,23 @@
+# Models package - lazy imports keep numpy out of lightweight tools such as the connection probe
+import importlib
+
+_MODULE_NAMES = {
+    "ObservationModel": "observation_model",
+    "CommandModel": "command_model",
+    "RewardComponents": "reward_components",
+    "EvaluationResultModel": "evaluation_result_model",
+    "TrainingConfigurationModel": "training_configuration_model",
+    "RolloutSegmentModel": "rollout_segment_model",
+    "TargetResultModel": "target_result_model",
+    "RunConfigurationModel": "run_configuration_model"
+}
+
+__all__ = list(_MODULE_NAMES)
+
+
+def __getattr__(name):
+    """Import the model's module on first access."""
+    if name not in _MODULE_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(f"{__name__}.{_MODULE_NAMES[name]}"), name)
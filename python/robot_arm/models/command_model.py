@@ -1,10 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional
-import sys
-import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from enums.command_type import CommandType
+from ..enums.command_type import CommandType
 
 
 @dataclass
@@ -19,6 +16,7 @@ class CommandModel:
     gripper_close_value: Optional[float] = None
     axis_6_orientation: Optional[float] = None
     simulation_mode_enabled: Optional[bool] = None
+    target_position: Optional[List[float]] = None
 
     def to_dictionary(self) -> dict:
         """Convert command to dictionary for JSON serialization.
@@ -39,4 +37,7 @@ class CommandModel:
         if self.simulation_mode_enabled is not None:
             result["SimulationModeEnabled"] = self.simulation_mode_enabled
 
+        if self.target_position is not None:
+            result["TargetPosition"] = self.target_position
+
         return result
@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class EvaluationResultModel:
+    """Aggregate outcome of evaluating one checkpoint over several episodes."""
+
+    checkpoint_path: str
+    cache_key: str
+    episode_count: int
+    success_rate: float
+    mean_return: float
+    mean_steps_to_target: Optional[float]
+    outcome_counts: Dict[str, int] = field(default_factory=dict)
+    evaluation_seconds: float = 0.0
+
+    @classmethod
+    def from_dictionary(cls, data: dict) -> "EvaluationResultModel":
+        """Create EvaluationResultModel from a cached JSON dictionary."""
+        return cls(
+            checkpoint_path=data["CheckpointPath"],
+            cache_key=data["CacheKey"],
+            episode_count=data["EpisodeCount"],
+            success_rate=data["SuccessRate"],
+            mean_return=data["MeanReturn"],
+            mean_steps_to_target=data.get("MeanStepsToTarget"),
+            outcome_counts=data.get("OutcomeCounts", {}),
+            evaluation_seconds=data.get("EvaluationSeconds", 0.0)
+        )
+
+    def to_dictionary(self) -> dict:
+        """Convert to dictionary for caching."""
+        return {
+            "CheckpointPath": self.checkpoint_path,
+            "CacheKey": self.cache_key,
+            "EpisodeCount": self.episode_count,
+            "SuccessRate": self.success_rate,
+            "MeanReturn": self.mean_return,
+            "MeanStepsToTarget": self.mean_steps_to_target,
+            "OutcomeCounts": self.outcome_counts,
+            "EvaluationSeconds": self.evaluation_seconds
+        }
@@ -0,0 +1,64 @@
+import io
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass
+class RolloutSegmentModel:
+    """Fixed-length slice of experience from N vectorized environments.
+
+    Arrays are time-major (T, N, ...). Actions are the unclipped Gaussian
+    samples whose behavior log-probabilities were recorded. Local actors
+    record observations already normalized by their VecNormalize; remote
+    workers record raw observations and rewards (is_normalized False) for
+    the learner to normalize with its own statistics.
+    """
+
+    observations: np.ndarray
+    actions: np.ndarray
+    rewards: np.ndarray
+    dones: np.ndarray
+    behavior_log_probabilities: np.ndarray
+    truncation_mask: np.ndarray
+    terminal_observations: np.ndarray
+    last_observations: np.ndarray
+    policy_version: int
+    is_normalized: bool = True
+
+    ARRAY_FIELD_NAMES = (
+        "observations",
+        "actions",
+        "rewards",
+        "dones",
+        "behavior_log_probabilities",
+        "truncation_mask",
+        "terminal_observations",
+        "last_observations"
+    )
+
+    @property
+    def step_count(self) -> int:
+        """Number of environment transitions in the segment."""
+        return int(self.rewards.size)
+
+    @classmethod
+    def from_compressed_bytes(cls, payload: bytes) -> "RolloutSegmentModel":
+        """Create RolloutSegmentModel from bytes produced by to_compressed_bytes."""
+        with np.load(io.BytesIO(payload), allow_pickle=False) as archive:
+            return cls(
+                **{field_name: archive[field_name] for field_name in cls.ARRAY_FIELD_NAMES},
+                policy_version=int(archive["policy_version"]),
+                is_normalized=bool(archive["is_normalized"])
+            )
+
+    def to_compressed_bytes(self) -> bytes:
+        """Serialize to a deflate-compressed .npz payload for network transfer."""
+        buffer: io.BytesIO = io.BytesIO()
+        np.savez_compressed(
+            buffer,
+            **{field_name: getattr(self, field_name) for field_name in self.ARRAY_FIELD_NAMES},
+            policy_version=np.array(self.policy_version),
+            is_normalized=np.array(self.is_normalized)
+        )
+
+        return buffer.getvalue()
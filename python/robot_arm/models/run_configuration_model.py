@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+
+from ..enums.vectorized_environment_type import VectorizedEnvironmentType
+from .training_configuration_model import TrainingConfigurationModel
+
+
+@dataclass
+class RunConfigurationModel:
+    """Training hyperparameters plus the environment layout a training run uses."""
+
+    training_configuration: TrainingConfigurationModel = field(default_factory=TrainingConfigurationModel)
+    environment_count: int = 1
+    vectorized_environment_type: VectorizedEnvironmentType = VectorizedEnvironmentType.DUMMY
+
+    @classmethod
+    def from_dictionary(cls, data: dict) -> "RunConfigurationModel":
+        """Create RunConfigurationModel from a dictionary, keeping defaults for missing keys."""
+        return cls(
+            training_configuration=TrainingConfigurationModel.from_dictionary(data.get("TrainingConfiguration", {})),
+            environment_count=int(data.get("EnvironmentCount", 1)),
+            vectorized_environment_type=VectorizedEnvironmentType(
+                data.get("VectorizedEnvironmentType", VectorizedEnvironmentType.DUMMY.value))
+        )
+
+    def to_dictionary(self) -> dict:
+        """Convert to dictionary for the run configuration file."""
+        return {
+            "TrainingConfiguration": self.training_configuration.to_dictionary(),
+            "EnvironmentCount": self.environment_count,
+            "VectorizedEnvironmentType": self.vectorized_environment_type.value
+        }
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import List
+
+
+@dataclass
+class TargetResultModel:
+    """Outcome of driving the policy to one queued target position."""
+
+    target_position: List[float]
+    outcome: str
+    step_count: int
+    elapsed_seconds: float
+    final_distance: float
+
+    @property
+    def is_success(self) -> bool:
+        """Whether the target was reached."""
+        return self.outcome == "success"
+
+    def to_dictionary(self) -> dict:
+        """Convert to a flat dictionary for the results table export."""
+        return {
+            "TargetX": self.target_position[0],
+            "TargetY": self.target_position[1],
+            "TargetZ": self.target_position[2],
+            "Success": self.is_success,
+            "Outcome": self.outcome,
+            "StepCount": self.step_count,
+            "ElapsedSeconds": self.elapsed_seconds,
+            "FinalDistance": self.final_distance
+        }
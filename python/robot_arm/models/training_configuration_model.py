@@ -0,0 +1,40 @@
+from dataclasses import asdict, dataclass, field, fields
+from typing import List
+
+
+@dataclass
+class TrainingConfigurationModel:
+    """Hyperparameters used by TrainingController.
+
+    The replay buffer fields only apply to the off-policy algorithms (SAC, TD3),
+    and the synthetic data fields only to their model-based rollouts.
+    """
+
+    learning_rate: float = 3e-4
+    steps_per_update: int = 2048
+    batch_size: int = 64
+    training_epochs: int = 7
+    discount_factor: float = 0.99
+    gae_lambda: float = 0.95
+    clip_range: float = 0.2
+    entropy_coefficient: float = 0.003
+    network_layer_sizes: List[int] = field(default_factory=lambda: [256, 256])
+    replay_buffer_size: int = 1_000_000
+    learning_starts: int = 1000
+    synthetic_data_fraction: float = 0.5
+    imagined_rollout_horizon: int = 3
+
+    @classmethod
+    def from_dictionary(cls, data: dict) -> "TrainingConfigurationModel":
+        """Create TrainingConfigurationModel from a dictionary, keeping defaults for missing keys."""
+        field_names = {configuration_field.name for configuration_field in fields(cls)}
+        unknown_keys = sorted(set(data) - field_names)
+
+        if unknown_keys:
+            raise ValueError(f"Unknown training configuration keys: {', '.join(unknown_keys)}")
+
+        return cls(**data)
+
+    def to_dictionary(self) -> dict:
+        """Convert to dictionary for logging and results storage."""
+        return asdict(self)
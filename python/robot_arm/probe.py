@@ -0,0 +1,112 @@
+"""Qualify a simulator host: protocol conformance and round-trip latency under load, without numpy or torch."""
+
+import sys
+import argparse
+import json
+
+from .services.connection_probe_service import ConnectionProbeService
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Probe a Unity simulator connection")
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=ConnectionProbeService.DEFAULT_HOST,
+        help="Simulator host"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=ConnectionProbeService.DEFAULT_PORT,
+        help="Simulator port"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=ConnectionProbeService.DEFAULT_TIMEOUT_SECONDS,
+        help="Seconds to wait for a connection or a response before counting a timeout"
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=1,
+        help="Concurrent connections for the load phase"
+    )
+    parser.add_argument(
+        "--commands",
+        type=int,
+        default=ConnectionProbeService.DEFAULT_COMMAND_COUNT,
+        help="Total commands for the load phase (0 to only check conformance)"
+    )
+    parser.add_argument(
+        "--episode-length",
+        type=int,
+        default=ConnectionProbeService.DEFAULT_EPISODE_LENGTH,
+        help="STEP commands between RESETs on each connection"
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        default=None,
+        help="Also write the conformance results and load statistics to this JSON file"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for the connection probe."""
+    args = parse_arguments()
+
+    probe_service: ConnectionProbeService = ConnectionProbeService(
+        host=args.host,
+        port=args.port,
+        connection_count=args.connections,
+        timeout_seconds=args.timeout
+    )
+
+    try:
+        errors, warnings = probe_service.check_conformance()
+    except (OSError, ConnectionError, ValueError) as probe_error:
+        print(f"[FAIL] {args.host}:{args.port}: {probe_error}")
+        sys.exit(1)
+
+    for warning in warnings:
+        print(f"[WARN] {warning}")
+    for error in errors:
+        print(f"[FAIL] {error}")
+    if not errors:
+        print(f"[OK] {args.host}:{args.port} conforms to the observation protocol")
+
+    statistics: dict = {}
+    if args.commands > 0 and not errors:
+        print(f"\nSending {args.commands} commands over {args.connections} connection(s)...")
+        statistics = probe_service.run_load(args.commands, args.episode_length)
+
+        print(f"\n{'Command':<8} {'Count':>7} {'Cmd/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+              f"{'Max ms':>8} {'Req B':>6} {'Resp B':>7} {'Timeout':>8} {'Error':>6}")
+        for command_type, summary in statistics.items():
+            print(f"{command_type:<8} {summary['count']:>7.0f} {summary['commands_per_second']:>9.0f} "
+                  f"{summary['p50_milliseconds']:>8.2f} {summary['p95_milliseconds']:>8.2f} "
+                  f"{summary['p99_milliseconds']:>8.2f} {summary['maximum_milliseconds']:>8.2f} "
+                  f"{summary['mean_request_bytes']:>6.0f} {summary['mean_response_bytes']:>7.0f} "
+                  f"{summary['timeouts']:>8.0f} {summary['errors']:>6.0f}")
+
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump({
+                "Host": args.host,
+                "Port": args.port,
+                "Connections": args.connections,
+                "ConformanceErrors": errors,
+                "ConformanceWarnings": warnings,
+                "Statistics": statistics
+            }, json_file, indent=2)
+
+    if errors or (statistics and statistics["ALL"]["timeouts"] + statistics["ALL"]["errors"] > 0):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Record the states a trained policy visits, for distillation or offline analysis."""
+
+import argparse
+
+from .controllers.distillation_controller import DistillationController
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Record policy rollout states to an .npz dataset")
+    parser.add_argument(
+        "policy_path",
+        type=str,
+        help="Trained policy (.zip model or .npz export, e.g. ./models/robot_policy_pick_and_place)"
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default="./models/distillation_states.npz",
+        help="Destination state dataset"
+    )
+    parser.add_argument(
+        "--episodes",
+        type=int,
+        default=DistillationController.DEFAULT_RECORDING_EPISODES,
+        help="Number of episodes to record"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=5555,
+        help="Simulator port"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for state recording."""
+    args = parse_arguments()
+
+    distillation_controller: DistillationController = DistillationController(
+        args.policy_path,
+        server_address=f"tcp://localhost:{args.port}"
+    )
+    output_path: str = distillation_controller.record_states(args.episodes, args.output)
+
+    print(f"Saved states to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Rollout worker that streams experience from local simulators to a remote learner."""
+
+import argparse
+
+from .services.rollout_actor_service import RolloutActorService
+from .services.rollout_worker_service import RolloutWorkerService
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Stream rollouts to a train.py --rollout-port learner")
+    parser.add_argument(
+        "--learner-host",
+        type=str,
+        required=True,
+        help="Host running train.py --rollout-port"
+    )
+    parser.add_argument(
+        "--learner-port",
+        type=int,
+        default=5700,
+        help="Learner rollout port"
+    )
+    parser.add_argument(
+        "--simulator-host",
+        type=str,
+        default="localhost",
+        help="Host of the local simulators"
+    )
+    parser.add_argument(
+        "--simulator-ports",
+        type=int,
+        nargs="+",
+        default=[5555],
+        help="One Unity instance per port, stepped together as a vectorized environment"
+    )
+    parser.add_argument(
+        "--segment-steps",
+        type=int,
+        default=RolloutActorService.DEFAULT_SEGMENT_STEPS,
+        help="Steps per environment in each streamed segment"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for a rollout worker."""
+    args = parse_arguments()
+
+    from functools import partial
+    from stable_baselines3.common.vec_env import DummyVecEnv
+    from .controllers.training_controller import TrainingController
+
+    # The learner's policy only fits environments built with the learner's options
+    environment_options: dict = RolloutWorkerService.fetch_environment_options(args.learner_host, args.learner_port)
+    environment = DummyVecEnv([
+        partial(
+            TrainingController.create_configured_environment,
+            f"tcp://{args.simulator_host}:{port}",
+            environment_options)
+        for port in args.simulator_ports])
+    rollout_worker: RolloutWorkerService = RolloutWorkerService(
+        environment,
+        args.learner_host,
+        args.learner_port,
+        segment_steps=args.segment_steps,
+        environment_options=environment_options
+    )
+
+    try:
+        rollout_worker.connect()
+        print(f"Joined learner {args.learner_host}:{args.learner_port} as worker {rollout_worker.worker_id}")
+        rollout_worker.run()
+    except KeyboardInterrupt:
+        print("\nRollout worker interrupted by user.")
+        rollout_worker.disconnect()
+    finally:
+        environment.close()
+        print(f"Sent {rollout_worker.sent_segment_count} segments "
+              f"({rollout_worker.sent_byte_count / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
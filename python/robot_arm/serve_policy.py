@@ -0,0 +1,64 @@
+"""Serve a trained policy to local clients with request batching and hot-swap."""
+
+import argparse
+
+from .services.policy_server_service import PolicyServerService
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Serve policy predictions over TCP")
+    parser.add_argument(
+        "model_path",
+        type=str,
+        help="Model file (.npz or SB3 .zip) or a directory to serve its newest robot_policy file"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=PolicyServerService.DEFAULT_HOST,
+        help="Address to listen on"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=PolicyServerService.DEFAULT_PORT,
+        help="Port to listen on"
+    )
+    parser.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=PolicyServerService.DEFAULT_MAXIMUM_BATCH_SIZE,
+        help="Maximum observations per batched forward pass"
+    )
+    parser.add_argument(
+        "--max-batch-latency-ms",
+        type=float,
+        default=PolicyServerService.DEFAULT_MAXIMUM_BATCH_LATENCY_SECONDS * 1000.0,
+        help="Longest a request waits for others to join its batch"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Reload automatically when the model file changes or a newer checkpoint appears"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for the policy server."""
+    args = parse_arguments()
+
+    policy_server: PolicyServerService = PolicyServerService(
+        args.model_path,
+        host=args.host,
+        port=args.port,
+        maximum_batch_size=args.max_batch_size,
+        maximum_batch_latency_seconds=args.max_batch_latency_ms / 1000.0,
+        watch_for_updates=args.watch
+    )
+    policy_server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Services package - lazy imports to avoid dependency issues during testing
+import importlib
+
+_MODULE_NAMES = {
+    "NetworkService": "network_service",
+    "RewardCalculationService": "reward_calculation_service",
+    "KinematicsService": "kinematics_service",
+    "ActionSafetyService": "action_safety_service",
+    "DemonstrationService": "demonstration_service",
+    "PolicyExportService": "policy_export_service",
+    "NumpyPolicyService": "numpy_policy_service",
+    "MessageFramingService": "message_framing_service",
+    "PolicyServerService": "policy_server_service",
+    "PolicyClientService": "policy_client_service",
+    "VTraceService": "vtrace_service",
+    "RolloutActorService": "rollout_actor_service",
+    "RolloutServerService": "rollout_server_service",
+    "RolloutWorkerService": "rollout_worker_service",
+    "AsynchronousLearnerService": "asynchronous_learner_service",
+    "TargetSchedulerService": "target_scheduler_service",
+    "DynamicsEnsembleService": "dynamics_ensemble_service",
+    "PolicyDistillationService": "policy_distillation_service",
+    "ControlLoopSchedulerService": "control_loop_scheduler_service",
+    "TelemetryBufferService": "telemetry_buffer_service",
+    "PolicyCacheService": "policy_cache_service",
+    "TargetQueueService": "target_queue_service",
+    "ConnectionProbeService": "connection_probe_service",
+    "BenchmarkService": "benchmark_service",
+    "MockSimulatorService": "mock_simulator_service",
+    "LoadTestService": "load_test_service",
+    "StepPathBenchmarkService": "step_path_benchmark_service"
+}
+
+__all__ = list(_MODULE_NAMES)
+
+
+def __getattr__(name):
+    """Import the service's module on first access."""
+    if name not in _MODULE_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(f"{__name__}.{_MODULE_NAMES[name]}"), name)
@@ -0,0 +1,129 @@
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+from .kinematics_service import KinematicsService
+
+
+class ActionSafetyService:
+    """Action filter that rejects joint deltas driving the TCP below the base.
+
+    The filter self-calibrates its forward kinematics model from observed
+    (JointAngles, ToolCenterPointPosition) pairs and stays inactive until the
+    calibrated model is accurate enough to be trusted.
+    """
+
+    MINIMUM_TOOL_CENTER_POINT_HEIGHT: float = 0.02
+    CANDIDATE_DELTA_SCALES: Tuple[float, ...] = (1.0, 0.75, 0.5, 0.25, 0.0)
+    CALIBRATION_SAMPLE_COUNT: int = 500
+    MAXIMUM_CALIBRATION_ERROR_METERS: float = 0.02
+
+    def __init__(
+        self,
+        kinematics_service: Optional[KinematicsService] = None,
+        minimum_tool_center_point_height: float = MINIMUM_TOOL_CENTER_POINT_HEIGHT,
+        calibration_sample_count: int = CALIBRATION_SAMPLE_COUNT,
+        maximum_calibration_error: float = MAXIMUM_CALIBRATION_ERROR_METERS
+    ) -> None:
+        self._kinematics_service: KinematicsService = kinematics_service or KinematicsService()
+        self._minimum_tool_center_point_height: float = minimum_tool_center_point_height
+        self._maximum_calibration_error: float = maximum_calibration_error
+        self._candidate_scales: np.ndarray = np.array(self.CANDIDATE_DELTA_SCALES)
+
+        number_of_joints: int = self._kinematics_service.number_of_joints
+        self._recorded_joint_angles: np.ndarray = np.zeros((calibration_sample_count, number_of_joints))
+        self._recorded_positions: np.ndarray = np.zeros((calibration_sample_count, 3))
+        self._recorded_sample_count: int = 0
+
+        self._is_active: bool = False
+        self._filtered_action_count: int = 0
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the filter has a trusted kinematics model."""
+        return self._is_active
+
+    @property
+    def filtered_action_count(self) -> int:
+        """Number of actions modified by the filter so far."""
+        return self._filtered_action_count
+
+    @property
+    def kinematics_service(self) -> KinematicsService:
+        """Forward kinematics model used for prediction."""
+        return self._kinematics_service
+
+    def record_observation(
+        self,
+        joint_angles: Sequence[float],
+        tool_center_point_position: Sequence[float]
+    ) -> None:
+        """Record an observed configuration and calibrate once enough are collected."""
+        if self._is_active:
+            return
+
+        number_of_joints: int = self._kinematics_service.number_of_joints
+
+        if len(joint_angles) < number_of_joints:
+            return
+
+        sample_index: int = self._recorded_sample_count % len(self._recorded_joint_angles)
+        self._recorded_joint_angles[sample_index] = joint_angles[:number_of_joints]
+        self._recorded_positions[sample_index] = tool_center_point_position
+        self._recorded_sample_count += 1
+
+        if self._recorded_sample_count % len(self._recorded_joint_angles) != 0:
+            return
+
+        calibration_error: float = self._kinematics_service.calibrate(
+            self._recorded_joint_angles, self._recorded_positions)
+
+        if calibration_error <= self._maximum_calibration_error:
+            self._is_active = True
+            print(f"🛡️ Action safety filter active (FK error {calibration_error * 1000:.1f} mm)")
+
+    def filter_joint_deltas(
+        self,
+        next_joint_angles: np.ndarray,
+        joint_deltas: np.ndarray,
+        joint_angle_limits: np.ndarray
+    ) -> Tuple[np.ndarray, bool]:
+        """Scale joint deltas back until the predicted TCP stays above the base.
+
+        Args:
+            next_joint_angles: Joint angles the step would start from, with any
+                joint the step sets directly (axis 6 orientation) already applied.
+            joint_deltas: Deltas in degrees for the first len(joint_deltas) joints.
+            joint_angle_limits: Symmetric joint limits in degrees.
+
+        Returns:
+            Tuple of (joint_deltas to send, whether they were modified).
+        """
+        if not self._is_active:
+            return joint_deltas, False
+
+        number_of_joints: int = self._kinematics_service.number_of_joints
+        number_of_deltas: int = len(joint_deltas)
+
+        candidate_angles: np.ndarray = np.tile(
+            np.asarray(next_joint_angles[:number_of_joints], dtype=np.float64),
+            (len(self._candidate_scales), 1))
+        candidate_angles[:, :number_of_deltas] += self._candidate_scales[:, None] * joint_deltas
+        limits: np.ndarray = np.asarray(joint_angle_limits[:number_of_joints], dtype=np.float64)
+        candidate_angles = np.clip(candidate_angles, -limits, limits)
+
+        predicted_heights: np.ndarray = self._kinematics_service.compute_tool_center_point_positions(
+            candidate_angles)[:, 1]
+        is_safe: np.ndarray = predicted_heights >= self._minimum_tool_center_point_height
+
+        if is_safe[0]:
+            return joint_deltas, False
+
+        if not np.any(is_safe):
+            # The model predicts the current pose is already unsafe, which the
+            # simulator disagrees with; do not interfere with the policy.
+            return joint_deltas, False
+
+        safe_scale: float = float(self._candidate_scales[np.argmax(is_safe)])
+        self._filtered_action_count += 1
+
+        return joint_deltas * safe_scale, True
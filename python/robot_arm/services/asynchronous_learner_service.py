@@ -0,0 +1,183 @@
+import numpy as np
+from typing import Any, Dict, Optional
+
+from ..models.rollout_segment_model import RolloutSegmentModel
+from .vtrace_service import VTraceService
+
+
+class AsynchronousLearnerService:
+    """Trains an SB3 PPO model on rollout segments gathered by a stale behavior policy.
+
+    Each segment is corrected with V-trace against the learner's current
+    policy, then optimized with PPO's clipped surrogate for the model's
+    n_epochs and batch_size. Snapshots for actors are plain NumPy policies,
+    so broadcasting weights never blocks on torch. Raw segments from remote
+    workers are normalized with the given VecNormalize before training.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        normalizer: Optional[Any] = None,
+        importance_weight_clip: float = VTraceService.DEFAULT_IMPORTANCE_WEIGHT_CLIP,
+        trace_clip: float = VTraceService.DEFAULT_TRACE_CLIP
+    ) -> None:
+        self._model: Any = model
+        self._normalizer: Optional[Any] = normalizer
+        self._importance_weight_clip: float = importance_weight_clip
+        self._trace_clip: float = trace_clip
+        self._policy_version: int = 0
+
+    @property
+    def policy_version(self) -> int:
+        """Number of updates applied so far."""
+        return self._policy_version
+
+    def create_policy_snapshot(self, include_normalization: bool = False) -> Any:
+        """Copy the current actor weights into a NumPy policy for rollout actors.
+
+        Local actors see observations already normalized by VecNormalize;
+        remote workers step raw environments and need the statistics included.
+        """
+        from .numpy_policy_service import NumpyPolicyService
+        from .policy_export_service import PolicyExportService
+
+        normalizer: Optional[Any] = self._normalizer if include_normalization else None
+
+        return NumpyPolicyService(PolicyExportService().extract_parameters(self._model.policy, normalizer))
+
+    def normalize_segment(self, segment: RolloutSegmentModel) -> RolloutSegmentModel:
+        """Normalize a raw remote segment with the learner's current VecNormalize statistics."""
+        if segment.is_normalized:
+            return segment
+
+        if self._normalizer is None:
+            raise ValueError("Raw segments need a normalizer on the learner")
+
+        def normalize_observations(observations: np.ndarray) -> np.ndarray:
+            return self._normalizer.normalize_obs(observations).astype(np.float32)
+
+        return RolloutSegmentModel(
+            observations=normalize_observations(segment.observations),
+            actions=segment.actions,
+            rewards=self._normalizer.normalize_reward(segment.rewards).astype(np.float32),
+            dones=segment.dones,
+            behavior_log_probabilities=segment.behavior_log_probabilities,
+            truncation_mask=segment.truncation_mask,
+            terminal_observations=normalize_observations(segment.terminal_observations),
+            last_observations=normalize_observations(segment.last_observations),
+            policy_version=segment.policy_version,
+            is_normalized=True
+        )
+
+    def train_on_segment(self, segment: RolloutSegmentModel) -> Dict[str, float]:
+        """Apply one V-trace corrected PPO update and return training statistics."""
+        import torch
+
+        segment = self.normalize_segment(segment)
+        model = self._model
+        policy = model.policy
+        segment_steps, environment_count = segment.rewards.shape
+
+        flat_observations = torch.as_tensor(
+            segment.observations.reshape((segment_steps * environment_count,) + segment.observations.shape[2:]),
+            device=policy.device)
+        flat_actions = torch.as_tensor(
+            segment.actions.reshape((segment_steps * environment_count,) + segment.actions.shape[2:]),
+            device=policy.device)
+
+        policy.set_training_mode(False)
+        with torch.no_grad():
+            values, target_log_probabilities, _ = policy.evaluate_actions(flat_observations, flat_actions)
+            bootstrap_values = policy.predict_values(
+                torch.as_tensor(segment.last_observations, device=policy.device))
+            terminal_values = policy.predict_values(torch.as_tensor(
+                segment.terminal_observations.reshape(flat_observations.shape), device=policy.device))
+
+        values_array: np.ndarray = values.cpu().numpy().reshape(segment_steps, environment_count)
+        target_log_probability_array: np.ndarray = target_log_probabilities.cpu().numpy().reshape(
+            segment_steps, environment_count)
+        terminal_value_array: np.ndarray = terminal_values.cpu().numpy().reshape(segment_steps, environment_count)
+
+        # Timeouts keep the value of the state they were cut off in
+        rewards: np.ndarray = segment.rewards + model.gamma * segment.truncation_mask * terminal_value_array
+
+        value_targets, advantages = VTraceService.compute_targets(
+            segment.behavior_log_probabilities,
+            target_log_probability_array,
+            rewards,
+            values_array,
+            bootstrap_values.cpu().numpy().reshape(environment_count),
+            segment.dones,
+            model.gamma,
+            trace_decay=model.gae_lambda,
+            importance_weight_clip=self._importance_weight_clip,
+            trace_clip=self._trace_clip)
+
+        statistics: Dict[str, float] = self._optimize(
+            flat_observations,
+            flat_actions,
+            target_log_probabilities,
+            torch.as_tensor(value_targets.reshape(-1), dtype=torch.float32, device=policy.device),
+            torch.as_tensor(advantages.reshape(-1), dtype=torch.float32, device=policy.device))
+
+        importance_weights: np.ndarray = np.exp(target_log_probability_array - segment.behavior_log_probabilities)
+        statistics["mean_importance_weight"] = float(importance_weights.mean())
+        statistics["policy_lag"] = float(self._policy_version - segment.policy_version)
+
+        self._policy_version += 1
+        model.num_timesteps += segment.step_count
+        model._n_updates += model.n_epochs
+
+        return statistics
+
+    def _optimize(self, observations, actions, old_log_probabilities, value_targets, advantages) -> Dict[str, float]:
+        """Run PPO clipped-surrogate epochs over one corrected segment."""
+        import torch
+
+        model = self._model
+        policy = model.policy
+        clip_range: float = model.clip_range(model._current_progress_remaining)
+        sample_count: int = len(observations)
+
+        policy.set_training_mode(True)
+        policy_losses, value_losses, clip_fractions = [], [], []
+
+        for _ in range(model.n_epochs):
+            permutation = torch.randperm(sample_count, device=policy.device)
+
+            for batch_start in range(0, sample_count, model.batch_size):
+                batch_indices = permutation[batch_start:batch_start + model.batch_size]
+
+                values, log_probabilities, entropy = policy.evaluate_actions(
+                    observations[batch_indices], actions[batch_indices])
+                batch_advantages = advantages[batch_indices]
+
+                if model.normalize_advantage and len(batch_indices) > 1:
+                    batch_advantages = (batch_advantages - batch_advantages.mean()) / (batch_advantages.std() + 1e-8)
+
+                ratio = torch.exp(log_probabilities - old_log_probabilities[batch_indices])
+                policy_loss = -torch.min(
+                    batch_advantages * ratio,
+                    batch_advantages * torch.clamp(ratio, 1.0 - clip_range, 1.0 + clip_range)).mean()
+                value_loss = torch.nn.functional.mse_loss(value_targets[batch_indices], values.flatten())
+                entropy_loss = -torch.mean(entropy) if entropy is not None else -torch.mean(-log_probabilities)
+
+                loss = policy_loss + model.ent_coef * entropy_loss + model.vf_coef * value_loss
+
+                policy.optimizer.zero_grad()
+                loss.backward()
+                torch.nn.utils.clip_grad_norm_(policy.parameters(), model.max_grad_norm)
+                policy.optimizer.step()
+
+                policy_losses.append(policy_loss.item())
+                value_losses.append(value_loss.item())
+                clip_fractions.append(torch.mean((torch.abs(ratio - 1.0) > clip_range).float()).item())
+
+        policy.set_training_mode(False)
+
+        return {
+            "policy_loss": float(np.mean(policy_losses)),
+            "value_loss": float(np.mean(value_losses)),
+            "clip_fraction": float(np.mean(clip_fractions))
+        }
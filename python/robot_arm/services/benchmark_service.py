@@ -0,0 +1,153 @@
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional
+import os
+
+
+class BenchmarkService:
+    """Times small functions with warmup and repeated rounds, and compares results to a baseline.
+
+    Each benchmark is first calibrated to a loop count whose round takes at
+    least minimum_round_seconds, so timer resolution and loop overhead stay
+    negligible. Statistics are over the per-call time of each round; the
+    median is the regression metric because it ignores the occasional round
+    disturbed by the scheduler or garbage collection.
+    """
+
+    DEFAULT_WARMUP_ROUNDS: int = 2
+    DEFAULT_ROUNDS: int = 15
+    DEFAULT_MINIMUM_ROUND_SECONDS: float = 0.02
+    DEFAULT_REGRESSION_THRESHOLD: float = 0.25
+    MAXIMUM_CALIBRATION_LOOPS: int = 1 << 20
+
+    def __init__(
+        self,
+        warmup_rounds: int = DEFAULT_WARMUP_ROUNDS,
+        rounds: int = DEFAULT_ROUNDS,
+        minimum_round_seconds: float = DEFAULT_MINIMUM_ROUND_SECONDS
+    ) -> None:
+        if rounds < 2:
+            raise ValueError("At least two rounds are needed for spread statistics")
+
+        self._warmup_rounds: int = warmup_rounds
+        self._rounds: int = rounds
+        self._minimum_round_seconds: float = minimum_round_seconds
+
+    def measure(self, benchmark_function: Callable[[], Any]) -> Dict[str, float]:
+        """Per-call time statistics in microseconds for one benchmark function.
+
+        Returns:
+            Loop count per round plus median, mean, standard deviation,
+            minimum, maximum and interquartile range over rounds.
+        """
+        loop_count: int = self._calibrate_loop_count(benchmark_function)
+
+        for _ in range(self._warmup_rounds):
+            self._time_round(benchmark_function, loop_count)
+
+        per_call_microseconds: List[float] = [
+            self._time_round(benchmark_function, loop_count) / loop_count * 1e6 for _ in range(self._rounds)]
+        quartiles: List[float] = statistics.quantiles(per_call_microseconds, n=4, method="inclusive")
+
+        return {
+            "loops_per_round": float(loop_count),
+            "rounds": float(self._rounds),
+            "median_microseconds": statistics.median(per_call_microseconds),
+            "mean_microseconds": statistics.fmean(per_call_microseconds),
+            "standard_deviation_microseconds": statistics.stdev(per_call_microseconds),
+            "minimum_microseconds": min(per_call_microseconds),
+            "maximum_microseconds": max(per_call_microseconds),
+            "interquartile_range_microseconds": quartiles[2] - quartiles[0]
+        }
+
+    def run_suite(
+        self,
+        benchmark_functions: Dict[str, Callable[[], Any]],
+        progress_callback: Optional[Callable[[str, Dict[str, float]], None]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """Measure every benchmark in order, keyed by name."""
+        results: Dict[str, Dict[str, float]] = {}
+
+        for benchmark_name, benchmark_function in benchmark_functions.items():
+            results[benchmark_name] = self.measure(benchmark_function)
+            if progress_callback is not None:
+                progress_callback(benchmark_name, results[benchmark_name])
+
+        return results
+
+    @staticmethod
+    def compare_to_baseline(
+        results: Dict[str, Dict[str, float]],
+        baseline: Dict[str, Dict[str, float]],
+        regression_threshold: float = DEFAULT_REGRESSION_THRESHOLD
+    ) -> Dict[str, Dict[str, Any]]:
+        """Median change against the baseline for every benchmark present in both.
+
+        Returns:
+            Per benchmark: baseline and current median, relative change and
+            whether the slowdown exceeds regression_threshold (0.25 = 25 %).
+        """
+        comparisons: Dict[str, Dict[str, Any]] = {}
+
+        for benchmark_name, result in results.items():
+            if benchmark_name not in baseline:
+                continue
+
+            baseline_median: float = baseline[benchmark_name]["median_microseconds"]
+            current_median: float = result["median_microseconds"]
+            relative_change: float = current_median / baseline_median - 1.0 if baseline_median > 0.0 else 0.0
+
+            comparisons[benchmark_name] = {
+                "baseline_median_microseconds": baseline_median,
+                "median_microseconds": current_median,
+                "relative_change": relative_change,
+                "is_regression": relative_change > regression_threshold
+            }
+
+        return comparisons
+
+    @staticmethod
+    def save_results(results: Dict[str, Dict[str, float]], json_path: str) -> str:
+        """Write results with the interpreter and machine they were measured on."""
+        directory: str = os.path.dirname(json_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(json_path, "w", encoding="utf-8") as json_file:
+            json.dump({
+                "Python": platform.python_version(),
+                "Machine": platform.machine(),
+                "Processor": platform.processor(),
+                "Benchmarks": results
+            }, json_file, indent=2, sort_keys=True)
+
+        return json_path
+
+    @staticmethod
+    def load_results(json_path: str) -> Dict[str, Dict[str, float]]:
+        """Benchmark results from a file written by save_results."""
+        with open(json_path, "r", encoding="utf-8") as json_file:
+            return json.load(json_file)["Benchmarks"]
+
+    def _calibrate_loop_count(self, benchmark_function: Callable[[], Any]) -> int:
+        """Smallest power-of-two loop count whose round lasts minimum_round_seconds."""
+        loop_count: int = 1
+
+        while loop_count < self.MAXIMUM_CALIBRATION_LOOPS:
+            if self._time_round(benchmark_function, loop_count) >= self._minimum_round_seconds:
+                break
+            loop_count *= 2
+
+        return loop_count
+
+    @staticmethod
+    def _time_round(benchmark_function: Callable[[], Any], loop_count: int) -> float:
+        """Seconds taken by loop_count back-to-back calls."""
+        start_time: float = time.perf_counter()
+
+        for _ in range(loop_count):
+            benchmark_function()
+
+        return time.perf_counter() - start_time
@@ -0,0 +1,337 @@
+import json
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..enums.command_type import CommandType
+from ..models.command_model import CommandModel
+from .message_framing_service import MessageFramingService
+
+
+class ConnectionProbeService:
+    """Qualifies a simulator host: protocol conformance first, then sustained command load.
+
+    Conformance sends CONFIG, RESET and STEP on one connection and checks
+    every observation field against the ObservationModel schema. The load
+    phase spreads thousands of STEP commands, with a RESET every episode,
+    over several connections and records round-trip time and framed payload
+    size per command type. A timed-out connection is reopened, since its
+    stream can no longer be trusted. Only the standard library is used, so
+    the probe starts without the ML stack.
+    """
+
+    DEFAULT_HOST: str = "localhost"
+    DEFAULT_PORT: int = 5555
+    DEFAULT_TIMEOUT_SECONDS: float = 5.0
+    DEFAULT_COMMAND_COUNT: int = 5000
+    DEFAULT_EPISODE_LENGTH: int = 200
+    DEFAULT_PERCENTILES: Sequence[float] = (50.0, 95.0, 99.0)
+    ACTION_JOINT_COUNT: int = 5
+
+    # Observation field -> (kind, exact length or None, required), mirroring ObservationModel.from_dictionary
+    OBSERVATION_SCHEMA: Dict[str, Tuple[str, Optional[int], bool]] = {
+        "JointAngles": ("vector", None, True),
+        "ToolCenterPointPosition": ("vector", 3, True),
+        "DirectionToTarget": ("vector", 3, True),
+        "DistanceToTarget": ("number", None, True),
+        "CollisionDetected": ("boolean", None, True),
+        "IsResetFrame": ("boolean", None, True),
+        "TargetPosition": ("vector", 3, False),
+        "GripperState": ("number", None, False),
+        "IsGrippingObject": ("boolean", None, False),
+        "LaserSensorHit": ("boolean", None, False),
+        "LaserSensorDistance": ("number", None, False),
+        "TargetOrientationOneHot": ("vector", 2, False),
+        "JointAngleLimits": ("vector", None, False)
+    }
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        connection_count: int = 1,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS
+    ) -> None:
+        if connection_count < 1:
+            raise ValueError("At least one connection is required")
+
+        self._host: str = host
+        self._port: int = port
+        self._connection_count: int = connection_count
+        self._timeout_seconds: float = timeout_seconds
+
+    def check_conformance(self) -> Tuple[List[str], List[str]]:
+        """Send CONFIG, RESET and STEP once and validate the responses.
+
+        Returns:
+            Errors that break the Python client, and warnings for optional
+            fields the client would fill with defaults.
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        with self._open_connection() as connection:
+            configuration_response, _, _ = self._send_command(connection, self._create_configuration_command())
+            if not isinstance(configuration_response, dict):
+                errors.append("CONFIG: response is not a JSON object")
+
+            reset_response, _, _ = self._send_command(connection, self._create_reset_command())
+            reset_errors, reset_warnings = self.validate_observation(reset_response, is_reset_response=True)
+            errors += [f"RESET: {problem}" for problem in reset_errors]
+            warnings += [f"RESET: {problem}" for problem in reset_warnings]
+
+            step_response, _, _ = self._send_command(connection, self._create_step_command())
+            step_errors, step_warnings = self.validate_observation(step_response, is_reset_response=False)
+            errors += [f"STEP: {problem}" for problem in step_errors]
+            warnings += [f"STEP: {problem}" for problem in step_warnings]
+
+            # A STEP reply claiming to be a reset frame would make the client rebaseline every step
+            if not step_errors and step_response["IsResetFrame"]:
+                errors.append("STEP: IsResetFrame is true")
+
+        return errors, warnings
+
+    @classmethod
+    def validate_observation(cls, response: object, is_reset_response: bool) -> Tuple[List[str], List[str]]:
+        """Schema errors and warnings for one observation response."""
+        if not isinstance(response, dict):
+            return ["response is not a JSON object"], []
+
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        for field_name, (kind, expected_length, is_required) in cls.OBSERVATION_SCHEMA.items():
+            if field_name not in response or response[field_name] is None:
+                if is_required:
+                    errors.append(f"{field_name} is missing")
+                else:
+                    warnings.append(f"{field_name} is missing; the client uses its default")
+                continue
+
+            problem: Optional[str] = cls._check_field(response[field_name], kind, expected_length)
+            if problem is not None:
+                errors.append(f"{field_name} {problem}")
+
+        if errors:
+            return errors, warnings
+
+        if is_reset_response:
+            if not response["IsResetFrame"]:
+                errors.append("IsResetFrame is false")
+
+            joint_angle_limits = response.get("JointAngleLimits")
+            if not joint_angle_limits:
+                errors.append("JointAngleLimits is missing on the reset frame")
+            elif len(joint_angle_limits) != len(response["JointAngles"]):
+                errors.append(f"JointAngleLimits has {len(joint_angle_limits)} entries "
+                              f"for {len(response['JointAngles'])} joints")
+
+        return errors, warnings
+
+    def run_load(
+        self,
+        command_count: int = DEFAULT_COMMAND_COUNT,
+        episode_length: int = DEFAULT_EPISODE_LENGTH
+    ) -> Dict[str, Dict[str, float]]:
+        """Send command_count commands over all connections and summarize them per command type.
+
+        Each connection starts with a RESET and resets again every
+        episode_length STEP commands.
+
+        Returns:
+            Statistics keyed by command type plus "ALL": count, timeouts,
+            errors, throughput and latency percentiles in milliseconds, and
+            mean request and response bytes.
+        """
+        samples_by_connection: List[Dict[str, List[Tuple[float, int, int]]]] = [
+            {} for _ in range(self._connection_count)]
+        failures_by_connection: List[Dict[str, Dict[str, int]]] = [
+            {} for _ in range(self._connection_count)]
+
+        threads: List[threading.Thread] = [
+            threading.Thread(
+                target=self._run_connection_load,
+                args=(
+                    command_count // self._connection_count
+                    + int(connection_index < command_count % self._connection_count),
+                    episode_length,
+                    samples_by_connection[connection_index],
+                    failures_by_connection[connection_index]
+                ),
+                daemon=True
+            )
+            for connection_index in range(self._connection_count)
+        ]
+
+        start_time: float = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed_seconds: float = max(time.perf_counter() - start_time, 1e-9)
+
+        samples_by_type: Dict[str, List[Tuple[float, int, int]]] = {}
+        failures_by_type: Dict[str, Dict[str, int]] = {}
+        for connection_samples, connection_failures in zip(samples_by_connection, failures_by_connection):
+            for command_type, samples in connection_samples.items():
+                samples_by_type.setdefault(command_type, []).extend(samples)
+            for command_type, failure_counts in connection_failures.items():
+                type_failures: Dict[str, int] = failures_by_type.setdefault(command_type, {"timeouts": 0, "errors": 0})
+                type_failures["timeouts"] += failure_counts["timeouts"]
+                type_failures["errors"] += failure_counts["errors"]
+
+        command_types: List[str] = sorted(set(samples_by_type) | set(failures_by_type))
+        statistics: Dict[str, Dict[str, float]] = {
+            command_type: self._summarize_samples(
+                samples_by_type.get(command_type, []),
+                failures_by_type.get(command_type, {"timeouts": 0, "errors": 0}),
+                elapsed_seconds)
+            for command_type in command_types
+        }
+        statistics["ALL"] = self._summarize_samples(
+            [sample for samples in samples_by_type.values() for sample in samples],
+            {
+                "timeouts": sum(failures["timeouts"] for failures in failures_by_type.values()),
+                "errors": sum(failures["errors"] for failures in failures_by_type.values())
+            },
+            elapsed_seconds)
+
+        return statistics
+
+    @staticmethod
+    def compute_percentile(sorted_values: Sequence[float], percentile: float) -> float:
+        """Linearly interpolated percentile of already sorted values, as numpy.percentile computes it."""
+        if not sorted_values:
+            return 0.0
+
+        position: float = (len(sorted_values) - 1) * percentile / 100.0
+        lower_index: int = int(position)
+        upper_index: int = min(lower_index + 1, len(sorted_values) - 1)
+
+        return sorted_values[lower_index] + (sorted_values[upper_index] - sorted_values[lower_index]) * (
+            position - lower_index)
+
+    def _run_connection_load(
+        self,
+        command_count: int,
+        episode_length: int,
+        samples: Dict[str, List[Tuple[float, int, int]]],
+        failures: Dict[str, Dict[str, int]]
+    ) -> None:
+        """Send one connection's share of the commands, reopening it after timeouts and errors."""
+        connection: Optional[socket.socket] = None
+        steps_since_reset: int = 0
+
+        try:
+            for _ in range(command_count):
+                if connection is None or steps_since_reset >= episode_length:
+                    command: dict = self._create_reset_command()
+                    steps_since_reset = 0
+                else:
+                    command = self._create_step_command()
+                    steps_since_reset += 1
+
+                try:
+                    if connection is None:
+                        connection = self._open_connection()
+
+                    _, round_trip_seconds, payload_sizes = self._send_command(connection, command)
+                    samples.setdefault(command["Type"], []).append((round_trip_seconds, *payload_sizes))
+                except (OSError, ConnectionError, ValueError) as command_error:
+                    failure_name: str = "timeouts" if isinstance(command_error, socket.timeout) else "errors"
+                    failures.setdefault(command["Type"], {"timeouts": 0, "errors": 0})[failure_name] += 1
+
+                    if connection is not None:
+                        connection.close()
+                    connection = None
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def _summarize_samples(
+        self,
+        samples: List[Tuple[float, int, int]],
+        failure_counts: Dict[str, int],
+        elapsed_seconds: float
+    ) -> Dict[str, float]:
+        """Count, failures, throughput, latency percentiles and mean payload sizes for one command type."""
+        latencies: List[float] = sorted(round_trip_seconds * 1000.0 for round_trip_seconds, _, _ in samples)
+        summary: Dict[str, float] = {
+            "count": float(len(samples)),
+            "timeouts": float(failure_counts["timeouts"]),
+            "errors": float(failure_counts["errors"]),
+            "commands_per_second": len(samples) / elapsed_seconds
+        }
+
+        for percentile in self.DEFAULT_PERCENTILES:
+            summary[f"p{percentile:g}_milliseconds"] = self.compute_percentile(latencies, percentile)
+
+        summary["maximum_milliseconds"] = latencies[-1] if latencies else 0.0
+        summary["mean_request_bytes"] = (
+            sum(request_bytes for _, request_bytes, _ in samples) / len(samples) if samples else 0.0)
+        summary["mean_response_bytes"] = (
+            sum(response_bytes for _, _, response_bytes in samples) / len(samples) if samples else 0.0)
+
+        return summary
+
+    def _open_connection(self) -> socket.socket:
+        """Connect with the probe timeout applied to every later receive."""
+        connection: socket.socket = socket.create_connection(
+            (self._host, self._port), timeout=self._timeout_seconds)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        return connection
+
+    @staticmethod
+    def _send_command(connection: socket.socket, command: dict) -> Tuple[object, float, Tuple[int, int]]:
+        """Response, round-trip seconds and framed (request, response) sizes for one command."""
+        start_time: float = time.perf_counter()
+        request_bytes: int = MessageFramingService.send_message(connection, command)
+        response_payload: bytes = MessageFramingService.receive_bytes(connection)
+        round_trip_seconds: float = time.perf_counter() - start_time
+
+        return (json.loads(response_payload.decode("utf-8")), round_trip_seconds,
+                (request_bytes, MessageFramingService.LENGTH_PREFIX_SIZE + len(response_payload)))
+
+    @staticmethod
+    def _check_field(value: object, kind: str, expected_length: Optional[int]) -> Optional[str]:
+        """Problem with one field value, or None if it matches its kind and length."""
+        if kind == "boolean":
+            return None if isinstance(value, bool) else f"should be a boolean, got {type(value).__name__}"
+
+        if kind == "number":
+            is_number: bool = isinstance(value, (int, float)) and not isinstance(value, bool)
+            return None if is_number else f"should be a number, got {type(value).__name__}"
+
+        if not isinstance(value, list) or not all(
+                isinstance(element, (int, float)) and not isinstance(element, bool) for element in value):
+            return "should be a list of numbers"
+
+        if expected_length is not None and len(value) != expected_length:
+            return f"should have {expected_length} entries, got {len(value)}"
+
+        return None
+
+    @classmethod
+    def _create_step_command(cls) -> dict:
+        """Zero-motion STEP serialized exactly as UnityRobotEnvironment sends it."""
+        return CommandModel(
+            command_type=CommandType.STEP,
+            actions=[0.0] * cls.ACTION_JOINT_COUNT,
+            axis_6_orientation=0.0,
+            gripper_close_value=0.0
+        ).to_dictionary()
+
+    @staticmethod
+    def _create_reset_command() -> dict:
+        """RESET command."""
+        return CommandModel(command_type=CommandType.RESET).to_dictionary()
+
+    @staticmethod
+    def _create_configuration_command() -> dict:
+        """CONFIG command selecting instant training-mode movement."""
+        return CommandModel(
+            command_type=CommandType.CONFIGURATION,
+            simulation_mode_enabled=False
+        ).to_dictionary()
@@ -0,0 +1,128 @@
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Sequence
+import numpy as np
+
+
+class ControlLoopSchedulerService:
+    """Runs a control cycle at a fixed rate and accounts for every cycle's deadline.
+
+    Cycle k is scheduled at start_time + k * period and must finish before the
+    next cycle is due; start jitter is how late it actually began. After a
+    missed deadline the schedule skips the ticks already lost instead of
+    running them back to back. The thread sleeps until shortly before each
+    start and spins for the rest, keeping jitter below the OS timer resolution.
+    """
+
+    DEFAULT_CONTROL_FREQUENCY_HERTZ: float = 20.0
+    DEFAULT_STATISTICS_WINDOW_CYCLES: int = 1000
+    SPIN_WAIT_SECONDS: float = 0.002
+    DEFAULT_JITTER_PERCENTILES: Sequence[float] = (50.0, 95.0, 99.0)
+
+    def __init__(
+        self,
+        control_frequency_hertz: float = DEFAULT_CONTROL_FREQUENCY_HERTZ,
+        statistics_window_cycles: int = DEFAULT_STATISTICS_WINDOW_CYCLES,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        if control_frequency_hertz <= 0.0:
+            raise ValueError("Control frequency must be positive")
+
+        self._period_seconds: float = 1.0 / control_frequency_hertz
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+        self._start_jitters: Deque[float] = deque(maxlen=statistics_window_cycles)
+        self._cycle_durations: Deque[float] = deque(maxlen=statistics_window_cycles)
+        self._cycle_count: int = 0
+        self._missed_deadline_count: int = 0
+        self._skipped_cycle_count: int = 0
+
+    @property
+    def period_seconds(self) -> float:
+        """Time between scheduled cycle starts."""
+        return self._period_seconds
+
+    @property
+    def cycle_count(self) -> int:
+        """Number of cycles run since the scheduler was created."""
+        return self._cycle_count
+
+    @property
+    def missed_deadline_count(self) -> int:
+        """Number of cycles that finished after the next cycle was due."""
+        return self._missed_deadline_count
+
+    @property
+    def skipped_cycle_count(self) -> int:
+        """Number of scheduled cycles dropped to catch up after overruns."""
+        return self._skipped_cycle_count
+
+    def run(self, cycle_function: Callable[[], bool], should_continue: Callable[[], bool]) -> None:
+        """Call cycle_function once per period until it returns False or should_continue does."""
+        scheduled_start: float = self._clock()
+
+        while should_continue():
+            self._wait_until(scheduled_start)
+            actual_start: float = self._clock()
+
+            keep_running: bool = cycle_function()
+
+            finish_time: float = self._clock()
+            deadline: float = scheduled_start + self._period_seconds
+            self._record_cycle(actual_start - scheduled_start, finish_time - actual_start, finish_time > deadline)
+
+            if not keep_running:
+                break
+
+            scheduled_start = deadline
+            if finish_time > scheduled_start:
+                lost_cycles: int = int((finish_time - scheduled_start) // self._period_seconds) + 1
+                self._skipped_cycle_count += lost_cycles
+                scheduled_start += lost_cycles * self._period_seconds
+
+    def compute_jitter_percentiles(
+        self,
+        percentiles: Sequence[float] = DEFAULT_JITTER_PERCENTILES
+    ) -> Dict[float, float]:
+        """Start-jitter percentiles in milliseconds over the statistics window."""
+        if not self._start_jitters:
+            return {percentile: 0.0 for percentile in percentiles}
+
+        values: np.ndarray = np.percentile(np.array(self._start_jitters) * 1000.0, list(percentiles))
+
+        return {percentile: float(value) for percentile, value in zip(percentiles, values)}
+
+    def create_statistics_summary(self) -> Dict[str, float]:
+        """Cycle counts, deadline misses, jitter percentiles and mean cycle time."""
+        summary: Dict[str, float] = {
+            "cycle_count": float(self._cycle_count),
+            "missed_deadline_count": float(self._missed_deadline_count),
+            "skipped_cycle_count": float(self._skipped_cycle_count),
+            "mean_cycle_milliseconds": (
+                float(np.mean(self._cycle_durations)) * 1000.0 if self._cycle_durations else 0.0)
+        }
+
+        for percentile, value in self.compute_jitter_percentiles().items():
+            summary[f"jitter_p{percentile:g}_milliseconds"] = value
+
+        return summary
+
+    def _wait_until(self, target_time: float) -> None:
+        """Sleep until just before target_time, then spin until it passes."""
+        remaining_seconds: float = target_time - self._clock()
+
+        if remaining_seconds > self.SPIN_WAIT_SECONDS:
+            self._sleep(remaining_seconds - self.SPIN_WAIT_SECONDS)
+
+        while self._clock() < target_time:
+            pass
+
+    def _record_cycle(self, start_jitter: float, cycle_duration: float, is_deadline_missed: bool) -> None:
+        """Add one cycle to the counters and the statistics window."""
+        self._cycle_count += 1
+        self._start_jitters.append(start_jitter)
+        self._cycle_durations.append(cycle_duration)
+
+        if is_deadline_missed:
+            self._missed_deadline_count += 1
@@ -0,0 +1,188 @@
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from .kinematics_service import KinematicsService
+
+
+class DemonstrationService:
+    """Generates inverse-kinematics reaching demonstrations for behavior cloning.
+
+    Trajectories are produced in the environment's own representation: the
+    17-dim normalized observation and the 7-dim normalized action, so they
+    can be fed directly to the PPO actor.
+    """
+
+    ACTIVE_JOINT_COUNT: int = 5
+    MAXIMUM_DELTA_DEGREES: float = 10.0
+    WORKSPACE_RADIUS_METERS: float = 0.6
+    LASER_MAXIMUM_RANGE_METERS: float = 1.0
+    TARGET_SAMPLING_LIMIT_FRACTION: float = 0.8
+    MINIMUM_TOOL_CENTER_POINT_HEIGHT: float = 0.05
+    MAXIMUM_SOLUTION_ERROR_METERS: float = 0.01
+    MAXIMUM_TRAJECTORY_STEPS: int = 100
+
+    def __init__(
+        self,
+        kinematics_service: KinematicsService,
+        joint_angle_limits: np.ndarray
+    ) -> None:
+        self._kinematics_service: KinematicsService = kinematics_service
+        self._joint_angle_limits: np.ndarray = np.asarray(
+            joint_angle_limits[:kinematics_service.number_of_joints], dtype=np.float64)
+
+    def generate(
+        self,
+        number_of_trajectories: int,
+        seed: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """Generate reaching trajectories starting from the home position.
+
+        Returns:
+            Dictionary with "observations" (M, 17), "actions" (M, 7) and
+            "episode_starts" (M,) flattened over all accepted trajectories.
+        """
+        random_generator: np.random.Generator = np.random.default_rng(seed)
+        number_of_joints: int = self._kinematics_service.number_of_joints
+
+        target_positions: np.ndarray = self._sample_reachable_targets(
+            number_of_trajectories, random_generator)
+        is_vertical_target: np.ndarray = random_generator.random(number_of_trajectories) < 0.5
+
+        # Axis 6 is commanded directly: 0° for vertical targets, 90° for horizontal
+        start_joint_angles: np.ndarray = np.zeros((number_of_trajectories, number_of_joints))
+        if number_of_joints > self.ACTIVE_JOINT_COUNT:
+            start_joint_angles[:, self.ACTIVE_JOINT_COUNT] = np.where(is_vertical_target, 0.0, 90.0)
+
+        goal_joint_angles, solution_errors = self._kinematics_service.solve_inverse_kinematics(
+            target_positions,
+            start_joint_angles,
+            self._joint_angle_limits,
+            active_joint_count=self.ACTIVE_JOINT_COUNT)
+
+        joint_angle_history, action_history, step_counts = self._interpolate_joint_trajectories(
+            start_joint_angles, goal_joint_angles, is_vertical_target)
+
+        is_accepted: np.ndarray = (
+            (solution_errors < self.MAXIMUM_SOLUTION_ERROR_METERS)
+            & self._stays_above_ground(joint_angle_history, step_counts)
+        )
+
+        observation_history: np.ndarray = self._build_observations(
+            joint_angle_history, target_positions, is_vertical_target)
+
+        # Flatten accepted trajectories in trajectory-major order
+        step_indices: np.ndarray = np.arange(joint_angle_history.shape[1])
+        is_valid_step: np.ndarray = (step_indices[None, :] < step_counts[:, None]) & is_accepted[:, None]
+
+        return {
+            "observations": observation_history[is_valid_step],
+            "actions": action_history[is_valid_step],
+            "episode_starts": np.broadcast_to(step_indices == 0, is_valid_step.shape)[is_valid_step]
+        }
+
+    def _sample_reachable_targets(
+        self,
+        number_of_targets: int,
+        random_generator: np.random.Generator
+    ) -> np.ndarray:
+        """Sample targets as TCP positions of random in-limit configurations above ground."""
+        targets: np.ndarray = np.empty((0, 3))
+
+        while len(targets) < number_of_targets:
+            sample_limits: np.ndarray = self._joint_angle_limits * self.TARGET_SAMPLING_LIMIT_FRACTION
+            joint_angles: np.ndarray = random_generator.uniform(
+                -sample_limits, sample_limits, size=(number_of_targets, len(sample_limits)))
+            joint_angles[:, self.ACTIVE_JOINT_COUNT:] = 0.0
+
+            positions: np.ndarray = self._kinematics_service.compute_tool_center_point_positions(joint_angles)
+            is_above_ground: np.ndarray = positions[:, 1] >= self.MINIMUM_TOOL_CENTER_POINT_HEIGHT
+            targets = np.concatenate([targets, positions[is_above_ground]])
+
+        return targets[:number_of_targets]
+
+    def _interpolate_joint_trajectories(
+        self,
+        start_joint_angles: np.ndarray,
+        goal_joint_angles: np.ndarray,
+        is_vertical_target: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Move every joint toward its goal at most MAXIMUM_DELTA_DEGREES per step.
+
+        Returns:
+            Tuple of (joint angles before each step (N, T, J), actions (N, T, 7),
+            number of steps per trajectory (N,)).
+        """
+        number_of_trajectories, number_of_joints = start_joint_angles.shape
+        remaining_degrees: np.ndarray = np.abs(goal_joint_angles - start_joint_angles)[:, :self.ACTIVE_JOINT_COUNT]
+        step_counts: np.ndarray = np.maximum(
+            np.ceil(remaining_degrees.max(axis=1) / self.MAXIMUM_DELTA_DEGREES).astype(int), 1)
+        step_counts = np.minimum(step_counts, self.MAXIMUM_TRAJECTORY_STEPS)
+        maximum_steps: int = int(step_counts.max())
+
+        joint_angle_history: np.ndarray = np.zeros((number_of_trajectories, maximum_steps, number_of_joints))
+        action_history: np.ndarray = np.zeros((number_of_trajectories, maximum_steps, 7), dtype=np.float32)
+        action_history[:, :, 5] = np.where(is_vertical_target, -1.0, 1.0)[:, None]
+        action_history[:, :, 6] = -1.0
+
+        current_joint_angles: np.ndarray = start_joint_angles.copy()
+
+        for step_index in range(maximum_steps):
+            joint_angle_history[:, step_index] = current_joint_angles
+
+            joint_deltas: np.ndarray = np.clip(
+                goal_joint_angles[:, :self.ACTIVE_JOINT_COUNT] - current_joint_angles[:, :self.ACTIVE_JOINT_COUNT],
+                -self.MAXIMUM_DELTA_DEGREES,
+                self.MAXIMUM_DELTA_DEGREES)
+            action_history[:, step_index, :self.ACTIVE_JOINT_COUNT] = joint_deltas / self.MAXIMUM_DELTA_DEGREES
+            current_joint_angles[:, :self.ACTIVE_JOINT_COUNT] += joint_deltas
+
+        return joint_angle_history, action_history, step_counts
+
+    def _stays_above_ground(self, joint_angle_history: np.ndarray, step_counts: np.ndarray) -> np.ndarray:
+        """Check that no visited configuration puts the TCP below the minimum height."""
+        number_of_trajectories, maximum_steps, number_of_joints = joint_angle_history.shape
+        heights: np.ndarray = self._kinematics_service.compute_tool_center_point_positions(
+            joint_angle_history.reshape(-1, number_of_joints))[:, 1].reshape(number_of_trajectories, maximum_steps)
+
+        is_valid_step: np.ndarray = np.arange(maximum_steps)[None, :] < step_counts[:, None]
+        is_below_ground: np.ndarray = (heights < 0.0) & is_valid_step
+
+        return ~np.any(is_below_ground, axis=1)
+
+    def _build_observations(
+        self,
+        joint_angle_history: np.ndarray,
+        target_positions: np.ndarray,
+        is_vertical_target: np.ndarray
+    ) -> np.ndarray:
+        """Build normalized observations matching UnityRobotEnvironment._normalize_observation."""
+        number_of_trajectories, maximum_steps, number_of_joints = joint_angle_history.shape
+
+        tool_center_point_positions: np.ndarray = self._kinematics_service.compute_tool_center_point_positions(
+            joint_angle_history.reshape(-1, number_of_joints)).reshape(number_of_trajectories, maximum_steps, 3)
+
+        offsets_to_target: np.ndarray = target_positions[:, None, :] - tool_center_point_positions
+        distances_to_target: np.ndarray = np.linalg.norm(offsets_to_target, axis=2, keepdims=True)
+        directions_to_target: np.ndarray = np.divide(
+            offsets_to_target,
+            distances_to_target,
+            out=np.zeros_like(offsets_to_target),
+            where=distances_to_target > 1e-9)
+
+        normalized_joint_angles: np.ndarray = np.zeros((number_of_trajectories, maximum_steps, 6))
+        normalized_joint_angles[:, :, :number_of_joints] = joint_angle_history / self._joint_angle_limits
+
+        target_orientation: np.ndarray = np.where(
+            is_vertical_target[:, None], [1.0, 0.0], [0.0, 1.0])[:, None, :]
+
+        observations: np.ndarray = np.concatenate([
+            normalized_joint_angles,
+            np.ones((number_of_trajectories, maximum_steps, 1)),
+            tool_center_point_positions / self.WORKSPACE_RADIUS_METERS,
+            directions_to_target,
+            np.full((number_of_trajectories, maximum_steps, 1), 1.0 / self.LASER_MAXIMUM_RANGE_METERS),
+            np.zeros((number_of_trajectories, maximum_steps, 1)),
+            np.broadcast_to(target_orientation, (number_of_trajectories, maximum_steps, 2))
+        ], axis=2)
+
+        return np.clip(observations, -1.0, 1.0).astype(np.float32)
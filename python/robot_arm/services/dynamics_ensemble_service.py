@@ -0,0 +1,168 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+
+class DynamicsEnsembleService:
+    """Ensemble of small MLPs predicting the next observation and reward from an observation and joint deltas.
+
+    Every member is trained on its own bootstrap resample of the recorded
+    transitions and predicts the observation change plus the reward in
+    standardized units. Disagreement between members measures how far a
+    state is from the data the ensemble has seen, so imagined rollouts can
+    stop where the model cannot be trusted. Members are evaluated as one
+    batched matrix product per layer.
+    """
+
+    DEFAULT_ENSEMBLE_SIZE: int = 5
+    DEFAULT_HIDDEN_LAYER_SIZES: Tuple[int, ...] = (200, 200)
+    DEFAULT_LEARNING_RATE: float = 1e-3
+    DEFAULT_FIT_EPOCHS: int = 5
+    DEFAULT_FIT_BATCH_SIZE: int = 256
+    MINIMUM_STANDARD_DEVIATION: float = 1e-6
+
+    def __init__(
+        self,
+        observation_dimension: int,
+        action_dimension: int,
+        ensemble_size: int = DEFAULT_ENSEMBLE_SIZE,
+        hidden_layer_sizes: Tuple[int, ...] = DEFAULT_HIDDEN_LAYER_SIZES,
+        learning_rate: float = DEFAULT_LEARNING_RATE,
+        seed: Optional[int] = None
+    ) -> None:
+        import torch
+
+        self._observation_dimension: int = observation_dimension
+        self._action_dimension: int = action_dimension
+        self._ensemble_size: int = ensemble_size
+        self._random_generator: np.random.Generator = np.random.default_rng(seed)
+        self._torch_generator = torch.Generator().manual_seed(int(self._random_generator.integers(2 ** 31)))
+
+        input_dimension: int = observation_dimension + action_dimension
+        output_dimension: int = observation_dimension + 1
+        layer_sizes: List[int] = [input_dimension] + list(hidden_layer_sizes) + [output_dimension]
+
+        # One weight tensor per layer holds every member: (members, inputs, outputs)
+        self._weights: list = []
+        self._biases: list = []
+        for input_size, output_size in zip(layer_sizes[:-1], layer_sizes[1:]):
+            weight = torch.randn(ensemble_size, input_size, output_size, generator=self._torch_generator)
+            self._weights.append(torch.nn.Parameter(weight / np.sqrt(input_size)))
+            self._biases.append(torch.nn.Parameter(torch.zeros(ensemble_size, 1, output_size)))
+
+        self._optimizer = torch.optim.Adam(self._weights + self._biases, lr=learning_rate)
+
+        self._input_mean: np.ndarray = np.zeros(input_dimension, dtype=np.float32)
+        self._input_standard_deviation: np.ndarray = np.ones(input_dimension, dtype=np.float32)
+        self._target_mean: np.ndarray = np.zeros(output_dimension, dtype=np.float32)
+        self._target_standard_deviation: np.ndarray = np.ones(output_dimension, dtype=np.float32)
+        self._is_fitted: bool = False
+
+    @property
+    def ensemble_size(self) -> int:
+        """Number of independently trained members."""
+        return self._ensemble_size
+
+    @property
+    def is_fitted(self) -> bool:
+        """Whether fit has been called at least once."""
+        return self._is_fitted
+
+    def fit(
+        self,
+        observations: np.ndarray,
+        actions: np.ndarray,
+        next_observations: np.ndarray,
+        rewards: np.ndarray,
+        epochs: int = DEFAULT_FIT_EPOCHS,
+        batch_size: int = DEFAULT_FIT_BATCH_SIZE
+    ) -> float:
+        """Train every member on a bootstrap resample of the transitions.
+
+        Normalization statistics are refreshed from the given data, and
+        training continues from the current weights. Returns the mean
+        squared error of the final epoch in standardized units.
+        """
+        import torch
+
+        inputs: np.ndarray = np.concatenate([observations, actions], axis=1).astype(np.float32)
+        targets: np.ndarray = np.concatenate(
+            [next_observations - observations, np.reshape(rewards, (-1, 1))], axis=1).astype(np.float32)
+
+        self._input_mean = inputs.mean(axis=0)
+        self._input_standard_deviation = np.maximum(inputs.std(axis=0), self.MINIMUM_STANDARD_DEVIATION)
+        self._target_mean = targets.mean(axis=0)
+        self._target_standard_deviation = np.maximum(targets.std(axis=0), self.MINIMUM_STANDARD_DEVIATION)
+
+        input_tensor = torch.as_tensor((inputs - self._input_mean) / self._input_standard_deviation)
+        target_tensor = torch.as_tensor((targets - self._target_mean) / self._target_standard_deviation)
+
+        sample_count: int = len(inputs)
+        bootstrap_indices: np.ndarray = self._random_generator.integers(
+            0, sample_count, size=(self._ensemble_size, sample_count))
+        epoch_loss: float = 0.0
+
+        for _ in range(epochs):
+            permutation: np.ndarray = self._random_generator.permutation(sample_count)
+            batch_losses: List[float] = []
+
+            for batch_start in range(0, sample_count, batch_size):
+                batch_indices = torch.as_tensor(
+                    bootstrap_indices[:, permutation[batch_start:batch_start + batch_size]])
+
+                predictions = self._forward(input_tensor[batch_indices])
+                loss = torch.mean((predictions - target_tensor[batch_indices]) ** 2)
+
+                self._optimizer.zero_grad()
+                loss.backward()
+                self._optimizer.step()
+                batch_losses.append(float(loss.detach()))
+
+            epoch_loss = float(np.mean(batch_losses))
+
+        self._is_fitted = True
+
+        return epoch_loss
+
+    def predict(self, observations: np.ndarray, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Predict next observations and rewards with a per-sample uncertainty.
+
+        Each sample takes the prediction of a randomly chosen member, so
+        rollouts keep the spread of the ensemble instead of its average.
+
+        Returns:
+            Tuple of next observations (N, observation_dimension), rewards (N,)
+            and uncertainties (N,), the standard deviation of the members'
+            next observations averaged over dimensions.
+        """
+        import torch
+
+        inputs: np.ndarray = np.concatenate([observations, actions], axis=1).astype(np.float32)
+        input_tensor = torch.as_tensor((inputs - self._input_mean) / self._input_standard_deviation)
+
+        with torch.no_grad():
+            member_inputs = input_tensor.unsqueeze(0).expand(self._ensemble_size, -1, -1)
+            standardized_outputs: np.ndarray = self._forward(member_inputs).numpy()
+
+        outputs: np.ndarray = standardized_outputs * self._target_standard_deviation + self._target_mean
+        member_next_observations: np.ndarray = observations[np.newaxis] + outputs[:, :, :-1]
+
+        sample_count: int = len(observations)
+        chosen_members: np.ndarray = self._random_generator.integers(0, self._ensemble_size, size=sample_count)
+        chosen_outputs: np.ndarray = outputs[chosen_members, np.arange(sample_count)]
+
+        next_observations: np.ndarray = observations + chosen_outputs[:, :-1]
+        uncertainties: np.ndarray = member_next_observations.std(axis=0).mean(axis=1)
+
+        return next_observations.astype(np.float32), chosen_outputs[:, -1].astype(np.float32), uncertainties
+
+    def _forward(self, member_inputs):
+        """Evaluate all members on (members, batch, inputs) standardized inputs."""
+        import torch
+
+        hidden = member_inputs
+        for layer_index, (weight, bias) in enumerate(zip(self._weights, self._biases)):
+            hidden = torch.baddbmm(bias, hidden, weight)
+            if layer_index < len(self._weights) - 1:
+                hidden = torch.nn.functional.silu(hidden)
+
+        return hidden
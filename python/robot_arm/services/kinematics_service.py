@@ -0,0 +1,284 @@
+import itertools
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+
+class KinematicsService:
+    """Vectorized forward kinematics model of the 6-DOF robot arm.
+
+    The arm is modelled as a serial chain of revolute joints. Each joint
+    rotates about one principal axis of its parent frame and is followed by a
+    fixed link offset, so the tool center point is
+
+        tcp = base + R1 @ o1 + R1 @ R2 @ o2 + ... + R1 @ ... @ R6 @ o6
+
+    The position is linear in the base position and link offsets, which lets
+    them be calibrated with a single least-squares solve from observed
+    (JointAngles, ToolCenterPointPosition) pairs.
+    """
+
+    JOINT_ROTATION_AXES: Tuple[str, ...] = ("y", "x", "x", "x", "z", "x")
+    DEFAULT_BASE_POSITION: Tuple[float, float, float] = (0.0, 0.1, 0.0)
+    DEFAULT_LINK_OFFSETS: Tuple[Tuple[float, float, float], ...] = (
+        (0.0, 0.1, 0.0),
+        (0.0, 0.25, 0.0),
+        (0.0, 0.2, 0.0),
+        (0.0, 0.05, 0.0),
+        (0.0, 0.05, 0.0),
+        (0.0, 0.05, 0.0),
+    )
+    MINIMUM_CALIBRATION_SAMPLES: int = 30
+    INVERSE_KINEMATICS_ITERATIONS: int = 100
+    INVERSE_KINEMATICS_DAMPING: float = 0.05
+    INVERSE_KINEMATICS_MAXIMUM_STEP_DEGREES: float = 15.0
+
+    def __init__(
+        self,
+        joint_rotation_axes: Sequence[str] = JOINT_ROTATION_AXES,
+        base_position: Optional[Sequence[float]] = None,
+        link_offsets: Optional[Sequence[Sequence[float]]] = None
+    ) -> None:
+        self._joint_rotation_axes: Tuple[str, ...] = tuple(joint_rotation_axes)
+        self._number_of_joints: int = len(self._joint_rotation_axes)
+        self._axis_signs: np.ndarray = np.ones(self._number_of_joints)
+
+        self._base_position: np.ndarray = np.array(
+            base_position if base_position is not None else self.DEFAULT_BASE_POSITION,
+            dtype=np.float64)
+        self._link_offsets: np.ndarray = np.array(
+            link_offsets if link_offsets is not None
+            else self.DEFAULT_LINK_OFFSETS[:self._number_of_joints],
+            dtype=np.float64)
+
+        self._calibration_error: Optional[float] = None
+
+    @property
+    def number_of_joints(self) -> int:
+        """Number of revolute joints in the modelled chain."""
+        return self._number_of_joints
+
+    @property
+    def is_calibrated(self) -> bool:
+        """Check if the link parameters were fitted to observed data."""
+        return self._calibration_error is not None
+
+    @property
+    def calibration_error(self) -> Optional[float]:
+        """Root-mean-square TCP position error of the last calibration (meters)."""
+        return self._calibration_error
+
+    @property
+    def base_position(self) -> np.ndarray:
+        """Position of the chain origin in world coordinates."""
+        return self._base_position.copy()
+
+    @property
+    def link_offsets(self) -> np.ndarray:
+        """Link offset vectors, one row per joint, in the joint's local frame."""
+        return self._link_offsets.copy()
+
+    def compute_tool_center_point_positions(self, joint_angles_degrees: np.ndarray) -> np.ndarray:
+        """Compute TCP positions for a batch of joint configurations.
+
+        Args:
+            joint_angles_degrees: Array of shape (N, J) or (J,) with J >= number_of_joints.
+
+        Returns:
+            Array of shape (N, 3), or (3,) for a single configuration.
+        """
+        angles: np.ndarray = np.asarray(joint_angles_degrees, dtype=np.float64)
+        is_single_configuration: bool = angles.ndim == 1
+        angles = np.atleast_2d(angles)[:, :self._number_of_joints]
+
+        cumulative_rotations: np.ndarray = self._compute_cumulative_rotations(angles, self._axis_signs)
+        positions: np.ndarray = self._base_position + np.einsum(
+            "njab,jb->na", cumulative_rotations, self._link_offsets)
+
+        return positions[0] if is_single_configuration else positions
+
+    def compute_positional_jacobians(self, joint_angles_degrees: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute TCP positions and positional Jacobians for a batch of configurations.
+
+        Returns:
+            Tuple of (positions (N, 3), jacobians (N, 3, J) in meters per degree).
+        """
+        angles: np.ndarray = np.atleast_2d(np.asarray(joint_angles_degrees, dtype=np.float64))
+        angles = angles[:, :self._number_of_joints]
+        cumulative_rotations: np.ndarray = self._compute_cumulative_rotations(angles, self._axis_signs)
+
+        # Position of every link end; joint i pivots about the end of link i-1
+        link_vectors: np.ndarray = np.einsum("njab,jb->nja", cumulative_rotations, self._link_offsets)
+        link_end_positions: np.ndarray = self._base_position + np.cumsum(link_vectors, axis=1)
+        positions: np.ndarray = link_end_positions[:, -1]
+        pivot_positions: np.ndarray = np.concatenate([
+            np.broadcast_to(self._base_position, (len(angles), 1, 3)),
+            link_end_positions[:, :-1]
+        ], axis=1)
+
+        # A joint rotates about its own axis, so the axis is the same before and after it
+        axis_unit_vectors: np.ndarray = np.array([
+            {"x": (1.0, 0.0, 0.0), "y": (0.0, 1.0, 0.0), "z": (0.0, 0.0, 1.0)}[axis_name]
+            for axis_name in self._joint_rotation_axes
+        ]) * self._axis_signs[:, None]
+        world_axes: np.ndarray = np.einsum("njab,jb->nja", cumulative_rotations, axis_unit_vectors)
+
+        jacobians: np.ndarray = np.cross(world_axes, positions[:, None, :] - pivot_positions)
+        jacobians = np.deg2rad(jacobians).transpose(0, 2, 1)
+
+        return positions, jacobians
+
+    def solve_inverse_kinematics(
+        self,
+        target_positions: np.ndarray,
+        initial_joint_angles: np.ndarray,
+        joint_angle_limits: np.ndarray,
+        active_joint_count: Optional[int] = None,
+        iterations: int = INVERSE_KINEMATICS_ITERATIONS,
+        damping: float = INVERSE_KINEMATICS_DAMPING
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Solve position-only inverse kinematics for a batch of targets.
+
+        Uses damped least squares, dq = J^T (J J^T + lambda^2 I)^-1 e, with the
+        joint angles clamped to the symmetric limits after every iteration.
+        Joints at or beyond active_joint_count keep their initial angle.
+
+        Returns:
+            Tuple of (joint angles (N, J), remaining position errors (N,) in meters).
+        """
+        targets: np.ndarray = np.atleast_2d(np.asarray(target_positions, dtype=np.float64))
+        joint_angles: np.ndarray = np.array(
+            np.broadcast_to(initial_joint_angles, (len(targets), self._number_of_joints)),
+            dtype=np.float64)
+        limits: np.ndarray = np.asarray(joint_angle_limits[:self._number_of_joints], dtype=np.float64)
+        active_joints: int = active_joint_count if active_joint_count is not None else self._number_of_joints
+        damping_matrix: np.ndarray = (damping ** 2) * np.eye(3)
+
+        for _ in range(iterations):
+            positions, jacobians = self.compute_positional_jacobians(joint_angles)
+            position_errors: np.ndarray = targets - positions
+            # Damping is defined against a Jacobian in meters per radian
+            active_jacobians: np.ndarray = np.rad2deg(jacobians[:, :, :active_joints])
+
+            weighted_errors: np.ndarray = np.linalg.solve(
+                active_jacobians @ active_jacobians.transpose(0, 2, 1) + damping_matrix,
+                position_errors[:, :, None])
+            joint_steps: np.ndarray = np.rad2deg(
+                (active_jacobians.transpose(0, 2, 1) @ weighted_errors)[:, :, 0])
+            joint_steps = np.clip(
+                joint_steps,
+                -self.INVERSE_KINEMATICS_MAXIMUM_STEP_DEGREES,
+                self.INVERSE_KINEMATICS_MAXIMUM_STEP_DEGREES)
+
+            joint_angles[:, :active_joints] = np.clip(
+                joint_angles[:, :active_joints] + joint_steps,
+                -limits[:active_joints],
+                limits[:active_joints])
+
+        remaining_errors: np.ndarray = np.linalg.norm(
+            targets - self.compute_tool_center_point_positions(joint_angles), axis=1)
+
+        return joint_angles, remaining_errors
+
+    def calibrate(
+        self,
+        joint_angles_degrees: np.ndarray,
+        tool_center_point_positions: np.ndarray
+    ) -> float:
+        """Fit base position, link offsets and joint axis signs to observed samples.
+
+        Every combination of joint axis signs is solved as one linear
+        least-squares problem; the combination with the lowest residual wins.
+
+        Returns:
+            Root-mean-square position error of the fitted model (meters).
+        """
+        angles: np.ndarray = np.asarray(joint_angles_degrees, dtype=np.float64)[:, :self._number_of_joints]
+        positions: np.ndarray = np.asarray(tool_center_point_positions, dtype=np.float64)
+
+        if len(angles) < self.MINIMUM_CALIBRATION_SAMPLES:
+            raise ValueError(
+                f"Calibration requires at least {self.MINIMUM_CALIBRATION_SAMPLES} samples, "
+                f"got {len(angles)}")
+
+        target_vector: np.ndarray = positions.reshape(-1)
+        best_error: float = np.inf
+        best_parameters: Optional[np.ndarray] = None
+        best_signs: Optional[np.ndarray] = None
+
+        for sign_combination in itertools.product((1.0, -1.0), repeat=self._number_of_joints):
+            axis_signs: np.ndarray = np.array(sign_combination)
+            design_matrix: np.ndarray = self._build_design_matrix(angles, axis_signs)
+            parameters, _, _, _ = np.linalg.lstsq(design_matrix, target_vector, rcond=None)
+
+            residual: np.ndarray = design_matrix @ parameters - target_vector
+            error: float = float(np.sqrt(np.mean(np.sum(residual.reshape(-1, 3) ** 2, axis=1))))
+
+            if error < best_error:
+                best_error = error
+                best_parameters = parameters
+                best_signs = axis_signs
+
+        self._axis_signs = best_signs
+        self._base_position = best_parameters[:3]
+        self._link_offsets = best_parameters[3:].reshape(self._number_of_joints, 3)
+        self._calibration_error = best_error
+
+        return best_error
+
+    def _build_design_matrix(self, angles: np.ndarray, axis_signs: np.ndarray) -> np.ndarray:
+        """Build the (N*3, 3 + 3J) matrix mapping link parameters to TCP positions."""
+        number_of_samples: int = len(angles)
+        cumulative_rotations: np.ndarray = self._compute_cumulative_rotations(angles, axis_signs)
+
+        identity_block: np.ndarray = np.broadcast_to(np.eye(3), (number_of_samples, 3, 3))
+        rotation_blocks: np.ndarray = cumulative_rotations.transpose(0, 2, 1, 3).reshape(
+            number_of_samples, 3, 3 * self._number_of_joints)
+
+        return np.concatenate([identity_block, rotation_blocks], axis=2).reshape(
+            number_of_samples * 3, 3 + 3 * self._number_of_joints)
+
+    def _compute_cumulative_rotations(self, angles: np.ndarray, axis_signs: np.ndarray) -> np.ndarray:
+        """Compute world rotations of every link frame, shape (N, J, 3, 3)."""
+        radians: np.ndarray = np.deg2rad(angles) * axis_signs
+        cosines: np.ndarray = np.cos(radians)
+        sines: np.ndarray = np.sin(radians)
+
+        number_of_samples: int = len(angles)
+        cumulative_rotations: np.ndarray = np.empty((number_of_samples, self._number_of_joints, 3, 3))
+        current_rotation: np.ndarray = np.broadcast_to(np.eye(3), (number_of_samples, 3, 3))
+
+        for joint_index, axis_name in enumerate(self._joint_rotation_axes):
+            joint_rotation: np.ndarray = self._build_axis_rotations(
+                axis_name, cosines[:, joint_index], sines[:, joint_index])
+            current_rotation = current_rotation @ joint_rotation
+            cumulative_rotations[:, joint_index] = current_rotation
+
+        return cumulative_rotations
+
+    @staticmethod
+    def _build_axis_rotations(axis_name: str, cosines: np.ndarray, sines: np.ndarray) -> np.ndarray:
+        """Build a batch of rotation matrices about one principal axis."""
+        rotations: np.ndarray = np.zeros((len(cosines), 3, 3))
+
+        if axis_name == "x":
+            rotations[:, 0, 0] = 1.0
+            rotations[:, 1, 1] = cosines
+            rotations[:, 1, 2] = -sines
+            rotations[:, 2, 1] = sines
+            rotations[:, 2, 2] = cosines
+        elif axis_name == "y":
+            rotations[:, 1, 1] = 1.0
+            rotations[:, 0, 0] = cosines
+            rotations[:, 0, 2] = sines
+            rotations[:, 2, 0] = -sines
+            rotations[:, 2, 2] = cosines
+        elif axis_name == "z":
+            rotations[:, 2, 2] = 1.0
+            rotations[:, 0, 0] = cosines
+            rotations[:, 0, 1] = -sines
+            rotations[:, 1, 0] = sines
+            rotations[:, 1, 1] = cosines
+        else:
+            raise ValueError(f"Unknown joint rotation axis: {axis_name}")
+
+        return rotations
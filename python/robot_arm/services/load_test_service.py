@@ -0,0 +1,273 @@
+import asyncio
+import json
+import random
+import struct
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..enums.command_type import CommandType
+from ..models.command_model import CommandModel
+from .connection_probe_service import ConnectionProbeService
+from .message_framing_service import MessageFramingService
+
+
+class LoadTestService:
+    """Ramps concurrent training clients against a simulator host to find where latency collapses.
+
+    Every stage opens `concurrency` asyncio connections that each behave like
+    a training client: RESET, then STEP commands with random actions until
+    the episode ends by collision or episode_length steps, then RESET again.
+    Clients start at random points of their episode so resets are spread
+    out, and can wait think_time_seconds between commands to stand in for
+    policy inference. A connection that times out or fails is reopened.
+    Each stage reports connect times and, per command type, latency
+    percentiles, throughput and error rate; failed connects count as errors
+    of the whole stage. Only the standard library is
+    used, so it runs wherever the probe runs.
+    """
+
+    DEFAULT_HOST: str = ConnectionProbeService.DEFAULT_HOST
+    DEFAULT_PORT: int = ConnectionProbeService.DEFAULT_PORT
+    DEFAULT_TIMEOUT_SECONDS: float = ConnectionProbeService.DEFAULT_TIMEOUT_SECONDS
+    DEFAULT_CONCURRENCY_STAGES: Sequence[int] = (1, 10, 50, 100, 200, 400)
+    DEFAULT_STAGE_SECONDS: float = 10.0
+    DEFAULT_EPISODE_LENGTH: int = ConnectionProbeService.DEFAULT_EPISODE_LENGTH
+    DEFAULT_THINK_TIME_SECONDS: float = 0.0
+    DEFAULT_MAXIMUM_P99_MILLISECONDS: float = 50.0
+    DEFAULT_MAXIMUM_ERROR_RATE: float = 0.01
+    DEFAULT_PERCENTILES: Sequence[float] = ConnectionProbeService.DEFAULT_PERCENTILES
+    ACTION_JOINT_COUNT: int = ConnectionProbeService.ACTION_JOINT_COUNT
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        concurrency_stages: Sequence[int] = DEFAULT_CONCURRENCY_STAGES,
+        stage_seconds: float = DEFAULT_STAGE_SECONDS,
+        episode_length: int = DEFAULT_EPISODE_LENGTH,
+        think_time_seconds: float = DEFAULT_THINK_TIME_SECONDS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        seed: Optional[int] = None
+    ) -> None:
+        if not concurrency_stages or min(concurrency_stages) < 1:
+            raise ValueError("Every stage needs at least one connection")
+
+        if episode_length < 1:
+            raise ValueError("Episodes need at least one step")
+
+        self._host: str = host
+        self._port: int = port
+        self._concurrency_stages: List[int] = list(concurrency_stages)
+        self._stage_seconds: float = stage_seconds
+        self._episode_length: int = episode_length
+        self._think_time_seconds: float = think_time_seconds
+        self._timeout_seconds: float = timeout_seconds
+        self._random_generator: random.Random = random.Random(seed)
+
+    def run(self, progress_callback: Optional[Callable[[dict], None]] = None) -> List[dict]:
+        """Run every stage in order of the configured concurrency levels.
+
+        Returns:
+            One result per stage: "concurrency", "elapsed_seconds",
+            connect statistics and "commands", the per command type (and
+            "ALL") summaries.
+        """
+        stage_results: List[dict] = []
+
+        for concurrency in self._concurrency_stages:
+            stage_results.append(asyncio.run(self._run_stage(concurrency)))
+            if progress_callback is not None:
+                progress_callback(stage_results[-1])
+
+        return stage_results
+
+    @classmethod
+    def find_capacity(
+        cls,
+        stage_results: List[dict],
+        maximum_p99_milliseconds: float = DEFAULT_MAXIMUM_P99_MILLISECONDS,
+        maximum_error_rate: float = DEFAULT_MAXIMUM_ERROR_RATE
+    ) -> int:
+        """Highest concurrency served within the latency and error limits, stopping at the first stage over them.
+
+        A stage that completed no command at all counts as over the limits.
+
+        Returns:
+            The concurrency, or 0 if even the first stage exceeded a limit.
+        """
+        capacity: int = 0
+
+        for stage_result in stage_results:
+            summary: Dict[str, float] = stage_result["commands"]["ALL"]
+            if (summary["count"] == 0 or summary["p99_milliseconds"] > maximum_p99_milliseconds
+                    or summary["error_rate"] > maximum_error_rate):
+                break
+            capacity = stage_result["concurrency"]
+
+        return capacity
+
+    async def _run_stage(self, concurrency: int) -> dict:
+        """Run concurrency clients until the stage deadline and summarize them."""
+        samples: Dict[str, List[float]] = {}
+        failures: Dict[str, Dict[str, int]] = {}
+        connect_seconds: List[float] = []
+        connection_failures: List[int] = [0]
+
+        start_time: float = time.perf_counter()
+        deadline: float = start_time + self._stage_seconds
+
+        await asyncio.gather(*[
+            self._run_client(
+                self._random_generator.randrange(self._episode_length),
+                deadline, samples, failures, connect_seconds, connection_failures)
+            for _ in range(concurrency)])
+
+        elapsed_seconds: float = max(time.perf_counter() - start_time, 1e-9)
+        connect_milliseconds: List[float] = sorted(seconds * 1000.0 for seconds in connect_seconds)
+
+        command_types: List[str] = sorted(set(samples) | set(failures))
+        command_summaries: Dict[str, Dict[str, float]] = {
+            command_type: self._summarize_samples(
+                samples.get(command_type, []),
+                failures.get(command_type, {"timeouts": 0, "errors": 0}),
+                elapsed_seconds)
+            for command_type in command_types
+        }
+        # A refused or timed-out connect is a failed attempt of the stage as a whole
+        command_summaries["ALL"] = self._summarize_samples(
+            [latency for latencies in samples.values() for latency in latencies],
+            {
+                "timeouts": sum(failure_counts["timeouts"] for failure_counts in failures.values()),
+                "errors": sum(failure_counts["errors"] for failure_counts in failures.values()) + connection_failures[0]
+            },
+            elapsed_seconds)
+
+        return {
+            "concurrency": concurrency,
+            "elapsed_seconds": elapsed_seconds,
+            "connections_opened": len(connect_seconds),
+            "connection_failures": connection_failures[0],
+            "connect_p50_milliseconds": ConnectionProbeService.compute_percentile(connect_milliseconds, 50.0),
+            "connect_p99_milliseconds": ConnectionProbeService.compute_percentile(connect_milliseconds, 99.0),
+            "commands": command_summaries
+        }
+
+    async def _run_client(
+        self,
+        steps_since_reset: int,
+        deadline: float,
+        samples: Dict[str, List[float]],
+        failures: Dict[str, Dict[str, int]],
+        connect_seconds: List[float],
+        connection_failures: List[int]
+    ) -> None:
+        """One training client: reset, step through episodes, reconnect after failures."""
+        reader: Optional[asyncio.StreamReader] = None
+        writer: Optional[asyncio.StreamWriter] = None
+        needs_reset: bool = True
+
+        try:
+            while time.perf_counter() < deadline:
+                if writer is None:
+                    connect_start_time: float = time.perf_counter()
+                    try:
+                        reader, writer = await asyncio.wait_for(
+                            asyncio.open_connection(self._host, self._port), self._timeout_seconds)
+                    except (OSError, asyncio.TimeoutError):
+                        connection_failures[0] += 1
+                        await asyncio.sleep(min(self._timeout_seconds, 0.1))
+                        continue
+                    connect_seconds.append(time.perf_counter() - connect_start_time)
+                    needs_reset = True
+
+                if needs_reset:
+                    command: dict = self._create_reset_command()
+                else:
+                    command = self._create_step_command()
+
+                try:
+                    response, round_trip_seconds = await asyncio.wait_for(
+                        self._send_command(reader, writer, command), self._timeout_seconds)
+                except (OSError, ConnectionError, ValueError, asyncio.IncompleteReadError,
+                        asyncio.TimeoutError) as command_error:
+                    failure_name: str = "timeouts" if isinstance(command_error, asyncio.TimeoutError) else "errors"
+                    failures.setdefault(command["Type"], {"timeouts": 0, "errors": 0})[failure_name] += 1
+                    # The stream may hold a late response, so it is not reused
+                    writer.close()
+                    writer = None
+                    continue
+
+                samples.setdefault(command["Type"], []).append(round_trip_seconds)
+
+                if needs_reset:
+                    needs_reset = False
+                    steps_since_reset = 0
+                else:
+                    steps_since_reset += 1
+                    needs_reset = steps_since_reset >= self._episode_length or bool(
+                        response.get("CollisionDetected", False))
+
+                if self._think_time_seconds > 0.0:
+                    await asyncio.sleep(self._think_time_seconds)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    @staticmethod
+    async def _send_command(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        command: dict
+    ) -> Tuple[dict, float]:
+        """Response and round-trip seconds for one framed command."""
+        start_time: float = time.perf_counter()
+        writer.write(MessageFramingService.encode_message(command))
+        await writer.drain()
+
+        length_data: bytes = await reader.readexactly(MessageFramingService.LENGTH_PREFIX_SIZE)
+        response_length: int = struct.unpack(MessageFramingService.LENGTH_PREFIX_FORMAT, length_data)[0]
+        response_payload: bytes = await reader.readexactly(response_length)
+        round_trip_seconds: float = time.perf_counter() - start_time
+
+        return json.loads(response_payload.decode("utf-8")), round_trip_seconds
+
+    def _summarize_samples(
+        self,
+        latencies_seconds: List[float],
+        failure_counts: Dict[str, int],
+        elapsed_seconds: float
+    ) -> Dict[str, float]:
+        """Count, failures, error rate, throughput and latency percentiles for one command type."""
+        latencies: List[float] = sorted(latency_seconds * 1000.0 for latency_seconds in latencies_seconds)
+        failure_count: int = failure_counts["timeouts"] + failure_counts["errors"]
+        attempt_count: int = len(latencies) + failure_count
+        summary: Dict[str, float] = {
+            "count": float(len(latencies)),
+            "timeouts": float(failure_counts["timeouts"]),
+            "errors": float(failure_counts["errors"]),
+            "error_rate": failure_count / attempt_count if attempt_count else 0.0,
+            "commands_per_second": len(latencies) / elapsed_seconds,
+            "mean_milliseconds": sum(latencies) / len(latencies) if latencies else 0.0
+        }
+
+        for percentile in self.DEFAULT_PERCENTILES:
+            summary[f"p{percentile:g}_milliseconds"] = ConnectionProbeService.compute_percentile(
+                latencies, percentile)
+
+        summary["maximum_milliseconds"] = latencies[-1] if latencies else 0.0
+
+        return summary
+
+    def _create_step_command(self) -> dict:
+        """STEP with random actions, so payload sizes vary like a training client's."""
+        return CommandModel(
+            command_type=CommandType.STEP,
+            actions=[self._random_generator.uniform(-1.0, 1.0) for _ in range(self.ACTION_JOINT_COUNT)],
+            axis_6_orientation=self._random_generator.uniform(-1.0, 1.0),
+            gripper_close_value=self._random_generator.uniform(0.0, 1.0)
+        ).to_dictionary()
+
+    @staticmethod
+    def _create_reset_command() -> dict:
+        """RESET command."""
+        return CommandModel(command_type=CommandType.RESET).to_dictionary()
@@ -0,0 +1,70 @@
+import json
+import socket
+import struct
+
+
+class MessageFramingService:
+    """Length-prefixed JSON framing shared by every TCP endpoint.
+
+    Each message is a 4-byte big-endian length followed by a UTF-8 JSON body,
+    the format Unity's TcpNetworkService speaks.
+    """
+
+    LENGTH_PREFIX_FORMAT: str = ">I"
+    LENGTH_PREFIX_SIZE: int = 4
+
+    @staticmethod
+    def encode_message(message: dict) -> bytes:
+        """Serialize a message to its framed wire representation."""
+        json_bytes: bytes = json.dumps(message).encode("utf-8")
+        return struct.pack(MessageFramingService.LENGTH_PREFIX_FORMAT, len(json_bytes)) + json_bytes
+
+    @staticmethod
+    def send_message(connection: socket.socket, message: dict) -> int:
+        """Send one framed message and return the number of bytes written."""
+        framed_bytes: bytes = MessageFramingService.encode_message(message)
+        connection.sendall(framed_bytes)
+        return len(framed_bytes)
+
+    @staticmethod
+    def receive_message(connection: socket.socket) -> dict:
+        """Receive one framed message."""
+        length_data: bytes = MessageFramingService.receive_exact(
+            connection, MessageFramingService.LENGTH_PREFIX_SIZE)
+        message_length: int = struct.unpack(MessageFramingService.LENGTH_PREFIX_FORMAT, length_data)[0]
+        message_bytes: bytes = MessageFramingService.receive_exact(connection, message_length)
+
+        return json.loads(message_bytes.decode("utf-8"))
+
+    @staticmethod
+    def send_bytes(connection: socket.socket, payload: bytes) -> int:
+        """Send one length-prefixed binary payload and return the number of bytes written."""
+        connection.sendall(struct.pack(MessageFramingService.LENGTH_PREFIX_FORMAT, len(payload)) + payload)
+        return MessageFramingService.LENGTH_PREFIX_SIZE + len(payload)
+
+    @staticmethod
+    def receive_bytes(connection: socket.socket) -> bytes:
+        """Receive one length-prefixed binary payload."""
+        length_data: bytes = MessageFramingService.receive_exact(
+            connection, MessageFramingService.LENGTH_PREFIX_SIZE)
+        payload_length: int = struct.unpack(MessageFramingService.LENGTH_PREFIX_FORMAT, length_data)[0]
+
+        return MessageFramingService.receive_exact(connection, payload_length)
+
+    @staticmethod
+    def receive_exact(connection: socket.socket, num_bytes: int) -> bytes:
+        """Receive exactly num_bytes from the socket."""
+        # Preallocated buffer avoids quadratic copying for large binary payloads
+        data: bytearray = bytearray(num_bytes)
+        view: memoryview = memoryview(data)
+        received_count: int = 0
+
+        while received_count < num_bytes:
+            chunk_size: int = connection.recv_into(view[received_count:], num_bytes - received_count)
+
+            if chunk_size == 0:
+                raise ConnectionError("Connection closed by peer")
+
+            received_count += chunk_size
+
+        return bytes(data)
@@ -0,0 +1,209 @@
+import socket
+import threading
+import time
+from typing import List, Optional
+
+from .message_framing_service import MessageFramingService
+
+
+class MockSimulatorService:
+    """Local stand-in for the Unity simulator that speaks the full observation protocol.
+
+    Joint angles integrate the STEP actions within the joint limits, and the
+    distance to the target shrinks linearly until it is reached after
+    steps_to_target steps; NEW_TARGET and SET_TARGET move the target back
+    to the starting distance without ending the episode. Every command waits
+    response_latency_seconds before answering, standing in for physics time
+    and network delay. The time spent answering commands is accumulated so
+    callers can compute how busy the simulator was kept, and resets and
+    target changes are counted so tests can check what a client sent. With
+    include_optional_fields off, observations carry only the fields an older
+    Unity build sends.
+    """
+
+    DEFAULT_HOST: str = "localhost"
+    DEFAULT_STEPS_TO_TARGET: int = 1 << 30
+    DEFAULT_EPISODE_LENGTH: int = 200
+    JOINT_ANGLE_LIMITS: List[float] = [90.0, 90.0, 90.0, 180.0, 90.0, 90.0]
+    STARTING_DISTANCE: float = 1.0
+    TARGET_POSITION: List[float] = [0.4, 0.3, 0.2]
+    OPTIONAL_FIELD_NAMES: List[str] = [
+        "TargetPosition", "GripperState", "IsGrippingObject", "LaserSensorHit", "LaserSensorDistance",
+        "TargetOrientationOneHot"]
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = 0,
+        response_latency_seconds: float = 0.0,
+        steps_to_target: int = DEFAULT_STEPS_TO_TARGET,
+        episode_length: Optional[int] = DEFAULT_EPISODE_LENGTH,
+        include_optional_fields: bool = True
+    ) -> None:
+        self._response_latency_seconds: float = response_latency_seconds
+        self._steps_to_target: int = steps_to_target
+        self._episode_length: Optional[int] = episode_length
+        self._include_optional_fields: bool = include_optional_fields
+        self._statistics_lock: threading.Lock = threading.Lock()
+        self._busy_seconds: float = 0.0
+        self._command_count: int = 0
+        self._reset_count: int = 0
+        self._new_target_count: int = 0
+        self._set_target_positions: List[List[float]] = []
+
+        self._listening_socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listening_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listening_socket.bind((host, port))
+        self._listening_socket.listen()
+        self.port: int = self._listening_socket.getsockname()[1]
+
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    @property
+    def busy_seconds(self) -> float:
+        """Seconds spent answering commands since the server started, summed over connections."""
+        with self._statistics_lock:
+            return self._busy_seconds
+
+    @property
+    def command_count(self) -> int:
+        """Commands answered since the server started."""
+        with self._statistics_lock:
+            return self._command_count
+
+    @property
+    def reset_count(self) -> int:
+        """RESET commands received, summed over connections."""
+        with self._statistics_lock:
+            return self._reset_count
+
+    @property
+    def new_target_count(self) -> int:
+        """NEW_TARGET commands received, summed over connections."""
+        with self._statistics_lock:
+            return self._new_target_count
+
+    @property
+    def set_target_positions(self) -> List[List[float]]:
+        """Positions requested by SET_TARGET commands, in arrival order."""
+        with self._statistics_lock:
+            return list(self._set_target_positions)
+
+    def close(self) -> None:
+        """Stop accepting new connections."""
+        # A thread blocked in accept() keeps a closed socket listening on Linux; shutdown wakes it
+        try:
+            self._listening_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._listening_socket.close()
+
+    def _serve(self) -> None:
+        """Accept connections, one thread per client."""
+        while True:
+            try:
+                connection, _ = self._listening_socket.accept()
+            except OSError:
+                return
+
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._handle_connection, args=(connection,), daemon=True).start()
+
+    def _handle_connection(self, connection: socket.socket) -> None:
+        """Answer commands until the client disconnects; each connection simulates its own arm."""
+        joint_angles: List[float] = [0.0] * len(self.JOINT_ANGLE_LIMITS)
+        target_position: List[float] = list(self.TARGET_POSITION)
+        steps_toward_target: int = 0
+        episode_step_count: int = 0
+
+        with connection:
+            while True:
+                try:
+                    command: dict = MessageFramingService.receive_message(connection)
+                except (ConnectionError, OSError, ValueError):
+                    return
+
+                start_time: float = time.perf_counter()
+                command_type: str = command.get("Type", "")
+
+                if command_type == "RESET":
+                    joint_angles = [0.0] * len(self.JOINT_ANGLE_LIMITS)
+                    target_position = list(self.TARGET_POSITION)
+                    steps_toward_target = 0
+                    episode_step_count = 0
+                    with self._statistics_lock:
+                        self._reset_count += 1
+                elif command_type == "NEW_TARGET":
+                    steps_toward_target = 0
+                    with self._statistics_lock:
+                        self._new_target_count += 1
+                elif command_type == "SET_TARGET":
+                    target_position = list(command.get("TargetPosition") or target_position)
+                    steps_toward_target = 0
+                    with self._statistics_lock:
+                        self._set_target_positions.append(target_position)
+                elif command_type == "STEP":
+                    self._apply_actions(joint_angles, command)
+                    steps_toward_target += 1
+                    episode_step_count += 1
+
+                if self._response_latency_seconds > 0.0:
+                    time.sleep(self._response_latency_seconds)
+
+                if command_type == "CONFIG":
+                    response: dict = {"status": "ok"}
+                else:
+                    response = self._create_observation(
+                        joint_angles, target_position, steps_toward_target, episode_step_count,
+                        command_type == "RESET")
+
+                try:
+                    MessageFramingService.send_message(connection, response)
+                except OSError:
+                    return
+
+                with self._statistics_lock:
+                    self._busy_seconds += time.perf_counter() - start_time
+                    self._command_count += 1
+
+    def _apply_actions(self, joint_angles: List[float], command: dict) -> None:
+        """Add the action deltas to the first five joints and set the sixth from its orientation."""
+        for joint_index, action in enumerate((command.get("Actions") or [])[:len(joint_angles) - 1]):
+            limit: float = self.JOINT_ANGLE_LIMITS[joint_index]
+            joint_angles[joint_index] = min(max(joint_angles[joint_index] + float(action), -limit), limit)
+
+        if command.get("Axis6Orientation") is not None:
+            joint_angles[-1] = float(command["Axis6Orientation"]) * self.JOINT_ANGLE_LIMITS[-1]
+
+    def _create_observation(
+        self,
+        joint_angles: List[float],
+        target_position: List[float],
+        steps_toward_target: int,
+        episode_step_count: int,
+        is_reset_frame: bool
+    ) -> dict:
+        """Observation carrying every field Unity sends, or only the required ones and the joint limits."""
+        progress: float = min(steps_toward_target / self._steps_to_target, 1.0)
+
+        observation: dict = {
+            "JointAngles": list(joint_angles),
+            "ToolCenterPointPosition": [0.0, 0.3, 0.2],
+            "DirectionToTarget": [0.0, 0.0, 1.0],
+            "DistanceToTarget": self.STARTING_DISTANCE * (1.0 - 0.8 * progress),
+            "TargetPosition": target_position,
+            "GripperState": 0.0,
+            "IsGrippingObject": False,
+            "LaserSensorHit": False,
+            "LaserSensorDistance": 0.0,
+            "CollisionDetected": self._episode_length is not None and episode_step_count >= self._episode_length,
+            "TargetOrientationOneHot": [1.0, 0.0],
+            "IsResetFrame": is_reset_frame,
+            "JointAngleLimits": self.JOINT_ANGLE_LIMITS
+        }
+
+        if not self._include_optional_fields:
+            for field_name in self.OPTIONAL_FIELD_NAMES:
+                del observation[field_name]
+
+        return observation
@@ -2,12 +2,9 @@ import json
 import socket
 import struct
 from typing import Optional
-import sys
-import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from models.command_model import CommandModel
-from models.observation_model import ObservationModel
+from ..models.command_model import CommandModel
+from ..models.observation_model import ObservationModel
 
 
 class NetworkService:
@@ -0,0 +1,123 @@
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class NumpyPolicyService:
+    """Torch-free inference runtime for policies exported by PolicyExportService.
+
+    Takes raw environment observations, applies the exported VecNormalize
+    statistics and runs the actor MLP, reproducing SB3's
+    predict(normalize_obs(observation), deterministic=True).
+    """
+
+    ACTIVATION_FUNCTIONS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+        "tanh": np.tanh,
+        "relu": lambda values: np.maximum(values, 0.0),
+        "elu": lambda values: np.where(values > 0.0, values, np.expm1(np.minimum(values, 0.0))),
+        "identity": lambda values: values
+    }
+
+    def __init__(self, parameters: Dict[str, np.ndarray]) -> None:
+        activation_name: str = str(parameters["activation"])
+
+        if activation_name not in self.ACTIVATION_FUNCTIONS:
+            raise ValueError(f"Unsupported activation: {activation_name}")
+
+        self._activation_function: Callable[[np.ndarray], np.ndarray] = self.ACTIVATION_FUNCTIONS[activation_name]
+        self._parameters: Dict[str, np.ndarray] = dict(parameters)
+
+        # Weights stored transposed and contiguous for (batch, in) @ (in, out)
+        hidden_layer_count: int = int(parameters["hidden_layer_count"])
+        self._hidden_weights: List[np.ndarray] = [
+            np.ascontiguousarray(parameters[f"hidden_weight_{layer_index}"].T, dtype=np.float32)
+            for layer_index in range(hidden_layer_count)
+        ]
+        self._hidden_biases: List[np.ndarray] = [
+            np.asarray(parameters[f"hidden_bias_{layer_index}"], dtype=np.float32)
+            for layer_index in range(hidden_layer_count)
+        ]
+        self._action_weight: np.ndarray = np.ascontiguousarray(parameters["action_weight"].T, dtype=np.float32)
+        self._action_bias: np.ndarray = np.asarray(parameters["action_bias"], dtype=np.float32)
+        self._log_std: np.ndarray = np.asarray(parameters["log_std"], dtype=np.float32)
+        self._action_low: np.ndarray = np.asarray(parameters["action_low"], dtype=np.float32)
+        self._action_high: np.ndarray = np.asarray(parameters["action_high"], dtype=np.float32)
+
+        self._normalize_observations: bool = bool(parameters["normalize_observations"])
+        self._observation_mean: np.ndarray = np.asarray(parameters["observation_mean"], dtype=np.float64)
+        self._observation_scale: np.ndarray = np.sqrt(
+            np.asarray(parameters["observation_variance"], dtype=np.float64)
+            + float(parameters["observation_epsilon"]))
+        self._observation_clip: float = float(parameters["observation_clip"])
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyPolicyService":
+        """Load an exported policy from a .npz file."""
+        with np.load(path, allow_pickle=False) as archive:
+            return cls({key: archive[key] for key in archive.files})
+
+    @property
+    def parameters(self) -> Dict[str, np.ndarray]:
+        """Raw exported arrays, as passed to the constructor."""
+        return self._parameters
+
+    @property
+    def observation_dimension(self) -> int:
+        """Size of a single observation vector."""
+        return len(self._observation_mean)
+
+    @property
+    def action_dimension(self) -> int:
+        """Size of a single action vector."""
+        return len(self._action_bias)
+
+    @property
+    def parameter_bytes(self) -> int:
+        """Memory held by the runtime's arrays."""
+        return sum(array.nbytes for array in self._parameters.values())
+
+    def normalize_observations(self, observations: np.ndarray) -> np.ndarray:
+        """Apply the exported VecNormalize observation statistics."""
+        if not self._normalize_observations:
+            return np.asarray(observations, dtype=np.float32)
+
+        return np.clip(
+            (observations - self._observation_mean) / self._observation_scale,
+            -self._observation_clip,
+            self._observation_clip
+        ).astype(np.float32)
+
+    def compute_action_means(self, normalized_observations: np.ndarray) -> np.ndarray:
+        """Run the actor MLP on already-normalized observations."""
+        hidden_values: np.ndarray = normalized_observations
+
+        for weight, bias in zip(self._hidden_weights, self._hidden_biases):
+            hidden_values = self._activation_function(hidden_values @ weight + bias)
+
+        return hidden_values @ self._action_weight + self._action_bias
+
+    def predict(
+        self,
+        observation: np.ndarray,
+        state: Optional[Tuple] = None,
+        episode_start: Optional[np.ndarray] = None,
+        deterministic: bool = True,
+        random_generator: Optional[np.random.Generator] = None
+    ) -> Tuple[np.ndarray, Optional[Tuple]]:
+        """Compute actions for one observation (D,) or a batch (N, D).
+
+        Mirrors the SB3 predict signature so it can replace a loaded PPO model.
+        """
+        observations: np.ndarray = np.asarray(observation)
+        is_single_observation: bool = observations.ndim == 1
+        observations = observations.reshape(-1, self.observation_dimension)
+
+        actions: np.ndarray = self.compute_action_means(self.normalize_observations(observations))
+
+        if not deterministic:
+            random_generator = random_generator or np.random.default_rng()
+            actions = actions + np.exp(self._log_std) * random_generator.standard_normal(
+                actions.shape).astype(np.float32)
+
+        actions = np.clip(actions, self._action_low, self._action_high)
+
+        return (actions[0] if is_single_observation else actions), state
@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import os
+
+
+class PolicyCacheService:
+    """Least-recently-used cache of loaded policies, bounded by their parameter memory.
+
+    Policies are loaded on one background thread, so callers on a UI thread
+    never block on torch or disk. Entries are keyed by absolute path and
+    modification time, so a re-exported file is loaded fresh. A single
+    policy larger than the budget is still kept, alone.
+    """
+
+    DEFAULT_MAXIMUM_BYTES: int = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        maximum_bytes: int = DEFAULT_MAXIMUM_BYTES,
+        loader: Optional[Callable[[str], Any]] = None
+    ) -> None:
+        if loader is None:
+            from .policy_export_service import PolicyExportService
+            loader = PolicyExportService().load_numpy_policy
+
+        self._maximum_bytes: int = maximum_bytes
+        self._loader: Callable[[str], Any] = loader
+        self._policies: "OrderedDict[Tuple[str, float], Any]" = OrderedDict()
+        self._pending_loads: Dict[Tuple[str, float], Future] = {}
+        self._cached_bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="policy-loader")
+
+    @property
+    def cached_bytes(self) -> int:
+        """Parameter memory of all cached policies."""
+        return self._cached_bytes
+
+    @property
+    def cached_paths(self) -> List[str]:
+        """Paths of cached policies, least recently used first."""
+        with self._lock:
+            return [path for path, _ in self._policies]
+
+    def get(self, model_path: str) -> Optional[Any]:
+        """Cached policy for a path, marked most recently used, or None without loading."""
+        cache_key: Tuple[str, float] = self._create_cache_key(model_path)
+
+        with self._lock:
+            policy: Optional[Any] = self._policies.get(cache_key)
+            if policy is not None:
+                self._policies.move_to_end(cache_key)
+
+            return policy
+
+    def load(self, model_path: str) -> Any:
+        """Cached policy for a path, loading it on the calling thread if needed."""
+        return self.load_async(model_path).result()
+
+    def load_async(self, model_path: str) -> Future:
+        """Future resolving to the policy; already completed if the policy is cached.
+
+        Concurrent requests for the same file share one load.
+        """
+        cache_key: Tuple[str, float] = self._create_cache_key(model_path)
+
+        with self._lock:
+            policy: Optional[Any] = self._policies.get(cache_key)
+            if policy is not None:
+                self._policies.move_to_end(cache_key)
+                completed_future: Future = Future()
+                completed_future.set_result(policy)
+                return completed_future
+
+            pending_future: Optional[Future] = self._pending_loads.get(cache_key)
+            if pending_future is not None:
+                return pending_future
+
+            load_future: Future = self._executor.submit(self._load_and_insert, cache_key)
+            self._pending_loads[cache_key] = load_future
+
+            return load_future
+
+    def prefetch(self, model_paths: List[str]) -> None:
+        """Queue background loads for policies not yet cached."""
+        for model_path in model_paths:
+            if self.get(model_path) is None:
+                self.load_async(model_path)
+
+    def shutdown(self) -> None:
+        """Stop the loader thread after queued loads finish."""
+        self._executor.shutdown(wait=True)
+
+    def _load_and_insert(self, cache_key: Tuple[str, float]) -> Any:
+        """Load a policy on the loader thread, cache it and evict to the memory budget."""
+        try:
+            policy: Any = self._loader(cache_key[0])
+        except Exception:
+            with self._lock:
+                self._pending_loads.pop(cache_key, None)
+            raise
+
+        # Insert and clear the pending entry together so no second load can start in between
+        with self._lock:
+            self._pending_loads.pop(cache_key, None)
+            self._policies[cache_key] = policy
+            self._cached_bytes += policy.parameter_bytes
+
+            while self._cached_bytes > self._maximum_bytes and len(self._policies) > 1:
+                _, evicted_policy = self._policies.popitem(last=False)
+                self._cached_bytes -= evicted_policy.parameter_bytes
+
+        return policy
+
+    @staticmethod
+    def _create_cache_key(model_path: str) -> Tuple[str, float]:
+        """Absolute path and modification time of the file backing a model path."""
+        absolute_path: str = os.path.abspath(model_path)
+        backing_file: str = absolute_path if os.path.exists(absolute_path) else absolute_path + ".zip"
+
+        return absolute_path, os.path.getmtime(backing_file) if os.path.exists(backing_file) else 0.0
@@ -0,0 +1,96 @@
+import socket
+import numpy as np
+from typing import Optional, Tuple
+
+from .message_framing_service import MessageFramingService
+
+
+class PolicyClientService:
+    """TCP client for PolicyServerService with an SB3-compatible predict.
+
+    Observations are sent raw; normalization happens on the server. One
+    client holds one connection, so use one instance per thread.
+    """
+
+    DEFAULT_HOST: str = "localhost"
+    DEFAULT_PORT: int = 5600
+    DEFAULT_TIMEOUT_SECONDS: float = 5.0
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT
+    ) -> None:
+        self._host: str = host
+        self._port: int = port
+        self._socket: Optional[socket.socket] = None
+        self._is_connected: bool = False
+        self._last_model_version: int = 0
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if connected to the policy server."""
+        return self._is_connected
+
+    @property
+    def last_model_version(self) -> int:
+        """Model version that produced the most recent prediction."""
+        return self._last_model_version
+
+    def connect(self) -> None:
+        """Establish TCP connection to the policy server."""
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.settimeout(self.DEFAULT_TIMEOUT_SECONDS)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.connect((self._host, self._port))
+        self._is_connected = True
+
+    def disconnect(self) -> None:
+        """Close TCP connection to the policy server."""
+        if self._socket is not None:
+            try:
+                self._socket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._socket.close()
+            self._socket = None
+
+        self._is_connected = False
+
+    def predict(
+        self,
+        observation: np.ndarray,
+        state: Optional[Tuple] = None,
+        episode_start: Optional[np.ndarray] = None,
+        deterministic: bool = True
+    ) -> Tuple[np.ndarray, Optional[Tuple]]:
+        """Request actions for one observation (D,) or a batch (N, D)."""
+        response: dict = self._send_request({
+            "Type": "PREDICT",
+            "Observations": np.asarray(observation, dtype=np.float64).tolist(),
+            "Deterministic": deterministic
+        })
+        self._last_model_version = response["ModelVersion"]
+
+        return np.asarray(response["Actions"], dtype=np.float32), state
+
+    def get_information(self) -> dict:
+        """Get the served model's path, version, dimensions and server statistics."""
+        return self._send_request({"Type": "INFO"})
+
+    def load_model(self, model_path: str) -> int:
+        """Ask the server to hot-swap to another model and return its version."""
+        return self._send_request({"Type": "LOAD", "ModelPath": model_path})["ModelVersion"]
+
+    def _send_request(self, request: dict) -> dict:
+        """Send one request and raise if the server reports an error."""
+        if not self._is_connected:
+            raise RuntimeError("Not connected to policy server")
+
+        MessageFramingService.send_message(self._socket, request)
+        response: dict = MessageFramingService.receive_message(self._socket)
+
+        if "Error" in response:
+            raise RuntimeError(response["Error"])
+
+        return response
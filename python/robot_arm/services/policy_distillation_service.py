@@ -0,0 +1,167 @@
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .numpy_policy_service import NumpyPolicyService
+from .policy_export_service import PolicyExportService
+
+
+class PolicyDistillationService:
+    """Trains a small student MLP to reproduce a teacher policy's deterministic actions.
+
+    The student sees the same normalized observations as the teacher and is
+    fitted by regression on the teacher's clipped action means over a state
+    dataset. It is returned as a NumpyPolicyService with the teacher's
+    normalizer statistics, action bounds and log_std, so it exports to the
+    same .npz format and drops into any code that loads the teacher.
+    """
+
+    DEFAULT_HIDDEN_LAYER_SIZES: Tuple[int, ...] = (64, 64)
+    DEFAULT_ACTIVATION: str = "tanh"
+    DEFAULT_EPOCHS: int = 50
+    DEFAULT_BATCH_SIZE: int = 256
+    DEFAULT_LEARNING_RATE: float = 1e-3
+    VALIDATION_FRACTION: float = 0.1
+    TIMING_REPETITIONS: int = 200
+    STATE_DATASET_KEY: str = "observations"
+    TORCH_ACTIVATIONS: Dict[str, str] = {"tanh": "Tanh", "relu": "ReLU", "elu": "ELU"}
+
+    def __init__(
+        self,
+        hidden_layer_sizes: Sequence[int] = DEFAULT_HIDDEN_LAYER_SIZES,
+        activation: str = DEFAULT_ACTIVATION,
+        epochs: int = DEFAULT_EPOCHS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        learning_rate: float = DEFAULT_LEARNING_RATE,
+        seed: Optional[int] = None
+    ) -> None:
+        if activation not in self.TORCH_ACTIVATIONS:
+            raise ValueError(f"Unsupported student activation: {activation}")
+
+        self._hidden_layer_sizes: List[int] = list(hidden_layer_sizes)
+        self._activation: str = activation
+        self._epochs: int = epochs
+        self._batch_size: int = batch_size
+        self._learning_rate: float = learning_rate
+        self._random_generator: np.random.Generator = np.random.default_rng(seed)
+
+    @classmethod
+    def save_states(cls, observations: np.ndarray, output_path: str) -> str:
+        """Write a state dataset of raw observations, one row per state."""
+        return PolicyExportService.save_parameters(
+            {cls.STATE_DATASET_KEY: np.asarray(observations, dtype=np.float32)}, output_path)
+
+    @classmethod
+    def load_states(cls, path: str) -> np.ndarray:
+        """Read a state dataset written by save_states."""
+        with np.load(path, allow_pickle=False) as archive:
+            return np.asarray(archive[cls.STATE_DATASET_KEY], dtype=np.float32)
+
+    def distill(
+        self,
+        teacher: NumpyPolicyService,
+        observations: np.ndarray
+    ) -> Tuple[NumpyPolicyService, Dict[str, float]]:
+        """Fit a student on the teacher's actions for raw observations.
+
+        Returns:
+            The student policy and statistics: action errors on held-out
+            states, parameter sizes and single-observation inference times
+            of teacher and student.
+        """
+        import torch
+
+        normalized_observations: np.ndarray = teacher.normalize_observations(observations)
+        teacher_actions: np.ndarray = teacher.predict(observations, deterministic=True)[0].astype(np.float32)
+
+        permutation: np.ndarray = self._random_generator.permutation(len(observations))
+        validation_count: int = max(1, int(len(observations) * self.VALIDATION_FRACTION))
+        validation_indices: np.ndarray = permutation[:validation_count]
+        training_indices: np.ndarray = permutation[validation_count:]
+
+        torch.manual_seed(int(self._random_generator.integers(2 ** 31)))
+        network = self._create_network(teacher.observation_dimension, teacher.action_dimension)
+        optimizer = torch.optim.Adam(network.parameters(), lr=self._learning_rate)
+
+        training_inputs = torch.as_tensor(normalized_observations[training_indices])
+        training_targets = torch.as_tensor(teacher_actions[training_indices])
+        action_low_tensor = torch.as_tensor(teacher.parameters["action_low"], dtype=torch.float32)
+        action_high_tensor = torch.as_tensor(teacher.parameters["action_high"], dtype=torch.float32)
+
+        for _ in range(self._epochs):
+            batch_order = torch.randperm(len(training_indices))
+
+            for batch_start in range(0, len(training_indices), self._batch_size):
+                batch_indices = batch_order[batch_start:batch_start + self._batch_size]
+                # Match the clipped teacher actions, so saturated outputs are not pushed further
+                predicted_actions = torch.clamp(
+                    network(training_inputs[batch_indices]), action_low_tensor, action_high_tensor)
+                loss = torch.nn.functional.mse_loss(predicted_actions, training_targets[batch_indices])
+
+                optimizer.zero_grad()
+                loss.backward()
+                optimizer.step()
+
+        student: NumpyPolicyService = NumpyPolicyService(self._extract_student_parameters(network, teacher))
+
+        student_actions: np.ndarray = student.predict(observations[validation_indices], deterministic=True)[0]
+        action_errors: np.ndarray = np.abs(student_actions - teacher_actions[validation_indices])
+
+        statistics: Dict[str, float] = {
+            "mean_absolute_action_error": float(action_errors.mean()),
+            "maximum_absolute_action_error": float(action_errors.max()),
+            "validation_state_count": float(validation_count),
+            "teacher_parameter_bytes": float(teacher.parameter_bytes),
+            "student_parameter_bytes": float(student.parameter_bytes),
+            "teacher_inference_microseconds": self._measure_inference_microseconds(teacher, observations[0]),
+            "student_inference_microseconds": self._measure_inference_microseconds(student, observations[0])
+        }
+
+        return student, statistics
+
+    def _create_network(self, observation_dimension: int, action_dimension: int) -> Any:
+        """Student MLP with the configured hidden layers and a linear action head."""
+        import torch
+
+        activation_class = getattr(torch.nn, self.TORCH_ACTIVATIONS[self._activation])
+        layers: list = []
+        input_size: int = observation_dimension
+
+        for hidden_layer_size in self._hidden_layer_sizes:
+            layers += [torch.nn.Linear(input_size, hidden_layer_size), activation_class()]
+            input_size = hidden_layer_size
+
+        layers.append(torch.nn.Linear(input_size, action_dimension))
+
+        return torch.nn.Sequential(*layers)
+
+    def _extract_student_parameters(self, network: Any, teacher: NumpyPolicyService) -> Dict[str, np.ndarray]:
+        """Student weights in the PolicyExportService layout, keeping the teacher's other arrays."""
+        import torch
+
+        linear_layers = [module for module in network if isinstance(module, torch.nn.Linear)]
+        parameters: Dict[str, np.ndarray] = {
+            key: value for key, value in teacher.parameters.items() if not key.startswith("hidden_")
+        }
+
+        parameters["activation"] = np.array(self._activation)
+        parameters["hidden_layer_count"] = np.array(len(linear_layers) - 1)
+        parameters["action_weight"] = linear_layers[-1].weight.detach().numpy().astype(np.float32)
+        parameters["action_bias"] = linear_layers[-1].bias.detach().numpy().astype(np.float32)
+
+        for layer_index, layer in enumerate(linear_layers[:-1]):
+            parameters[f"hidden_weight_{layer_index}"] = layer.weight.detach().numpy().astype(np.float32)
+            parameters[f"hidden_bias_{layer_index}"] = layer.bias.detach().numpy().astype(np.float32)
+
+        return parameters
+
+    def _measure_inference_microseconds(self, policy: NumpyPolicyService, observation: np.ndarray) -> float:
+        """Median time of one deterministic predict call on a single observation."""
+        durations: List[float] = []
+
+        for _ in range(self.TIMING_REPETITIONS):
+            start_time: float = time.perf_counter()
+            policy.predict(observation, deterministic=True)
+            durations.append(time.perf_counter() - start_time)
+
+        return float(np.median(durations) * 1e6)
@@ -0,0 +1,213 @@
+import numpy as np
+from typing import Any, Dict, Optional
+import os
+
+
+class PolicyExportService:
+    """Exports SB3 PPO actors and VecNormalize statistics to a compact .npz file.
+
+    The exported file holds everything NumpyPolicyService needs to reproduce
+    predict(deterministic=True) without importing torch or stable_baselines3.
+    """
+
+    FORMAT_VERSION: int = 1
+    EXPORT_FILE_EXTENSION: str = ".npz"
+    SUPPORTED_ACTIVATIONS: Dict[str, str] = {
+        "Tanh": "tanh",
+        "ReLU": "relu",
+        "ELU": "elu",
+        "Identity": "identity"
+    }
+
+    def export_checkpoint(
+        self,
+        model_path: str,
+        output_path: Optional[str] = None,
+        normalizer_path: Optional[str] = None
+    ) -> str:
+        """Export a saved PPO model and its paired normalizer.
+
+        Args:
+            model_path: Path of the SB3 model, with or without ".zip".
+            output_path: Destination file; defaults to the model path with ".npz".
+            normalizer_path: VecNormalize pickle; found by naming convention if omitted.
+
+        Returns:
+            Path of the written file.
+        """
+        # Import here to keep the runtime side free of torch
+        from stable_baselines3 import PPO
+
+        model_base_path: str = self.strip_model_extension(model_path)
+        model = PPO.load(model_base_path, device="cpu")
+
+        if normalizer_path is None:
+            normalizer_path = self.find_normalizer_path(model_base_path)
+
+        normalizer = self.load_normalizer(normalizer_path) if normalizer_path is not None else None
+
+        if output_path is None:
+            output_path = model_base_path + self.EXPORT_FILE_EXTENSION
+
+        return self.export_policy(model.policy, normalizer, output_path)
+
+    def load_numpy_policy(self, model_path: str) -> Any:
+        """Load any saved policy as a NumpyPolicyService.
+
+        ".npz" exports load directly; SB3 ".zip" models are exported in memory,
+        which needs stable_baselines3 but writes nothing to disk.
+
+        Raises:
+            FileNotFoundError: A "_steps" checkpoint whose VecNormalize file
+                is not written yet; CheckpointCallback saves it just after the
+                model, so a watcher should retry instead of serving raw inputs.
+        """
+        from .numpy_policy_service import NumpyPolicyService
+
+        if model_path.endswith(self.EXPORT_FILE_EXTENSION):
+            return NumpyPolicyService.load(model_path)
+
+        exported_path: str = self.strip_model_extension(model_path) + self.EXPORT_FILE_EXTENSION
+        if not model_path.endswith(".zip") and os.path.exists(exported_path):
+            return NumpyPolicyService.load(exported_path)
+
+        model_base_path: str = self.strip_model_extension(model_path)
+        normalizer_path: Optional[str] = self.find_normalizer_path(model_base_path)
+
+        if normalizer_path is None and self.is_checkpoint_path(model_base_path):
+            raise FileNotFoundError(f"Normalizer for checkpoint not written yet: {model_base_path}")
+
+        from stable_baselines3 import PPO
+
+        model = PPO.load(model_base_path, device="cpu")
+        normalizer = self.load_normalizer(normalizer_path) if normalizer_path is not None else None
+
+        return NumpyPolicyService(self.extract_parameters(model.policy, normalizer))
+
+    def export_policy(self, policy: Any, normalizer: Optional[Any], output_path: str) -> str:
+        """Export an in-memory actor-critic policy and VecNormalize wrapper."""
+        return self.save_parameters(self.extract_parameters(policy, normalizer), output_path)
+
+    def extract_parameters(self, policy: Any, normalizer: Optional[Any]) -> Dict[str, np.ndarray]:
+        """Extract actor weights, action distribution and observation statistics as arrays."""
+        import torch
+
+        if not hasattr(policy, "mlp_extractor"):
+            raise ValueError(f"Only actor-critic (PPO) policies can be exported, got {type(policy).__name__}")
+
+        hidden_layers = [
+            module for module in policy.mlp_extractor.policy_net
+            if isinstance(module, torch.nn.Linear)
+        ]
+        activation_name: str = self.SUPPORTED_ACTIVATIONS.get(policy.activation_fn.__name__)
+
+        if activation_name is None:
+            raise ValueError(f"Unsupported activation for export: {policy.activation_fn.__name__}")
+
+        parameters: Dict[str, np.ndarray] = {
+            "format_version": np.array(self.FORMAT_VERSION),
+            "activation": np.array(activation_name),
+            "hidden_layer_count": np.array(len(hidden_layers)),
+            "action_weight": self._to_numpy(policy.action_net.weight),
+            "action_bias": self._to_numpy(policy.action_net.bias),
+            "log_std": self._to_numpy(policy.log_std),
+            "action_low": np.asarray(policy.action_space.low, dtype=np.float32),
+            "action_high": np.asarray(policy.action_space.high, dtype=np.float32)
+        }
+
+        for layer_index, layer in enumerate(hidden_layers):
+            parameters[f"hidden_weight_{layer_index}"] = self._to_numpy(layer.weight)
+            parameters[f"hidden_bias_{layer_index}"] = self._to_numpy(layer.bias)
+
+        parameters.update(self._extract_normalizer_statistics(normalizer, policy.observation_space.shape[0]))
+
+        return parameters
+
+    @staticmethod
+    def save_parameters(parameters: Dict[str, np.ndarray], output_path: str) -> str:
+        """Write exported parameters atomically so watchers never see a partial file."""
+        directory: str = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(directory, exist_ok=True)
+
+        temporary_path: str = output_path + ".tmp"
+        with open(temporary_path, "wb") as export_file:
+            np.savez(export_file, **parameters)
+        os.replace(temporary_path, output_path)
+
+        return output_path
+
+    @staticmethod
+    def load_normalizer(normalizer_path: str) -> Any:
+        """Load a VecNormalize pickle without attaching it to an environment."""
+        import pickle
+
+        with open(normalizer_path, "rb") as normalizer_file:
+            return pickle.load(normalizer_file)
+
+    @staticmethod
+    def strip_model_extension(model_path: str) -> str:
+        """Remove a trailing ".zip" or ".npz" from a model path."""
+        for extension in (".zip", ".npz"):
+            if model_path.endswith(extension):
+                return model_path[:-len(extension)]
+
+        return model_path
+
+    @staticmethod
+    def is_checkpoint_path(model_path: str) -> bool:
+        """Whether a model path follows the CheckpointCallback robot_policy_<n>_steps naming."""
+        name_parts = os.path.basename(PolicyExportService.strip_model_extension(model_path)).rsplit("_", 2)
+        return len(name_parts) == 3 and name_parts[1].isdigit() and name_parts[2] == "steps"
+
+    @staticmethod
+    def find_normalizer_path(model_path: str) -> Optional[str]:
+        """Find the VecNormalize pickle saved next to a model.
+
+        Follows the TrainingController naming conventions:
+        models/robot_policy_<phase> -> models/normalizer_<phase>.pkl and
+        checkpoints/robot_policy_<n>_steps -> checkpoints/robot_policy_vecnormalize_<n>_steps.pkl.
+        """
+        model_base_path: str = PolicyExportService.strip_model_extension(model_path)
+        directory, file_name = os.path.split(model_base_path)
+
+        candidate_names = [file_name.replace("robot_policy", "normalizer", 1) + ".pkl"]
+
+        name_parts = file_name.rsplit("_", 2)
+        if len(name_parts) == 3 and name_parts[2] == "steps":
+            candidate_names.append(f"{name_parts[0]}_vecnormalize_{name_parts[1]}_steps.pkl")
+
+        for candidate_name in candidate_names:
+            candidate_path: str = os.path.join(directory, candidate_name)
+            if os.path.exists(candidate_path):
+                return candidate_path
+
+        return None
+
+    def _extract_normalizer_statistics(
+        self,
+        normalizer: Optional[Any],
+        observation_dimension: int
+    ) -> Dict[str, np.ndarray]:
+        """Extract VecNormalize observation statistics, or an identity transform."""
+        if normalizer is None or not normalizer.norm_obs:
+            return {
+                "normalize_observations": np.array(False),
+                "observation_mean": np.zeros(observation_dimension),
+                "observation_variance": np.ones(observation_dimension),
+                "observation_clip": np.array(np.inf),
+                "observation_epsilon": np.array(0.0)
+            }
+
+        # Kept in float64 like VecNormalize so normalization matches bit for bit
+        return {
+            "normalize_observations": np.array(True),
+            "observation_mean": np.asarray(normalizer.obs_rms.mean, dtype=np.float64),
+            "observation_variance": np.asarray(normalizer.obs_rms.var, dtype=np.float64),
+            "observation_clip": np.array(normalizer.clip_obs, dtype=np.float64),
+            "observation_epsilon": np.array(normalizer.epsilon, dtype=np.float64)
+        }
+
+    @staticmethod
+    def _to_numpy(tensor: Any) -> np.ndarray:
+        """Detach a torch tensor to a float32 NumPy array."""
+        return tensor.detach().cpu().numpy().astype(np.float32)
@@ -0,0 +1,405 @@
+import queue
+import socket
+import threading
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import os
+
+from .message_framing_service import MessageFramingService
+from .policy_export_service import PolicyExportService
+
+
+@dataclass
+class PredictionRequest:
+    """Observations from one client call waiting to be batched."""
+    observations: np.ndarray
+    deterministic: bool
+    completed_event: threading.Event = field(default_factory=threading.Event)
+    actions: Optional[np.ndarray] = None
+    model_version: int = 0
+    error_message: Optional[str] = None
+
+
+class PolicyServerService:
+    """Local policy server that coalesces concurrent requests into batched forward passes.
+
+    Clients send length-prefixed JSON requests over TCP. PREDICT requests are
+    queued and a single batching thread waits at most the latency budget after
+    the first queued request before running one NumPy forward pass for all of
+    them. Models are swapped by replacing one reference, so batches already
+    running finish on the old weights and no request is dropped.
+    """
+
+    DEFAULT_HOST: str = "localhost"
+    DEFAULT_PORT: int = 5600
+    DEFAULT_MAXIMUM_BATCH_SIZE: int = 256
+    DEFAULT_MAXIMUM_BATCH_LATENCY_SECONDS: float = 0.002
+    DEFAULT_WATCH_INTERVAL_SECONDS: float = 2.0
+    ACCEPT_TIMEOUT_SECONDS: float = 0.5
+    PREDICTION_TIMEOUT_SECONDS: float = 10.0
+    MODEL_FILE_EXTENSIONS: Tuple[str, ...] = (".npz", ".zip")
+
+    def __init__(
+        self,
+        model_path: str,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        maximum_batch_size: int = DEFAULT_MAXIMUM_BATCH_SIZE,
+        maximum_batch_latency_seconds: float = DEFAULT_MAXIMUM_BATCH_LATENCY_SECONDS,
+        watch_for_updates: bool = False,
+        watch_interval_seconds: float = DEFAULT_WATCH_INTERVAL_SECONDS
+    ) -> None:
+        self._model_path: str = model_path
+        self._host: str = host
+        self._port: int = port
+        self._maximum_batch_size: int = maximum_batch_size
+        self._maximum_batch_latency_seconds: float = maximum_batch_latency_seconds
+        self._watch_for_updates: bool = watch_for_updates
+        self._watch_interval_seconds: float = watch_interval_seconds
+
+        self._policy_export_service: PolicyExportService = PolicyExportService()
+        self._active_policy: Optional[Tuple[Any, int]] = None
+        self._loaded_model_file: Optional[str] = None
+        self._loaded_model_modification_time: float = 0.0
+        # (file, modification time) the watcher failed to load, skipped until the file changes
+        self._failed_model_file: Optional[Tuple[str, float]] = None
+        self._reported_missing_file: Optional[Tuple[str, float]] = None
+        self._model_load_lock: threading.Lock = threading.Lock()
+
+        self._request_queue: "queue.Queue[PredictionRequest]" = queue.Queue()
+        self._listening_socket: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+        self._is_running: bool = False
+        self._random_generator: np.random.Generator = np.random.default_rng()
+
+        self._statistics: Dict[str, int] = {
+            "requests": 0,
+            "batches": 0,
+            "observations": 0,
+            "model_swaps": 0
+        }
+
+    @property
+    def port(self) -> int:
+        """Port the server is listening on (resolved when started with port 0)."""
+        return self._port
+
+    @property
+    def model_version(self) -> int:
+        """Version counter of the active policy, incremented on every swap."""
+        return self._active_policy[1] if self._active_policy is not None else 0
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Request, batch and model swap counters."""
+        return dict(self._statistics)
+
+    def start(self) -> None:
+        """Load the initial model and start the accept, batching and watch threads."""
+        self.load_policy(self._model_path)
+
+        self._listening_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listening_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listening_socket.bind((self._host, self._port))
+        self._listening_socket.listen()
+        self._listening_socket.settimeout(self.ACCEPT_TIMEOUT_SECONDS)
+        self._port = self._listening_socket.getsockname()[1]
+        self._is_running = True
+
+        thread_targets = [self._accept_connections, self._process_batches]
+        if self._watch_for_updates:
+            thread_targets.append(self._watch_model_updates)
+
+        for thread_target in thread_targets:
+            thread: threading.Thread = threading.Thread(target=thread_target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        print(f"Policy server listening on {self._host}:{self._port} "
+              f"(batch <= {self._maximum_batch_size}, "
+              f"latency budget {self._maximum_batch_latency_seconds * 1000:.1f} ms)")
+
+    def serve_forever(self) -> None:
+        """Start the server and block until interrupted."""
+        self.start()
+
+        try:
+            while self._is_running:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            print("\nPolicy server interrupted by user.")
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop accepting connections and shut down worker threads."""
+        self._is_running = False
+
+        if self._listening_socket is not None:
+            self._listening_socket.close()
+            self._listening_socket = None
+
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+
+        self._threads = []
+
+    def load_policy(self, model_path: str) -> int:
+        """Load a model (file or directory of checkpoints) and swap it in.
+
+        Returns:
+            The new model version.
+        """
+        with self._model_load_lock:
+            resolved_path: Optional[str] = self._resolve_model_file(model_path)
+
+            if resolved_path is None:
+                raise FileNotFoundError(f"No policy found at: {model_path}")
+
+            modification_time: float = os.path.getmtime(resolved_path)
+            new_policy = self._policy_export_service.load_numpy_policy(resolved_path)
+
+            if self._active_policy is not None:
+                current_policy = self._active_policy[0]
+                if (new_policy.observation_dimension != current_policy.observation_dimension
+                        or new_policy.action_dimension != current_policy.action_dimension):
+                    raise ValueError("New policy does not match the observation/action dimensions being served")
+
+            new_version: int = self.model_version + 1
+            self._active_policy = (new_policy, new_version)
+            self._model_path = model_path
+            self._loaded_model_file = resolved_path
+            self._loaded_model_modification_time = modification_time
+            self._statistics["model_swaps"] += 1
+
+        print(f"Policy server loaded model v{new_version}: {resolved_path}")
+        return new_version
+
+    def _accept_connections(self) -> None:
+        """Accept client connections, serving each on its own thread."""
+        while self._is_running:
+            try:
+                connection, _ = self._listening_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._handle_connection, args=(connection,), daemon=True).start()
+
+    def _handle_connection(self, connection: socket.socket) -> None:
+        """Serve requests from one client until it disconnects."""
+        with connection:
+            while self._is_running:
+                try:
+                    request: dict = MessageFramingService.receive_message(connection)
+                except (ConnectionError, OSError, ValueError):
+                    break
+
+                response: dict = self._handle_request(request)
+
+                try:
+                    MessageFramingService.send_message(connection, response)
+                except OSError:
+                    break
+
+    def _handle_request(self, request: dict) -> dict:
+        """Dispatch one client request and build its response."""
+        request_type: str = request.get("Type", "")
+
+        if request_type == "PREDICT":
+            return self._handle_predict_request(request)
+
+        if request_type == "INFO":
+            policy, version = self._active_policy
+            return {
+                "ModelPath": self._loaded_model_file,
+                "ModelVersion": version,
+                "ObservationDimension": policy.observation_dimension,
+                "ActionDimension": policy.action_dimension,
+                "Statistics": self.statistics
+            }
+
+        if request_type == "LOAD":
+            try:
+                return {"ModelVersion": self.load_policy(request["ModelPath"])}
+            except (KeyError, OSError, ValueError) as load_error:
+                return {"Error": f"Model load failed: {load_error}"}
+
+        return {"Error": f"Unknown request type: {request_type}"}
+
+    def _handle_predict_request(self, request: dict) -> dict:
+        """Queue observations for the batching thread and wait for the result."""
+        observation_dimension: int = self._active_policy[0].observation_dimension
+        shape_error: dict = {"Error": f"Observations must have shape (D,) or (N, D) with D={observation_dimension}"}
+
+        # Ragged or non-numeric lists are answered with an error rather than dropping the connection
+        try:
+            observations: np.ndarray = np.asarray(request.get("Observations", []), dtype=np.float64)
+        except (TypeError, ValueError):
+            return shape_error
+
+        is_single_observation: bool = observations.ndim == 1
+
+        if observations.size == 0 or observations.shape[-1] != observation_dimension or observations.ndim > 2:
+            return shape_error
+
+        prediction_request: PredictionRequest = PredictionRequest(
+            observations=observations.reshape(-1, observation_dimension),
+            deterministic=bool(request.get("Deterministic", True)))
+        self._request_queue.put(prediction_request)
+
+        if not prediction_request.completed_event.wait(self.PREDICTION_TIMEOUT_SECONDS):
+            return {"Error": f"Prediction timed out after {self.PREDICTION_TIMEOUT_SECONDS:g} s"}
+
+        if prediction_request.error_message is not None:
+            return {"Error": prediction_request.error_message}
+
+        actions: np.ndarray = prediction_request.actions[0] if is_single_observation else prediction_request.actions
+
+        return {"Actions": actions.tolist(), "ModelVersion": prediction_request.model_version}
+
+    def _process_batches(self) -> None:
+        """Collect queued requests within the latency budget and run them together."""
+        while self._is_running:
+            batch: List[PredictionRequest] = self._collect_batch()
+
+            if not batch:
+                continue
+
+            # The thread must outlive any failure, or every later PREDICT would wait for nothing
+            try:
+                self._run_batch(batch)
+            except Exception as batch_error:
+                for request in batch:
+                    if not request.completed_event.is_set():
+                        request.error_message = f"Prediction failed: {batch_error}"
+                        request.completed_event.set()
+
+    def _collect_batch(self) -> List[PredictionRequest]:
+        """Block for a first request, then gather more until the budget or size is hit."""
+        try:
+            first_request: PredictionRequest = self._request_queue.get(timeout=self.ACCEPT_TIMEOUT_SECONDS)
+        except queue.Empty:
+            return []
+
+        batch: List[PredictionRequest] = [first_request]
+        observation_count: int = len(first_request.observations)
+        batch_deadline: float = time.perf_counter() + self._maximum_batch_latency_seconds
+
+        while observation_count < self._maximum_batch_size:
+            remaining_seconds: float = batch_deadline - time.perf_counter()
+
+            if remaining_seconds <= 0.0:
+                break
+
+            try:
+                next_request: PredictionRequest = self._request_queue.get(timeout=remaining_seconds)
+            except queue.Empty:
+                break
+
+            batch.append(next_request)
+            observation_count += len(next_request.observations)
+
+        return batch
+
+    def _run_batch(self, batch: List[PredictionRequest]) -> None:
+        """Run one forward pass per determinism mode and hand results back."""
+        # Snapshot once so a concurrent swap cannot mix weights within a batch
+        policy, version = self._active_policy
+
+        for deterministic in (True, False):
+            requests: List[PredictionRequest] = [
+                request for request in batch if request.deterministic == deterministic
+            ]
+
+            if not requests:
+                continue
+
+            try:
+                stacked_observations: np.ndarray = np.concatenate([request.observations for request in requests])
+                stacked_actions, _ = policy.predict(
+                    stacked_observations,
+                    deterministic=deterministic,
+                    random_generator=self._random_generator)
+                split_indices: np.ndarray = np.cumsum([len(request.observations) for request in requests])[:-1]
+                split_actions: List[np.ndarray] = np.split(stacked_actions, split_indices)
+            except Exception as prediction_error:
+                for request in requests:
+                    request.error_message = f"Prediction failed: {prediction_error}"
+                    request.completed_event.set()
+                continue
+
+            for request, actions in zip(requests, split_actions):
+                request.actions = actions
+                request.model_version = version
+                request.completed_event.set()
+
+            self._statistics["observations"] += len(stacked_observations)
+
+        self._statistics["requests"] += len(batch)
+        self._statistics["batches"] += 1
+
+    def _watch_model_updates(self) -> None:
+        """Poll the model path and hot-swap when a newer file appears.
+
+        A file that fails to load is reported once and skipped until its
+        modification time changes. A checkpoint whose normalizer is not
+        written yet is retried quietly instead, since finishing it does not
+        touch the checkpoint itself.
+        """
+        while self._is_running:
+            time.sleep(self._watch_interval_seconds)
+
+            try:
+                resolved_path: Optional[str] = self._resolve_model_file(self._model_path)
+                if resolved_path is None:
+                    continue
+                modification_time: float = os.path.getmtime(resolved_path)
+            except OSError:
+                # Checkpoints can be rotated away between listing and reading them
+                continue
+
+            if (resolved_path, modification_time) == self._failed_model_file:
+                continue
+
+            is_new_file: bool = resolved_path != self._loaded_model_file
+            is_modified: bool = modification_time > self._loaded_model_modification_time
+
+            if not (is_new_file or is_modified):
+                continue
+
+            try:
+                self.load_policy(self._model_path)
+            except FileNotFoundError as load_error:
+                if not os.path.exists(resolved_path):
+                    continue
+                if self._reported_missing_file != (resolved_path, modification_time):
+                    print(f"Policy server kept model v{self.model_version}: {load_error}")
+                    self._reported_missing_file = (resolved_path, modification_time)
+            except Exception as load_error:
+                print(f"Policy server kept model v{self.model_version}, skipping {resolved_path}: {load_error}")
+                self._failed_model_file = (resolved_path, modification_time)
+
+    def _resolve_model_file(self, model_path: str) -> Optional[str]:
+        """Resolve a model file, picking the newest policy when given a directory."""
+        if os.path.isdir(model_path):
+            candidate_files: List[str] = [
+                os.path.join(model_path, file_name)
+                for file_name in os.listdir(model_path)
+                if file_name.startswith("robot_policy") and file_name.endswith(self.MODEL_FILE_EXTENSIONS)
+            ]
+
+            if not candidate_files:
+                return None
+
+            return max(candidate_files, key=os.path.getmtime)
+
+        for candidate_path in (model_path, model_path + ".npz", model_path + ".zip"):
+            if os.path.isfile(candidate_path):
+                return candidate_path
+
+        return None
@@ -1,11 +1,8 @@
 import numpy as np
-from typing import Tuple, Dict, Any
-import sys
-import os
+from typing import Tuple, Dict, Any, Optional, Sequence
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from models.observation_model import ObservationModel
-from models.reward_components import RewardComponents
+from ..models.observation_model import ObservationModel
+from ..models.reward_components import RewardComponents
 
 
 class RewardCalculationService:
@@ -89,6 +86,37 @@ class RewardCalculationService:
 
         return reward_components.total_reward, episode_terminated, information_dictionary
 
+    def calculate_goal_rewards(
+        self,
+        achieved_goals: np.ndarray,
+        desired_goals: np.ndarray,
+        informations: Optional[Sequence[Dict[str, Any]]] = None
+    ) -> np.ndarray:
+        """
+        Calculate rewards for reached TCP positions against (possibly substitute) goals.
+
+        Uses only terms that can be recomputed after the fact: the success
+        reward within GRASP_DISTANCE_THRESHOLD, the survival reward and the
+        goal-independent collision and underground penalties.
+
+        Returns:
+            Array of rewards with the leading shape of the goal arrays
+        """
+        distances: np.ndarray = np.linalg.norm(
+            np.asarray(achieved_goals, dtype=np.float64) - np.asarray(desired_goals, dtype=np.float64), axis=-1)
+        rewards: np.ndarray = np.where(
+            distances < self.GRASP_DISTANCE_THRESHOLD, self.GRASP_SUCCESS_REWARD, 0.0) + self.SURVIVAL_REWARD
+
+        if informations is not None:
+            penalties: np.ndarray = np.array([
+                (self.COLLISION_PENALTY_VALUE if information.get("collision", False) else 0.0)
+                + (self.UNDERGROUND_PENALTY_VALUE if information.get("underground", False) else 0.0)
+                for information in informations
+            ])
+            rewards = rewards + penalties.reshape(rewards.shape)
+
+        return rewards.astype(np.float32)
+
     def reset_state(self, initial_observation: ObservationModel) -> None:
         """Reset reward calculation state for new episode."""
         self._previous_distance_to_target = initial_observation.distance_to_target
@@ -96,6 +124,12 @@ class RewardCalculationService:
             initial_observation.tool_center_point_position)
         self._is_first_step = True
 
+    def rebaseline_target(self, new_target_observation: ObservationModel) -> None:
+        """Measure progress against a new target without resetting the episode."""
+        self._previous_distance_to_target = new_target_observation.distance_to_target
+        self._previous_tool_center_point_position = np.array(
+            new_target_observation.tool_center_point_position)
+
     def _calculate_distance_reward(self, current_distance: float) -> float:
         """Calculate reward based on distance improvement."""
         distance_improvement: float = self._previous_distance_to_target - current_distance
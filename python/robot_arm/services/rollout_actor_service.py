@@ -0,0 +1,203 @@
+import math
+import queue
+import threading
+import time
+import numpy as np
+from typing import Any, Optional, Tuple
+
+from ..models.rollout_segment_model import RolloutSegmentModel
+
+
+class RolloutActorService:
+    """Steps a vectorized environment with a NumPy policy snapshot and emits rollout segments.
+
+    Observations are recorded exactly as the environment returns them. Behind
+    a VecNormalize they are already normalized and the snapshot must not
+    normalize again; raw environments (remote workers) use a snapshot that
+    carries the learner's statistics and set observations_normalized False.
+    Snapshots can be replaced at any time from another thread; the actor
+    picks up the newest one at the next step.
+    """
+
+    DEFAULT_SEGMENT_STEPS: int = 256
+    QUEUE_POLL_SECONDS: float = 0.5
+
+    def __init__(
+        self,
+        environment: Any,
+        segment_steps: int = DEFAULT_SEGMENT_STEPS,
+        segment_queue: Optional["queue.Queue[RolloutSegmentModel]"] = None,
+        seed: Optional[int] = None,
+        observations_normalized: bool = True
+    ) -> None:
+        self._environment: Any = environment
+        self._segment_steps: int = segment_steps
+        self._observations_normalized: bool = observations_normalized
+        self._segment_queue: Optional["queue.Queue[RolloutSegmentModel]"] = segment_queue
+        self._random_generator: np.random.Generator = np.random.default_rng(seed)
+
+        self._policy_snapshot: Optional[Tuple[Any, int]] = None
+        self._current_observations: Optional[np.ndarray] = None
+        self._is_success_in_progress: np.ndarray = np.zeros(environment.num_envs, dtype=bool)
+
+        self._actor_thread: Optional[threading.Thread] = None
+        self._is_running: bool = False
+        self._actor_error: Optional[BaseException] = None
+
+        self._collected_step_count: int = 0
+        self._finished_episode_count: int = 0
+        self._successful_episode_count: int = 0
+        self._environment_seconds: float = 0.0
+        self._start_time: Optional[float] = None
+
+    @property
+    def collected_step_count(self) -> int:
+        """Environment transitions collected so far."""
+        return self._collected_step_count
+
+    @property
+    def finished_episode_count(self) -> int:
+        """Episodes finished so far."""
+        return self._finished_episode_count
+
+    @property
+    def successful_episode_count(self) -> int:
+        """Finished episodes in which the target was reached."""
+        return self._successful_episode_count
+
+    @property
+    def environment_busy_fraction(self) -> float:
+        """Share of wall time since start spent inside environment steps."""
+        if self._start_time is None:
+            return 0.0
+
+        elapsed_seconds: float = time.perf_counter() - self._start_time
+        return self._environment_seconds / elapsed_seconds if elapsed_seconds > 0.0 else 0.0
+
+    def set_policy(self, policy: Any, policy_version: int) -> None:
+        """Replace the acting policy snapshot."""
+        self._policy_snapshot = (policy, policy_version)
+
+    def start(self) -> None:
+        """Collect segments on a background thread into the segment queue."""
+        if self._segment_queue is None:
+            raise RuntimeError("A segment queue is required to run the actor in the background")
+
+        self._is_running = True
+        self._actor_thread = threading.Thread(target=self._run_actor_loop, daemon=True)
+        self._actor_thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread after its current step."""
+        self._is_running = False
+
+        if self._actor_thread is not None:
+            self._actor_thread.join()
+            self._actor_thread = None
+
+    def raise_if_failed(self) -> None:
+        """Re-raise an exception that stopped the background thread."""
+        if self._actor_error is not None:
+            raise RuntimeError(f"Rollout actor stopped: {self._actor_error}") from self._actor_error
+
+    def collect_segment(self) -> RolloutSegmentModel:
+        """Step every environment segment_steps times with the current snapshot."""
+        if self._policy_snapshot is None:
+            raise RuntimeError("No policy snapshot set")
+
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+
+        if self._current_observations is None:
+            self._current_observations = np.asarray(self._environment.reset(), dtype=np.float32)
+
+        environment_count: int = self._environment.num_envs
+        observation_shape: Tuple[int, ...] = self._current_observations.shape[1:]
+        action_space = self._environment.action_space
+
+        observations = np.zeros((self._segment_steps, environment_count) + observation_shape, dtype=np.float32)
+        actions = np.zeros((self._segment_steps, environment_count) + action_space.shape, dtype=np.float32)
+        rewards = np.zeros((self._segment_steps, environment_count), dtype=np.float32)
+        dones = np.zeros((self._segment_steps, environment_count), dtype=np.float32)
+        behavior_log_probabilities = np.zeros((self._segment_steps, environment_count), dtype=np.float32)
+        truncation_mask = np.zeros((self._segment_steps, environment_count), dtype=np.float32)
+        terminal_observations = np.zeros_like(observations)
+        policy_version: int = self._policy_snapshot[1]
+
+        for step_index in range(self._segment_steps):
+            # Read the snapshot once per step so a concurrent swap is never half-applied
+            policy, _ = self._policy_snapshot
+            sampled_actions, log_probabilities = self._sample_actions(policy, self._current_observations)
+
+            environment_start_time: float = time.perf_counter()
+            next_observations, step_rewards, step_dones, step_informations = self._environment.step(
+                np.clip(sampled_actions, action_space.low, action_space.high))
+            self._environment_seconds += time.perf_counter() - environment_start_time
+
+            observations[step_index] = self._current_observations
+            actions[step_index] = sampled_actions
+            rewards[step_index] = step_rewards
+            dones[step_index] = step_dones
+            behavior_log_probabilities[step_index] = log_probabilities
+
+            for environment_index, information in enumerate(step_informations):
+                self._is_success_in_progress[environment_index] |= bool(information.get("success", False))
+
+                if not step_dones[environment_index]:
+                    continue
+
+                # Timeouts are bootstrapped from the terminal state, like SB3 does
+                if information.get("TimeLimit.truncated", False) and "terminal_observation" in information:
+                    truncation_mask[step_index, environment_index] = 1.0
+                    terminal_observations[step_index, environment_index] = information["terminal_observation"]
+
+                self._finished_episode_count += 1
+                self._successful_episode_count += int(self._is_success_in_progress[environment_index])
+                self._is_success_in_progress[environment_index] = False
+
+            self._current_observations = np.asarray(next_observations, dtype=np.float32)
+
+        self._collected_step_count += self._segment_steps * environment_count
+
+        return RolloutSegmentModel(
+            observations=observations,
+            actions=actions,
+            rewards=rewards,
+            dones=dones,
+            behavior_log_probabilities=behavior_log_probabilities,
+            truncation_mask=truncation_mask,
+            terminal_observations=terminal_observations,
+            last_observations=self._current_observations.copy(),
+            policy_version=policy_version,
+            is_normalized=self._observations_normalized
+        )
+
+    def _run_actor_loop(self) -> None:
+        """Collect segments until stopped, blocking while the learner is behind."""
+        try:
+            while self._is_running:
+                segment: RolloutSegmentModel = self.collect_segment()
+
+                while self._is_running:
+                    try:
+                        self._segment_queue.put(segment, timeout=self.QUEUE_POLL_SECONDS)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as actor_error:
+            self._actor_error = actor_error
+            self._is_running = False
+
+    def _sample_actions(self, policy: Any, observations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample unclipped Gaussian actions and their log-probabilities."""
+        action_means: np.ndarray = policy.compute_action_means(policy.normalize_observations(observations))
+        log_standard_deviations: np.ndarray = np.asarray(policy.parameters["log_std"], dtype=np.float32)
+        standard_normal_samples: np.ndarray = self._random_generator.standard_normal(
+            action_means.shape).astype(np.float32)
+
+        sampled_actions: np.ndarray = action_means + np.exp(log_standard_deviations) * standard_normal_samples
+        log_probabilities: np.ndarray = -np.sum(
+            0.5 * standard_normal_samples ** 2 + log_standard_deviations + 0.5 * math.log(2.0 * math.pi),
+            axis=-1)
+
+        return sampled_actions, log_probabilities
@@ -0,0 +1,213 @@
+import io
+import queue
+import socket
+import threading
+import numpy as np
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ..models.rollout_segment_model import RolloutSegmentModel
+from .message_framing_service import MessageFramingService
+
+
+class RolloutServerService:
+    """Learner-side endpoint that receives rollout segments from remote workers.
+
+    Every message is a JSON header frame, optionally followed by one binary
+    frame. Workers send HELLO to join and receive the current policy weights,
+    then one SEGMENT per collected segment; the acknowledgement carries new
+    weights whenever the learner has published a newer version. Workers may
+    join or disconnect at any time without affecting the others. OPTIONS
+    (and the HELLO reply) return the learner's environment options, so
+    workers build environments that match the policy they receive.
+    """
+
+    DEFAULT_HOST: str = "0.0.0.0"
+    DEFAULT_PORT: int = 5700
+    ACCEPT_TIMEOUT_SECONDS: float = 0.5
+    QUEUE_POLL_SECONDS: float = 0.5
+
+    def __init__(
+        self,
+        segment_queue: "queue.Queue[RolloutSegmentModel]",
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        environment_options: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self._segment_queue: "queue.Queue[RolloutSegmentModel]" = segment_queue
+        self._host: str = host
+        self._port: int = port
+        self._environment_options: Dict[str, Any] = dict(environment_options or {})
+
+        self._listening_socket: Optional[socket.socket] = None
+        self._accept_thread: Optional[threading.Thread] = None
+        self._is_running: bool = False
+
+        self._published_policy: Optional[Tuple[bytes, int]] = None
+        self._worker_lock: threading.Lock = threading.Lock()
+        self._connected_workers: Dict[int, str] = {}
+        self._open_connections: Set[socket.socket] = set()
+        self._next_worker_id: int = 0
+        self._received_segment_count: int = 0
+        self._received_byte_count: int = 0
+
+    @property
+    def port(self) -> int:
+        """Port the server is listening on (resolved when started with port 0)."""
+        return self._port
+
+    @property
+    def connected_worker_count(self) -> int:
+        """Number of workers currently connected."""
+        with self._worker_lock:
+            return len(self._connected_workers)
+
+    @property
+    def received_segment_count(self) -> int:
+        """Segments received from all workers so far."""
+        return self._received_segment_count
+
+    @property
+    def received_byte_count(self) -> int:
+        """Compressed segment bytes received so far."""
+        return self._received_byte_count
+
+    def publish_policy(self, parameters: Dict[str, np.ndarray], policy_version: int) -> None:
+        """Make new exported policy parameters available to workers."""
+        buffer: io.BytesIO = io.BytesIO()
+        np.savez(buffer, **parameters)
+        self._published_policy = (buffer.getvalue(), policy_version)
+
+    def start(self) -> None:
+        """Start accepting worker connections."""
+        if self._published_policy is None:
+            raise RuntimeError("Publish a policy before accepting workers")
+
+        self._listening_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listening_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listening_socket.bind((self._host, self._port))
+        self._listening_socket.listen()
+        self._listening_socket.settimeout(self.ACCEPT_TIMEOUT_SECONDS)
+        self._port = self._listening_socket.getsockname()[1]
+        self._is_running = True
+
+        self._accept_thread = threading.Thread(target=self._accept_connections, daemon=True)
+        self._accept_thread.start()
+
+        print(f"Rollout server listening on {self._host}:{self._port}")
+
+    def stop(self) -> None:
+        """Stop accepting workers; connected workers see the connection close."""
+        self._is_running = False
+
+        if self._accept_thread is not None:
+            self._accept_thread.join()
+            self._accept_thread = None
+
+        if self._listening_socket is not None:
+            self._listening_socket.close()
+            self._listening_socket = None
+
+        # Unblock worker threads waiting in recv
+        with self._worker_lock:
+            open_connections = list(self._open_connections)
+
+        for connection in open_connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _accept_connections(self) -> None:
+        """Accept worker connections, serving each on its own thread."""
+        while self._is_running:
+            try:
+                connection, address = self._listening_socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(
+                target=self._handle_worker, args=(connection, f"{address[0]}:{address[1]}"), daemon=True).start()
+
+    def _handle_worker(self, connection: socket.socket, address: str) -> None:
+        """Serve one worker until it says goodbye, disconnects or the server stops."""
+        worker_id: Optional[int] = None
+
+        with self._worker_lock:
+            self._open_connections.add(connection)
+
+        with connection:
+            try:
+                while self._is_running:
+                    request: dict = MessageFramingService.receive_message(connection)
+                    request_type: str = request.get("Type", "")
+
+                    if request_type == "OPTIONS":
+                        MessageFramingService.send_message(
+                            connection, {"EnvironmentOptions": self._environment_options})
+                    elif request_type == "HELLO":
+                        worker_id = self._register_worker(request.get("WorkerName", address))
+                        self._send_policy(
+                            connection, {"WorkerId": worker_id, "EnvironmentOptions": self._environment_options}, -1)
+                    elif request_type == "SEGMENT":
+                        payload: bytes = MessageFramingService.receive_bytes(connection)
+                        self._enqueue_segment(RolloutSegmentModel.from_compressed_bytes(payload), len(payload))
+                        self._send_policy(connection, {}, int(request.get("PolicyVersion", -1)))
+                    elif request_type == "GOODBYE":
+                        break
+                    else:
+                        MessageFramingService.send_message(
+                            connection, {"Error": f"Unknown request type: {request_type}"})
+            except (ConnectionError, OSError, ValueError):
+                pass
+            finally:
+                with self._worker_lock:
+                    self._open_connections.discard(connection)
+
+                if worker_id is not None:
+                    self._unregister_worker(worker_id)
+
+    def _register_worker(self, worker_name: str) -> int:
+        """Record a joining worker and assign its id."""
+        with self._worker_lock:
+            worker_id: int = self._next_worker_id
+            self._next_worker_id += 1
+            self._connected_workers[worker_id] = worker_name
+            worker_count: int = len(self._connected_workers)
+
+        print(f"Rollout worker {worker_id} joined ({worker_name}); {worker_count} connected")
+        return worker_id
+
+    def _unregister_worker(self, worker_id: int) -> None:
+        """Forget a worker that left."""
+        with self._worker_lock:
+            worker_name: str = self._connected_workers.pop(worker_id, "")
+            worker_count: int = len(self._connected_workers)
+
+        print(f"Rollout worker {worker_id} left ({worker_name}); {worker_count} connected")
+
+    def _enqueue_segment(self, segment: RolloutSegmentModel, payload_size: int) -> None:
+        """Hand a segment to the learner, blocking the worker while the learner is behind."""
+        while self._is_running:
+            try:
+                self._segment_queue.put(segment, timeout=self.QUEUE_POLL_SECONDS)
+            except queue.Full:
+                continue
+
+            # Segments dropped at shutdown never reached the learner and are not counted
+            self._received_segment_count += 1
+            self._received_byte_count += payload_size
+            return
+
+    def _send_policy(self, connection: socket.socket, response: dict, worker_policy_version: int) -> None:
+        """Reply with the current version, attaching weights if the worker's copy is older."""
+        policy_bytes, policy_version = self._published_policy
+        has_weights: bool = policy_version != worker_policy_version
+
+        MessageFramingService.send_message(
+            connection, {**response, "PolicyVersion": policy_version, "HasWeights": has_weights})
+
+        if has_weights:
+            MessageFramingService.send_bytes(connection, policy_bytes)
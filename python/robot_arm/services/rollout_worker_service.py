@@ -0,0 +1,162 @@
+import io
+import socket
+import numpy as np
+from typing import Any, Dict, Optional
+import os
+
+from .message_framing_service import MessageFramingService
+from .numpy_policy_service import NumpyPolicyService
+from .rollout_actor_service import RolloutActorService
+
+
+class RolloutWorkerService:
+    """Collects rollout segments from raw local environments and streams them to a learner.
+
+    The worker acts with the latest weights published by the learner, which
+    include its observation normalization, and sends raw observations and
+    rewards so every worker is normalized with the same statistics. When
+    built with environment_options, joining fails unless they match the
+    learner's, since the policy's inputs depend on them.
+    """
+
+    DEFAULT_TIMEOUT_SECONDS: float = 60.0
+
+    def __init__(
+        self,
+        environment: Any,
+        learner_host: str,
+        learner_port: int,
+        segment_steps: int = RolloutActorService.DEFAULT_SEGMENT_STEPS,
+        worker_name: Optional[str] = None,
+        seed: Optional[int] = None,
+        environment_options: Optional[Dict[str, Any]] = None
+    ) -> None:
+        self._learner_host: str = learner_host
+        self._learner_port: int = learner_port
+        self._worker_name: str = worker_name or f"{socket.gethostname()}:{os.getpid()}"
+        self._environment_options: Optional[Dict[str, Any]] = environment_options
+        self._actor: RolloutActorService = RolloutActorService(
+            environment,
+            segment_steps=segment_steps,
+            seed=seed,
+            observations_normalized=False
+        )
+        self._socket: Optional[socket.socket] = None
+        self._worker_id: Optional[int] = None
+        self._policy_version: int = -1
+        self._sent_segment_count: int = 0
+        self._sent_byte_count: int = 0
+
+    @property
+    def worker_id(self) -> Optional[int]:
+        """Id assigned by the learner on joining."""
+        return self._worker_id
+
+    @property
+    def policy_version(self) -> int:
+        """Version of the weights currently used for acting."""
+        return self._policy_version
+
+    @property
+    def sent_segment_count(self) -> int:
+        """Segments delivered to the learner."""
+        return self._sent_segment_count
+
+    @property
+    def sent_byte_count(self) -> int:
+        """Compressed segment bytes delivered to the learner."""
+        return self._sent_byte_count
+
+    @classmethod
+    def fetch_environment_options(cls, learner_host: str, learner_port: int) -> Dict[str, Any]:
+        """Environment options of a learner, without joining it."""
+        with cls._open_connection(learner_host, learner_port) as connection:
+            MessageFramingService.send_message(connection, {"Type": "OPTIONS"})
+            response: dict = MessageFramingService.receive_message(connection)
+            MessageFramingService.send_message(connection, {"Type": "GOODBYE"})
+
+        if "Error" in response:
+            raise RuntimeError(response["Error"])
+
+        return response["EnvironmentOptions"]
+
+    def connect(self) -> None:
+        """Join the learner and load its current weights."""
+        self._socket = self._open_connection(self._learner_host, self._learner_port)
+
+        MessageFramingService.send_message(self._socket, {"Type": "HELLO", "WorkerName": self._worker_name})
+        response: dict = self._receive_policy_response()
+        self._worker_id = response["WorkerId"]
+
+        learner_options: Dict[str, Any] = response.get("EnvironmentOptions", {})
+        if self._environment_options is not None and learner_options != self._environment_options:
+            self.disconnect()
+            raise RuntimeError(
+                f"Worker environment options {self._environment_options} differ from the learner's {learner_options}")
+
+    def disconnect(self) -> None:
+        """Leave the learner cleanly."""
+        if self._socket is None:
+            return
+
+        try:
+            MessageFramingService.send_message(self._socket, {"Type": "GOODBYE"})
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+        self._socket.close()
+        self._socket = None
+
+    def run(self, maximum_segments: Optional[int] = None) -> None:
+        """Collect and send segments until the learner goes away or the limit is reached."""
+        if self._socket is None:
+            self.connect()
+
+        try:
+            while maximum_segments is None or self._sent_segment_count < maximum_segments:
+                self.send_segment()
+        except (ConnectionError, OSError) as connection_error:
+            print(f"Learner connection closed: {connection_error}")
+        finally:
+            self.disconnect()
+
+    def send_segment(self) -> None:
+        """Collect one segment, send it and pick up newer weights from the acknowledgement."""
+        segment_payload: bytes = self._actor.collect_segment().to_compressed_bytes()
+
+        MessageFramingService.send_message(
+            self._socket, {"Type": "SEGMENT", "PolicyVersion": self._policy_version})
+        MessageFramingService.send_bytes(self._socket, segment_payload)
+        self._sent_byte_count += len(segment_payload)
+        self._sent_segment_count += 1
+
+        self._receive_policy_response()
+
+    @classmethod
+    def _open_connection(cls, learner_host: str, learner_port: int) -> socket.socket:
+        """Connected learner socket with the worker timeout."""
+        connection: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        connection.settimeout(cls.DEFAULT_TIMEOUT_SECONDS)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection.connect((learner_host, learner_port))
+
+        return connection
+
+    def _receive_policy_response(self) -> dict:
+        """Read a learner response and switch to attached weights, if any."""
+        response: dict = MessageFramingService.receive_message(self._socket)
+
+        if "Error" in response:
+            raise RuntimeError(response["Error"])
+
+        if response.get("HasWeights", False):
+            policy_bytes: bytes = MessageFramingService.receive_bytes(self._socket)
+
+            with np.load(io.BytesIO(policy_bytes), allow_pickle=False) as archive:
+                parameters: Dict[str, np.ndarray] = {key: archive[key] for key in archive.files}
+
+            self._policy_version = response["PolicyVersion"]
+            self._actor.set_policy(NumpyPolicyService(parameters), self._policy_version)
+
+        return response
@@ -0,0 +1,76 @@
+import contextlib
+import json
+from typing import Any, Callable, Dict, Iterator
+import os
+
+
+class StepPathBenchmarkService:
+    """Micro-benchmarks of the Python side of one environment step, with their stored baseline.
+
+    The suite covers command serialization, observation parsing and
+    normalization, the reward calculation and a full environment step over a
+    loopback MockSimulatorService. The baseline ships with the package so
+    `benchmark step` works from an installed copy. Dependencies are imported
+    when the suite is created, so reading BASELINE_PATH stays cheap.
+    """
+
+    BASELINE_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "step_path_baseline.json")
+
+    # A full observation as Unity's JsonUtility serializes it
+    OBSERVATION_DICTIONARY: Dict[str, Any] = {
+        "JointAngles": [10.0, -20.0, 30.0, -40.0, 50.0, -60.0],
+        "ToolCenterPointPosition": [0.3, 0.2, 0.1],
+        "DirectionToTarget": [0.577, 0.577, 0.577],
+        "DistanceToTarget": 0.45,
+        "TargetPosition": [0.4, 0.3, 0.2],
+        "GripperState": 0.5,
+        "IsGrippingObject": False,
+        "LaserSensorHit": True,
+        "LaserSensorDistance": 0.08,
+        "CollisionDetected": False,
+        "TargetOrientationOneHot": [1.0, 0.0],
+        "IsResetFrame": False,
+        "JointAngleLimits": []
+    }
+
+    @classmethod
+    @contextlib.contextmanager
+    def create_benchmarks(cls) -> Iterator[Dict[str, Callable[[], Any]]]:
+        """Benchmark functions keyed by name; the loopback simulator and environment live for the block."""
+        import numpy as np
+        from ..enums.command_type import CommandType
+        from ..environments.unity_robot_environment import UnityRobotEnvironment
+        from ..models.command_model import CommandModel
+        from ..models.observation_model import ObservationModel
+        from .mock_simulator_service import MockSimulatorService
+        from .reward_calculation_service import RewardCalculationService
+
+        step_command: CommandModel = CommandModel(
+            command_type=CommandType.STEP,
+            actions=[1.5, -0.5, 0.25, 2.0, -1.0],
+            axis_6_orientation=1.0,
+            gripper_close_value=0.3
+        )
+        observation_model: ObservationModel = ObservationModel.from_dictionary(cls.OBSERVATION_DICTIONARY)
+        reward_calculation_service: RewardCalculationService = RewardCalculationService()
+        reward_calculation_service.reset_state(observation_model)
+
+        # The target is never reached and episodes never end, so every step takes the same path
+        simulator: MockSimulatorService = MockSimulatorService(steps_to_target=1 << 30, episode_length=None)
+        environment = UnityRobotEnvironment(
+            server_address=f"tcp://localhost:{simulator.port}", maximum_episode_steps=1 << 30)
+        action: np.ndarray = np.full(UnityRobotEnvironment.ACTION_DIMENSION, 0.1, dtype=np.float32)
+
+        try:
+            environment.reset()
+
+            yield {
+                "command_to_json": lambda: json.dumps(step_command.to_dictionary()).encode("utf-8"),
+                "observation_from_dictionary": lambda: ObservationModel.from_dictionary(cls.OBSERVATION_DICTIONARY),
+                "normalize_observation": lambda: environment._normalize_observation(observation_model),
+                "calculate_reward": lambda: reward_calculation_service.calculate_reward(observation_model),
+                "environment_step_loopback": lambda: environment.step(action)
+            }
+        finally:
+            environment.close()
+            simulator.close()
@@ -0,0 +1,209 @@
+import csv
+import time
+import numpy as np
+from typing import Any, Callable, List, Optional, Sequence
+import os
+
+from ..models.target_result_model import TargetResultModel
+from .control_loop_scheduler_service import ControlLoopSchedulerService
+from .target_scheduler_service import TargetSchedulerService
+
+
+class TargetQueueService:
+    """Drives a policy to a queue of target positions back to back on one environment.
+
+    Targets come from a CSV file or a regular grid over the spawn volume.
+    Each target gets a fresh episode placed with SET_TARGET and ends on
+    success, collision, the environment's step limit or the optional
+    per-target cap. The whole queue runs on the calling thread, so a UI only
+    needs to start it and read the results afterwards.
+    """
+
+    DEFAULT_POINTS_PER_AXIS: Sequence[int] = (5, 3, 5)
+    RESULT_FIELD_NAMES: List[str] = [
+        "TargetX", "TargetY", "TargetZ", "Success", "Outcome", "StepCount", "ElapsedSeconds", "FinalDistance"]
+
+    @staticmethod
+    def load_targets(csv_path: str) -> np.ndarray:
+        """Target positions from the first three columns of a CSV file, skipping a header row.
+
+        Returns:
+            Array shaped (targets, 3).
+        """
+        target_positions: List[List[float]] = []
+
+        with open(csv_path, "r", newline="", encoding="utf-8") as csv_file:
+            for row_number, row in enumerate(csv.reader(csv_file), start=1):
+                if not row or not "".join(row).strip():
+                    continue
+
+                try:
+                    target_positions.append([float(value) for value in row[:3]])
+                except ValueError:
+                    if row_number == 1:
+                        continue
+                    raise ValueError(f"Row {row_number} of {csv_path} is not numeric: {row}")
+
+                if len(target_positions[-1]) != 3:
+                    raise ValueError(f"Row {row_number} of {csv_path} needs x, y and z columns")
+
+        if not target_positions:
+            raise ValueError(f"No target positions in {csv_path}")
+
+        return np.asarray(target_positions, dtype=np.float64)
+
+    @staticmethod
+    def generate_grid(
+        points_per_axis: Sequence[int] = DEFAULT_POINTS_PER_AXIS,
+        lower_bounds: Sequence[float] = TargetSchedulerService.DEFAULT_LOWER_BOUNDS,
+        upper_bounds: Sequence[float] = TargetSchedulerService.DEFAULT_UPPER_BOUNDS,
+        minimum_horizontal_radius: float = TargetSchedulerService.MINIMUM_HORIZONTAL_RADIUS,
+        maximum_horizontal_radius: float = TargetSchedulerService.MAXIMUM_HORIZONTAL_RADIUS
+    ) -> np.ndarray:
+        """Evenly spaced targets over the bounds, keeping points inside the horizontal spawn annulus.
+
+        Returns:
+            Array shaped (targets, 3), ordered x-major.
+        """
+        axis_values: List[np.ndarray] = [
+            np.linspace(lower_bound, upper_bound, point_count)
+            for lower_bound, upper_bound, point_count in zip(lower_bounds, upper_bounds, points_per_axis)
+        ]
+        grid_positions: np.ndarray = np.stack(np.meshgrid(*axis_values, indexing="ij"), axis=-1).reshape(-1, 3)
+        horizontal_radii: np.ndarray = np.hypot(grid_positions[:, 0], grid_positions[:, 2])
+
+        return grid_positions[
+            (horizontal_radii >= minimum_horizontal_radius) & (horizontal_radii <= maximum_horizontal_radius)]
+
+    @staticmethod
+    def save_results(results: Sequence[TargetResultModel], csv_path: str) -> str:
+        """Write one CSV row per target result and return the path."""
+        directory: str = os.path.dirname(csv_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
+            writer: csv.DictWriter = csv.DictWriter(csv_file, fieldnames=TargetQueueService.RESULT_FIELD_NAMES)
+            writer.writeheader()
+            for result in results:
+                writer.writerow(result.to_dictionary())
+
+        return csv_path
+
+    @staticmethod
+    def summarize(results: Sequence[TargetResultModel]) -> str:
+        """One-line success rate and mean steps to reached targets."""
+        if not results:
+            return "No targets executed"
+
+        successful_steps: List[int] = [result.step_count for result in results if result.is_success]
+        mean_steps_text: str = f"{np.mean(successful_steps):.1f}" if successful_steps else "n/a"
+
+        return (f"{len(successful_steps)}/{len(results)} reached "
+                f"({len(successful_steps) / len(results):.0%}), mean steps {mean_steps_text}")
+
+    def execute(
+        self,
+        environment: Any,
+        policy: Any,
+        target_positions: np.ndarray,
+        should_continue: Callable[[], bool],
+        control_frequency_hertz: Optional[float] = None,
+        maximum_steps_per_target: Optional[int] = None,
+        step_callback: Optional[Callable[[float], None]] = None,
+        target_callback: Optional[Callable[[int, TargetResultModel], None]] = None
+    ) -> List[TargetResultModel]:
+        """Run one deterministic episode per target until the queue is done or should_continue is False.
+
+        Args:
+            environment: UnityRobotEnvironment, or anything with reset, step,
+                set_target_position and last_observation.
+            policy: Object with predict(observation, deterministic=True).
+            target_positions: Array shaped (targets, 3).
+            should_continue: Polled every step; False abandons the current target.
+            control_frequency_hertz: Fixed step rate, or None to step as fast as the simulator answers.
+            maximum_steps_per_target: Optional cap below the environment's own step limit.
+            step_callback: Called after every step with its latency in milliseconds.
+            target_callback: Called after every finished target with its index and result.
+
+        Returns:
+            One result per finished target, in queue order.
+        """
+        results: List[TargetResultModel] = []
+
+        for target_index, target_position in enumerate(np.asarray(target_positions, dtype=np.float64)):
+            if not should_continue():
+                break
+
+            result: Optional[TargetResultModel] = self._execute_target(
+                environment, policy, target_position.tolist(), should_continue,
+                control_frequency_hertz, maximum_steps_per_target, step_callback)
+
+            if result is None:
+                break
+
+            results.append(result)
+            if target_callback is not None:
+                target_callback(target_index, result)
+
+        return results
+
+    def _execute_target(
+        self,
+        environment: Any,
+        policy: Any,
+        target_position: List[float],
+        should_continue: Callable[[], bool],
+        control_frequency_hertz: Optional[float],
+        maximum_steps_per_target: Optional[int],
+        step_callback: Optional[Callable[[float], None]]
+    ) -> Optional[TargetResultModel]:
+        """Drive the policy to one target; None if stopped before the episode ended."""
+        start_time: float = time.perf_counter()
+        environment.reset()
+        episode_state: dict = {
+            "observation": environment.set_target_position(target_position),
+            "step_count": 0,
+            "outcome": None
+        }
+
+        def run_step() -> bool:
+            step_start_time: float = time.perf_counter()
+            action, _ = policy.predict(episode_state["observation"], deterministic=True)
+            episode_state["observation"], _, terminated, truncated, information = environment.step(action)
+            episode_state["step_count"] += 1
+
+            if step_callback is not None:
+                step_callback((time.perf_counter() - step_start_time) * 1000.0)
+
+            # Reaching the target does not terminate the environment, so stop here
+            if information.get("success", False):
+                episode_state["outcome"] = "success"
+            elif information.get("collision", False):
+                episode_state["outcome"] = "collision"
+            elif information.get("underground", False):
+                episode_state["outcome"] = "underground"
+            elif terminated or truncated or (
+                    maximum_steps_per_target is not None and episode_state["step_count"] >= maximum_steps_per_target):
+                episode_state["outcome"] = "timeout"
+
+            return episode_state["outcome"] is None
+
+        if control_frequency_hertz is None:
+            while should_continue() and run_step():
+                pass
+        else:
+            ControlLoopSchedulerService(control_frequency_hertz).run(run_step, should_continue)
+
+        if episode_state["outcome"] is None:
+            return None
+
+        last_observation = environment.last_observation
+
+        return TargetResultModel(
+            target_position=[float(coordinate) for coordinate in target_position],
+            outcome=episode_state["outcome"],
+            step_count=episode_state["step_count"],
+            elapsed_seconds=time.perf_counter() - start_time,
+            final_distance=float(last_observation.distance_to_target) if last_observation is not None else float("nan")
+        )
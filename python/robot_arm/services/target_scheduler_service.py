@@ -0,0 +1,105 @@
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+
+class TargetSchedulerService:
+    """Samples target positions with priority on regions where the policy keeps failing.
+
+    The spawn volume is divided into a uniform grid. Each cell keeps success and
+    failure counts, and cells are drawn in proportion to their posterior failure
+    rate, so solved regions are visited less while new regions start at 0.5.
+    A fixed share of uniform draws keeps every region in the training mix.
+    Defaults mirror the Unity RandomTargetService spawn annulus around a robot
+    base at the origin.
+    """
+
+    DEFAULT_LOWER_BOUNDS: Tuple[float, float, float] = (-2.5, 0.3, -2.5)
+    DEFAULT_UPPER_BOUNDS: Tuple[float, float, float] = (2.5, 2.0, 2.5)
+    DEFAULT_CELLS_PER_AXIS: Tuple[int, int, int] = (10, 4, 10)
+    MINIMUM_HORIZONTAL_RADIUS: float = 0.5
+    MAXIMUM_HORIZONTAL_RADIUS: float = 2.5
+    UNIFORM_SAMPLING_FRACTION: float = 0.2
+    PRIOR_OUTCOME_COUNT: float = 1.0
+
+    def __init__(
+        self,
+        lower_bounds: Sequence[float] = DEFAULT_LOWER_BOUNDS,
+        upper_bounds: Sequence[float] = DEFAULT_UPPER_BOUNDS,
+        cells_per_axis: Sequence[int] = DEFAULT_CELLS_PER_AXIS,
+        minimum_horizontal_radius: float = MINIMUM_HORIZONTAL_RADIUS,
+        maximum_horizontal_radius: float = MAXIMUM_HORIZONTAL_RADIUS,
+        uniform_sampling_fraction: float = UNIFORM_SAMPLING_FRACTION,
+        seed: Optional[int] = None
+    ) -> None:
+        self._lower_bounds: np.ndarray = np.asarray(lower_bounds, dtype=np.float64)
+        self._upper_bounds: np.ndarray = np.asarray(upper_bounds, dtype=np.float64)
+        self._cells_per_axis: np.ndarray = np.asarray(cells_per_axis, dtype=np.int64)
+        self._cell_size: np.ndarray = (self._upper_bounds - self._lower_bounds) / self._cells_per_axis
+        self._uniform_sampling_fraction: float = uniform_sampling_fraction
+        self._random_generator: np.random.Generator = np.random.default_rng(seed)
+
+        cell_count: int = int(np.prod(self._cells_per_axis))
+        self._success_counts: np.ndarray = np.zeros(cell_count)
+        self._failure_counts: np.ndarray = np.zeros(cell_count)
+
+        # Only cells whose centers lie in the horizontal spawn annulus are sampled
+        cell_centers: np.ndarray = self._compute_cell_centers()
+        horizontal_radii: np.ndarray = np.hypot(cell_centers[:, 0], cell_centers[:, 2])
+        self._valid_cell_indices: np.ndarray = np.flatnonzero(
+            (horizontal_radii >= minimum_horizontal_radius) & (horizontal_radii <= maximum_horizontal_radius))
+
+        if len(self._valid_cell_indices) == 0:
+            raise ValueError("No grid cell lies inside the spawn radius range")
+
+    @property
+    def valid_cell_count(self) -> int:
+        """Number of grid cells targets are drawn from."""
+        return len(self._valid_cell_indices)
+
+    @property
+    def recorded_outcome_count(self) -> int:
+        """Number of target outcomes recorded so far."""
+        return int(self._success_counts.sum() + self._failure_counts.sum())
+
+    def sample_target(self) -> np.ndarray:
+        """Draw a target position, favoring cells with a high failure rate."""
+        if self._random_generator.random() < self._uniform_sampling_fraction:
+            cell_index: int = int(self._random_generator.choice(self._valid_cell_indices))
+        else:
+            priorities: np.ndarray = self.compute_failure_rates()[self._valid_cell_indices]
+            cell_index = int(self._random_generator.choice(
+                self._valid_cell_indices, p=priorities / priorities.sum()))
+
+        cell_coordinates: np.ndarray = np.array(np.unravel_index(cell_index, tuple(self._cells_per_axis)))
+        cell_lower_corner: np.ndarray = self._lower_bounds + cell_coordinates * self._cell_size
+
+        return cell_lower_corner + self._random_generator.random(3) * self._cell_size
+
+    def record_outcome(self, target_position: Sequence[float], is_success: bool) -> None:
+        """Count whether the target at this position was reached."""
+        cell_index: int = self.find_cell_index(target_position)
+
+        if is_success:
+            self._success_counts[cell_index] += 1
+        else:
+            self._failure_counts[cell_index] += 1
+
+    def compute_failure_rates(self) -> np.ndarray:
+        """Posterior mean failure rate of every cell (0.5 for unvisited cells)."""
+        prior: float = self.PRIOR_OUTCOME_COUNT
+        return (self._failure_counts + prior) / (self._success_counts + self._failure_counts + 2.0 * prior)
+
+    def find_cell_index(self, position: Sequence[float]) -> int:
+        """Flat index of the grid cell containing a position, clamped to the grid."""
+        cell_coordinates: np.ndarray = np.floor(
+            (np.asarray(position, dtype=np.float64) - self._lower_bounds) / self._cell_size).astype(np.int64)
+        cell_coordinates = np.clip(cell_coordinates, 0, self._cells_per_axis - 1)
+
+        return int(np.ravel_multi_index(tuple(cell_coordinates), tuple(self._cells_per_axis)))
+
+    def _compute_cell_centers(self) -> np.ndarray:
+        """Center position of every cell in flat index order."""
+        cell_coordinates: np.ndarray = np.stack(
+            np.unravel_index(np.arange(int(np.prod(self._cells_per_axis))), tuple(self._cells_per_axis)), axis=1)
+
+        return self._lower_bounds + (cell_coordinates + 0.5) * self._cell_size
@@ -0,0 +1,100 @@
+import threading
+from typing import Dict, List, Sequence
+import numpy as np
+
+
+class TelemetryBufferService:
+    """Fixed-size ring of telemetry samples shared by a producer thread and a plotting thread.
+
+    Appending writes one row in place under a short lock, so the producer
+    never waits on rendering. Readers take an ordered snapshot and reduce it
+    with min/max decimation to a fixed number of points per channel, which
+    keeps spikes visible while drawing cost stays independent of how long
+    the producer has been running.
+    """
+
+    DEFAULT_CAPACITY: int = 4096
+
+    def __init__(self, channel_names: Sequence[str], capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("Telemetry capacity must be at least 1")
+
+        self._channel_names: List[str] = list(channel_names)
+        self._channel_indices: Dict[str, int] = {name: index for index, name in enumerate(self._channel_names)}
+        self._samples: np.ndarray = np.zeros((capacity, len(self._channel_names)), dtype=np.float32)
+        self._write_position: int = 0
+        self._sample_count: int = 0
+        self._appended_count: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def channel_names(self) -> List[str]:
+        """Channel names in column order."""
+        return list(self._channel_names)
+
+    @property
+    def sample_count(self) -> int:
+        """Number of samples currently held, at most the capacity."""
+        return self._sample_count
+
+    @property
+    def appended_count(self) -> int:
+        """Number of samples appended since creation, including overwritten ones."""
+        return self._appended_count
+
+    def append(self, values: Sequence[float]) -> None:
+        """Store one sample with a value per channel, overwriting the oldest when full."""
+        with self._lock:
+            self._samples[self._write_position] = values
+            self._write_position = (self._write_position + 1) % len(self._samples)
+            self._sample_count = min(self._sample_count + 1, len(self._samples))
+            self._appended_count += 1
+
+    def clear(self) -> None:
+        """Drop all samples; counts as a change for appended_count watchers."""
+        with self._lock:
+            self._write_position = 0
+            self._sample_count = 0
+            self._appended_count += 1
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the held samples, oldest first, shaped (samples, channels)."""
+        with self._lock:
+            if self._sample_count < len(self._samples):
+                return self._samples[:self._sample_count].copy()
+
+            return np.concatenate([self._samples[self._write_position:], self._samples[:self._write_position]])
+
+    def decimated_snapshot(self, bucket_count: int) -> Dict[str, np.ndarray]:
+        """Min/max decimated series per channel, keyed by channel name."""
+        samples: np.ndarray = self.snapshot()
+
+        return {
+            channel_name: self.decimate_min_max(samples[:, channel_index], bucket_count)
+            for channel_name, channel_index in self._channel_indices.items()
+        }
+
+    @staticmethod
+    def decimate_min_max(values: np.ndarray, bucket_count: int) -> np.ndarray:
+        """Reduce a series to at most 2 * bucket_count points, keeping each bucket's min and max in time order.
+
+        Series short enough to fit are returned unchanged.
+        """
+        if len(values) <= 2 * bucket_count:
+            return values
+
+        # Equal buckets over the leading samples; the remainder joins the last bucket
+        bucket_size: int = len(values) // bucket_count
+        buckets: np.ndarray = values[:bucket_size * bucket_count].reshape(bucket_count, bucket_size)
+        bucket_starts: np.ndarray = np.arange(bucket_count) * bucket_size
+        minimum_indices: np.ndarray = bucket_starts + buckets.argmin(axis=1)
+        maximum_indices: np.ndarray = bucket_starts + buckets.argmax(axis=1)
+
+        last_bucket_start: int = int(bucket_starts[-1])
+        minimum_indices[-1] = last_bucket_start + int(values[last_bucket_start:].argmin())
+        maximum_indices[-1] = last_bucket_start + int(values[last_bucket_start:].argmax())
+
+        ordered_indices: np.ndarray = np.stack(
+            [np.minimum(minimum_indices, maximum_indices), np.maximum(minimum_indices, maximum_indices)], axis=1)
+
+        return values[ordered_indices.reshape(-1)]
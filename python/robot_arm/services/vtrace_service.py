@@ -0,0 +1,70 @@
+import numpy as np
+from typing import Tuple
+
+
+class VTraceService:
+    """V-trace off-policy value targets and advantages (Espeholt et al., 2018).
+
+    Corrects trajectories collected by a slightly stale behavior policy so
+    they can train the current target policy. All arrays are time-major with
+    shape (T, N) for T steps of N environments.
+    """
+
+    DEFAULT_IMPORTANCE_WEIGHT_CLIP: float = 1.0
+    DEFAULT_TRACE_CLIP: float = 1.0
+
+    @staticmethod
+    def compute_targets(
+        behavior_log_probabilities: np.ndarray,
+        target_log_probabilities: np.ndarray,
+        rewards: np.ndarray,
+        values: np.ndarray,
+        bootstrap_values: np.ndarray,
+        dones: np.ndarray,
+        discount_factor: float,
+        trace_decay: float = 1.0,
+        importance_weight_clip: float = DEFAULT_IMPORTANCE_WEIGHT_CLIP,
+        trace_clip: float = DEFAULT_TRACE_CLIP
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute V-trace value targets and policy-gradient advantages.
+
+        Args:
+            behavior_log_probabilities: log mu(a_t|s_t) of the acting policy.
+            target_log_probabilities: log pi(a_t|s_t) of the policy being trained.
+            rewards: Rewards r_t.
+            values: Value estimates V(s_t) under the current critic.
+            bootstrap_values: V(s_T) for the state after the last step, shape (N,).
+            dones: 1.0 where the episode ended at step t, so s_t+1 is not bootstrapped.
+            discount_factor: Discount gamma.
+            trace_decay: Extra lambda factor on the traces; 1.0 is plain V-trace.
+            importance_weight_clip: rho-bar, clips weights in the TD errors and advantages.
+            trace_clip: c-bar, clips weights in the trace products.
+
+        Returns:
+            Tuple of (value targets v_s (T, N), advantages rho_t (r_t + gamma v_s+1 - V(s_t)) (T, N)).
+        """
+        importance_weights: np.ndarray = np.exp(target_log_probabilities - behavior_log_probabilities)
+        clipped_importance_weights: np.ndarray = np.minimum(importance_weight_clip, importance_weights)
+        clipped_traces: np.ndarray = trace_decay * np.minimum(trace_clip, importance_weights)
+
+        continuation_discounts: np.ndarray = discount_factor * (1.0 - dones)
+        next_values: np.ndarray = np.concatenate([values[1:], bootstrap_values[None]], axis=0)
+        temporal_differences: np.ndarray = clipped_importance_weights * (
+            rewards + continuation_discounts * next_values - values)
+
+        # Backward recursion: v_s - V(s) = delta_s + gamma c_s (v_s+1 - V(s+1))
+        value_corrections: np.ndarray = np.zeros_like(values)
+        next_value_correction: np.ndarray = np.zeros_like(bootstrap_values)
+
+        for step_index in reversed(range(len(values))):
+            next_value_correction = (
+                temporal_differences[step_index]
+                + continuation_discounts[step_index] * clipped_traces[step_index] * next_value_correction)
+            value_corrections[step_index] = next_value_correction
+
+        value_targets: np.ndarray = values + value_corrections
+        next_value_targets: np.ndarray = np.concatenate([value_targets[1:], bootstrap_values[None]], axis=0)
+        advantages: np.ndarray = clipped_importance_weights * (
+            rewards + continuation_discounts * next_value_targets - values)
+
+        return value_targets, advantages
@@ -0,0 +1,111 @@
+"""Hyperparameter sweep with successive-halving early stopping."""
+
+import os
+import argparse
+import json
+import time
+
+from .controllers.sweep_controller import SweepController
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Sweep PPO hyperparameters for the robot arm")
+    parser.add_argument(
+        "--search-space",
+        type=str,
+        default=None,
+        help="JSON file mapping parameters to choice lists or {low, high, log} ranges"
+    )
+    parser.add_argument(
+        "--ports",
+        type=int,
+        nargs="+",
+        default=[5555],
+        help="Simulator ports; one worker process is started per port"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="localhost",
+        help="Simulator host"
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=SweepController.DEFAULT_TRIAL_COUNT,
+        help="Number of sampled configurations"
+    )
+    parser.add_argument(
+        "--min-timesteps",
+        type=int,
+        default=SweepController.DEFAULT_MINIMUM_TIMESTEPS,
+        help="Training steps per trial in the first rung"
+    )
+    parser.add_argument(
+        "--reduction-factor",
+        type=int,
+        default=SweepController.DEFAULT_REDUCTION_FACTOR,
+        help="Keep 1/N of trials per rung and multiply their budget by N"
+    )
+    parser.add_argument(
+        "--rungs",
+        type=int,
+        default=SweepController.DEFAULT_RUNG_COUNT,
+        help="Number of successive-halving rungs"
+    )
+    parser.add_argument(
+        "--output-directory",
+        type=str,
+        default=None,
+        help="Directory for trial models and results.jsonl (default: ./sweeps/<timestamp>)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for configuration sampling"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Main entry point for the hyperparameter sweep."""
+    args = parse_arguments()
+
+    search_space = None
+    if args.search_space is not None:
+        with open(args.search_space, "r", encoding="utf-8") as search_space_file:
+            search_space = json.load(search_space_file)
+
+    output_directory: str = args.output_directory or os.path.join(
+        "./sweeps", time.strftime("%Y%m%d_%H%M%S"))
+
+    sweep_controller: SweepController = SweepController(
+        server_ports=args.ports,
+        output_directory=output_directory,
+        search_space=search_space,
+        server_host=args.host,
+        trial_count=args.trials,
+        minimum_timesteps=args.min_timesteps,
+        reduction_factor=args.reduction_factor,
+        rung_count=args.rungs,
+        seed=args.seed
+    )
+
+    try:
+        final_results = sweep_controller.run()
+    except KeyboardInterrupt:
+        print("\n\nSweep interrupted by user.")
+        return
+
+    print(f"\nResults written to: {sweep_controller.results_path}")
+    best_result = final_results[0]
+    print(f"Best trial {best_result['trial_number']}: success {best_result['success_rate']:.0%}, "
+          f"return {best_result['mean_return']:.1f}")
+    print(f"Configuration: {json.dumps(best_result['configuration'])}")
+    print(f"Model: {best_result['model_path']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Training script for the robotic arm RL agent."""
+
+import sys
+import argparse
+import json
+
+from .controllers.training_controller import TrainingController
+from .enums.training_algorithm import TrainingAlgorithm
+from .models.run_configuration_model import RunConfigurationModel
+
+DEFAULT_RUN_CONFIGURATION_PATH = "run_config.json"
+
+
+def parse_arguments():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Train 6-DOF Robot Arm RL Agent")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume training from a saved model"
+    )
+    parser.add_argument(
+        "--model-path",
+        type=str,
+        default=None,
+        help="Path to the saved model to resume from (e.g., ./models/robot_policy_touch)"
+    )
+    parser.add_argument(
+        "--algorithm",
+        type=str,
+        choices=[algorithm.value for algorithm in TrainingAlgorithm],
+        default=TrainingAlgorithm.PPO.value,
+        help="PPO, or an off-policy algorithm with a disk-backed replay buffer (SAC, TD3)"
+    )
+    parser.add_argument(
+        "--hindsight-relabeling",
+        action="store_true",
+        help="Goal-conditioned observations with hindsight relabeling of reached TCP positions (SAC/TD3 only)"
+    )
+    parser.add_argument(
+        "--model-based-rollouts",
+        action="store_true",
+        help="Mix short rollouts imagined by a learned dynamics ensemble into training batches (SAC/TD3 only)"
+    )
+    parser.add_argument(
+        "--continuing-targets",
+        action="store_true",
+        help="Spawn a new target after each success instead of waiting for a reset"
+    )
+    parser.add_argument(
+        "--target-scheduler",
+        action="store_true",
+        help="Place targets from Python, favoring regions where the policy keeps failing"
+    )
+    parser.add_argument(
+        "--history-length",
+        type=int,
+        default=1,
+        help="Stack this many recent observations into each policy input"
+    )
+    parser.add_argument(
+        "--history-deltas",
+        action="store_true",
+        help="Add per-field changes from the previous observation to each stacked entry"
+    )
+    parser.add_argument(
+        "--safety-filter",
+        action="store_true",
+        help="Scale back actions that forward kinematics predicts drive the TCP underground"
+    )
+    parser.add_argument(
+        "--asynchronous",
+        action="store_true",
+        help="Keep the simulator stepping during gradient updates (V-trace corrected PPO)"
+    )
+    parser.add_argument(
+        "--rollout-port",
+        type=int,
+        default=None,
+        help="Accept experience from rollout_worker.py processes on this port (implies --asynchronous)"
+    )
+    parser.add_argument(
+        "--pretrain-trajectories",
+        type=int,
+        default=0,
+        help="Number of inverse-kinematics demonstrations to behavior-clone before training"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="localhost",
+        help="Simulator host"
+    )
+    parser.add_argument(
+        "--ports",
+        type=int,
+        nargs="+",
+        default=[5555],
+        help="Simulator ports; the run configuration's environments use the first ones, one port each"
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=None,
+        help="Run configuration JSON with training hyperparameters and environment layout "
+             f"(written here by --auto-tune, default {DEFAULT_RUN_CONFIGURATION_PATH})"
+    )
+    parser.add_argument(
+        "--auto-tune",
+        action="store_true",
+        help="Calibrate environment count, vectorized environment type, steps per update and batch size "
+             "against mock simulators, write the run configuration and train with it (PPO only)"
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=float,
+        default=None,
+        help="Memory the tuned setting may use for rollouts and environments (default 4096)"
+    )
+    parser.add_argument(
+        "--simulator-latency-ms",
+        type=float,
+        default=None,
+        help="Simulator STEP latency for tuning (default: measured from the first port)"
+    )
+    return parser.parse_args()
+
+
+def measure_simulator_latency(host: str, port: int) -> float:
+    """Median STEP round trip of a live simulator, in seconds."""
+    from .services.connection_probe_service import ConnectionProbeService
+
+    statistics: dict = ConnectionProbeService(host=host, port=port).run_load(command_count=200)
+    if "STEP" not in statistics or statistics["ALL"]["timeouts"] + statistics["ALL"]["errors"] > 0:
+        raise ConnectionError(f"Could not measure the simulator latency at {host}:{port}")
+
+    return statistics["STEP"]["p50_milliseconds"] / 1000.0
+
+
+def auto_tune_run_configuration(args) -> RunConfigurationModel:
+    """Calibrate a run configuration for the available simulators and save it."""
+    from .controllers.auto_tune_controller import AutoTuneController
+
+    if args.simulator_latency_ms is not None:
+        response_latency_seconds: float = args.simulator_latency_ms / 1000.0
+    else:
+        response_latency_seconds = measure_simulator_latency(args.host, args.ports[0])
+    print(f"\nSimulator STEP latency: {response_latency_seconds * 1000.0:.2f} ms")
+
+    # Every environment needs its own simulator
+    environment_counts = sorted({
+        environment_count for environment_count in AutoTuneController.DEFAULT_ENVIRONMENT_COUNTS
+        if environment_count <= len(args.ports)} | {len(args.ports)})
+    auto_tune_controller: AutoTuneController = AutoTuneController(
+        environment_counts=environment_counts,
+        response_latency_seconds=response_latency_seconds,
+        memory_budget_bytes=int(
+            args.memory_budget_mb * 1024 ** 2 if args.memory_budget_mb is not None
+            else AutoTuneController.DEFAULT_MEMORY_BUDGET_BYTES)
+    )
+
+    run_configuration, predictions = auto_tune_controller.run(progress_callback=lambda result: print(
+        f"Calibrated {result['environment_count']} x {result['vectorized_environment_type']}, "
+        f"batch {result['batch_size']}: {result['collection_steps_per_second']:.0f} steps/s collecting, "
+        f"{result['update_time_fraction']:.0%} updating"))
+
+    configuration_path: str = args.config or DEFAULT_RUN_CONFIGURATION_PATH
+    auto_tune_controller.save_run_configuration(run_configuration, predictions, configuration_path)
+    print(f"\nTuned {run_configuration.environment_count} x {run_configuration.vectorized_environment_type.value} "
+          f"environment(s), {run_configuration.training_configuration.steps_per_update} steps per update, "
+          f"batch size {run_configuration.training_configuration.batch_size}; saved to {configuration_path}")
+
+    return run_configuration
+
+
+def load_run_configuration(configuration_path: str) -> RunConfigurationModel:
+    """Run configuration from a JSON file written by --auto-tune or by hand."""
+    with open(configuration_path, "r", encoding="utf-8") as configuration_file:
+        return RunConfigurationModel.from_dictionary(json.load(configuration_file))
+
+
+def main() -> None:
+    """Main entry point for training."""
+    args = parse_arguments()
+    
+    print("=" * 60)
+    print("6-DOF Robot Arm RL Training")
+    print("=" * 60)
+
+    if args.resume:
+        if args.model_path is None:
+            print("Error: --model-path is required when using --resume")
+            sys.exit(1)
+        print(f"\nResuming training from: {args.model_path}")
+
+    if args.auto_tune and args.algorithm != TrainingAlgorithm.PPO.value:
+        print("Error: --auto-tune tunes PPO rollouts and requires --algorithm PPO")
+        sys.exit(1)
+
+    if args.auto_tune:
+        run_configuration: RunConfigurationModel = auto_tune_run_configuration(args)
+    elif args.config is not None:
+        run_configuration = load_run_configuration(args.config)
+        print(f"\nLoaded run configuration from: {args.config}")
+    else:
+        run_configuration = RunConfigurationModel()
+
+    if run_configuration.environment_count > len(args.ports):
+        print(f"Error: the run configuration needs {run_configuration.environment_count} simulator ports, "
+              f"got {len(args.ports)}")
+        sys.exit(1)
+
+    training_controller: TrainingController = TrainingController(
+        server_addresses=[
+            f"tcp://{args.host}:{port}" for port in args.ports[:run_configuration.environment_count]],
+        vectorized_environment_type=run_configuration.vectorized_environment_type,
+        training_configuration=run_configuration.training_configuration,
+        resume_from_model=args.model_path if args.resume else None,
+        use_action_safety_filter=args.safety_filter,
+        use_asynchronous_training=args.asynchronous,
+        rollout_server_port=args.rollout_port,
+        training_algorithm=TrainingAlgorithm(args.algorithm),
+        use_goal_relabeling=args.hindsight_relabeling,
+        use_continuing_targets=args.continuing_targets,
+        use_target_scheduler=args.target_scheduler,
+        use_model_based_rollouts=args.model_based_rollouts,
+        observation_history_length=args.history_length,
+        include_observation_deltas=args.history_deltas
+    )
+
+    try:
+        print("\nInitializing training...")
+        training_controller.initialize_training()
+
+        if args.pretrain_trajectories > 0:
+            print(f"\nBehavior cloning on {args.pretrain_trajectories} demonstrations...")
+            training_controller.execute_behavior_cloning_pretraining(args.pretrain_trajectories)
+
+        print("\nStarting curriculum training...")
+        training_controller.execute_curriculum_training()
+
+    except KeyboardInterrupt:
+        print("\n\nTraining interrupted by user.")
+    except Exception as error:
+        print(f"\nTraining error: {error}")
+        raise
+    finally:
+        training_controller.shutdown()
+        print("\nTraining session ended.")
+
+
+if __name__ == "__main__":
+    main()
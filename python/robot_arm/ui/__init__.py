@@ -0,0 +1,4 @@
+from .control_panel import RobotControlPanel
+from .telemetry_plot_panel import TelemetryPlotPanel
+
+__all__ = ["RobotControlPanel", "TelemetryPlotPanel"]
@@ -0,0 +1,682 @@
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+import numpy as np
+import os
+
+from ..services.control_loop_scheduler_service import ControlLoopSchedulerService
+from ..services.policy_cache_service import PolicyCacheService
+from ..services.target_queue_service import TargetQueueService
+from ..services.target_scheduler_service import TargetSchedulerService
+from ..services.telemetry_buffer_service import TelemetryBufferService
+
+
+class RobotControlPanel:
+    """Control panel for robot simulation and inference.
+
+    Inference runs on a worker thread at a fixed control frequency. The
+    worker never touches Tk widgets: it posts UI updates to a queue that the
+    Tk thread drains in bounded batches with after(), and records telemetry
+    into a ring buffer that the plots read at their own frame rate. Models
+    are loaded on a background thread into a memory-bounded cache, so
+    switching back to a recently used policy is instant. A target queue
+    loaded from CSV or generated as a grid runs back to back on the worker
+    thread and fills the results table once it finishes. The frames sit in
+    a scrollable body, so the panel stays usable on short displays.
+    """
+
+    WINDOW_TITLE: str = "Robot Control Panel"
+    WINDOW_GEOMETRY: str = "620x860"
+    BUTTON_PADDING: int = 5
+    FRAME_PADDING: int = 10
+    UI_QUEUE_DRAIN_INTERVAL_MILLISECONDS: int = 50
+    UI_QUEUE_DRAIN_LIMIT: int = 20
+    STATUS_REPORT_INTERVAL_SECONDS: float = 1.0
+    PHASE_MODEL_DIRECTORY: str = "./models"
+    CHECKPOINT_DIRECTORY: str = "./checkpoints"
+    PREFERRED_MODEL_PATHS: List[str] = [
+        "./models/robot_policy_pick_and_place_student.npz",
+        "./models/robot_policy_pick_and_place.npz",
+        "./models/robot_policy_pick_and_place.zip"
+    ]
+    NO_MODELS_TEXT: str = "(no models found)"
+    RESULTS_DIRECTORY: str = "./results"
+    RESULTS_TABLE_HEIGHT: int = 140
+    JOINT_CHANNEL_NAMES: List[str] = [f"joint_{joint_number}" for joint_number in range(1, 7)]
+    TELEMETRY_CHANNEL_NAMES: List[str] = JOINT_CHANNEL_NAMES + [
+        "distance_to_target", "gripper_state", "step_latency_milliseconds"]
+
+    def __init__(self) -> None:
+        # Import here to make CustomTkinter optional
+        import customtkinter as ctk
+
+        self._ctk = ctk
+        self._root: ctk.CTk = ctk.CTk()
+        self._environment = None
+        self._trained_model = None
+        self._inference_thread: Optional[threading.Thread] = None
+        self._is_inference_running: bool = False
+        self._ui_update_queue: queue.Queue = queue.Queue()
+        self._telemetry_buffer: TelemetryBufferService = TelemetryBufferService(self.TELEMETRY_CHANNEL_NAMES)
+        self._policy_cache: PolicyCacheService = PolicyCacheService()
+        self._target_queue_service: TargetQueueService = TargetQueueService()
+        self._queued_target_positions: np.ndarray = np.zeros((0, 3))
+        self._target_results: list = []
+
+        self._configure_window()
+        self._create_mode_selection_frame()
+        self._create_target_position_frame()
+        self._create_target_queue_frame()
+        self._create_model_browser_frame()
+        self._create_control_buttons_frame()
+        self._create_status_display()
+        self._create_telemetry_frame()
+        self._handle_refresh_models()
+
+        self._root.after(self.UI_QUEUE_DRAIN_INTERVAL_MILLISECONDS, self._drain_ui_updates)
+
+    def run(self) -> None:
+        """Start the control panel main loop."""
+        self._root.mainloop()
+
+    def _configure_window(self) -> None:
+        """Configure main window properties and the scrollable body holding every frame."""
+        ctk = self._ctk
+        self._root.title(self.WINDOW_TITLE)
+        self._root.geometry(self.WINDOW_GEOMETRY)
+
+        self._body: ctk.CTkScrollableFrame = ctk.CTkScrollableFrame(self._root)
+        self._body.pack(fill="both", expand=True)
+
+    def _create_mode_selection_frame(self) -> None:
+        """Create mode selection UI."""
+        ctk = self._ctk
+        mode_frame: ctk.CTkFrame = ctk.CTkFrame(self._body)
+        mode_frame.pack(pady=self.FRAME_PADDING, padx=self.FRAME_PADDING, fill="x")
+
+        self._simulation_mode_variable = ctk.BooleanVar(value=False)
+
+        simulation_mode_checkbox: ctk.CTkCheckBox = ctk.CTkCheckBox(
+            mode_frame,
+            text="Simulation Mode (Smooth Movement)",
+            variable=self._simulation_mode_variable,
+            command=self._handle_mode_change
+        )
+        simulation_mode_checkbox.pack(pady=self.BUTTON_PADDING)
+
+        frequency_frame: ctk.CTkFrame = ctk.CTkFrame(mode_frame)
+        frequency_frame.pack(pady=self.BUTTON_PADDING)
+
+        frequency_label: ctk.CTkLabel = ctk.CTkLabel(frequency_frame, text="Control Frequency (Hz):")
+        frequency_label.pack(side="left")
+
+        self._control_frequency_entry: ctk.CTkEntry = ctk.CTkEntry(frequency_frame, width=80)
+        self._control_frequency_entry.insert(0, f"{ControlLoopSchedulerService.DEFAULT_CONTROL_FREQUENCY_HERTZ:g}")
+        self._control_frequency_entry.pack(side="left", padx=self.BUTTON_PADDING)
+
+    def _create_target_position_frame(self) -> None:
+        """Create target position input UI."""
+        ctk = self._ctk
+        target_frame: ctk.CTkFrame = ctk.CTkFrame(self._body)
+        target_frame.pack(pady=self.FRAME_PADDING, padx=self.FRAME_PADDING, fill="x")
+
+        title_label: ctk.CTkLabel = ctk.CTkLabel(target_frame, text="Target Position:")
+        title_label.pack()
+
+        self._target_position_entries: dict = {}
+        axis_labels: list = ["X", "Y", "Z"]
+
+        for axis_label in axis_labels:
+            entry_frame: ctk.CTkFrame = ctk.CTkFrame(target_frame)
+            entry_frame.pack(fill="x", pady=2)
+
+            axis_name_label: ctk.CTkLabel = ctk.CTkLabel(entry_frame, text=f"{axis_label}:")
+            axis_name_label.pack(side="left")
+
+            # Left empty, Unity keeps its random target
+            position_entry: ctk.CTkEntry = ctk.CTkEntry(entry_frame, width=100, placeholder_text="random")
+            position_entry.pack(side="left", padx=self.BUTTON_PADDING)
+
+            self._target_position_entries[axis_label] = position_entry
+
+    def _create_target_queue_frame(self) -> None:
+        """Create target queue UI with CSV and grid sources and a results table."""
+        ctk = self._ctk
+        queue_frame: ctk.CTkFrame = ctk.CTkFrame(self._body)
+        queue_frame.pack(pady=self.FRAME_PADDING, padx=self.FRAME_PADDING, fill="x")
+
+        self._target_queue_label: ctk.CTkLabel = ctk.CTkLabel(queue_frame, text="Target Queue: empty")
+        self._target_queue_label.pack()
+
+        source_frame: ctk.CTkFrame = ctk.CTkFrame(queue_frame)
+        source_frame.pack(fill="x", pady=2)
+
+        load_targets_button: ctk.CTkButton = ctk.CTkButton(
+            source_frame,
+            text="Load Targets CSV...",
+            command=self._handle_load_targets
+        )
+        load_targets_button.pack(side="left", padx=self.BUTTON_PADDING)
+
+        grid_label: ctk.CTkLabel = ctk.CTkLabel(source_frame, text="Grid X,Y,Z points:")
+        grid_label.pack(side="left")
+
+        self._grid_points_entry: ctk.CTkEntry = ctk.CTkEntry(source_frame, width=80)
+        self._grid_points_entry.insert(0, ",".join(map(str, TargetQueueService.DEFAULT_POINTS_PER_AXIS)))
+        self._grid_points_entry.pack(side="left", padx=self.BUTTON_PADDING)
+
+        generate_grid_button: ctk.CTkButton = ctk.CTkButton(
+            source_frame,
+            text="Generate Grid",
+            command=self._handle_generate_grid
+        )
+        generate_grid_button.pack(side="left", padx=self.BUTTON_PADDING)
+
+        run_frame: ctk.CTkFrame = ctk.CTkFrame(queue_frame)
+        run_frame.pack(fill="x", pady=2)
+
+        run_queue_button: ctk.CTkButton = ctk.CTkButton(
+            run_frame,
+            text="Run Target Queue",
+            command=self._handle_run_target_queue
+        )
+        run_queue_button.pack(side="left", expand=True, padx=self.BUTTON_PADDING)
+
+        export_results_button: ctk.CTkButton = ctk.CTkButton(
+            run_frame,
+            text="Export Results...",
+            command=self._handle_export_results
+        )
+        export_results_button.pack(side="left", expand=True, padx=self.BUTTON_PADDING)
+
+        self._results_table: ctk.CTkTextbox = ctk.CTkTextbox(
+            queue_frame, height=self.RESULTS_TABLE_HEIGHT, font=("Courier", 12))
+        self._results_table.pack(fill="x", pady=self.BUTTON_PADDING)
+        self._results_table.configure(state="disabled")
+
+    def _create_model_browser_frame(self) -> None:
+        """Create model selection UI over the model and checkpoint directories."""
+        ctk = self._ctk
+        browser_frame: ctk.CTkFrame = ctk.CTkFrame(self._body)
+        browser_frame.pack(pady=self.FRAME_PADDING, padx=self.FRAME_PADDING, fill="x")
+
+        title_label: ctk.CTkLabel = ctk.CTkLabel(browser_frame, text="Model:")
+        title_label.pack()
+
+        self._model_selection_menu: ctk.CTkOptionMenu = ctk.CTkOptionMenu(
+            browser_frame,
+            values=[self.NO_MODELS_TEXT],
+            width=520,
+            dynamic_resizing=False
+        )
+        self._model_selection_menu.pack(pady=self.BUTTON_PADDING)
+
+        refresh_button: ctk.CTkButton = ctk.CTkButton(
+            browser_frame,
+            text="Refresh Model List",
+            command=self._handle_refresh_models
+        )
+        refresh_button.pack(side="left", expand=True, pady=self.BUTTON_PADDING)
+
+        load_model_button: ctk.CTkButton = ctk.CTkButton(
+            browser_frame,
+            text="Load Selected Model",
+            command=self._handle_load_model
+        )
+        load_model_button.pack(side="left", expand=True, pady=self.BUTTON_PADDING)
+
+    def _create_control_buttons_frame(self) -> None:
+        """Create control buttons UI."""
+        ctk = self._ctk
+        buttons_frame: ctk.CTkFrame = ctk.CTkFrame(self._body)
+        buttons_frame.pack(pady=self.FRAME_PADDING, padx=self.FRAME_PADDING, fill="x")
+
+        connect_button: ctk.CTkButton = ctk.CTkButton(
+            buttons_frame,
+            text="Connect to Unity",
+            command=self._handle_connect
+        )
+        connect_button.pack(pady=self.BUTTON_PADDING)
+
+        execute_button: ctk.CTkButton = ctk.CTkButton(
+            buttons_frame,
+            text="Execute Trajectory",
+            command=self._handle_execute_trajectory
+        )
+        execute_button.pack(pady=self.BUTTON_PADDING)
+
+        stop_button: ctk.CTkButton = ctk.CTkButton(
+            buttons_frame,
+            text="Stop Execution",
+            command=self._handle_stop_execution
+        )
+        stop_button.pack(pady=self.BUTTON_PADDING)
+
+    def _create_status_display(self) -> None:
+        """Create status display label."""
+        ctk = self._ctk
+        self._status_label: ctk.CTkLabel = ctk.CTkLabel(
+            self._body,
+            text="Status: Disconnected"
+        )
+        self._status_label.pack(pady=self.FRAME_PADDING)
+
+    def _create_telemetry_frame(self) -> None:
+        """Create live plots of the inference telemetry."""
+        from .telemetry_plot_panel import TelemetryPlotPanel
+
+        ctk = self._ctk
+        telemetry_frame: ctk.CTkFrame = ctk.CTkFrame(self._body)
+        telemetry_frame.pack(pady=self.FRAME_PADDING, padx=self.FRAME_PADDING, fill="x")
+
+        self._telemetry_plot_panel: TelemetryPlotPanel = TelemetryPlotPanel(
+            telemetry_frame,
+            ctk,
+            self._telemetry_buffer,
+            [
+                ("Joint Angles (deg)", self.JOINT_CHANNEL_NAMES),
+                ("TCP Distance to Target (m)", ["distance_to_target"]),
+                ("Gripper State", ["gripper_state"]),
+                ("Step Latency (ms)", ["step_latency_milliseconds"])
+            ]
+        )
+        self._telemetry_plot_panel.start()
+
+    def _handle_connect(self) -> None:
+        """Handle connect button click."""
+        try:
+            from ..environments.unity_robot_environment import UnityRobotEnvironment
+            self._environment = UnityRobotEnvironment()
+            self._update_status("Status: Connected to Unity")
+        except Exception as connection_error:
+            self._update_status(f"Connection Error: {connection_error}")
+
+    def _handle_mode_change(self) -> None:
+        """Handle simulation mode toggle."""
+        if self._environment is None:
+            return
+
+        enable_simulation_mode: bool = self._simulation_mode_variable.get()
+        self._environment.set_simulation_mode(enable_simulation_mode)
+
+        mode_name: str = "Simulation" if enable_simulation_mode else "Training"
+        self._update_status(f"Status: Mode changed to {mode_name}")
+
+    def _handle_refresh_models(self) -> None:
+        """List exported and SB3 models, preferring exports, and warm the cache with phase models."""
+        from ..controllers.evaluation_controller import EvaluationController
+
+        def list_models(directory: str) -> List[str]:
+            return EvaluationController.find_checkpoint_files([directory]) if os.path.isdir(directory) else []
+
+        # Phase models and students first, newest checkpoints next
+        phase_model_files: List[str] = list_models(self.PHASE_MODEL_DIRECTORY)
+        checkpoint_files: List[str] = sorted(
+            list_models(self.CHECKPOINT_DIRECTORY), key=os.path.getmtime, reverse=True)
+        listed_files: List[str] = phase_model_files + checkpoint_files
+        preferred_files: List[str] = [
+            model_path for model_path in self.PREFERRED_MODEL_PATHS
+            if os.path.normpath(model_path) in map(os.path.normpath, listed_files)]
+
+        self._model_selection_menu.configure(values=listed_files or [self.NO_MODELS_TEXT])
+        self._model_selection_menu.set(
+            (preferred_files + listed_files)[0] if listed_files else self.NO_MODELS_TEXT)
+        self._policy_cache.prefetch(phase_model_files)
+
+        self._update_status(f"Status: {len(listed_files)} model(s) found")
+
+    def _handle_load_model(self) -> None:
+        """Switch to the selected model, instantly if cached, otherwise after a background load."""
+        model_path: str = self._model_selection_menu.get()
+
+        if model_path == self.NO_MODELS_TEXT:
+            self._update_status("Error: No model selected")
+            return
+
+        cached_policy = self._policy_cache.get(model_path)
+        if cached_policy is not None:
+            self._trained_model = cached_policy
+            self._update_status(f"Status: Switched to {os.path.basename(model_path)}")
+            return
+
+        self._update_status(f"Status: Loading {os.path.basename(model_path)}...")
+        load_future = self._policy_cache.load_async(model_path)
+        load_future.add_done_callback(
+            lambda completed_future: self._post_ui_update(
+                lambda: self._complete_model_load(model_path, completed_future)))
+
+    def _complete_model_load(self, model_path: str, load_future) -> None:
+        """Apply a finished background load on the Tk thread."""
+        load_error = load_future.exception()
+
+        if load_error is not None:
+            self._update_status(f"Model Load Error: {load_error}")
+            return
+
+        # Only switch if the operator has not picked another model meanwhile
+        if self._model_selection_menu.get() == model_path:
+            self._trained_model = load_future.result()
+            self._update_status(f"Status: Loaded {os.path.basename(model_path)} "
+                                f"({self._policy_cache.cached_bytes / 1024:.0f} KiB cached)")
+
+    def _handle_load_targets(self) -> None:
+        """Replace the target queue with positions read from a CSV file."""
+        from tkinter import filedialog
+
+        csv_path: str = filedialog.askopenfilename(
+            title="Load Targets", filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not csv_path:
+            return
+
+        try:
+            self._set_target_queue(TargetQueueService.load_targets(csv_path), os.path.basename(csv_path))
+        except (OSError, ValueError) as load_error:
+            self._update_status(f"Target Load Error: {load_error}")
+
+    def _handle_generate_grid(self) -> None:
+        """Replace the target queue with a grid over the spawn volume."""
+        try:
+            points_per_axis: List[int] = [
+                int(point_text) for point_text in self._grid_points_entry.get().split(",")]
+        except ValueError:
+            points_per_axis = []
+
+        if len(points_per_axis) != 3 or min(points_per_axis) < 1:
+            self._update_status("Error: Grid points must be three positive integers, e.g. 5,3,5")
+            return
+
+        self._set_target_queue(
+            TargetQueueService.generate_grid(points_per_axis), "grid " + "x".join(map(str, points_per_axis)))
+
+    def _set_target_queue(self, target_positions: np.ndarray, source_name: str) -> None:
+        """Store queued targets and show their count."""
+        self._queued_target_positions = target_positions
+        self._target_queue_label.configure(text=f"Target Queue: {len(target_positions)} targets from {source_name}")
+        self._update_status(f"Status: {len(target_positions)} targets queued")
+
+    def _handle_run_target_queue(self) -> None:
+        """Execute every queued target back to back on the inference thread."""
+        if len(self._queued_target_positions) == 0:
+            self._update_status("Error: Target queue is empty")
+            return
+
+        control_frequency_hertz: Optional[float] = self._validate_execution_start()
+        if control_frequency_hertz is None:
+            return
+
+        self._is_inference_running = True
+        self._update_status(f"Status: Running {len(self._queued_target_positions)} targets...")
+
+        self._inference_thread = threading.Thread(
+            target=self._execute_target_queue,
+            args=(self._queued_target_positions.copy(), control_frequency_hertz),
+            daemon=True
+        )
+        self._inference_thread.start()
+
+    def _handle_export_results(self) -> None:
+        """Save the results table as CSV."""
+        from tkinter import filedialog
+
+        if not self._target_results:
+            self._update_status("Error: No target results to export")
+            return
+
+        csv_path: str = filedialog.asksaveasfilename(
+            title="Export Results",
+            initialdir=self.RESULTS_DIRECTORY,
+            initialfile=f"target_results_{time.strftime('%Y%m%d_%H%M%S')}.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")]
+        )
+        if not csv_path:
+            return
+
+        try:
+            TargetQueueService.save_results(self._target_results, csv_path)
+            self._update_status(f"Status: Results exported to {os.path.basename(csv_path)}")
+        except OSError as export_error:
+            self._update_status(f"Export Error: {export_error}")
+
+    def _handle_execute_trajectory(self) -> None:
+        """Handle execute trajectory button click."""
+        # Read the entries on the UI thread; the inference thread only gets the values
+        try:
+            target_position: Optional[List[float]] = self._read_target_position()
+        except ValueError as target_error:
+            self._update_status(f"Error: {target_error}")
+            return
+
+        control_frequency_hertz: Optional[float] = self._validate_execution_start()
+        if control_frequency_hertz is None:
+            return
+
+        self._is_inference_running = True
+        self._update_status("Status: Executing trajectory...")
+
+        self._inference_thread = threading.Thread(
+            target=self._execute_inference_loop,
+            args=(target_position, control_frequency_hertz),
+            daemon=True
+        )
+        self._inference_thread.start()
+
+    def _handle_stop_execution(self) -> None:
+        """Handle stop execution button click."""
+        self._is_inference_running = False
+        self._update_status("Status: Execution stopped")
+
+    def _validate_execution_start(self) -> Optional[float]:
+        """Control frequency if connected, a model is loaded and nothing is running; otherwise report and return None."""
+        if self._environment is None:
+            self._update_status("Error: Not connected to Unity")
+            return None
+
+        if self._trained_model is None:
+            self._update_status("Error: No trained model loaded")
+            return None
+
+        if self._inference_thread is not None and self._inference_thread.is_alive():
+            self._update_status("Error: Execution already running")
+            return None
+
+        try:
+            control_frequency_hertz: float = float(self._control_frequency_entry.get())
+        except ValueError:
+            control_frequency_hertz = 0.0
+
+        if control_frequency_hertz <= 0.0:
+            self._update_status("Error: Control frequency must be a positive number")
+            return None
+
+        return control_frequency_hertz
+
+    def _read_target_position(self) -> Optional[List[float]]:
+        """Target X/Y/Z from the entries, or None to keep Unity's random target when all are empty.
+
+        Raises:
+            ValueError: If an entry is not numeric or the point lies outside the spawn volume.
+        """
+        entry_texts: List[str] = [
+            self._target_position_entries[axis_label].get().strip() for axis_label in ["X", "Y", "Z"]
+        ]
+
+        if not any(entry_texts):
+            return None
+
+        try:
+            target_position: List[float] = [float(entry_text) for entry_text in entry_texts]
+        except ValueError:
+            raise ValueError("Target position must be numeric") from None
+
+        # Policies were only trained on targets in Unity's spawn annulus
+        horizontal_radius: float = float(np.hypot(target_position[0], target_position[2]))
+        if not (TargetSchedulerService.MINIMUM_HORIZONTAL_RADIUS <= horizontal_radius
+                <= TargetSchedulerService.MAXIMUM_HORIZONTAL_RADIUS):
+            raise ValueError(
+                f"Target must lie {TargetSchedulerService.MINIMUM_HORIZONTAL_RADIUS:g} to "
+                f"{TargetSchedulerService.MAXIMUM_HORIZONTAL_RADIUS:g} m from the base horizontally "
+                f"(X/Z radius is {horizontal_radius:.2f} m)")
+
+        minimum_height: float = TargetSchedulerService.DEFAULT_LOWER_BOUNDS[1]
+        maximum_height: float = TargetSchedulerService.DEFAULT_UPPER_BOUNDS[1]
+        if not minimum_height <= target_position[1] <= maximum_height:
+            raise ValueError(f"Target height Y must be between {minimum_height:g} and {maximum_height:g} m")
+
+        return target_position
+
+    def _execute_inference_loop(
+        self,
+        target_position: Optional[List[float]] = None,
+        control_frequency_hertz: float = ControlLoopSchedulerService.DEFAULT_CONTROL_FREQUENCY_HERTZ
+    ) -> None:
+        """Run predict and step once per control period until the episode ends or is stopped."""
+        scheduler: ControlLoopSchedulerService = ControlLoopSchedulerService(control_frequency_hertz)
+        control_state: dict = {"final_status": "Status: Execution stopped"}
+
+        try:
+            observation, _ = self._environment.reset()
+
+            if target_position is not None:
+                observation = self._environment.set_target_position(target_position)
+
+            control_state["observation"] = observation
+            control_state["last_report_time"] = time.perf_counter()
+            self._telemetry_buffer.clear()
+
+            def run_control_cycle() -> bool:
+                step_start_time: float = time.perf_counter()
+                action, _ = self._trained_model.predict(control_state["observation"], deterministic=True)
+                control_state["observation"], _, terminated, truncated, info = self._environment.step(action)
+                self._record_telemetry((time.perf_counter() - step_start_time) * 1000.0)
+
+                if terminated or truncated:
+                    control_state["final_status"] = (
+                        "Status: Task completed successfully!" if info.get("success", False)
+                        else "Status: Episode ended")
+                    return False
+
+                current_time: float = time.perf_counter()
+                if current_time - control_state["last_report_time"] >= self.STATUS_REPORT_INTERVAL_SECONDS:
+                    control_state["last_report_time"] = current_time
+                    self._post_status(self._format_timing_status("Status: Executing", scheduler))
+
+                return True
+
+            scheduler.run(run_control_cycle, lambda: self._is_inference_running)
+        except Exception as inference_error:
+            control_state["final_status"] = f"Inference Error: {inference_error}"
+
+        self._is_inference_running = False
+        self._post_status(self._format_timing_status(control_state["final_status"], scheduler))
+
+    def _execute_target_queue(self, target_positions: np.ndarray, control_frequency_hertz: float) -> None:
+        """Run every queued target and hand the results to the Tk thread once at the end."""
+        progress_state: dict = {"last_report_time": time.perf_counter()}
+        results: list = []
+        final_status: str = "Status: Target queue stopped"
+
+        def report_progress(target_index: int, _) -> None:
+            current_time: float = time.perf_counter()
+            if current_time - progress_state["last_report_time"] >= self.STATUS_REPORT_INTERVAL_SECONDS:
+                progress_state["last_report_time"] = current_time
+                self._post_status(f"Status: Target {target_index + 1}/{len(target_positions)} done")
+
+        try:
+            self._telemetry_buffer.clear()
+            results = self._target_queue_service.execute(
+                self._environment,
+                self._trained_model,
+                target_positions,
+                lambda: self._is_inference_running,
+                control_frequency_hertz=control_frequency_hertz,
+                step_callback=self._record_telemetry,
+                target_callback=report_progress
+            )
+            if len(results) == len(target_positions):
+                final_status = "Status: Target queue finished"
+        except Exception as inference_error:
+            final_status = f"Inference Error: {inference_error}"
+
+        self._is_inference_running = False
+        self._post_ui_update(lambda: self._show_target_results(results))
+        self._post_status(f"{final_status} | {TargetQueueService.summarize(results)}")
+
+    def _show_target_results(self, results: list) -> None:
+        """Fill the results table; call only from the Tk thread."""
+        self._target_results = results
+        table_lines: List[str] = [f"{'#':>3} {'X':>6} {'Y':>6} {'Z':>6}  {'Outcome':<11} {'Steps':>5} {'Time s':>7}"]
+        table_lines += [
+            f"{result_index + 1:>3} {result.target_position[0]:>6.2f} {result.target_position[1]:>6.2f} "
+            f"{result.target_position[2]:>6.2f}  {result.outcome:<11} {result.step_count:>5} "
+            f"{result.elapsed_seconds:>7.2f}"
+            for result_index, result in enumerate(results)
+        ]
+
+        self._results_table.configure(state="normal")
+        self._results_table.delete("1.0", "end")
+        self._results_table.insert("1.0", "\n".join(table_lines))
+        self._results_table.configure(state="disabled")
+
+    def _record_telemetry(self, step_latency_milliseconds: float) -> None:
+        """Append the latest simulator state and step latency to the telemetry buffer."""
+        observation_model = self._environment.last_observation
+
+        if observation_model is None:
+            return
+
+        self._telemetry_buffer.append(
+            list(observation_model.joint_angles[:len(self.JOINT_CHANNEL_NAMES)])
+            + [observation_model.distance_to_target, observation_model.gripper_state, step_latency_milliseconds])
+
+    @staticmethod
+    def _format_timing_status(prefix: str, scheduler: ControlLoopSchedulerService) -> str:
+        """Status text with cycle count, missed deadlines and jitter percentiles."""
+        jitter_percentiles = scheduler.compute_jitter_percentiles()
+
+        return (f"{prefix} | {scheduler.cycle_count} cycles, {scheduler.missed_deadline_count} missed | "
+                f"jitter p50 {jitter_percentiles[50.0]:.2f} ms, p95 {jitter_percentiles[95.0]:.2f} ms, "
+                f"p99 {jitter_percentiles[99.0]:.2f} ms")
+
+    def _post_ui_update(self, update_function: Callable[[], None]) -> None:
+        """Queue a widget update from any thread; it runs on the Tk thread."""
+        self._ui_update_queue.put(update_function)
+
+    def _post_status(self, status_message: str) -> None:
+        """Queue a status label update from any thread."""
+        self._post_ui_update(lambda: self._update_status(status_message))
+
+    def _drain_ui_updates(self) -> None:
+        """Apply a bounded batch of queued updates, then reschedule on the Tk thread.
+
+        A failing update is reported and skipped, and the loop is always
+        rescheduled, so one bad update cannot freeze the panel.
+        """
+        try:
+            for _ in range(self.UI_QUEUE_DRAIN_LIMIT):
+                try:
+                    update_function: Callable[[], None] = self._ui_update_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    update_function()
+                except Exception as update_error:
+                    print(f"UI update failed: {update_error!r}")
+        finally:
+            self._root.after(self.UI_QUEUE_DRAIN_INTERVAL_MILLISECONDS, self._drain_ui_updates)
+
+    def _update_status(self, status_message: str) -> None:
+        """Update status label text; call only from the Tk thread."""
+        self._status_label.configure(text=status_message)
+
+
+def main() -> None:
+    """Main entry point for control panel."""
+    control_panel: RobotControlPanel = RobotControlPanel()
+    control_panel.run()
+
+
+if __name__ == "__main__":
+    main()
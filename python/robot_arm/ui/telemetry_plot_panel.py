@@ -0,0 +1,109 @@
+from typing import Any, Dict, List, Sequence, Tuple
+import numpy as np
+
+from ..services.telemetry_buffer_service import TelemetryBufferService
+
+
+class TelemetryPlotPanel:
+    """Strip charts of telemetry channels, redrawn on the Tk thread at a capped frame rate.
+
+    Each plot keeps its canvas line items and only moves their coordinates,
+    drawing min/max decimated series with one bucket per two horizontal
+    pixels. Frames are skipped when no new samples arrived.
+    """
+
+    MAXIMUM_FRAMES_PER_SECOND: float = 10.0
+    PLOT_WIDTH: int = 560
+    PLOT_HEIGHT: int = 80
+    PLOT_MARGIN: int = 4
+    LINE_COLORS: Tuple[str, ...] = ("#e6194b", "#3cb44b", "#4363d8", "#f58231", "#911eb4", "#42d4f4")
+    BACKGROUND_COLOR: str = "#1e1e1e"
+    TEXT_COLOR: str = "#cccccc"
+
+    def __init__(
+        self,
+        parent: Any,
+        ctk: Any,
+        telemetry_buffer: TelemetryBufferService,
+        plot_definitions: Sequence[Tuple[str, Sequence[str]]]
+    ) -> None:
+        self._parent: Any = parent
+        self._telemetry_buffer: TelemetryBufferService = telemetry_buffer
+        self._plots: List[Dict[str, Any]] = []
+        self._drawn_appended_count: int = -1
+
+        for plot_title, channel_names in plot_definitions:
+            title_label = ctk.CTkLabel(parent, text=plot_title)
+            title_label.pack(anchor="w")
+
+            canvas = ctk.CTkCanvas(
+                parent, width=self.PLOT_WIDTH, height=self.PLOT_HEIGHT,
+                background=self.BACKGROUND_COLOR, highlightthickness=0)
+            canvas.pack(pady=(0, self.PLOT_MARGIN))
+
+            line_identifiers: Dict[str, int] = {
+                channel_name: canvas.create_line(
+                    0, 0, 0, 0, fill=self.LINE_COLORS[line_index % len(self.LINE_COLORS)])
+                for line_index, channel_name in enumerate(channel_names)
+            }
+            range_text_identifier: int = canvas.create_text(
+                self.PLOT_MARGIN, self.PLOT_MARGIN, anchor="nw", fill=self.TEXT_COLOR, text="")
+
+            self._plots.append({
+                "canvas": canvas,
+                "channel_names": list(channel_names),
+                "line_identifiers": line_identifiers,
+                "range_text_identifier": range_text_identifier
+            })
+
+    def start(self) -> None:
+        """Begin periodic redraws; call from the Tk thread."""
+        self._parent.after(self._frame_interval_milliseconds(), self._redraw)
+
+    def _frame_interval_milliseconds(self) -> int:
+        """Delay between redraws for the frame rate cap."""
+        return max(1, int(1000.0 / self.MAXIMUM_FRAMES_PER_SECOND))
+
+    def _redraw(self) -> None:
+        """Draw the latest samples if any arrived, then schedule the next frame.
+
+        A failed frame is reported once and skipped; the next frame is always
+        scheduled, so one bad draw cannot stop the plots for good.
+        """
+        try:
+            appended_count: int = self._telemetry_buffer.appended_count
+
+            if appended_count != self._drawn_appended_count:
+                self._drawn_appended_count = appended_count
+                series_by_channel = self._telemetry_buffer.decimated_snapshot(self.PLOT_WIDTH // 2)
+                for plot in self._plots:
+                    self._draw_plot(plot, series_by_channel)
+        except Exception as draw_error:
+            print(f"Telemetry plot redraw failed: {draw_error!r}")
+        finally:
+            self._parent.after(self._frame_interval_milliseconds(), self._redraw)
+
+    def _draw_plot(self, plot: Dict[str, Any], series_by_channel: Dict[str, Any]) -> None:
+        """Scale a plot's channels to a shared vertical range and move its lines."""
+        channel_series = [series_by_channel[channel_name] for channel_name in plot["channel_names"]]
+        canvas = plot["canvas"]
+
+        if len(channel_series[0]) < 2:
+            for line_identifier in plot["line_identifiers"].values():
+                canvas.coords(line_identifier, 0, 0, 0, 0)
+            return
+
+        minimum_value: float = float(min(series.min() for series in channel_series))
+        maximum_value: float = float(max(series.max() for series in channel_series))
+        value_span: float = max(maximum_value - minimum_value, 1e-6)
+        drawable_height: int = self.PLOT_HEIGHT - 2 * self.PLOT_MARGIN
+
+        for channel_name, series in zip(plot["channel_names"], channel_series):
+            x_coordinates = np.linspace(0, self.PLOT_WIDTH, len(series))
+            y_coordinates = self.PLOT_MARGIN + drawable_height * (maximum_value - series) / value_span
+            canvas.coords(
+                plot["line_identifiers"][channel_name],
+                *np.stack([x_coordinates, y_coordinates], axis=1).reshape(-1).tolist())
+
+        canvas.itemconfigure(
+            plot["range_text_identifier"], text=f"{minimum_value:.3g} .. {maximum_value:.3g}")
@@ -1,2 +0,0 @@
-# Services package - lazy imports to avoid dependency issues during testing
-__all__ = ["NetworkService", "RewardCalculationService"]
@@ -42,10 +42,10 @@ def test_with_mock():
     print("=" * 60)
 
     # Test models
-    from models.observation_model import ObservationModel
-    from models.command_model import CommandModel
-    from models.reward_components import RewardComponents
-    from enums.command_type import CommandType
+    from robot_arm.models.observation_model import ObservationModel
+    from robot_arm.models.command_model import CommandModel
+    from robot_arm.models.reward_components import RewardComponents
+    from robot_arm.enums.command_type import CommandType
 
     print("\n[1] Testing ObservationModel...")
     obs_data = {
@@ -82,7 +82,7 @@ def test_with_mock():
     print("   OK")
 
     print("\n[3] Testing RewardComponents...")
-    from services.reward_calculation_service import RewardCalculationService
+    from robot_arm.services.reward_calculation_service import RewardCalculationService
     reward_service = RewardCalculationService()
     reward_service.reset_state(obs)
 
@@ -125,7 +125,7 @@ def test_with_mock():
     print("   OK")
 
     print("\n[5] Testing NetworkService (TCP socket)...")
-    from services.network_service import NetworkService
+    from robot_arm.services.network_service import NetworkService
     net_service = NetworkService()
     print(f"   Default host: {net_service._host}")
     print(f"   Default port: {net_service._port}")
@@ -0,0 +1,165 @@
+"""Tests for V-trace and the asynchronous actor/learner training path."""
+
+import queue
+import pytest
+import numpy as np
+
+from robot_arm.services.vtrace_service import VTraceService
+
+
+def compute_generalized_advantages(rewards, values, bootstrap_values, dones, discount_factor, trace_decay):
+    """Reference GAE(lambda) advantages for on-policy comparison."""
+    advantages = np.zeros_like(values)
+    next_advantage = np.zeros_like(bootstrap_values)
+    next_values = np.concatenate([values[1:], bootstrap_values[None]], axis=0)
+
+    for step_index in reversed(range(len(values))):
+        continuation = discount_factor * (1.0 - dones[step_index])
+        temporal_difference = rewards[step_index] + continuation * next_values[step_index] - values[step_index]
+        next_advantage = temporal_difference + continuation * trace_decay * next_advantage
+        advantages[step_index] = next_advantage
+
+    return advantages
+
+
+def create_trajectory(seed: int = 0, steps: int = 12, environments: int = 3):
+    """Random rewards, values and episode boundaries."""
+    random_generator = np.random.default_rng(seed)
+    return {
+        "rewards": random_generator.normal(size=(steps, environments)),
+        "values": random_generator.normal(size=(steps, environments)),
+        "bootstrap_values": random_generator.normal(size=environments),
+        "dones": (random_generator.random((steps, environments)) < 0.2).astype(np.float64)
+    }
+
+
+class TestVTraceService:
+    """Tests for VTraceService."""
+
+    def test_on_policy_matches_generalized_advantage_estimation(self) -> None:
+        """Test equal behavior and target policies reduce V-trace to TD(lambda) returns."""
+        trajectory = create_trajectory()
+        log_probabilities = np.random.default_rng(1).normal(size=trajectory["rewards"].shape)
+
+        value_targets, _ = VTraceService.compute_targets(
+            log_probabilities, log_probabilities, trajectory["rewards"], trajectory["values"],
+            trajectory["bootstrap_values"], trajectory["dones"], 0.99, trace_decay=0.95)
+
+        expected_advantages = compute_generalized_advantages(
+            trajectory["rewards"], trajectory["values"], trajectory["bootstrap_values"],
+            trajectory["dones"], 0.99, 0.95)
+        np.testing.assert_allclose(value_targets - trajectory["values"], expected_advantages, atol=1e-10)
+
+    def test_weights_above_clip_behave_on_policy(self) -> None:
+        """Test importance weights above the clip thresholds are truncated to one."""
+        trajectory = create_trajectory(seed=2)
+        behavior_log_probabilities = np.zeros(trajectory["rewards"].shape)
+        arguments = (trajectory["rewards"], trajectory["values"], trajectory["bootstrap_values"],
+                     trajectory["dones"], 0.9)
+
+        on_policy_targets, on_policy_advantages = VTraceService.compute_targets(
+            behavior_log_probabilities, behavior_log_probabilities, *arguments)
+        clipped_targets, clipped_advantages = VTraceService.compute_targets(
+            behavior_log_probabilities, behavior_log_probabilities + 2.0, *arguments)
+
+        np.testing.assert_allclose(clipped_targets, on_policy_targets)
+        np.testing.assert_allclose(clipped_advantages, on_policy_advantages)
+
+    def test_unlikely_actions_are_down_weighted(self) -> None:
+        """Test actions the target policy rarely takes contribute less correction."""
+        trajectory = create_trajectory(seed=3, steps=1, environments=1)
+        trajectory["dones"][:] = 1.0
+        arguments = (trajectory["rewards"], trajectory["values"], trajectory["bootstrap_values"],
+                     trajectory["dones"], 0.99)
+
+        _, on_policy_advantages = VTraceService.compute_targets(np.zeros((1, 1)), np.zeros((1, 1)), *arguments)
+        _, off_policy_advantages = VTraceService.compute_targets(
+            np.zeros((1, 1)), np.full((1, 1), np.log(0.25)), *arguments)
+
+        np.testing.assert_allclose(off_policy_advantages, 0.25 * on_policy_advantages)
+
+
+class TestAsynchronousTraining:
+    """Tests for RolloutActorService and AsynchronousLearnerService on a Gymnasium task."""
+
+    @pytest.fixture
+    def training_setup(self):
+        """Small PPO model on a normalized Pendulum environment."""
+        pytest.importorskip("stable_baselines3")
+        from stable_baselines3 import PPO
+        from stable_baselines3.common.env_util import make_vec_env
+        from stable_baselines3.common.vec_env import VecNormalize
+
+        environment = VecNormalize(make_vec_env("Pendulum-v1", n_envs=2, seed=0))
+        model = PPO("MlpPolicy", environment, n_steps=64, batch_size=32, n_epochs=2,
+                    policy_kwargs=dict(net_arch=[16]), seed=0, device="cpu")
+        yield environment, model
+        environment.close()
+
+    def test_fresh_snapshot_behavior_matches_learner(self, training_setup) -> None:
+        """Test actor log-probabilities match the learner, giving unit importance weights."""
+        from robot_arm.services.asynchronous_learner_service import AsynchronousLearnerService
+        from robot_arm.services.rollout_actor_service import RolloutActorService
+
+        environment, model = training_setup
+        learner = AsynchronousLearnerService(model)
+        actor = RolloutActorService(environment, segment_steps=16, seed=0)
+        actor.set_policy(learner.create_policy_snapshot(), learner.policy_version)
+
+        segment = actor.collect_segment()
+        statistics = learner.train_on_segment(segment)
+
+        assert segment.observations.shape == (16, 2, 3)
+        assert segment.actions.shape == (16, 2, 1)
+        assert segment.step_count == 32
+        assert statistics["mean_importance_weight"] == pytest.approx(1.0, abs=1e-4)
+        assert statistics["policy_lag"] == 0.0
+        assert learner.policy_version == 1
+        assert model.num_timesteps == 32
+
+    def test_stale_segments_report_policy_lag(self, training_setup) -> None:
+        """Test segments from an older snapshot still train and report their staleness."""
+        from robot_arm.services.asynchronous_learner_service import AsynchronousLearnerService
+        from robot_arm.services.rollout_actor_service import RolloutActorService
+
+        environment, model = training_setup
+        learner = AsynchronousLearnerService(model)
+        actor = RolloutActorService(environment, segment_steps=32, seed=0)
+        actor.set_policy(learner.create_policy_snapshot(), learner.policy_version)
+
+        first_segment = actor.collect_segment()
+        stale_segment = actor.collect_segment()
+        learner.train_on_segment(first_segment)
+        statistics = learner.train_on_segment(stale_segment)
+
+        assert statistics["policy_lag"] == 1.0
+        assert statistics["mean_importance_weight"] != pytest.approx(1.0, abs=1e-6)
+        assert np.isfinite(statistics["value_loss"])
+
+    def test_background_actor_keeps_collecting(self, training_setup) -> None:
+        """Test the actor thread fills the queue while the learner consumes it."""
+        from robot_arm.services.asynchronous_learner_service import AsynchronousLearnerService
+        from robot_arm.services.rollout_actor_service import RolloutActorService
+
+        environment, model = training_setup
+        learner = AsynchronousLearnerService(model)
+        segment_queue = queue.Queue(maxsize=2)
+        actor = RolloutActorService(environment, segment_steps=16, segment_queue=segment_queue, seed=0)
+        actor.set_policy(learner.create_policy_snapshot(), learner.policy_version)
+
+        actor.start()
+        try:
+            for _ in range(3):
+                learner.train_on_segment(segment_queue.get(timeout=10.0))
+                actor.set_policy(learner.create_policy_snapshot(), learner.policy_version)
+        finally:
+            actor.stop()
+
+        actor.raise_if_failed()
+        assert learner.policy_version == 3
+        assert actor.collected_step_count >= 3 * 32
+        assert 0.0 < actor.environment_busy_fraction <= 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
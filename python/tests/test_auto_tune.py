@@ -0,0 +1,113 @@
+"""Tests for the throughput-driven auto-tuner."""
+
+import json
+import pytest
+
+from robot_arm.controllers.auto_tune_controller import AutoTuneController
+from robot_arm.enums.vectorized_environment_type import VectorizedEnvironmentType
+from robot_arm.models.run_configuration_model import RunConfigurationModel
+
+
+def create_calibration_result(
+    environment_count: int,
+    vectorized_environment_type: VectorizedEnvironmentType,
+    batch_size: int,
+    collection_steps_per_second: float,
+    update_time_fraction: float
+) -> dict:
+    """Calibration window of two 128-step rollouts whose simulators were busy half of each step."""
+    measured_steps = 2 * 128 * environment_count
+    wall_seconds = measured_steps / collection_steps_per_second / (1.0 - update_time_fraction)
+    return {
+        "environment_count": environment_count,
+        "vectorized_environment_type": vectorized_environment_type.value,
+        "steps_per_update": 128,
+        "batch_size": batch_size,
+        "measured_steps": measured_steps,
+        "wall_seconds": wall_seconds,
+        "collection_steps_per_second": collection_steps_per_second,
+        "update_time_fraction": update_time_fraction,
+        "simulator_busy_seconds": 0.5 * measured_steps / collection_steps_per_second
+    }
+
+
+CALIBRATION_RESULTS = [
+    create_calibration_result(1, VectorizedEnvironmentType.DUMMY, 64, 200.0, 0.2),
+    create_calibration_result(2, VectorizedEnvironmentType.DUMMY, 64, 220.0, 0.2),
+    create_calibration_result(2, VectorizedEnvironmentType.SUBPROCESS, 64, 380.0, 0.2),
+    create_calibration_result(2, VectorizedEnvironmentType.SUBPROCESS, 256, 380.0, 0.1)
+]
+
+
+class TestAutoTuneController:
+    """Tests for AutoTuneController."""
+
+    def test_predicts_every_rollout_size(self) -> None:
+        """Test each calibration window yields one prediction per steps-per-update candidate."""
+        auto_tune_controller = AutoTuneController(environment_counts=[1, 2], steps_per_update_values=[512, 2048])
+
+        predictions = auto_tune_controller.predict(CALIBRATION_RESULTS)
+
+        assert len(predictions) == 2 * len(CALIBRATION_RESULTS)
+        for prediction in predictions:
+            assert 0.0 < prediction["simulator_utilization"] <= 1.0
+            assert prediction["memory_bytes"] > 0
+
+    def test_update_cost_scales_with_minibatch_count(self) -> None:
+        """Test the update share is carried over from calibration to longer rollouts."""
+        auto_tune_controller = AutoTuneController(environment_counts=[1, 2], steps_per_update_values=[1024])
+
+        prediction = auto_tune_controller.predict(CALIBRATION_RESULTS[:1])[0]
+
+        assert prediction["update_time_fraction"] == pytest.approx(0.2)
+        assert prediction["steps_per_second"] == pytest.approx(200.0 * 0.8)
+
+    def test_selects_highest_utilization_within_budget(self) -> None:
+        """Test parallel environments win unless the memory budget rules them out."""
+        generous_controller = AutoTuneController(
+            environment_counts=[1, 2], steps_per_update_values=[512, 2048], memory_budget_bytes=4 * 1024 ** 3)
+        tight_controller = AutoTuneController(
+            environment_counts=[1, 2], steps_per_update_values=[512, 2048], memory_budget_bytes=256 * 1024 ** 2)
+
+        generous_choice = generous_controller.select(generous_controller.predict(CALIBRATION_RESULTS))
+        tight_choice = tight_controller.select(tight_controller.predict(CALIBRATION_RESULTS))
+
+        assert generous_choice.environment_count == 2
+        assert generous_choice.vectorized_environment_type == VectorizedEnvironmentType.SUBPROCESS
+        assert generous_choice.training_configuration.batch_size == 256
+        assert generous_choice.training_configuration.steps_per_update == 2048
+        assert tight_choice.vectorized_environment_type == VectorizedEnvironmentType.DUMMY
+
+    def test_rejects_budget_nothing_fits(self) -> None:
+        """Test a budget below every candidate raises."""
+        auto_tune_controller = AutoTuneController(environment_counts=[1, 2], memory_budget_bytes=1024)
+
+        with pytest.raises(ValueError):
+            auto_tune_controller.select(auto_tune_controller.predict(CALIBRATION_RESULTS))
+
+    def test_run_writes_loadable_configuration(self, tmp_path) -> None:
+        """Test a tiny calibration against mock simulators produces a run configuration train.py can load."""
+        auto_tune_controller = AutoTuneController(
+            environment_counts=[1],
+            vectorized_environment_types=[VectorizedEnvironmentType.DUMMY],
+            steps_per_update_values=[64, 128],
+            batch_sizes=[16],
+            calibration_steps_per_update=16,
+            calibration_rollouts=1
+        )
+
+        run_configuration, predictions = auto_tune_controller.run()
+        json_path = auto_tune_controller.save_run_configuration(
+            run_configuration, predictions, str(tmp_path / "run_config.json"))
+
+        with open(json_path, "r", encoding="utf-8") as json_file:
+            saved_configuration = json.load(json_file)
+
+        assert len(predictions) == 2
+        assert RunConfigurationModel.from_dictionary(saved_configuration) == run_configuration
+        assert run_configuration.training_configuration.batch_size == 16
+        assert saved_configuration["AutoTune"]["Predictions"] == predictions
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
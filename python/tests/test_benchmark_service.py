@@ -0,0 +1,85 @@
+"""Tests for the benchmark harness and the step-path benchmark suite."""
+
+import json
+import subprocess
+import sys
+import os
+import pytest
+
+from robot_arm.services.benchmark_service import BenchmarkService
+from robot_arm.services.step_path_benchmark_service import StepPathBenchmarkService
+
+PYTHON_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_results(median_microseconds_by_name):
+    """Minimal results with only the regression metric set."""
+    return {name: {"median_microseconds": median} for name, median in median_microseconds_by_name.items()}
+
+
+class TestBenchmarkService:
+    """Tests for BenchmarkService."""
+
+    def test_measure_calibrates_rounds(self) -> None:
+        """Test the loop count is raised until a round lasts the minimum time."""
+        benchmark_service = BenchmarkService(warmup_rounds=1, rounds=3, minimum_round_seconds=0.005)
+
+        result = benchmark_service.measure(lambda: sum(range(100)))
+
+        assert result["rounds"] == 3
+        assert result["loops_per_round"] > 1
+        assert result["minimum_microseconds"] <= result["median_microseconds"] <= result["maximum_microseconds"]
+
+    def test_compare_flags_only_slowdowns_above_threshold(self) -> None:
+        """Test regressions need a slowdown above the threshold and a baseline entry."""
+        baseline = create_results({"fast": 10.0, "steady": 10.0, "removed": 10.0})
+        results = create_results({"fast": 8.0, "steady": 14.0, "new": 50.0})
+
+        lenient = BenchmarkService.compare_to_baseline(results, baseline, regression_threshold=0.5)
+        strict = BenchmarkService.compare_to_baseline(results, baseline, regression_threshold=0.25)
+
+        assert set(lenient) == {"fast", "steady"}
+        assert lenient["steady"]["relative_change"] == pytest.approx(0.4)
+        assert not lenient["steady"]["is_regression"]
+        assert strict["steady"]["is_regression"]
+        assert not strict["fast"]["is_regression"]
+
+    def test_results_round_trip(self, tmp_path) -> None:
+        """Test saved results load back with machine information alongside."""
+        results = create_results({"command_to_json": 5.0})
+
+        json_path = BenchmarkService.save_results(results, str(tmp_path / "nested" / "results.json"))
+
+        assert BenchmarkService.load_results(json_path) == results
+        with open(json_path, encoding="utf-8") as json_file:
+            assert "Python" in json.load(json_file)
+
+    def test_step_path_suite_matches_baseline(self) -> None:
+        """Test every step-path benchmark runs and has a stored baseline."""
+        benchmark_service = BenchmarkService(warmup_rounds=0, rounds=2, minimum_round_seconds=0.001)
+
+        with StepPathBenchmarkService.create_benchmarks() as benchmark_functions:
+            results = benchmark_service.run_suite(benchmark_functions)
+
+        assert set(results) == {
+            "command_to_json", "observation_from_dictionary", "normalize_observation",
+            "calculate_reward", "environment_step_loopback"}
+        assert set(BenchmarkService.load_results(StepPathBenchmarkService.BASELINE_PATH)) == set(results)
+
+    @pytest.mark.parametrize("baseline_median, expected_return_code", [(1e-3, 1), (1e9, 0)])
+    def test_step_command_gates_on_baseline(self, tmp_path, baseline_median, expected_return_code) -> None:
+        """Test the benchmark command fails the build only when the baseline is beaten by the threshold."""
+        baseline_path = BenchmarkService.save_results(
+            create_results({"calculate_reward": baseline_median}), str(tmp_path / "baseline.json"))
+
+        completed = subprocess.run(
+            [sys.executable, "-m", "robot_arm.benchmark", "step", "--baseline", baseline_path,
+             "--rounds", "2", "--warmup-rounds", "0", "--min-round-ms", "1", "--output", str(tmp_path / "out.json")],
+            capture_output=True, text=True, timeout=120, cwd=PYTHON_DIRECTORY)
+
+        assert completed.returncode == expected_return_code, completed.stdout + completed.stderr
+        assert os.path.exists(tmp_path / "out.json")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
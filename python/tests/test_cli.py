@@ -0,0 +1,106 @@
+"""Tests for the robot-arm command-line entry point and the modules it loads."""
+
+import json
+import subprocess
+import sys
+import os
+import pytest
+
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+PYTHON_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI_COMMAND = [sys.executable, "-m", "robot_arm.cli"]
+HEAVY_MODULES = ["numpy", "gymnasium", "torch", "stable_baselines3"]
+# Cumulative import time of the --help and probe paths; both measure 15-35 ms on a laptop
+IMPORT_BUDGET_MICROSECONDS = 100_000
+
+# Runs the CLI in a fresh interpreter and reports which heavy modules it loaded
+MODULE_REPORT_SCRIPT = """
+import json, sys
+from robot_arm import cli
+try:
+    cli.main({arguments!r})
+except SystemExit:
+    pass
+print(json.dumps({{"loaded": [name for name in {heavy_modules!r} if name in sys.modules]}}))
+"""
+
+
+def run_cli_in_fresh_interpreter(arguments):
+    """Loaded heavy modules and output of one CLI invocation."""
+    completed = subprocess.run(
+        [sys.executable, "-c", MODULE_REPORT_SCRIPT.format(arguments=arguments, heavy_modules=HEAVY_MODULES)],
+        capture_output=True, text=True, timeout=30, cwd=PYTHON_DIRECTORY)
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stdout
+
+
+def measure_import_microseconds(module_name):
+    """Fastest of three cumulative -X importtime measurements of module_name in a fresh interpreter."""
+    measurements = []
+    for _ in range(3):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+            capture_output=True, text=True, timeout=30, cwd=PYTHON_DIRECTORY, check=True)
+        # Lines read "import time: self | cumulative | name"; the module itself is reported last
+        module_line = [line for line in completed.stderr.splitlines() if line.split("|")[-1].strip() == module_name]
+        measurements.append(int(module_line[-1].split("|")[1]))
+    return min(measurements)
+
+
+class TestCommandLineInterface:
+    """Tests for the cli module."""
+
+    def test_help_lists_commands_without_heavy_imports(self) -> None:
+        """Test top-level help names every command and loads none of the ML stack."""
+        report, output = run_cli_in_fresh_interpreter(["--help"])
+
+        assert report["loaded"] == []
+        for command_name in ["train", "evaluate", "probe", "loadtest", "serve", "record", "benchmark"]:
+            assert command_name in output
+
+    def test_probe_answers_without_heavy_imports(self) -> None:
+        """Test a short probe of a live server succeeds and loads none of the ML stack."""
+        server = MockSimulatorService(steps_to_target=4, episode_length=None)
+
+        try:
+            report, output = run_cli_in_fresh_interpreter(
+                ["probe", "--port", str(server.port), "--commands", "100"])
+        finally:
+            server.close()
+
+        assert "[OK]" in output
+        assert report["loaded"] == []
+
+    @pytest.mark.parametrize("module_name", ["robot_arm.cli", "robot_arm.probe"])
+    def test_import_stays_within_budget(self, module_name) -> None:
+        """Test importing the --help and probe paths stays well under the 200 ms start-up target."""
+        assert measure_import_microseconds(module_name) < IMPORT_BUDGET_MICROSECONDS
+
+    def test_command_usage_and_unknown_command(self) -> None:
+        """Test commands report the CLI name in usage and unknown commands fail."""
+        command_help = subprocess.run(
+            CLI_COMMAND + ["probe", "--help"], capture_output=True, text=True, timeout=30, cwd=PYTHON_DIRECTORY)
+        unknown_command = subprocess.run(
+            CLI_COMMAND + ["fly"], capture_output=True, text=True, timeout=30, cwd=PYTHON_DIRECTORY)
+
+        assert command_help.returncode == 0
+        assert command_help.stdout.startswith("usage: robot-arm probe")
+        assert unknown_command.returncode == 2
+        assert "invalid choice" in unknown_command.stderr
+
+    def test_probe_fails_on_closed_port(self) -> None:
+        """Test the probe exits non-zero when nothing listens."""
+        server = MockSimulatorService(steps_to_target=4, episode_length=None)
+        closed_port = server.port
+        server.close()
+
+        completed = subprocess.run(
+            CLI_COMMAND + ["probe", "--port", str(closed_port), "--timeout", "1"],
+            capture_output=True, text=True, timeout=30, cwd=PYTHON_DIRECTORY)
+
+        assert completed.returncode == 1
+        assert "[FAIL]" in completed.stdout
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""Tests for simulator connection probing."""
+
+import socket
+import pytest
+import numpy as np
+
+from robot_arm.models.observation_model import ObservationModel
+from robot_arm.services.connection_probe_service import ConnectionProbeService
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+
+@pytest.fixture
+def mock_simulator():
+    """Mock simulator on a free port that omits the optional observation fields."""
+    server = MockSimulatorService(steps_to_target=4, episode_length=None, include_optional_fields=False)
+    yield server
+    server.close()
+
+
+def create_reset_response() -> dict:
+    """Complete reset observation as Unity serializes it."""
+    response = ObservationModel.from_dictionary({}).to_dictionary()
+    response.update({
+        "TargetPosition": [0.5, 0.4, 0.3],
+        "IsResetFrame": True,
+        "JointAngleLimits": [90.0] * 6
+    })
+    return response
+
+
+class TestConnectionProbeService:
+    """Tests for ConnectionProbeService."""
+
+    def test_schema_covers_observation_model(self) -> None:
+        """Test every field ObservationModel reads is validated."""
+        assert set(ObservationModel.from_dictionary({}).to_dictionary()) <= set(
+            ConnectionProbeService.OBSERVATION_SCHEMA)
+        assert "JointAngleLimits" in ConnectionProbeService.OBSERVATION_SCHEMA
+        assert "TargetPosition" in ConnectionProbeService.OBSERVATION_SCHEMA
+
+    def test_validate_observation_reports_problems(self) -> None:
+        """Test wrong types, wrong lengths and missing reset fields are errors."""
+        valid_response = create_reset_response()
+        assert ConnectionProbeService.validate_observation(valid_response, is_reset_response=True) == ([], [])
+
+        broken_response = dict(valid_response, DistanceToTarget="far", DirectionToTarget=[0.0, 1.0])
+        del broken_response["GripperState"]
+        errors, warnings = ConnectionProbeService.validate_observation(broken_response, is_reset_response=True)
+        assert any("DistanceToTarget should be a number" in error for error in errors)
+        assert any("DirectionToTarget should have 3 entries" in error for error in errors)
+        assert warnings == ["GripperState is missing; the client uses its default"]
+
+        step_as_reset = dict(valid_response, IsResetFrame=False, JointAngleLimits=[90.0] * 5)
+        errors, _ = ConnectionProbeService.validate_observation(step_as_reset, is_reset_response=True)
+        assert errors == ["IsResetFrame is false", "JointAngleLimits has 5 entries for 6 joints"]
+
+    def test_conformance_against_mock_simulator(self, mock_simulator) -> None:
+        """Test the mock simulator conforms, with warnings for the fields it omits."""
+        errors, warnings = ConnectionProbeService(port=mock_simulator.port).check_conformance()
+
+        assert errors == []
+        assert "STEP: GripperState is missing; the client uses its default" in warnings
+
+    def test_load_counts_every_command(self, mock_simulator) -> None:
+        """Test load statistics add up across connections and command types."""
+        statistics = ConnectionProbeService(port=mock_simulator.port, connection_count=3).run_load(
+            command_count=302, episode_length=10)
+
+        assert statistics["ALL"]["count"] == 302
+        assert statistics["RESET"]["count"] + statistics["STEP"]["count"] == 302
+        assert statistics["RESET"]["count"] == 3 * 10
+        assert statistics["ALL"]["timeouts"] == statistics["ALL"]["errors"] == 0
+        assert 0.0 < statistics["STEP"]["p50_milliseconds"] <= statistics["STEP"]["maximum_milliseconds"]
+        assert statistics["STEP"]["mean_request_bytes"] > statistics["RESET"]["mean_request_bytes"]
+
+    def test_silent_server_counts_timeouts(self) -> None:
+        """Test unanswered commands are counted as timeouts and the connection is reopened."""
+        listening_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listening_socket.bind(("localhost", 0))
+        listening_socket.listen(8)
+
+        try:
+            statistics = ConnectionProbeService(
+                port=listening_socket.getsockname()[1], timeout_seconds=0.05).run_load(command_count=3)
+        finally:
+            listening_socket.close()
+
+        assert statistics["ALL"]["count"] == 0
+        assert statistics["RESET"]["timeouts"] == 3
+
+    def test_percentiles_match_numpy(self) -> None:
+        """Test the standard-library percentile matches numpy's linear interpolation."""
+        values = sorted(np.random.default_rng(0).exponential(size=101).tolist())
+
+        for percentile in (0.0, 50.0, 95.0, 99.0, 100.0):
+            assert ConnectionProbeService.compute_percentile(values, percentile) == pytest.approx(
+                np.percentile(values, percentile))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
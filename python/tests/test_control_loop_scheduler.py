@@ -0,0 +1,89 @@
+"""Tests for the fixed-rate control loop scheduler."""
+
+import pytest
+
+from robot_arm.services.control_loop_scheduler_service import ControlLoopSchedulerService
+
+
+class FakeClock:
+    """Clock advanced by sleeps, simulated work, and a tiny tick per reading."""
+
+    TICK_SECONDS = 1e-6
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleep_calls = []
+
+    def __call__(self) -> float:
+        self.now += self.TICK_SECONDS
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleep_calls.append(seconds)
+        self.now += seconds
+
+
+def run_cycles(cycle_durations, control_frequency_hertz: float = 100.0):
+    """Run one cycle per duration on a fake clock and return the scheduler and cycle start times."""
+    clock = FakeClock()
+    scheduler = ControlLoopSchedulerService(control_frequency_hertz, clock=clock, sleep=clock.sleep)
+    start_times = []
+    remaining_durations = list(cycle_durations)
+
+    def cycle_function() -> bool:
+        start_times.append(clock.now)
+        clock.now += remaining_durations.pop(0)
+        return bool(remaining_durations)
+
+    scheduler.run(cycle_function, lambda: True)
+    return scheduler, start_times
+
+
+class TestControlLoopSchedulerService:
+    """Tests for ControlLoopSchedulerService."""
+
+    def test_cycles_start_on_the_period_grid(self) -> None:
+        """Test cycles shorter than the period start once per period with no misses."""
+        scheduler, start_times = run_cycles([0.004] * 10)
+
+        for cycle_index, start_time in enumerate(start_times):
+            assert start_time - start_times[0] == pytest.approx(cycle_index * 0.01, abs=1e-4)
+        assert scheduler.cycle_count == 10
+        assert scheduler.missed_deadline_count == 0
+        assert scheduler.compute_jitter_percentiles()[99.0] < 0.1
+
+    def test_overrun_counts_missed_deadline_and_skips_lost_ticks(self) -> None:
+        """Test a 25 ms cycle at 100 Hz misses its deadline and the schedule realigns to the grid."""
+        scheduler, start_times = run_cycles([0.004, 0.025, 0.004, 0.004])
+
+        assert scheduler.missed_deadline_count == 1
+        assert scheduler.skipped_cycle_count == 2
+        assert start_times[2] - start_times[0] == pytest.approx(0.04, abs=1e-4)
+        assert start_times[3] - start_times[2] == pytest.approx(0.01, abs=1e-4)
+
+    def test_stops_when_asked(self) -> None:
+        """Test should_continue is checked before every cycle."""
+        clock = FakeClock()
+        scheduler = ControlLoopSchedulerService(50.0, clock=clock, sleep=clock.sleep)
+
+        scheduler.run(lambda: True, lambda: scheduler.cycle_count < 3)
+
+        assert scheduler.cycle_count == 3
+
+    def test_summary_reports_jitter_percentiles(self) -> None:
+        """Test the statistics summary names every percentile in milliseconds."""
+        scheduler, _ = run_cycles([0.001] * 5)
+        summary = scheduler.create_statistics_summary()
+
+        assert summary["cycle_count"] == 5.0
+        assert {"jitter_p50_milliseconds", "jitter_p95_milliseconds", "jitter_p99_milliseconds"} <= set(summary)
+        assert summary["mean_cycle_milliseconds"] == pytest.approx(1.0, abs=0.01)
+
+    def test_rejects_non_positive_frequency(self) -> None:
+        """Test a zero control frequency is refused."""
+        with pytest.raises(ValueError, match="positive"):
+            ControlLoopSchedulerService(0.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
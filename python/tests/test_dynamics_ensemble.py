@@ -0,0 +1,156 @@
+"""Tests for the dynamics ensemble and Dyna-style imagined rollouts."""
+
+import pytest
+import numpy as np
+
+from robot_arm.enums.training_algorithm import TrainingAlgorithm
+from robot_arm.models.training_configuration_model import TrainingConfigurationModel
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+pytest.importorskip("torch")
+from robot_arm.services.dynamics_ensemble_service import DynamicsEnsembleService
+
+
+def create_linear_transitions(count: int, seed: int = 0):
+    """Transitions where joint deltas move the first observations and the reward is their sum."""
+    random_generator = np.random.default_rng(seed)
+    observations = random_generator.uniform(-0.5, 0.5, size=(count, 4)).astype(np.float32)
+    actions = random_generator.uniform(-1.0, 1.0, size=(count, 2)).astype(np.float32)
+    next_observations = observations.copy()
+    next_observations[:, :2] += 0.1 * actions
+    rewards = next_observations[:, :2].sum(axis=1)
+
+    return observations, actions, next_observations, rewards
+
+
+class TestDynamicsEnsembleService:
+    """Tests for DynamicsEnsembleService."""
+
+    def test_fit_learns_transitions(self) -> None:
+        """Test the ensemble predicts held-out next observations and rewards closely."""
+        ensemble = DynamicsEnsembleService(4, 2, hidden_layer_sizes=(32, 32), seed=0)
+        observations, actions, next_observations, rewards = create_linear_transitions(2000)
+
+        first_loss = ensemble.fit(observations, actions, next_observations, rewards, epochs=1)
+        final_loss = ensemble.fit(observations, actions, next_observations, rewards, epochs=30)
+
+        test_observations, test_actions, test_next_observations, test_rewards = create_linear_transitions(200, seed=1)
+        predicted_observations, predicted_rewards, uncertainties = ensemble.predict(test_observations, test_actions)
+
+        assert ensemble.is_fitted
+        assert final_loss < first_loss
+        assert np.abs(predicted_observations - test_next_observations).mean() < 0.02
+        assert np.abs(predicted_rewards - test_rewards).mean() < 0.05
+        assert uncertainties.shape == (200,)
+
+    def test_uncertainty_grows_away_from_data(self) -> None:
+        """Test members disagree more on states far outside the training data."""
+        ensemble = DynamicsEnsembleService(4, 2, hidden_layer_sizes=(32, 32), seed=0)
+        observations, actions, next_observations, rewards = create_linear_transitions(2000)
+        ensemble.fit(observations, actions, next_observations, rewards, epochs=20)
+
+        _, _, familiar_uncertainties = ensemble.predict(observations[:200], actions[:200])
+        _, _, unfamiliar_uncertainties = ensemble.predict(observations[:200] + 5.0, actions[:200])
+
+        assert unfamiliar_uncertainties.mean() > 5 * familiar_uncertainties.mean()
+
+
+class TestDynaReplayBuffer:
+    """Tests for DynaReplayBuffer."""
+
+    def test_batches_mix_synthetic_fraction(self, tmp_path) -> None:
+        """Test a quarter of each batch comes from imagined transitions once any exist."""
+        pytest.importorskip("stable_baselines3")
+        from gymnasium import spaces
+        from robot_arm.controllers.dyna_replay_buffer import DynaReplayBuffer
+
+        replay_buffer = DynaReplayBuffer(
+            100, spaces.Box(-1.0, 1.0, shape=(3,)), spaces.Box(-1.0, 1.0, shape=(2,)), device="cpu",
+            storage_directory=str(tmp_path), synthetic_fraction=0.25, synthetic_buffer_size=10)
+
+        for _ in range(20):
+            replay_buffer.add(
+                np.zeros((1, 3)), np.zeros((1, 3)), np.zeros((1, 2)), np.zeros(1), np.zeros(1), [{}])
+
+        assert replay_buffer.sample(16).rewards.sum() == 0.0
+
+        replay_buffer.add_synthetic(np.ones((15, 3)), np.ones((15, 3)), np.ones((15, 2)), np.ones(15))
+        samples = replay_buffer.sample(16)
+
+        assert replay_buffer.synthetic_size == 10
+        assert samples.observations.shape == (16, 3)
+        assert float(samples.rewards.sum()) == 4.0
+        assert float(samples.dones.sum()) == 0.0
+
+    def test_imagined_terminations_are_sampled_as_done(self, tmp_path) -> None:
+        """Test imagined transitions keep the termination predicted for them."""
+        pytest.importorskip("stable_baselines3")
+        from gymnasium import spaces
+        from robot_arm.controllers.dyna_replay_buffer import DynaReplayBuffer
+
+        replay_buffer = DynaReplayBuffer(
+            100, spaces.Box(-1.0, 1.0, shape=(3,)), spaces.Box(-1.0, 1.0, shape=(2,)), device="cpu",
+            storage_directory=str(tmp_path), synthetic_fraction=0.5, synthetic_buffer_size=10)
+        replay_buffer.add(np.zeros((1, 3)), np.zeros((1, 3)), np.zeros((1, 2)), np.zeros(1), np.zeros(1), [{}])
+
+        replay_buffer.add_synthetic(
+            np.ones((10, 3)), np.ones((10, 3)), np.ones((10, 2)), -np.ones(10), np.ones(10, dtype=bool))
+        samples = replay_buffer.sample(16)
+
+        # Real rewards are zero, so the done flags line up with the imagined rows
+        np.testing.assert_array_equal(samples.dones.numpy(), -samples.rewards.numpy())
+        assert float(samples.dones.sum()) == 8.0
+
+    def test_predicted_terminations_follow_environment_rules(self) -> None:
+        """Test underground TCP positions and collision-sized penalties end imagined episodes."""
+        from robot_arm.environments.unity_robot_environment import UnityRobotEnvironment
+
+        next_observations = np.zeros((3, 2 * UnityRobotEnvironment.OBSERVATION_DIMENSION), dtype=np.float32)
+        newest_height_index = UnityRobotEnvironment.OBSERVATION_DIMENSION + 8
+        next_observations[:, newest_height_index] = [0.5, -0.1, 0.5]
+        # An underground TCP in the older stacked entry does not count
+        next_observations[0, 8] = -0.5
+
+        terminations = UnityRobotEnvironment.predict_terminations(
+            next_observations, np.array([1.0, 1.0, -300.0]),
+            latest_entry_start=UnityRobotEnvironment.OBSERVATION_DIMENSION)
+
+        assert terminations.tolist() == [False, True, True]
+
+    def test_training_adds_imagined_transitions(self, tmp_path, monkeypatch) -> None:
+        """Test SAC with model-based rollouts fills the synthetic buffer while training."""
+        pytest.importorskip("stable_baselines3")
+        from robot_arm.controllers.training_controller import TrainingController
+
+        monkeypatch.setattr(TrainingController, "DYNAMICS_MODEL_TRAINING_INTERVAL", 20)
+        configuration = TrainingConfigurationModel(
+            batch_size=16, network_layer_sizes=[8], replay_buffer_size=1000, learning_starts=20)
+        server = MockSimulatorService(steps_to_target=4, episode_length=30)
+
+        try:
+            controller = TrainingController(
+                server_address=f"tcp://localhost:{server.port}",
+                training_configuration=configuration,
+                output_directory=str(tmp_path),
+                training_algorithm=TrainingAlgorithm.SAC,
+                use_model_based_rollouts=True)
+            controller.initialize_training()
+            controller.execute_training_steps(60)
+            controller.shutdown()
+
+            assert controller._dyna_rollout_callback.imagined_transition_count > 0
+            assert controller._model.replay_buffer.synthetic_size == (
+                controller._dyna_rollout_callback.imagined_transition_count)
+        finally:
+            server.close()
+
+    def test_model_based_rollouts_require_off_policy(self) -> None:
+        """Test PPO cannot be combined with model-based rollouts."""
+        from robot_arm.controllers.training_controller import TrainingController
+
+        with pytest.raises(ValueError, match="off-policy"):
+            TrainingController(use_model_based_rollouts=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
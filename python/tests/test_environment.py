@@ -1,12 +1,9 @@
 """Tests for Gymnasium environment (mock tests without Unity connection)."""
 
-import sys
-import os
 import pytest
 import numpy as np
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from models.observation_model import ObservationModel
+from robot_arm.models.observation_model import ObservationModel
 
 
 # Environment constants for testing without importing the full environment
@@ -190,5 +187,109 @@ class TestMockObservation:
         assert np.all(clipped <= 1.0)
 
 
+class TestGoalConditionedEnvironment:
+    """Tests for the goal-conditioned observation and reward interface."""
+
+    @pytest.fixture
+    def environment(self):
+        """Goal-conditioned environment connected to a mock simulator that omits TargetPosition."""
+        from robot_arm.environments.unity_robot_environment import UnityRobotEnvironment
+        from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+        server = MockSimulatorService(steps_to_target=4, episode_length=None, include_optional_fields=False)
+        environment = UnityRobotEnvironment(
+            server_address=f"tcp://localhost:{server.port}", goal_conditioned=True)
+
+        yield environment
+
+        environment.close()
+        server.close()
+
+    def test_observation_splits_goals(self, environment) -> None:
+        """Test observations carry the TCP and target positions as goals."""
+        observation, _ = environment.reset()
+
+        assert environment.observation_space.contains(observation)
+        assert observation["observation"].shape == (14,)
+        np.testing.assert_allclose(observation["achieved_goal"], [0.0, 0.3, 0.2])
+        # Reconstructed from direction and distance when the simulator omits TargetPosition
+        np.testing.assert_allclose(observation["desired_goal"], [0.0, 0.3, 1.2])
+
+    def test_step_reward_matches_compute_reward(self, environment) -> None:
+        """Test the step reward is what relabeling recomputes for the same goal."""
+        environment.reset()
+
+        observation, reward, _, _, information = environment.step(np.zeros(7, dtype=np.float32))
+
+        assert reward == pytest.approx(float(environment.compute_reward(
+            observation["achieved_goal"], observation["desired_goal"], information)))
+
+    def test_compute_reward_relabels_batches(self, environment) -> None:
+        """Test a batch of substitute goals equal to the achieved positions all count as reached."""
+        achieved_goals = np.random.default_rng(0).uniform(-0.5, 0.5, size=(8, 3))
+
+        rewards = environment.compute_reward(achieved_goals, achieved_goals + 0.01, [{}] * 8)
+
+        assert rewards.shape == (8,)
+        assert np.all(rewards > 50.0)
+
+
+class TestContinuingTaskEnvironment:
+    """Tests for spawning new targets after a success without resetting."""
+
+    def test_success_spawns_new_target(self) -> None:
+        """Test each success requests a new target and progress is measured against it."""
+        from robot_arm.environments.unity_robot_environment import UnityRobotEnvironment
+        from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+        server = MockSimulatorService(steps_to_target=4, episode_length=None)
+        environment = UnityRobotEnvironment(
+            server_address=f"tcp://localhost:{server.port}", continuing_task=True)
+
+        try:
+            environment.reset()
+            informations = [environment.step(np.zeros(7, dtype=np.float32))[4] for _ in range(9)]
+
+            assert [bool(information.get("new_target")) for information in informations] == [
+                False, False, False, True, False, False, False, True, False]
+            assert informations[-1]["targets_reached"] == 2
+            assert server.new_target_count == 2
+            assert server.reset_count == 1
+            # Distance 1.0 -> 0.8 against the new target, not a jump from the old one
+            assert informations[4]["reward_components"]["distance"] == pytest.approx(2.0)
+        finally:
+            environment.close()
+            server.close()
+
+
+    def test_scheduler_places_targets_and_records_outcomes(self) -> None:
+        """Test scheduled targets are sent with SET_TARGET and each outcome reaches the scheduler."""
+        from robot_arm.environments.unity_robot_environment import UnityRobotEnvironment
+        from robot_arm.services.target_scheduler_service import TargetSchedulerService
+        from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+        server = MockSimulatorService(steps_to_target=4, episode_length=6)
+        scheduler = TargetSchedulerService(seed=0)
+        environment = UnityRobotEnvironment(
+            server_address=f"tcp://localhost:{server.port}", continuing_task=True, target_scheduler=scheduler)
+
+        try:
+            environment.reset()
+            terminated = False
+            while not terminated:
+                _, _, terminated, _, _ = environment.step(np.zeros(7, dtype=np.float32))
+
+            # One target reached at step 4, its replacement still pending at the collision
+            assert len(server.set_target_positions) == 2
+            assert server.new_target_count == 0
+            assert scheduler.recorded_outcome_count == 2
+            failure_rates = scheduler.compute_failure_rates()
+            assert failure_rates[scheduler.find_cell_index(server.set_target_positions[0])] < 0.5
+            assert failure_rates[scheduler.find_cell_index(server.set_target_positions[1])] > 0.5
+        finally:
+            environment.close()
+            server.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+"""Tests for the parallel checkpoint evaluation harness."""
+
+import os
+import pytest
+import numpy as np
+
+from robot_arm.controllers.evaluation_controller import EvaluationController
+from robot_arm.services.policy_export_service import PolicyExportService
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+
+OBSERVATION_DIMENSION = 17
+ACTION_DIMENSION = 7
+STEPS_TO_TARGET = 4
+
+
+def save_policy(path: str, seed: int) -> str:
+    """Save a random linear exported policy."""
+    random_generator = np.random.default_rng(seed)
+    parameters = {
+        "format_version": np.array(PolicyExportService.FORMAT_VERSION),
+        "activation": np.array("tanh"),
+        "hidden_layer_count": np.array(0),
+        "action_weight": random_generator.normal(size=(ACTION_DIMENSION, OBSERVATION_DIMENSION)).astype(np.float32),
+        "action_bias": np.zeros(ACTION_DIMENSION, dtype=np.float32),
+        "log_std": np.zeros(ACTION_DIMENSION, dtype=np.float32),
+        "action_low": -np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "action_high": np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "normalize_observations": np.array(False),
+        "observation_mean": np.zeros(OBSERVATION_DIMENSION),
+        "observation_variance": np.ones(OBSERVATION_DIMENSION),
+        "observation_clip": np.array(np.inf),
+        "observation_epsilon": np.array(0.0)
+    }
+    return PolicyExportService.save_parameters(parameters, path)
+
+
+@pytest.fixture
+def checkpoint_directory(tmp_path):
+    """Directory holding three exported checkpoints."""
+    for checkpoint_index in range(3):
+        save_policy(str(tmp_path / f"robot_policy_{(checkpoint_index + 1) * 10000}_steps.npz"), checkpoint_index)
+    return tmp_path
+
+
+class TestEvaluationController:
+    """Tests for EvaluationController."""
+
+    def test_evaluates_checkpoints_across_workers(self, checkpoint_directory) -> None:
+        """Test every checkpoint is evaluated with outcome and timing statistics."""
+        servers = [MockSimulatorService(steps_to_target=4, episode_length=None) for _ in range(2)]
+        controller = EvaluationController(
+            server_ports=[server.port for server in servers],
+            episodes_per_checkpoint=3,
+            cache_path=str(checkpoint_directory / "cache.json"))
+
+        results = controller.evaluate([str(checkpoint_directory)])
+
+        for server in servers:
+            server.close()
+
+        assert len(results) == 3
+        for result in results:
+            assert result.episode_count == 3
+            assert result.success_rate == 1.0
+            assert result.outcome_counts["success"] == 3
+            assert result.mean_steps_to_target == STEPS_TO_TARGET
+            assert len(result.cache_key) == 64
+
+    def test_cached_results_skip_evaluation(self, checkpoint_directory) -> None:
+        """Test re-runs only evaluate new checkpoints."""
+        cache_path = str(checkpoint_directory / "cache.json")
+        server = MockSimulatorService(steps_to_target=4, episode_length=None)
+        EvaluationController(
+            server_ports=[server.port], episodes_per_checkpoint=2, cache_path=cache_path
+        ).evaluate([str(checkpoint_directory)])
+        resets_after_first_run = server.reset_count
+
+        save_policy(str(checkpoint_directory / "robot_policy_40000_steps.npz"), seed=9)
+        results = EvaluationController(
+            server_ports=[server.port], episodes_per_checkpoint=2, cache_path=cache_path
+        ).evaluate([str(checkpoint_directory)])
+        server.close()
+
+        assert resets_after_first_run == 3 * 2
+        assert server.reset_count - resets_after_first_run == 2
+        assert len(results) == 4
+        assert all(result.success_rate == 1.0 for result in results)
+
+    def test_cache_key_depends_on_content_and_settings(self, checkpoint_directory) -> None:
+        """Test the cache key changes with checkpoint contents and evaluation settings."""
+        model_file = str(checkpoint_directory / "robot_policy_10000_steps.npz")
+        controller = EvaluationController(server_ports=[5555], episodes_per_checkpoint=5)
+        original_key = controller.compute_cache_key(model_file)
+
+        assert EvaluationController(server_ports=[5555], episodes_per_checkpoint=5).compute_cache_key(
+            model_file) == original_key
+        assert EvaluationController(server_ports=[5555], episodes_per_checkpoint=6).compute_cache_key(
+            model_file) != original_key
+
+        save_policy(model_file, seed=42)
+        assert controller.compute_cache_key(model_file) != original_key
+
+    def test_find_checkpoint_files_prefers_exports(self, tmp_path) -> None:
+        """Test directories expand to one file per checkpoint, preferring .npz."""
+        for file_name in ["robot_policy_touch.zip", "robot_policy_touch.npz",
+                          "robot_policy_grasp.zip", "normalizer_touch.pkl"]:
+            (tmp_path / file_name).write_bytes(b"")
+
+        model_files = EvaluationController.find_checkpoint_files([str(tmp_path)])
+
+        assert [os.path.basename(model_file) for model_file in model_files] == [
+            "robot_policy_grasp.zip", "robot_policy_touch.npz"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,224 @@
+"""Tests for forward kinematics and the action safety filter."""
+
+import pytest
+import numpy as np
+
+from robot_arm.services.kinematics_service import KinematicsService
+from robot_arm.services.action_safety_service import ActionSafetyService
+from robot_arm.services.demonstration_service import DemonstrationService
+
+
+JOINT_ANGLE_LIMITS = np.array([90.0, 90.0, 90.0, 180.0, 90.0, 90.0])
+
+
+def create_random_joint_angles(number_of_samples: int, seed: int = 0) -> np.ndarray:
+    """Sample joint configurations uniformly within the joint limits."""
+    random_generator = np.random.default_rng(seed)
+    return random_generator.uniform(-JOINT_ANGLE_LIMITS, JOINT_ANGLE_LIMITS, size=(number_of_samples, 6))
+
+
+class TestKinematicsService:
+    """Tests for KinematicsService."""
+
+    def test_home_position_is_sum_of_offsets(self) -> None:
+        """Test that zero joint angles stack all link offsets vertically."""
+        service: KinematicsService = KinematicsService()
+
+        position = service.compute_tool_center_point_positions(np.zeros(6))
+
+        expected = service.base_position + service.link_offsets.sum(axis=0)
+        np.testing.assert_array_almost_equal(position, expected)
+
+    def test_batched_matches_single(self) -> None:
+        """Test batched computation matches one-at-a-time computation."""
+        service: KinematicsService = KinematicsService()
+        joint_angles = create_random_joint_angles(8)
+
+        batched = service.compute_tool_center_point_positions(joint_angles)
+        single = np.array([service.compute_tool_center_point_positions(angles) for angles in joint_angles])
+
+        assert batched.shape == (8, 3)
+        np.testing.assert_array_almost_equal(batched, single)
+
+    def test_base_rotation_preserves_height(self) -> None:
+        """Test that rotating only the base joint does not change TCP height."""
+        service: KinematicsService = KinematicsService(
+            link_offsets=[[0.0, 0.1, 0.0], [0.0, 0.0, 0.3], [0.0, 0.0, 0.2],
+                          [0.0, 0.0, 0.05], [0.0, 0.0, 0.05], [0.0, 0.0, 0.05]])
+        joint_angles = np.zeros((3, 6))
+        joint_angles[:, 0] = [-60.0, 0.0, 60.0]
+
+        positions = service.compute_tool_center_point_positions(joint_angles)
+
+        np.testing.assert_array_almost_equal(positions[:, 1], positions[1, 1])
+
+    def test_calibration_recovers_true_model(self) -> None:
+        """Test calibration recovers offsets and flipped axis signs from samples."""
+        true_service: KinematicsService = KinematicsService(
+            base_position=[1.0, 0.2, -0.5],
+            link_offsets=[[0.0, 0.12, 0.0], [0.0, 0.3, 0.02], [0.0, 0.25, 0.0],
+                          [0.0, 0.0, 0.08], [0.0, 0.06, 0.0], [0.0, 0.04, 0.0]])
+        joint_angles = create_random_joint_angles(200)
+        flipped_angles = joint_angles.copy()
+        flipped_angles[:, 1] *= -1.0
+        observed_positions = true_service.compute_tool_center_point_positions(flipped_angles)
+
+        fitted_service: KinematicsService = KinematicsService()
+        calibration_error: float = fitted_service.calibrate(joint_angles, observed_positions)
+
+        assert calibration_error < 1e-6
+        assert fitted_service.is_calibrated is True
+        test_angles = create_random_joint_angles(20, seed=1)
+        flipped_test_angles = test_angles.copy()
+        flipped_test_angles[:, 1] *= -1.0
+        np.testing.assert_array_almost_equal(
+            fitted_service.compute_tool_center_point_positions(test_angles),
+            true_service.compute_tool_center_point_positions(flipped_test_angles))
+
+    def test_jacobian_matches_finite_differences(self) -> None:
+        """Test analytical Jacobian against central finite differences."""
+        service: KinematicsService = KinematicsService()
+        joint_angles = create_random_joint_angles(4)
+        step_degrees = 1e-4
+
+        _, jacobians = service.compute_positional_jacobians(joint_angles)
+
+        for joint_index in range(6):
+            offset = np.zeros(6)
+            offset[joint_index] = step_degrees
+            numerical_column = (
+                service.compute_tool_center_point_positions(joint_angles + offset)
+                - service.compute_tool_center_point_positions(joint_angles - offset)
+            ) / (2.0 * step_degrees)
+            np.testing.assert_array_almost_equal(jacobians[:, :, joint_index], numerical_column)
+
+    def test_inverse_kinematics_reaches_reachable_targets(self) -> None:
+        """Test batched IK converges for targets produced by forward kinematics."""
+        service: KinematicsService = KinematicsService()
+        goal_angles = create_random_joint_angles(50) * 0.6
+        goal_angles[:, 5] = 0.0
+        targets = service.compute_tool_center_point_positions(goal_angles)
+
+        solved_angles, errors = service.solve_inverse_kinematics(
+            targets, np.zeros(6), JOINT_ANGLE_LIMITS, active_joint_count=5)
+
+        assert np.all(errors < 1e-3)
+        assert np.all(np.abs(solved_angles) <= JOINT_ANGLE_LIMITS + 1e-9)
+        np.testing.assert_array_equal(solved_angles[:, 5], 0.0)
+
+    def test_calibration_requires_minimum_samples(self) -> None:
+        """Test calibration rejects too few samples."""
+        service: KinematicsService = KinematicsService()
+
+        with pytest.raises(ValueError):
+            service.calibrate(np.zeros((5, 6)), np.zeros((5, 3)))
+
+
+class TestActionSafetyService:
+    """Tests for ActionSafetyService."""
+
+    def create_calibrated_service(self) -> ActionSafetyService:
+        """Create a safety service calibrated on the default kinematics model."""
+        reference_service: KinematicsService = KinematicsService()
+        safety_service: ActionSafetyService = ActionSafetyService(calibration_sample_count=100)
+
+        for joint_angles in create_random_joint_angles(100):
+            safety_service.record_observation(
+                joint_angles, reference_service.compute_tool_center_point_positions(joint_angles))
+
+        return safety_service
+
+    def test_inactive_until_calibrated(self) -> None:
+        """Test that actions pass through unchanged before calibration."""
+        service: ActionSafetyService = ActionSafetyService()
+        deltas = np.array([0.0, 10.0, 10.0, 0.0, 0.0])
+
+        filtered, is_modified = service.filter_joint_deltas(np.zeros(6), deltas, JOINT_ANGLE_LIMITS)
+
+        assert service.is_active is False
+        assert is_modified is False
+        np.testing.assert_array_equal(filtered, deltas)
+
+    def test_activates_after_calibration(self) -> None:
+        """Test that enough accurate samples activate the filter."""
+        service: ActionSafetyService = self.create_calibrated_service()
+
+        assert service.is_active is True
+
+    def test_safe_action_unchanged(self) -> None:
+        """Test that an action keeping the TCP above ground is not modified."""
+        service: ActionSafetyService = self.create_calibrated_service()
+        deltas = np.array([10.0, 5.0, 0.0, 0.0, 0.0])
+
+        filtered, is_modified = service.filter_joint_deltas(np.zeros(6), deltas, JOINT_ANGLE_LIMITS)
+
+        assert is_modified is False
+        np.testing.assert_array_equal(filtered, deltas)
+
+    def test_underground_action_scaled_back(self) -> None:
+        """Test that an action driving the TCP below the base is scaled down."""
+        service: ActionSafetyService = self.create_calibrated_service()
+        kinematics: KinematicsService = service.kinematics_service
+        current_angles = np.array([0.0, 60.0, 60.0, 0.0, 0.0, 0.0])
+        deltas = np.array([0.0, 10.0, 10.0, 0.0, 0.0])
+        assert kinematics.compute_tool_center_point_positions(current_angles + np.append(deltas, 0.0))[1] < 0.02
+
+        filtered, is_modified = service.filter_joint_deltas(current_angles, deltas, JOINT_ANGLE_LIMITS)
+
+        assert is_modified is True
+        assert np.all(np.abs(filtered) < np.abs(deltas) + 1e-12)
+        assert kinematics.compute_tool_center_point_positions(current_angles + np.append(filtered, 0.0))[1] >= 0.02
+        assert service.filtered_action_count == 1
+
+
+class TestDemonstrationService:
+    """Tests for DemonstrationService."""
+
+    def test_generated_shapes_and_ranges(self) -> None:
+        """Test demonstrations use the environment's observation and action layout."""
+        service: DemonstrationService = DemonstrationService(KinematicsService(), JOINT_ANGLE_LIMITS)
+
+        demonstrations = service.generate(50, seed=0)
+
+        observations = demonstrations["observations"]
+        actions = demonstrations["actions"]
+        assert observations.shape[1] == 17
+        assert actions.shape == (len(observations), 7)
+        assert demonstrations["episode_starts"].sum() > 0
+        assert np.all(np.abs(observations) <= 1.0)
+        assert np.all(np.abs(actions) <= 1.0)
+        np.testing.assert_array_equal(actions[:, 6], -1.0)
+
+    def test_trajectories_start_at_home(self) -> None:
+        """Test every trajectory starts from zero joint angles."""
+        service: DemonstrationService = DemonstrationService(KinematicsService(), JOINT_ANGLE_LIMITS)
+
+        demonstrations = service.generate(20, seed=1)
+
+        first_observations = demonstrations["observations"][demonstrations["episode_starts"]]
+        np.testing.assert_array_equal(first_observations[:, :5], 0.0)
+
+    def test_replayed_actions_reach_target(self) -> None:
+        """Test applying a trajectory's actions ends close to the target."""
+        kinematics: KinematicsService = KinematicsService()
+        service: DemonstrationService = DemonstrationService(kinematics, JOINT_ANGLE_LIMITS)
+
+        demonstrations = service.generate(10, seed=2)
+
+        episode_boundaries = np.flatnonzero(demonstrations["episode_starts"])
+        actions = demonstrations["actions"][episode_boundaries[0]:episode_boundaries[1]]
+        first_observation = demonstrations["observations"][episode_boundaries[0]]
+        joint_angles = np.zeros(6)
+        joint_angles[5] = 0.0 if actions[0, 5] < 0 else 90.0
+        initial_position = kinematics.compute_tool_center_point_positions(joint_angles)
+        for action in actions:
+            joint_angles[:5] += action[:5] * 10.0
+        final_position = kinematics.compute_tool_center_point_positions(joint_angles)
+
+        initial_direction = first_observation[10:13]
+        travelled = final_position - initial_position
+        assert np.dot(travelled / np.linalg.norm(travelled), initial_direction) > 0.99
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
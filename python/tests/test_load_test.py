@@ -0,0 +1,82 @@
+"""Tests for the multi-client simulator load test."""
+
+import pytest
+
+from robot_arm.services.load_test_service import LoadTestService
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+
+@pytest.fixture
+def mock_simulator():
+    """Mock simulator whose episodes end by collision after 5 steps."""
+    simulator = MockSimulatorService(episode_length=5)
+    yield simulator
+    simulator.close()
+
+
+def create_stage_result(concurrency: int, p99_milliseconds: float, error_rate: float) -> dict:
+    """Stage result with only the fields capacity is judged on."""
+    return {
+        "concurrency": concurrency,
+        "commands": {"ALL": {"count": 100.0, "p99_milliseconds": p99_milliseconds, "error_rate": error_rate}}
+    }
+
+
+class TestLoadTestService:
+    """Tests for LoadTestService."""
+
+    def test_stages_replay_step_and_reset_mix(self, mock_simulator) -> None:
+        """Test every stage opens its connections and mixes episode resets into the steps."""
+        load_test_service = LoadTestService(
+            port=mock_simulator.port, concurrency_stages=[1, 20], stage_seconds=0.3, episode_length=50, seed=0)
+
+        stage_results = load_test_service.run()
+
+        assert [stage_result["concurrency"] for stage_result in stage_results] == [1, 20]
+        assert [stage_result["connections_opened"] for stage_result in stage_results] == [1, 20]
+        for stage_result in stage_results:
+            commands = stage_result["commands"]
+            assert set(commands) == {"STEP", "RESET", "ALL"}
+            assert commands["ALL"]["error_rate"] == 0.0
+            # Collisions after 5 steps reset episodes well before episode_length
+            assert commands["STEP"]["count"] <= 6 * commands["RESET"]["count"]
+            assert commands["ALL"]["count"] == commands["STEP"]["count"] + commands["RESET"]["count"]
+            assert commands["ALL"]["p50_milliseconds"] <= commands["ALL"]["p99_milliseconds"]
+
+    def test_counts_connection_failures(self, mock_simulator) -> None:
+        """Test a host that refuses connections yields failures rather than an exception."""
+        closed_port = mock_simulator.port
+        mock_simulator.close()
+
+        stage_results = LoadTestService(
+            port=closed_port, concurrency_stages=[3], stage_seconds=0.2, timeout_seconds=0.5).run()
+
+        assert stage_results[0]["connection_failures"] >= 3
+        assert stage_results[0]["connections_opened"] == 0
+        assert stage_results[0]["commands"]["ALL"]["count"] == 0
+        assert stage_results[0]["commands"]["ALL"]["error_rate"] == 1.0
+        assert LoadTestService.find_capacity(stage_results, maximum_error_rate=1.0) == 0
+
+    def test_capacity_stops_at_first_collapsed_stage(self) -> None:
+        """Test capacity is the last stage before latency or errors exceed the limits."""
+        stage_results = [
+            create_stage_result(10, 5.0, 0.0),
+            create_stage_result(100, 20.0, 0.001),
+            create_stage_result(200, 80.0, 0.0),
+            create_stage_result(400, 10.0, 0.0)
+        ]
+
+        assert LoadTestService.find_capacity(stage_results, 50.0, 0.01) == 100
+        assert LoadTestService.find_capacity(stage_results, 10.0, 0.01) == 10
+        assert LoadTestService.find_capacity(stage_results, 1.0, 0.01) == 0
+
+    def test_rejects_empty_stages(self) -> None:
+        """Test stages without connections are refused."""
+        with pytest.raises(ValueError):
+            LoadTestService(concurrency_stages=[])
+        with pytest.raises(ValueError):
+            LoadTestService(concurrency_stages=[10, 0])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
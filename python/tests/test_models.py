@@ -1,14 +1,17 @@
 """Tests for data models."""
 
+import subprocess
 import sys
 import os
 import pytest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from models.observation_model import ObservationModel
-from models.command_model import CommandModel
-from models.reward_components import RewardComponents
-from enums.command_type import CommandType
+from robot_arm.models.observation_model import ObservationModel
+from robot_arm.models.command_model import CommandModel
+from robot_arm.models.reward_components import RewardComponents
+from robot_arm.models.run_configuration_model import RunConfigurationModel
+from robot_arm.models.training_configuration_model import TrainingConfigurationModel
+from robot_arm.enums.command_type import CommandType
+from robot_arm.enums.vectorized_environment_type import VectorizedEnvironmentType
 
 
 class TestObservationModel:
@@ -165,5 +168,63 @@ class TestRewardComponents:
         assert result["total"] == 60.5
 
 
+class TestRunConfigurationModel:
+    """Tests for RunConfigurationModel."""
+
+    def test_round_trip(self) -> None:
+        """Test a run configuration survives to_dictionary and from_dictionary."""
+        run_configuration: RunConfigurationModel = RunConfigurationModel(
+            training_configuration=TrainingConfigurationModel(steps_per_update=512, batch_size=128),
+            environment_count=4,
+            vectorized_environment_type=VectorizedEnvironmentType.SUBPROCESS
+        )
+
+        assert RunConfigurationModel.from_dictionary(run_configuration.to_dictionary()) == run_configuration
+
+    def test_missing_keys_use_defaults(self) -> None:
+        """Test a partial file keeps the default layout and hyperparameters."""
+        run_configuration: RunConfigurationModel = RunConfigurationModel.from_dictionary(
+            {"TrainingConfiguration": {"batch_size": 256}})
+
+        assert run_configuration.environment_count == 1
+        assert run_configuration.vectorized_environment_type == VectorizedEnvironmentType.DUMMY
+        assert run_configuration.training_configuration.batch_size == 256
+        assert run_configuration.training_configuration.steps_per_update == 2048
+
+
+class TestLazyPackages:
+    """Tests for the lazily importing models, services and environments packages."""
+
+    def test_package_exports_load_lazily(self) -> None:
+        """Test package-level imports resolve, and only a model that needs numpy loads it."""
+        completed = subprocess.run(
+            [sys.executable, "-c",
+             "import sys\n"
+             "from robot_arm.models import CommandModel, TrainingConfigurationModel\n"
+             "assert 'numpy' not in sys.modules\n"
+             "from robot_arm.models import *\n"
+             "print(ObservationModel.__name__, RunConfigurationModel.__name__)"],
+            capture_output=True, text=True, timeout=30,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.split() == ["ObservationModel", "RunConfigurationModel"]
+
+    @pytest.mark.parametrize("package_name", ["robot_arm.services", "robot_arm.environments"])
+    def test_every_listed_export_resolves(self, package_name) -> None:
+        """Test star imports of the other lazy packages provide every name in __all__."""
+        pytest.importorskip("gymnasium")
+        completed = subprocess.run(
+            [sys.executable, "-c",
+             f"import {package_name}\n"
+             f"from {package_name} import *\n"
+             f"print(all(name in globals() for name in {package_name}.__all__))"],
+            capture_output=True, text=True, timeout=60,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.split() == ["True"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
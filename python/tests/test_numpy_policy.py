@@ -0,0 +1,177 @@
+"""Tests for the torch-free NumPy policy runtime and exporter."""
+
+import pytest
+import numpy as np
+
+from robot_arm.services.numpy_policy_service import NumpyPolicyService
+from robot_arm.services.policy_export_service import PolicyExportService
+
+
+OBSERVATION_DIMENSION = 17
+ACTION_DIMENSION = 7
+HIDDEN_SIZE = 32
+
+
+def create_policy_parameters(seed: int = 0, normalize_observations: bool = True) -> dict:
+    """Create exported-format parameters for a random two-layer tanh policy."""
+    random_generator = np.random.default_rng(seed)
+
+    return {
+        "format_version": np.array(PolicyExportService.FORMAT_VERSION),
+        "activation": np.array("tanh"),
+        "hidden_layer_count": np.array(2),
+        "hidden_weight_0": random_generator.normal(size=(HIDDEN_SIZE, OBSERVATION_DIMENSION)).astype(np.float32),
+        "hidden_bias_0": random_generator.normal(size=HIDDEN_SIZE).astype(np.float32),
+        "hidden_weight_1": random_generator.normal(size=(HIDDEN_SIZE, HIDDEN_SIZE)).astype(np.float32),
+        "hidden_bias_1": random_generator.normal(size=HIDDEN_SIZE).astype(np.float32),
+        "action_weight": random_generator.normal(size=(ACTION_DIMENSION, HIDDEN_SIZE)).astype(np.float32),
+        "action_bias": random_generator.normal(size=ACTION_DIMENSION).astype(np.float32),
+        "log_std": np.zeros(ACTION_DIMENSION, dtype=np.float32),
+        "action_low": -np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "action_high": np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "normalize_observations": np.array(normalize_observations),
+        "observation_mean": random_generator.normal(size=OBSERVATION_DIMENSION),
+        "observation_variance": random_generator.uniform(0.5, 2.0, size=OBSERVATION_DIMENSION),
+        "observation_clip": np.array(10.0),
+        "observation_epsilon": np.array(1e-8)
+    }
+
+
+def compute_reference_actions(parameters: dict, observations: np.ndarray) -> np.ndarray:
+    """Straightforward reference implementation of the exported policy."""
+    normalized = np.clip(
+        (observations - parameters["observation_mean"])
+        / np.sqrt(parameters["observation_variance"] + parameters["observation_epsilon"]),
+        -10.0, 10.0).astype(np.float32)
+    hidden = np.tanh(normalized @ parameters["hidden_weight_0"].T + parameters["hidden_bias_0"])
+    hidden = np.tanh(hidden @ parameters["hidden_weight_1"].T + parameters["hidden_bias_1"])
+    means = hidden @ parameters["action_weight"].T + parameters["action_bias"]
+    return np.clip(means, -1.0, 1.0)
+
+
+class TestNumpyPolicyService:
+    """Tests for NumpyPolicyService."""
+
+    def test_predict_matches_reference(self) -> None:
+        """Test batched prediction matches the reference forward pass."""
+        parameters = create_policy_parameters()
+        service: NumpyPolicyService = NumpyPolicyService(parameters)
+        observations = np.random.default_rng(1).uniform(-1.0, 1.0, size=(64, OBSERVATION_DIMENSION))
+
+        actions, state = service.predict(observations, deterministic=True)
+
+        assert state is None
+        assert actions.shape == (64, ACTION_DIMENSION)
+        np.testing.assert_allclose(actions, compute_reference_actions(parameters, observations), atol=1e-5)
+
+    def test_single_observation_matches_batch(self) -> None:
+        """Test single-observation prediction returns one unbatched action."""
+        service: NumpyPolicyService = NumpyPolicyService(create_policy_parameters())
+        observations = np.random.default_rng(2).uniform(-1.0, 1.0, size=(4, OBSERVATION_DIMENSION))
+
+        batched_actions, _ = service.predict(observations)
+        single_action, _ = service.predict(observations[2])
+
+        assert single_action.shape == (ACTION_DIMENSION,)
+        np.testing.assert_allclose(single_action, batched_actions[2], atol=1e-6)
+
+    def test_actions_clipped_to_bounds(self) -> None:
+        """Test actions are clipped to the action space bounds."""
+        parameters = create_policy_parameters()
+        parameters["action_bias"] = np.full(ACTION_DIMENSION, 50.0, dtype=np.float32)
+        service: NumpyPolicyService = NumpyPolicyService(parameters)
+
+        actions, _ = service.predict(np.zeros(OBSERVATION_DIMENSION))
+
+        np.testing.assert_array_equal(actions, 1.0)
+
+    def test_without_normalization_passes_observations_through(self) -> None:
+        """Test disabled normalization leaves observations unchanged."""
+        service: NumpyPolicyService = NumpyPolicyService(
+            create_policy_parameters(normalize_observations=False))
+        observations = np.random.default_rng(3).uniform(-1.0, 1.0, size=(3, OBSERVATION_DIMENSION))
+
+        np.testing.assert_allclose(service.normalize_observations(observations), observations, atol=1e-7)
+
+    def test_stochastic_prediction_differs_from_deterministic(self) -> None:
+        """Test sampling adds exploration noise around the mean."""
+        service: NumpyPolicyService = NumpyPolicyService(create_policy_parameters())
+        observations = np.zeros((16, OBSERVATION_DIMENSION))
+
+        deterministic_actions, _ = service.predict(observations, deterministic=True)
+        sampled_actions, _ = service.predict(
+            observations, deterministic=False, random_generator=np.random.default_rng(0))
+
+        assert not np.allclose(deterministic_actions, sampled_actions)
+
+    def test_save_and_load_roundtrip(self, tmp_path) -> None:
+        """Test an exported file loads back to an identical policy."""
+        parameters = create_policy_parameters()
+        export_path = PolicyExportService.save_parameters(parameters, str(tmp_path / "policy.npz"))
+
+        loaded_service: NumpyPolicyService = NumpyPolicyService.load(export_path)
+        observations = np.random.default_rng(4).uniform(-1.0, 1.0, size=(8, OBSERVATION_DIMENSION))
+
+        np.testing.assert_array_equal(
+            loaded_service.predict(observations)[0],
+            NumpyPolicyService(parameters).predict(observations)[0])
+        assert loaded_service.observation_dimension == OBSERVATION_DIMENSION
+        assert loaded_service.action_dimension == ACTION_DIMENSION
+
+
+class TestPolicyExportService:
+    """Tests for PolicyExportService."""
+
+    def test_find_phase_normalizer(self, tmp_path) -> None:
+        """Test phase models pair with normalizer_<phase>.pkl."""
+        (tmp_path / "normalizer_touch.pkl").write_bytes(b"")
+
+        normalizer_path = PolicyExportService.find_normalizer_path(str(tmp_path / "robot_policy_touch.zip"))
+
+        assert normalizer_path == str(tmp_path / "normalizer_touch.pkl")
+
+    def test_find_checkpoint_normalizer(self, tmp_path) -> None:
+        """Test checkpoints pair with the CheckpointCallback VecNormalize file."""
+        (tmp_path / "robot_policy_vecnormalize_10000_steps.pkl").write_bytes(b"")
+
+        normalizer_path = PolicyExportService.find_normalizer_path(str(tmp_path / "robot_policy_10000_steps"))
+
+        assert normalizer_path == str(tmp_path / "robot_policy_vecnormalize_10000_steps.pkl")
+
+    def test_missing_normalizer_returns_none(self, tmp_path) -> None:
+        """Test no normalizer is reported when none is saved."""
+        assert PolicyExportService.find_normalizer_path(str(tmp_path / "robot_policy_grasp")) is None
+
+    def test_checkpoint_without_normalizer_is_not_ready(self, tmp_path) -> None:
+        """Test a checkpoint is not loaded before CheckpointCallback writes its normalizer."""
+        checkpoint_path = tmp_path / "robot_policy_10000_steps.zip"
+        checkpoint_path.write_bytes(b"")
+
+        assert PolicyExportService.is_checkpoint_path(str(checkpoint_path))
+        assert not PolicyExportService.is_checkpoint_path(str(tmp_path / "robot_policy_touch.zip"))
+        with pytest.raises(FileNotFoundError, match="not written yet"):
+            PolicyExportService().load_numpy_policy(str(checkpoint_path))
+
+    def test_export_matches_stable_baselines_predict(self, tmp_path) -> None:
+        """Test the exported runtime reproduces SB3 deterministic predictions."""
+        pytest.importorskip("stable_baselines3")
+        import gymnasium as gym
+        from stable_baselines3 import PPO
+        from stable_baselines3.common.vec_env import DummyVecEnv, VecNormalize
+
+        environment = VecNormalize(DummyVecEnv([lambda: gym.make("Pendulum-v1")]))
+        environment.obs_rms.update(np.random.default_rng(5).normal(size=(100, 3)))
+        model = PPO("MlpPolicy", environment, policy_kwargs=dict(net_arch=[64, 64]), device="cpu")
+
+        export_path = PolicyExportService().export_policy(model.policy, environment, str(tmp_path / "policy.npz"))
+        service: NumpyPolicyService = NumpyPolicyService.load(export_path)
+
+        observations = np.random.default_rng(6).normal(size=(32, 3)).astype(np.float32)
+        expected_actions, _ = model.predict(environment.normalize_obs(observations), deterministic=True)
+        actions, _ = service.predict(observations, deterministic=True)
+
+        np.testing.assert_allclose(actions, expected_actions, atol=1e-5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,99 @@
+"""Tests for the observation-history ring buffer wrapper."""
+
+import pytest
+import numpy as np
+import gymnasium as gym
+from gymnasium import spaces
+
+from robot_arm.environments.observation_history_wrapper import ObservationHistoryWrapper
+
+
+class CountingEnvironment(gym.Env):
+    """Observation is the step count in every field; episodes last episode_length steps."""
+
+    def __init__(self, observation_dimension: int = 3, episode_length: int = 100) -> None:
+        self.observation_space = spaces.Box(low=-1000.0, high=1000.0, shape=(observation_dimension,))
+        self.action_space = spaces.Box(low=-1.0, high=1.0, shape=(1,))
+        self._observation_dimension = observation_dimension
+        self._episode_length = episode_length
+        self._step_count = 0
+
+    def reset(self, *, seed=None, options=None):
+        super().reset(seed=seed)
+        self._step_count = 0
+        return np.zeros(self._observation_dimension, dtype=np.float32), {}
+
+    def step(self, action):
+        self._step_count += 1
+        observation = np.full(self._observation_dimension, self._step_count, dtype=np.float32)
+        return observation, 0.0, False, self._step_count >= self._episode_length, {}
+
+
+class TestObservationHistoryWrapper:
+    """Tests for ObservationHistoryWrapper."""
+
+    def test_stacks_newest_entries_oldest_first(self) -> None:
+        """Test the stacked view holds the last K observations in order across ring wrap-around."""
+        environment = ObservationHistoryWrapper(CountingEnvironment(), history_length=3)
+        observation, _ = environment.reset()
+
+        assert environment.observation_space.shape == (9,)
+        np.testing.assert_array_equal(observation, np.zeros(9))
+
+        for step_index in range(1, 8):
+            observation, _, _, _, _ = environment.step(np.zeros(1))
+            expected_counts = [max(step_index - 2, 0), max(step_index - 1, 0), step_index]
+            np.testing.assert_array_equal(observation, np.repeat(expected_counts, 3))
+
+    def test_stacked_observation_is_a_view(self) -> None:
+        """Test stacking returns a contiguous view of the ring rather than a copy."""
+        environment = ObservationHistoryWrapper(CountingEnvironment(), history_length=50)
+        environment.reset()
+        observation, _, _, _, _ = environment.step(np.zeros(1))
+
+        assert observation.flags["C_CONTIGUOUS"]
+        assert observation.base is not None
+
+    def test_deltas_follow_each_observation(self) -> None:
+        """Test each entry carries its change from the previous observation, zero after reset."""
+        environment = ObservationHistoryWrapper(CountingEnvironment(observation_dimension=2), 2, include_deltas=True)
+        observation, _ = environment.reset()
+        np.testing.assert_array_equal(observation, np.zeros(8))
+
+        environment.step(np.zeros(1))
+        observation, _, _, _, _ = environment.step(np.zeros(1))
+
+        np.testing.assert_array_equal(observation, [1, 1, 1, 1, 2, 2, 1, 1])
+        assert environment.observation_space.shape == (8,)
+        assert environment.observation_space.low[2] == -2000.0
+
+    def test_vectorized_terminal_observation_survives_reset(self) -> None:
+        """Test DummyVecEnv's terminal observation is not overwritten by the automatic reset."""
+        pytest.importorskip("stable_baselines3")
+        from stable_baselines3.common.vec_env import DummyVecEnv, VecNormalize
+
+        vectorized_environment = VecNormalize(DummyVecEnv([
+            lambda: ObservationHistoryWrapper(CountingEnvironment(episode_length=3), history_length=2)
+            for _ in range(2)]))
+        vectorized_environment.reset()
+
+        for _ in range(3):
+            observations, _, dones, informations = vectorized_environment.step(np.zeros((2, 1)))
+
+        assert dones.all()
+        assert observations.shape == (2, 6)
+        np.testing.assert_allclose(
+            vectorized_environment.unnormalize_obs(informations[0]["terminal_observation"]),
+            [2, 2, 2, 3, 3, 3], atol=1e-5)
+
+    def test_rejects_dictionary_observations(self) -> None:
+        """Test goal-conditioned dictionary observations cannot be stacked."""
+        environment = CountingEnvironment()
+        environment.observation_space = spaces.Dict({"observation": spaces.Box(-1.0, 1.0, shape=(3,))})
+
+        with pytest.raises(ValueError, match="Box"):
+            ObservationHistoryWrapper(environment, history_length=2)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,170 @@
+"""Tests for off-policy training and the memory-mapped replay buffer."""
+
+import os
+import pytest
+import numpy as np
+
+from robot_arm.enums.training_algorithm import TrainingAlgorithm
+from robot_arm.models.training_configuration_model import TrainingConfigurationModel
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+pytest.importorskip("stable_baselines3")
+from gymnasium import spaces
+from robot_arm.controllers.memory_mapped_replay_buffer import MemoryMappedReplayBuffer
+
+
+OBSERVATION_SPACE = spaces.Box(low=-1.0, high=1.0, shape=(17,), dtype=np.float32)
+ACTION_SPACE = spaces.Box(low=-1.0, high=1.0, shape=(7,), dtype=np.float32)
+
+
+def create_buffer(storage_directory: str, buffer_size: int = 100, **kwargs) -> MemoryMappedReplayBuffer:
+    """Buffer with the robot's observation and action sizes."""
+    return MemoryMappedReplayBuffer(
+        buffer_size, OBSERVATION_SPACE, ACTION_SPACE, device="cpu", n_envs=2,
+        storage_directory=storage_directory, **kwargs)
+
+
+def add_transitions(replay_buffer: MemoryMappedReplayBuffer, count: int) -> None:
+    """Add count steps of two environments with recognizable values."""
+    for step_index in range(count):
+        replay_buffer.add(
+            np.full((2, 17), step_index, dtype=np.float32),
+            np.full((2, 17), step_index + 1, dtype=np.float32),
+            np.zeros((2, 7), dtype=np.float32),
+            np.array([step_index, -step_index], dtype=np.float32),
+            np.zeros(2, dtype=np.float32),
+            [{}, {"TimeLimit.truncated": True}])
+
+
+class TestMemoryMappedReplayBuffer:
+    """Tests for MemoryMappedReplayBuffer."""
+
+    def test_arrays_are_float32_files(self, tmp_path) -> None:
+        """Test every array is a float32 memory map stored in the directory."""
+        replay_buffer = create_buffer(str(tmp_path))
+
+        for array_name in MemoryMappedReplayBuffer.ARRAY_NAMES:
+            array = getattr(replay_buffer, array_name)
+            assert isinstance(array, np.memmap)
+            assert array.dtype == np.float32
+            assert os.path.exists(tmp_path / f"{array_name}.float32")
+        assert replay_buffer.observations.shape == (50, 2, 17)
+
+    def test_reopening_resumes_after_flush(self, tmp_path) -> None:
+        """Test a flushed buffer reopens with its transitions and write position."""
+        replay_buffer = create_buffer(str(tmp_path))
+        add_transitions(replay_buffer, 10)
+        replay_buffer.flush()
+        del replay_buffer
+
+        reopened_buffer = create_buffer(str(tmp_path))
+
+        assert reopened_buffer.pos == 10
+        assert reopened_buffer.size() == 10
+        np.testing.assert_array_equal(reopened_buffer.rewards[:10, 1], -np.arange(10))
+        np.testing.assert_array_equal(reopened_buffer.timeouts[:10], [[0.0, 1.0]] * 10)
+
+        samples = reopened_buffer.sample(32)
+        np.testing.assert_array_equal(samples.next_observations - samples.observations, 1.0)
+
+    def test_fresh_buffer_ignores_existing_data(self, tmp_path) -> None:
+        """Test resume_existing False starts empty even if a buffer is on disk."""
+        replay_buffer = create_buffer(str(tmp_path))
+        add_transitions(replay_buffer, 10)
+        replay_buffer.flush()
+
+        assert create_buffer(str(tmp_path), resume_existing=False).size() == 0
+        assert create_buffer(str(tmp_path)).size() == 0
+
+    def test_mismatched_shape_rejected(self, tmp_path) -> None:
+        """Test a buffer written with another capacity is not reinterpreted."""
+        create_buffer(str(tmp_path)).flush()
+
+        with pytest.raises(ValueError, match="BufferSize"):
+            create_buffer(str(tmp_path), buffer_size=200)
+
+
+class TestOffPolicyTraining:
+    """Tests for SAC and TD3 through TrainingController."""
+
+    @pytest.mark.parametrize("training_algorithm", [TrainingAlgorithm.SAC, TrainingAlgorithm.TD3])
+    def test_training_resumes_with_replay_buffer(self, tmp_path, training_algorithm) -> None:
+        """Test an off-policy run fills its buffer on disk and a resumed run keeps it."""
+        from robot_arm.controllers.training_controller import TrainingController
+
+        configuration = TrainingConfigurationModel(
+            batch_size=16, network_layer_sizes=[8], replay_buffer_size=1000, learning_starts=20)
+        server = MockSimulatorService(steps_to_target=4, episode_length=30)
+
+        try:
+            controller = TrainingController(
+                server_address=f"tcp://localhost:{server.port}",
+                training_configuration=configuration,
+                output_directory=str(tmp_path),
+                training_algorithm=training_algorithm)
+            controller.initialize_training()
+            outcome = controller.execute_training_steps(60)
+            model_path = controller.save_policy("first")
+            controller.shutdown()
+
+            assert outcome["episode_count"] == 2
+            assert isinstance(controller._model.replay_buffer, MemoryMappedReplayBuffer)
+
+            resumed_controller = TrainingController(
+                server_address=f"tcp://localhost:{server.port}",
+                resume_from_model=model_path,
+                training_configuration=configuration,
+                output_directory=str(tmp_path),
+                training_algorithm=training_algorithm)
+            resumed_controller.initialize_training()
+
+            assert resumed_controller._model.replay_buffer.size() == 60
+            resumed_controller.execute_training_steps(10)
+            assert resumed_controller._model.replay_buffer.size() == 70
+            resumed_controller.shutdown()
+        finally:
+            server.close()
+
+    def test_hindsight_relabeling_with_sac(self, tmp_path) -> None:
+        """Test SAC trains on goal-conditioned observations with a hindsight replay buffer."""
+        from stable_baselines3 import HerReplayBuffer
+        from robot_arm.controllers.training_controller import TrainingController
+
+        configuration = TrainingConfigurationModel(
+            batch_size=16, network_layer_sizes=[8], replay_buffer_size=1000, learning_starts=40)
+        server = MockSimulatorService(steps_to_target=4, episode_length=20)
+
+        try:
+            controller = TrainingController(
+                server_address=f"tcp://localhost:{server.port}",
+                training_configuration=configuration,
+                output_directory=str(tmp_path),
+                training_algorithm=TrainingAlgorithm.SAC,
+                use_goal_relabeling=True)
+            controller.initialize_training()
+            outcome = controller.execute_training_steps(60)
+            controller.save_policy("goal")
+            controller.shutdown()
+
+            assert isinstance(controller._model.replay_buffer, HerReplayBuffer)
+            assert outcome["episode_count"] == 3
+        finally:
+            server.close()
+
+    def test_hindsight_relabeling_requires_off_policy(self) -> None:
+        """Test PPO cannot be combined with hindsight relabeling."""
+        from robot_arm.controllers.training_controller import TrainingController
+
+        with pytest.raises(ValueError, match="off-policy"):
+            TrainingController(use_goal_relabeling=True)
+
+    def test_asynchronous_mode_requires_ppo(self) -> None:
+        """Test off-policy algorithms cannot be combined with the asynchronous learner."""
+        from robot_arm.controllers.training_controller import TrainingController
+
+        with pytest.raises(ValueError, match="PPO"):
+            TrainingController(use_asynchronous_training=True, training_algorithm=TrainingAlgorithm.SAC)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,125 @@
+"""Tests for the background-loading policy cache."""
+
+import os
+import threading
+import pytest
+import numpy as np
+
+from robot_arm.services.policy_cache_service import PolicyCacheService
+from tests.test_evaluation import save_policy
+
+
+class SizedPolicy:
+    """Stand-in policy reporting a fixed parameter size."""
+
+    def __init__(self, path: str, parameter_bytes: int) -> None:
+        self.path = path
+        self.parameter_bytes = parameter_bytes
+
+
+def create_model_files(directory, count: int):
+    """Empty files standing in for exported models."""
+    paths = []
+    for model_index in range(count):
+        path = directory / f"robot_policy_{model_index}.npz"
+        path.write_bytes(b"")
+        paths.append(str(path))
+    return paths
+
+
+class TestPolicyCacheService:
+    """Tests for PolicyCacheService."""
+
+    def test_cached_policy_returned_without_loading(self, tmp_path) -> None:
+        """Test a second request for the same file is served from the cache."""
+        load_calls = []
+        cache = PolicyCacheService(loader=lambda path: load_calls.append(path) or SizedPolicy(path, 10))
+        model_path, = create_model_files(tmp_path, 1)
+
+        first_policy = cache.load(model_path)
+
+        assert cache.get(model_path) is first_policy
+        assert cache.load_async(model_path).done()
+        assert len(load_calls) == 1
+
+    def test_least_recently_used_evicted_over_memory_budget(self, tmp_path) -> None:
+        """Test loading past the byte budget evicts the policy used longest ago."""
+        cache = PolicyCacheService(maximum_bytes=250, loader=lambda path: SizedPolicy(path, 100))
+        first_path, second_path, third_path = create_model_files(tmp_path, 3)
+
+        cache.load(first_path)
+        cache.load(second_path)
+        cache.get(first_path)
+        cache.load(third_path)
+
+        assert cache.get(second_path) is None
+        assert cache.cached_paths == [first_path, third_path]
+        assert cache.cached_bytes == 200
+
+    def test_concurrent_requests_share_one_load(self, tmp_path) -> None:
+        """Test requests made while a load is in flight wait for that load."""
+        release_load = threading.Event()
+        load_calls = []
+
+        def blocking_loader(path: str) -> SizedPolicy:
+            load_calls.append(path)
+            release_load.wait(timeout=5.0)
+            return SizedPolicy(path, 10)
+
+        cache = PolicyCacheService(loader=blocking_loader)
+        model_path, = create_model_files(tmp_path, 1)
+
+        first_future = cache.load_async(model_path)
+        second_future = cache.load_async(model_path)
+        assert not first_future.done()
+
+        release_load.set()
+
+        assert first_future.result(timeout=5.0) is second_future.result(timeout=5.0)
+        assert len(load_calls) == 1
+
+    def test_modified_file_is_reloaded(self, tmp_path) -> None:
+        """Test a re-exported file is not served from a stale entry."""
+        cache = PolicyCacheService(loader=lambda path: SizedPolicy(path, 10))
+        model_path, = create_model_files(tmp_path, 1)
+
+        first_policy = cache.load(model_path)
+        os.utime(model_path, (0, os.path.getmtime(model_path) + 10))
+
+        assert cache.get(model_path) is None
+        assert cache.load(model_path) is not first_policy
+
+    def test_failed_load_is_not_cached(self, tmp_path) -> None:
+        """Test a loader error reaches the caller and a retry loads again."""
+        attempts = []
+
+        def failing_loader(path: str) -> SizedPolicy:
+            attempts.append(path)
+            raise ValueError("corrupt export")
+
+        cache = PolicyCacheService(loader=failing_loader)
+        model_path, = create_model_files(tmp_path, 1)
+
+        with pytest.raises(ValueError, match="corrupt"):
+            cache.load(model_path)
+        with pytest.raises(ValueError):
+            cache.load(model_path)
+
+        assert len(attempts) == 2
+        assert cache.cached_bytes == 0
+
+    def test_default_loader_pairs_exported_policy(self, tmp_path) -> None:
+        """Test the default loader returns NumPy policies sized by their parameters."""
+        model_path = save_policy(str(tmp_path / "robot_policy_touch.npz"), seed=0)
+        cache = PolicyCacheService()
+
+        policy = cache.load(model_path)
+        action, _ = policy.predict(np.zeros(17, dtype=np.float32))
+
+        assert action.shape == (7,)
+        assert cache.cached_bytes == policy.parameter_bytes
+        cache.shutdown()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,113 @@
+"""Tests for distilling a policy into a smaller student network."""
+
+import pytest
+import numpy as np
+
+from robot_arm.services.numpy_policy_service import NumpyPolicyService
+from robot_arm.services.policy_export_service import PolicyExportService
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+pytest.importorskip("torch")
+from robot_arm.services.policy_distillation_service import PolicyDistillationService
+
+
+OBSERVATION_DIMENSION = 17
+ACTION_DIMENSION = 7
+
+
+def create_teacher_parameters(hidden_layer_sizes=(256, 256), seed: int = 0) -> dict:
+    """Random tanh teacher with observation normalization, like a PPO export."""
+    random_generator = np.random.default_rng(seed)
+    layer_sizes = [OBSERVATION_DIMENSION] + list(hidden_layer_sizes)
+    parameters = {
+        "format_version": np.array(PolicyExportService.FORMAT_VERSION),
+        "activation": np.array("tanh"),
+        "hidden_layer_count": np.array(len(hidden_layer_sizes)),
+        "action_weight": random_generator.normal(
+            scale=0.5 / np.sqrt(layer_sizes[-1]), size=(ACTION_DIMENSION, layer_sizes[-1])).astype(np.float32),
+        "action_bias": np.zeros(ACTION_DIMENSION, dtype=np.float32),
+        "log_std": np.full(ACTION_DIMENSION, -1.0, dtype=np.float32),
+        "action_low": -np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "action_high": np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "normalize_observations": np.array(True),
+        "observation_mean": random_generator.normal(scale=0.1, size=OBSERVATION_DIMENSION),
+        "observation_variance": np.full(OBSERVATION_DIMENSION, 0.25),
+        "observation_clip": np.array(10.0),
+        "observation_epsilon": np.array(1e-8)
+    }
+
+    for layer_index, (input_size, output_size) in enumerate(zip(layer_sizes[:-1], layer_sizes[1:])):
+        parameters[f"hidden_weight_{layer_index}"] = random_generator.normal(
+            scale=1.0 / np.sqrt(input_size), size=(output_size, input_size)).astype(np.float32)
+        parameters[f"hidden_bias_{layer_index}"] = np.zeros(output_size, dtype=np.float32)
+
+    return parameters
+
+
+class TestPolicyDistillationService:
+    """Tests for PolicyDistillationService."""
+
+    def test_student_matches_teacher_actions(self) -> None:
+        """Test a small student predicts the teacher far better than its mean action does."""
+        teacher = NumpyPolicyService(create_teacher_parameters())
+        observations = np.random.default_rng(1).uniform(-1.0, 1.0, size=(4000, OBSERVATION_DIMENSION))
+        teacher_actions = teacher.predict(observations)[0]
+        mean_action_error = np.abs(teacher_actions - teacher_actions.mean(axis=0)).mean()
+
+        student, statistics = PolicyDistillationService(hidden_layer_sizes=(32,), seed=0).distill(
+            teacher, observations.astype(np.float32))
+
+        assert statistics["mean_absolute_action_error"] < 0.5 * mean_action_error
+        assert statistics["student_parameter_bytes"] < statistics["teacher_parameter_bytes"] / 10
+        assert student.parameters["hidden_weight_0"].shape == (32, OBSERVATION_DIMENSION)
+        np.testing.assert_array_equal(student.parameters["observation_mean"], teacher.parameters["observation_mean"])
+
+    def test_student_round_trips_through_export(self, tmp_path) -> None:
+        """Test an exported student loads with NumpyPolicyService and predicts the same actions."""
+        teacher = NumpyPolicyService(create_teacher_parameters(hidden_layer_sizes=(16,)))
+        observations = np.random.default_rng(2).uniform(-1.0, 1.0, size=(500, OBSERVATION_DIMENSION))
+        student, _ = PolicyDistillationService(hidden_layer_sizes=(8, 8), epochs=2, seed=0).distill(
+            teacher, observations.astype(np.float32))
+
+        student_path = PolicyExportService.save_parameters(student.parameters, str(tmp_path / "student.npz"))
+        loaded_student = NumpyPolicyService.load(student_path)
+
+        np.testing.assert_allclose(
+            loaded_student.predict(observations[:10])[0], student.predict(observations[:10])[0], atol=1e-6)
+
+    def test_unsupported_activation_rejected(self) -> None:
+        """Test activations the NumPy runtime cannot reproduce are refused."""
+        with pytest.raises(ValueError, match="activation"):
+            PolicyDistillationService(activation="gelu")
+
+
+class TestDistillationController:
+    """Tests for DistillationController."""
+
+    def test_records_distills_and_evaluates(self, tmp_path) -> None:
+        """Test the pipeline records teacher states, exports a student and evaluates both."""
+        from robot_arm.controllers.distillation_controller import DistillationController
+
+        teacher_path = PolicyExportService.save_parameters(
+            create_teacher_parameters(hidden_layer_sizes=(16,)), str(tmp_path / "robot_policy_touch.npz"))
+        server = MockSimulatorService(steps_to_target=4, episode_length=10)
+
+        try:
+            controller = DistillationController(
+                teacher_path, server_address=f"tcp://localhost:{server.port}", maximum_episode_steps=10)
+            states_path = controller.record_states(3, str(tmp_path / "states.npz"))
+            student_path, statistics = controller.distill(states_path, hidden_layer_sizes=(8,))
+            results = controller.evaluate_parity(
+                student_path, [server.port], episodes=2, cache_path=str(tmp_path / "cache.json"))
+        finally:
+            server.close()
+
+        assert PolicyDistillationService.load_states(states_path).shape == (30, OBSERVATION_DIMENSION)
+        assert student_path == str(tmp_path / "robot_policy_touch_student.npz")
+        assert "mean_absolute_action_error" in statistics
+        assert results["teacher"].episode_count == 2
+        assert results["student"].episode_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,249 @@
+"""Tests for the batching policy server and its client."""
+
+import os
+import socket
+import threading
+import time
+import pytest
+import numpy as np
+
+from robot_arm.services.message_framing_service import MessageFramingService
+from robot_arm.services.numpy_policy_service import NumpyPolicyService
+from robot_arm.services.policy_client_service import PolicyClientService
+from robot_arm.services.policy_export_service import PolicyExportService
+from robot_arm.services.policy_server_service import PolicyServerService
+
+
+OBSERVATION_DIMENSION = 17
+ACTION_DIMENSION = 7
+HIDDEN_SIZE = 16
+
+
+def save_policy(path: str, seed: int, observation_dimension: int = OBSERVATION_DIMENSION) -> str:
+    """Save a random one-layer exported policy and return its path."""
+    random_generator = np.random.default_rng(seed)
+    parameters = {
+        "format_version": np.array(PolicyExportService.FORMAT_VERSION),
+        "activation": np.array("tanh"),
+        "hidden_layer_count": np.array(1),
+        "hidden_weight_0": random_generator.normal(size=(HIDDEN_SIZE, observation_dimension)).astype(np.float32),
+        "hidden_bias_0": random_generator.normal(size=HIDDEN_SIZE).astype(np.float32),
+        "action_weight": random_generator.normal(size=(ACTION_DIMENSION, HIDDEN_SIZE)).astype(np.float32),
+        "action_bias": random_generator.normal(size=ACTION_DIMENSION).astype(np.float32),
+        "log_std": np.zeros(ACTION_DIMENSION, dtype=np.float32),
+        "action_low": -np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "action_high": np.ones(ACTION_DIMENSION, dtype=np.float32),
+        "normalize_observations": np.array(False),
+        "observation_mean": np.zeros(observation_dimension),
+        "observation_variance": np.ones(observation_dimension),
+        "observation_clip": np.array(np.inf),
+        "observation_epsilon": np.array(0.0)
+    }
+    return PolicyExportService.save_parameters(parameters, path)
+
+
+@pytest.fixture
+def policy_server(tmp_path):
+    """Start a server on a free port with a generous batching window."""
+    model_path = save_policy(str(tmp_path / "robot_policy_touch.npz"), seed=0)
+    server = PolicyServerService(model_path, port=0, maximum_batch_latency_seconds=0.05)
+    server.start()
+    yield server
+    server.stop()
+
+
+def connect_client(server: PolicyServerService) -> PolicyClientService:
+    """Connect a client to the given server."""
+    client = PolicyClientService(port=server.port)
+    client.connect()
+    return client
+
+
+class TestPolicyServerService:
+    """Tests for PolicyServerService."""
+
+    def test_predict_matches_local_policy(self, policy_server, tmp_path) -> None:
+        """Test served actions match running the exported policy locally."""
+        local_policy = NumpyPolicyService.load(str(tmp_path / "robot_policy_touch.npz"))
+        observations = np.random.default_rng(1).uniform(-1.0, 1.0, size=(5, OBSERVATION_DIMENSION))
+        client = connect_client(policy_server)
+
+        batched_actions, state = client.predict(observations)
+        single_action, _ = client.predict(observations[3])
+        client.disconnect()
+
+        assert state is None
+        assert batched_actions.shape == (5, ACTION_DIMENSION)
+        assert single_action.shape == (ACTION_DIMENSION,)
+        np.testing.assert_allclose(batched_actions, local_policy.predict(observations)[0], atol=1e-6)
+        np.testing.assert_allclose(single_action, batched_actions[3], atol=1e-6)
+
+    def test_concurrent_requests_are_batched(self, policy_server) -> None:
+        """Test simultaneous clients share forward passes and get their own results."""
+        client_count = 8
+        observations = np.random.default_rng(2).uniform(-1.0, 1.0, size=(client_count, OBSERVATION_DIMENSION))
+        expected_actions, _ = connect_client(policy_server).predict(observations)
+        requests_before = policy_server.statistics["requests"]
+        batches_before = policy_server.statistics["batches"]
+
+        clients = [connect_client(policy_server) for _ in range(client_count)]
+        results = [None] * client_count
+        start_barrier = threading.Barrier(client_count)
+
+        def request_action(client_index: int) -> None:
+            start_barrier.wait()
+            results[client_index] = clients[client_index].predict(observations[client_index])[0]
+
+        threads = [threading.Thread(target=request_action, args=(index,)) for index in range(client_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+        for client in clients:
+            client.disconnect()
+
+        statistics = policy_server.statistics
+        assert statistics["requests"] - requests_before == client_count
+        assert statistics["batches"] - batches_before < client_count
+        np.testing.assert_allclose(np.stack(results), expected_actions, atol=1e-6)
+
+    def test_load_swaps_model_version(self, policy_server, tmp_path) -> None:
+        """Test a LOAD request swaps weights and bumps the version."""
+        new_model_path = save_policy(str(tmp_path / "robot_policy_grasp.npz"), seed=7)
+        observation = np.zeros(OBSERVATION_DIMENSION)
+        client = connect_client(policy_server)
+
+        old_action, _ = client.predict(observation)
+        old_version = client.last_model_version
+        new_version = client.load_model(new_model_path)
+        new_action, _ = client.predict(observation)
+
+        assert new_version == old_version + 1
+        assert client.last_model_version == new_version
+        assert client.get_information()["ModelPath"] == new_model_path
+        assert not np.allclose(old_action, new_action)
+        client.disconnect()
+
+    def test_load_rejects_mismatched_dimensions(self, policy_server, tmp_path) -> None:
+        """Test a model with a different observation size is refused and the old one kept."""
+        mismatched_path = save_policy(str(tmp_path / "other_policy.npz"), seed=3, observation_dimension=5)
+        client = connect_client(policy_server)
+
+        with pytest.raises(RuntimeError, match="Model load failed"):
+            client.load_model(mismatched_path)
+
+        assert client.get_information()["ModelVersion"] == 1
+        client.disconnect()
+
+    def test_invalid_observation_returns_error(self, policy_server) -> None:
+        """Test a wrongly sized observation is reported without killing the connection."""
+        client = connect_client(policy_server)
+
+        with pytest.raises(RuntimeError, match="Observations must have shape"):
+            client.predict(np.zeros(3))
+
+        actions, _ = client.predict(np.zeros(OBSERVATION_DIMENSION))
+        assert actions.shape == (ACTION_DIMENSION,)
+        client.disconnect()
+
+    def test_ragged_observations_return_error(self, policy_server) -> None:
+        """Test ragged or non-numeric observation lists get an error reply on a live connection."""
+        with socket.create_connection(("localhost", policy_server.port), timeout=5.0) as connection:
+            for observations in ([[0.0] * OBSERVATION_DIMENSION, [0.0]], ["a"] * OBSERVATION_DIMENSION):
+                MessageFramingService.send_message(connection, {"Type": "PREDICT", "Observations": observations})
+                assert "Observations must have shape" in MessageFramingService.receive_message(connection)["Error"]
+
+            MessageFramingService.send_message(
+                connection, {"Type": "PREDICT", "Observations": [0.0] * OBSERVATION_DIMENSION})
+            assert len(MessageFramingService.receive_message(connection)["Actions"]) == ACTION_DIMENSION
+
+    def test_prediction_failure_keeps_batching_thread_alive(self, policy_server, monkeypatch) -> None:
+        """Test an unexpected exception from predict is reported and later requests are still served."""
+        original_predict = NumpyPolicyService.predict
+        failures = [TypeError("broken weights")]
+
+        def failing_predict(policy, *args, **kwargs):
+            if failures:
+                raise failures.pop()
+            return original_predict(policy, *args, **kwargs)
+
+        monkeypatch.setattr(NumpyPolicyService, "predict", failing_predict)
+        client = connect_client(policy_server)
+
+        with pytest.raises(RuntimeError, match="broken weights"):
+            client.predict(np.zeros(OBSERVATION_DIMENSION))
+
+        actions, _ = client.predict(np.zeros(OBSERVATION_DIMENSION))
+        assert actions.shape == (ACTION_DIMENSION,)
+        client.disconnect()
+
+    def test_watch_directory_picks_up_newest_checkpoint(self, tmp_path) -> None:
+        """Test the watcher hot-swaps when a newer policy file appears."""
+        models_directory = tmp_path / "models"
+        models_directory.mkdir()
+        first_path = save_policy(str(models_directory / "robot_policy_touch.npz"), seed=0)
+        server = PolicyServerService(
+            str(models_directory), port=0, watch_for_updates=True, watch_interval_seconds=0.05)
+        server.start()
+
+        try:
+            assert server.model_version == 1
+            second_path = save_policy(str(models_directory / "robot_policy_grasp.npz"), seed=1)
+            os.utime(second_path, (os.path.getmtime(first_path) + 10.0,) * 2)
+
+            deadline = time.time() + 5.0
+            while server.model_version == 1 and time.time() < deadline:
+                time.sleep(0.05)
+
+            assert server.model_version == 2
+            client = connect_client(server)
+            assert client.get_information()["ModelPath"] == second_path
+            client.disconnect()
+        finally:
+            server.stop()
+
+    def test_watcher_survives_rotation_and_skips_broken_file(self, tmp_path, monkeypatch, capsys) -> None:
+        """Test a vanished checkpoint does not stop the watcher and a broken one is reported once."""
+        models_directory = tmp_path / "models"
+        models_directory.mkdir()
+        first_path = save_policy(str(models_directory / "robot_policy_touch.npz"), seed=0)
+        server = PolicyServerService(
+            str(models_directory), port=0, watch_for_updates=True, watch_interval_seconds=0.02)
+        resolve_model_file = server._resolve_model_file
+        call_count = [0]
+
+        # The first call loads the initial policy, the second is the watcher's first poll
+        def rotate_once(model_path):
+            call_count[0] += 1
+            if call_count[0] == 2:
+                raise FileNotFoundError("checkpoint rotated away")
+            return resolve_model_file(model_path)
+
+        monkeypatch.setattr(server, "_resolve_model_file", rotate_once)
+        server.start()
+
+        try:
+            broken_path = models_directory / "robot_policy_grasp.npz"
+            broken_path.write_bytes(b"not a policy")
+            os.utime(broken_path, (os.path.getmtime(first_path) + 10.0,) * 2)
+            time.sleep(0.3)
+
+            assert call_count[0] > 2
+            assert server.model_version == 1
+            assert capsys.readouterr().out.count("skipping") == 1
+
+            save_policy(str(broken_path), seed=1)
+            os.utime(broken_path, (os.path.getmtime(first_path) + 20.0,) * 2)
+
+            deadline = time.time() + 5.0
+            while server.model_version == 1 and time.time() < deadline:
+                time.sleep(0.02)
+
+            assert server.model_version == 2
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
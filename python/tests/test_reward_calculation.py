@@ -1,17 +1,10 @@
 """Tests for reward calculation service."""
 
-import sys
-import os
 import pytest
 import numpy as np
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from models.observation_model import ObservationModel
-
-
-# Import RewardCalculationService directly to avoid network_service import
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'services'))
-from reward_calculation_service import RewardCalculationService
+from robot_arm.models.observation_model import ObservationModel
+from robot_arm.services.reward_calculation_service import RewardCalculationService
 
 
 class TestRewardCalculationService:
@@ -225,5 +218,35 @@ class TestRewardCalculationService:
         assert info["reward_components"]["alignment"] == 0.0
 
 
+    def test_goal_rewards_vectorized(self) -> None:
+        """Test goal rewards for a batch of substitute goals, including goal-independent penalties."""
+        service: RewardCalculationService = RewardCalculationService()
+        achieved_goals = np.zeros((3, 3))
+        desired_goals = np.array([[0.1, 0.0, 0.0], [1.0, 0.0, 0.0], [0.1, 0.0, 0.0]])
+        informations = [{}, {}, {"collision": True}]
+
+        rewards = service.calculate_goal_rewards(achieved_goals, desired_goals, informations)
+
+        survival = service.SURVIVAL_REWARD
+        np.testing.assert_allclose(rewards, [
+            service.GRASP_SUCCESS_REWARD + survival,
+            survival,
+            service.GRASP_SUCCESS_REWARD + survival + service.COLLISION_PENALTY_VALUE
+        ], rtol=1e-6)
+
+
+    def test_rebaseline_target_measures_new_progress(self) -> None:
+        """Test distance progress after a new target is relative to the new target."""
+        service: RewardCalculationService = RewardCalculationService()
+        service.reset_state(self.create_observation(distance=1.0))
+        service.calculate_reward(self.create_observation(distance=0.2))
+
+        service.rebaseline_target(self.create_observation(distance=1.5))
+        reward, terminated, info = service.calculate_reward(self.create_observation(distance=1.4))
+
+        assert info["reward_components"]["distance"] == pytest.approx(0.1 * service.DISTANCE_REWARD_SCALE)
+        assert terminated is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
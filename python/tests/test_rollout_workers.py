@@ -0,0 +1,193 @@
+"""Tests for streaming rollout segments from remote workers to the learner."""
+
+import queue
+import threading
+import time
+import pytest
+import numpy as np
+from typing import Optional
+
+from robot_arm.models.rollout_segment_model import RolloutSegmentModel
+
+ENVIRONMENT_OPTIONS = {"ObservationHistoryLength": 3, "ObservationDeltas": True}
+
+
+def create_segment(steps: int = 8, environments: int = 2, observation_dimension: int = 17) -> RolloutSegmentModel:
+    """Random segment with the environment's observation and action sizes."""
+    random_generator = np.random.default_rng(0)
+    return RolloutSegmentModel(
+        observations=random_generator.normal(size=(steps, environments, observation_dimension)).astype(np.float32),
+        actions=random_generator.normal(size=(steps, environments, 7)).astype(np.float32),
+        rewards=random_generator.normal(size=(steps, environments)).astype(np.float32),
+        dones=np.zeros((steps, environments), dtype=np.float32),
+        behavior_log_probabilities=random_generator.normal(size=(steps, environments)).astype(np.float32),
+        truncation_mask=np.zeros((steps, environments), dtype=np.float32),
+        terminal_observations=np.zeros((steps, environments, observation_dimension), dtype=np.float32),
+        last_observations=random_generator.normal(size=(environments, observation_dimension)).astype(np.float32),
+        policy_version=5,
+        is_normalized=False
+    )
+
+
+class TestRolloutSegmentModel:
+    """Tests for RolloutSegmentModel serialization."""
+
+    def test_compressed_round_trip(self) -> None:
+        """Test every array and flag survives compression."""
+        segment = create_segment()
+
+        restored_segment = RolloutSegmentModel.from_compressed_bytes(segment.to_compressed_bytes())
+
+        for field_name in RolloutSegmentModel.ARRAY_FIELD_NAMES:
+            np.testing.assert_array_equal(getattr(restored_segment, field_name), getattr(segment, field_name))
+        assert restored_segment.policy_version == 5
+        assert restored_segment.is_normalized is False
+        assert restored_segment.step_count == 16
+
+
+class TestRolloutWorkers:
+    """Tests for RolloutServerService and RolloutWorkerService on a Gymnasium task."""
+
+    @pytest.fixture
+    def learner_setup(self):
+        """Learner with a normalized Pendulum model and a rollout server on a free port."""
+        pytest.importorskip("stable_baselines3")
+        from stable_baselines3 import PPO
+        from stable_baselines3.common.env_util import make_vec_env
+        from stable_baselines3.common.vec_env import VecNormalize
+        from robot_arm.services.asynchronous_learner_service import AsynchronousLearnerService
+        from robot_arm.services.rollout_server_service import RolloutServerService
+
+        environment = VecNormalize(make_vec_env("Pendulum-v1", n_envs=1, seed=0))
+        environment.reset()
+        model = PPO("MlpPolicy", environment, n_steps=64, batch_size=32, n_epochs=1,
+                    policy_kwargs=dict(net_arch=[16]), seed=0, device="cpu")
+        learner = AsynchronousLearnerService(model, normalizer=environment)
+        segment_queue = queue.Queue(maxsize=2)
+        rollout_server = RolloutServerService(
+            segment_queue, host="localhost", port=0, environment_options=ENVIRONMENT_OPTIONS)
+        rollout_server.publish_policy(
+            learner.create_policy_snapshot(include_normalization=True).parameters, learner.policy_version)
+        rollout_server.start()
+
+        yield learner, segment_queue, rollout_server
+
+        rollout_server.stop()
+        environment.close()
+
+    @staticmethod
+    def create_worker(rollout_server, seed: int, environment_options: Optional[dict] = None):
+        """Worker stepping its own raw Pendulum environments."""
+        from stable_baselines3.common.env_util import make_vec_env
+        from robot_arm.services.rollout_worker_service import RolloutWorkerService
+
+        return RolloutWorkerService(
+            make_vec_env("Pendulum-v1", n_envs=2, seed=seed),
+            "localhost",
+            rollout_server.port,
+            segment_steps=16,
+            worker_name=f"worker-{seed}",
+            seed=seed,
+            environment_options=environment_options)
+
+    @staticmethod
+    def train_and_publish(learner, segment_queue, rollout_server) -> dict:
+        """Train on the next queued segment and publish the new weights."""
+        statistics = learner.train_on_segment(segment_queue.get(timeout=10.0))
+        rollout_server.publish_policy(
+            learner.create_policy_snapshot(include_normalization=True).parameters, learner.policy_version)
+        return statistics
+
+    def test_workers_join_and_leave_mid_run(self, learner_setup) -> None:
+        """Test a second worker can join after the first leaves, and both receive fresh weights."""
+        learner, segment_queue, rollout_server = learner_setup
+
+        first_worker = self.create_worker(rollout_server, seed=1)
+        first_worker.connect()
+        assert rollout_server.connected_worker_count == 1
+
+        first_thread = threading.Thread(target=first_worker.run, kwargs={"maximum_segments": 2})
+        first_thread.start()
+        for _ in range(2):
+            self.train_and_publish(learner, segment_queue, rollout_server)
+        first_thread.join(timeout=10.0)
+
+        deadline = time.time() + 5.0
+        while rollout_server.connected_worker_count > 0 and time.time() < deadline:
+            time.sleep(0.01)
+        assert rollout_server.connected_worker_count == 0
+        assert first_worker.sent_segment_count == 2
+
+        second_worker = self.create_worker(rollout_server, seed=2)
+        second_worker.connect()
+        assert second_worker.worker_id == 1
+        assert second_worker.policy_version == learner.policy_version
+
+        second_thread = threading.Thread(target=second_worker.run, kwargs={"maximum_segments": 2})
+        second_thread.start()
+        for _ in range(2):
+            statistics = self.train_and_publish(learner, segment_queue, rollout_server)
+        second_thread.join(timeout=10.0)
+
+        assert learner.policy_version == 4
+        assert rollout_server.received_segment_count == 4
+        assert rollout_server.received_byte_count == first_worker.sent_byte_count + second_worker.sent_byte_count
+        assert np.isfinite(statistics["value_loss"])
+
+    def test_raw_segments_are_normalized_by_learner(self, learner_setup) -> None:
+        """Test remote observations are normalized with the learner's statistics before training."""
+        learner, segment_queue, rollout_server = learner_setup
+        worker = self.create_worker(rollout_server, seed=3)
+        worker.connect()
+
+        worker_thread = threading.Thread(target=worker.run, kwargs={"maximum_segments": 1})
+        worker_thread.start()
+        raw_segment = segment_queue.get(timeout=10.0)
+        worker_thread.join(timeout=10.0)
+
+        normalized_segment = learner.normalize_segment(raw_segment)
+
+        assert raw_segment.is_normalized is False
+        assert normalized_segment.is_normalized is True
+        assert np.abs(normalized_segment.observations).max() <= 10.0
+        assert not np.allclose(normalized_segment.observations, raw_segment.observations)
+
+    def test_workers_receive_learner_environment_options(self, learner_setup) -> None:
+        """Test options are served before joining and a worker built with other options is refused."""
+        from robot_arm.services.rollout_worker_service import RolloutWorkerService
+        learner, segment_queue, rollout_server = learner_setup
+
+        environment_options = RolloutWorkerService.fetch_environment_options("localhost", rollout_server.port)
+        assert environment_options == ENVIRONMENT_OPTIONS
+
+        matching_worker = self.create_worker(rollout_server, seed=4, environment_options=environment_options)
+        matching_worker.connect()
+        matching_worker.disconnect()
+
+        mismatched_worker = self.create_worker(
+            rollout_server, seed=5, environment_options={**environment_options, "ObservationDeltas": False})
+        with pytest.raises(RuntimeError):
+            mismatched_worker.connect()
+
+    def test_segments_dropped_at_shutdown_are_not_counted(self) -> None:
+        """Test a segment that never reached the full queue is left out of the received counts."""
+        from robot_arm.services.rollout_server_service import RolloutServerService
+
+        segment_queue = queue.Queue(maxsize=1)
+        segment_queue.put(create_segment())
+        rollout_server = RolloutServerService(segment_queue, host="localhost", port=0)
+        rollout_server.publish_policy({"weights": np.zeros(2)}, 0)
+        rollout_server.start()
+
+        enqueue_thread = threading.Thread(target=rollout_server._enqueue_segment, args=(create_segment(), 100))
+        enqueue_thread.start()
+        time.sleep(0.1)
+        rollout_server.stop()
+        enqueue_thread.join(timeout=5.0)
+
+        assert rollout_server.received_segment_count == 0
+        assert rollout_server.received_byte_count == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
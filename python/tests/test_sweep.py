@@ -0,0 +1,113 @@
+"""Tests for training configuration and the successive-halving sweep."""
+
+import os
+import json
+import pytest
+
+from robot_arm.controllers.sweep_controller import SweepController
+from robot_arm.models.training_configuration_model import TrainingConfigurationModel
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+
+TINY_SEARCH_SPACE = {
+    "learning_rate": {"low": 1e-4, "high": 1e-3, "log": True},
+    "steps_per_update": [16],
+    "batch_size": [16],
+    "training_epochs": [1],
+    "network_layer_sizes": [[8]]
+}
+
+
+class TestTrainingConfigurationModel:
+    """Tests for TrainingConfigurationModel."""
+
+    def test_round_trip_keeps_defaults(self) -> None:
+        """Test partial dictionaries fill in defaults and round-trip."""
+        configuration = TrainingConfigurationModel.from_dictionary({"learning_rate": 1e-4})
+
+        assert configuration.learning_rate == 1e-4
+        assert configuration.steps_per_update == TrainingConfigurationModel().steps_per_update
+        assert TrainingConfigurationModel.from_dictionary(configuration.to_dictionary()) == configuration
+
+    def test_unknown_key_rejected(self) -> None:
+        """Test misspelled hyperparameters raise instead of being ignored."""
+        with pytest.raises(ValueError, match="learnin_rate"):
+            TrainingConfigurationModel.from_dictionary({"learnin_rate": 1e-4})
+
+
+class TestSweepController:
+    """Tests for SweepController."""
+
+    def test_sampled_configurations_respect_search_space(self, tmp_path) -> None:
+        """Test samples stay within ranges and choices and are reproducible."""
+        search_space = {
+            "learning_rate": {"low": 1e-5, "high": 1e-3, "log": True},
+            "training_epochs": {"low": 3, "high": 10},
+            "batch_size": [64, 128],
+            "clip_range": 0.25
+        }
+        controller = SweepController([5555], str(tmp_path), search_space, trial_count=50, seed=3)
+
+        configurations = controller.sample_configurations()
+
+        assert configurations == SweepController(
+            [5555], str(tmp_path), search_space, trial_count=50, seed=3).sample_configurations()
+        for configuration in configurations:
+            assert 1e-5 <= configuration["learning_rate"] <= 1e-3
+            assert isinstance(configuration["training_epochs"], int)
+            assert 3 <= configuration["training_epochs"] <= 10
+            assert configuration["batch_size"] in (64, 128)
+            assert configuration["clip_range"] == 0.25
+
+    def test_unknown_search_parameter_rejected(self, tmp_path) -> None:
+        """Test search spaces naming unknown hyperparameters fail before any training."""
+        controller = SweepController([5555], str(tmp_path), {"momentum": [0.9]})
+
+        with pytest.raises(ValueError, match="momentum"):
+            controller.sample_configurations()
+
+    def test_rung_budgets_and_promotion(self, tmp_path) -> None:
+        """Test budgets grow by the reduction factor and the best third is promoted."""
+        controller = SweepController(
+            [5555], str(tmp_path), minimum_timesteps=1000, reduction_factor=3, rung_count=3)
+        rung_results = [
+            {"trial_number": trial_number, "success_rate": success_rate, "mean_return": mean_return}
+            for trial_number, (success_rate, mean_return) in enumerate(
+                [(0.1, 5.0), (0.6, 1.0), (0.6, 9.0), (0.0, 50.0), (0.3, 0.0), (0.2, 0.0), (0.1, 1.0)])
+        ]
+
+        assert controller.compute_rung_timesteps() == [1000, 3000, 9000]
+        assert controller.select_promoted_trials(rung_results) == [2, 1, 4]
+
+    def test_sweep_prunes_and_resumes_trials(self, tmp_path) -> None:
+        """Test an end-to-end sweep against mock simulators."""
+        servers = [MockSimulatorService(steps_to_target=4, episode_length=8) for _ in range(2)]
+        controller = SweepController(
+            server_ports=[server.port for server in servers],
+            output_directory=str(tmp_path),
+            search_space=TINY_SEARCH_SPACE,
+            trial_count=3,
+            minimum_timesteps=32,
+            reduction_factor=3,
+            rung_count=2,
+            seed=0)
+
+        final_results = controller.run()
+
+        for server in servers:
+            server.close()
+
+        with open(controller.results_path, "r", encoding="utf-8") as results_file:
+            records = [json.loads(line) for line in results_file]
+
+        first_rung_statuses = sorted(record["status"] for record in records if record["rung"] == 0)
+        assert first_rung_statuses == ["promoted", "pruned", "pruned"]
+        assert len(final_results) == 1
+        assert final_results[0]["status"] == "completed"
+        assert final_results[0]["timesteps"] == 96
+        assert final_results[0]["success_rate"] == 1.0
+        assert os.path.exists(final_results[0]["model_path"] + ".zip")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
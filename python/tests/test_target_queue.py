@@ -0,0 +1,104 @@
+"""Tests for batch target execution."""
+
+import pytest
+import numpy as np
+
+from robot_arm.services.target_queue_service import TargetQueueService
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+
+class ZeroActionPolicy:
+    """Policy that always outputs zero joint deltas."""
+
+    def predict(self, observation, deterministic: bool = True):
+        return np.zeros(7, dtype=np.float32), None
+
+
+@pytest.fixture
+def simulated_environment():
+    """Environment connected to a mock simulator that reaches each target in four steps."""
+    from robot_arm.environments.unity_robot_environment import UnityRobotEnvironment
+
+    server = MockSimulatorService(steps_to_target=4, episode_length=None)
+    environment = UnityRobotEnvironment(server_address=f"tcp://localhost:{server.port}")
+
+    yield environment, server
+
+    environment.close()
+    server.close()
+
+
+class TestTargetQueueService:
+    """Tests for TargetQueueService."""
+
+    def test_load_targets_skips_header(self, tmp_path) -> None:
+        """Test CSV targets load with or without a header row."""
+        csv_path = tmp_path / "targets.csv"
+        csv_path.write_text("x,y,z\n1.0,0.5,0.0\n\n-1.0,1.5,0.5\n")
+
+        target_positions = TargetQueueService.load_targets(str(csv_path))
+
+        np.testing.assert_allclose(target_positions, [[1.0, 0.5, 0.0], [-1.0, 1.5, 0.5]])
+
+    def test_load_targets_rejects_bad_rows(self, tmp_path) -> None:
+        """Test non-numeric rows after the header and short rows are errors."""
+        csv_path = tmp_path / "targets.csv"
+        csv_path.write_text("1.0,0.5,0.0\n1.0,high,0.0\n")
+        with pytest.raises(ValueError, match="Row 2"):
+            TargetQueueService.load_targets(str(csv_path))
+
+        csv_path.write_text("1.0,0.5\n")
+        with pytest.raises(ValueError, match="x, y and z"):
+            TargetQueueService.load_targets(str(csv_path))
+
+    def test_grid_stays_inside_spawn_annulus(self) -> None:
+        """Test grid points outside the horizontal radius range are dropped."""
+        target_positions = TargetQueueService.generate_grid(
+            (5, 2, 5), minimum_horizontal_radius=0.5, maximum_horizontal_radius=2.5)
+        horizontal_radii = np.hypot(target_positions[:, 0], target_positions[:, 2])
+
+        assert 0 < len(target_positions) < 50
+        assert np.all((horizontal_radii >= 0.5) & (horizontal_radii <= 2.5))
+        assert set(np.unique(target_positions[:, 1])) == {0.3, 2.0}
+
+    def test_execute_places_every_target(self, simulated_environment) -> None:
+        """Test each target gets its own episode and a result row."""
+        environment, server = simulated_environment
+        target_positions = np.array([[1.0, 0.5, 0.0], [0.0, 1.0, -1.0], [-1.5, 0.8, 0.5]])
+        finished_indices = []
+        step_latencies = []
+
+        results = TargetQueueService().execute(
+            environment, ZeroActionPolicy(), target_positions, lambda: True,
+            step_callback=step_latencies.append,
+            target_callback=lambda target_index, _: finished_indices.append(target_index))
+
+        assert server.set_target_positions == target_positions.tolist()
+        assert finished_indices == [0, 1, 2]
+        assert all(result.is_success and result.step_count == 4 for result in results)
+        assert len(step_latencies) == 12
+        assert "3/3 reached" in TargetQueueService.summarize(results)
+
+    def test_step_cap_and_stop(self, simulated_environment, tmp_path) -> None:
+        """Test the per-target cap records timeouts and a stop ends the queue early."""
+        environment, _ = simulated_environment
+        target_positions = np.array([[1.0, 0.5, 0.0], [0.0, 1.0, -1.0]])
+        service = TargetQueueService()
+
+        capped_results = service.execute(
+            environment, ZeroActionPolicy(), target_positions, lambda: True, maximum_steps_per_target=2)
+        stopped_results = service.execute(
+            environment, ZeroActionPolicy(), target_positions, lambda: False)
+
+        assert [result.outcome for result in capped_results] == ["timeout", "timeout"]
+        assert stopped_results == []
+
+        csv_path = TargetQueueService.save_results(capped_results, str(tmp_path / "results" / "targets.csv"))
+        with open(csv_path, encoding="utf-8") as csv_file:
+            lines = csv_file.read().splitlines()
+        assert lines[0].split(",") == TargetQueueService.RESULT_FIELD_NAMES
+        assert len(lines) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
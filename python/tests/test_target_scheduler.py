@@ -0,0 +1,66 @@
+"""Tests for the failure-aware target scheduler."""
+
+import pytest
+import numpy as np
+
+from robot_arm.services.target_scheduler_service import TargetSchedulerService
+
+
+class TestTargetSchedulerService:
+    """Tests for TargetSchedulerService."""
+
+    def test_samples_stay_in_spawn_region(self) -> None:
+        """Test samples lie within the bounds and near the spawn annulus."""
+        scheduler = TargetSchedulerService(seed=0)
+
+        targets = np.array([scheduler.sample_target() for _ in range(500)])
+        horizontal_radii = np.hypot(targets[:, 0], targets[:, 2])
+
+        assert np.all(targets >= np.array(TargetSchedulerService.DEFAULT_LOWER_BOUNDS))
+        assert np.all(targets <= np.array(TargetSchedulerService.DEFAULT_UPPER_BOUNDS))
+        # Cells are kept by their centers, so samples may overhang the annulus by half a cell diagonal
+        assert horizontal_radii.min() > 0.5 - 0.36
+        assert horizontal_radii.max() < 2.5 + 0.36
+
+    def test_failing_region_sampled_more_often(self) -> None:
+        """Test a cell with many failures is drawn more often than a solved one."""
+        scheduler = TargetSchedulerService(
+            lower_bounds=(0.0, 0.0, 0.0), upper_bounds=(2.0, 1.0, 1.0), cells_per_axis=(2, 1, 1),
+            minimum_horizontal_radius=0.0, maximum_horizontal_radius=10.0, seed=1)
+        hard_position, easy_position = [0.5, 0.5, 0.5], [1.5, 0.5, 0.5]
+
+        for _ in range(30):
+            scheduler.record_outcome(hard_position, is_success=False)
+            scheduler.record_outcome(easy_position, is_success=True)
+
+        targets = np.array([scheduler.sample_target() for _ in range(1000)])
+        hard_fraction = np.mean(targets[:, 0] < 1.0)
+
+        assert scheduler.recorded_outcome_count == 60
+        assert hard_fraction > 0.85
+        # Uniform draws keep the solved region in the mix
+        assert hard_fraction < 1.0
+
+    def test_unvisited_cells_have_even_prior(self) -> None:
+        """Test cells without outcomes start at a 0.5 failure rate."""
+        scheduler = TargetSchedulerService()
+
+        failure_rates = scheduler.compute_failure_rates()
+
+        np.testing.assert_allclose(failure_rates, 0.5)
+
+    def test_positions_outside_grid_are_clamped(self) -> None:
+        """Test outcomes for positions beyond the bounds land in edge cells."""
+        scheduler = TargetSchedulerService()
+
+        assert scheduler.find_cell_index([-10.0, -10.0, -10.0]) == 0
+        assert scheduler.find_cell_index([10.0, 10.0, 10.0]) == len(scheduler.compute_failure_rates()) - 1
+
+    def test_empty_spawn_region_rejected(self) -> None:
+        """Test a grid with no cell inside the radius range raises."""
+        with pytest.raises(ValueError):
+            TargetSchedulerService(minimum_horizontal_radius=5.0, maximum_horizontal_radius=6.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+"""Tests for the telemetry ring buffer and min/max decimation."""
+
+import threading
+import pytest
+import numpy as np
+
+from robot_arm.services.telemetry_buffer_service import TelemetryBufferService
+
+
+class TestTelemetryBufferService:
+    """Tests for TelemetryBufferService."""
+
+    def test_snapshot_is_ordered_after_wrap_around(self) -> None:
+        """Test a full ring keeps the newest samples, oldest first."""
+        telemetry_buffer = TelemetryBufferService(["first", "second"], capacity=4)
+
+        for sample_index in range(6):
+            telemetry_buffer.append([sample_index, -sample_index])
+
+        snapshot = telemetry_buffer.snapshot()
+
+        np.testing.assert_array_equal(snapshot[:, 0], [2, 3, 4, 5])
+        np.testing.assert_array_equal(snapshot[:, 1], [-2, -3, -4, -5])
+        assert telemetry_buffer.sample_count == 4
+        assert telemetry_buffer.appended_count == 6
+
+    def test_clear_empties_and_signals_change(self) -> None:
+        """Test clear drops samples and still advances the change counter."""
+        telemetry_buffer = TelemetryBufferService(["value"], capacity=4)
+        telemetry_buffer.append([1.0])
+        telemetry_buffer.clear()
+
+        assert telemetry_buffer.snapshot().shape == (0, 1)
+        assert telemetry_buffer.appended_count == 2
+
+    def test_decimation_keeps_extremes_in_order(self) -> None:
+        """Test every bucket contributes its minimum and maximum, so single-sample spikes survive."""
+        values = np.zeros(1003, dtype=np.float32)
+        values[123] = 9.0
+        values[777] = -4.0
+        values[1001] = 5.0
+
+        decimated = TelemetryBufferService.decimate_min_max(values, 100)
+
+        assert len(decimated) == 200
+        assert decimated.max() == 9.0
+        assert decimated.min() == -4.0
+        assert decimated[-1] == 5.0 or decimated[-2] == 5.0
+        assert list(decimated).index(9.0) < list(decimated).index(-4.0)
+
+    def test_decimation_output_size_is_constant(self) -> None:
+        """Test the decimated length depends on the bucket count, not on the series length."""
+        for length in (1000, 10_000, 100_000):
+            assert len(TelemetryBufferService.decimate_min_max(np.arange(length, dtype=np.float32), 50)) == 100
+
+        short_values = np.arange(30, dtype=np.float32)
+        np.testing.assert_array_equal(TelemetryBufferService.decimate_min_max(short_values, 50), short_values)
+
+    def test_concurrent_appends_and_snapshots(self) -> None:
+        """Test a reader never sees a torn ring while a producer appends."""
+        telemetry_buffer = TelemetryBufferService(["value"], capacity=64)
+        producer = threading.Thread(
+            target=lambda: [telemetry_buffer.append([float(index)]) for index in range(20_000)])
+        producer.start()
+
+        while producer.is_alive():
+            samples = telemetry_buffer.snapshot()[:, 0]
+            assert np.all(np.diff(samples) == 1.0)
+
+        producer.join()
+        assert telemetry_buffer.snapshot()[-1, 0] == 19_999.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,114 @@
+"""Tests for the mock simulator and the training throughput benchmark."""
+
+import socket
+import time
+import os
+import pytest
+
+from robot_arm.controllers.throughput_benchmark_controller import ThroughputBenchmarkController
+from robot_arm.enums.vectorized_environment_type import VectorizedEnvironmentType
+from robot_arm.services.connection_probe_service import ConnectionProbeService
+from robot_arm.services.message_framing_service import MessageFramingService
+from robot_arm.services.mock_simulator_service import MockSimulatorService
+
+
+@pytest.fixture
+def mock_simulator():
+    """Mock simulator with a short episode and 5 ms of injected latency."""
+    simulator = MockSimulatorService(response_latency_seconds=0.005, episode_length=3)
+    yield simulator
+    simulator.close()
+
+
+class TestMockSimulatorService:
+    """Tests for MockSimulatorService."""
+
+    def test_conforms_to_observation_protocol(self, mock_simulator) -> None:
+        """Test the probe finds neither errors nor missing optional fields."""
+        errors, warnings = ConnectionProbeService(port=mock_simulator.port).check_conformance()
+
+        assert errors == []
+        assert warnings == []
+
+    def test_integrates_actions_and_ends_episodes(self, mock_simulator) -> None:
+        """Test joint angles follow the actions and the episode ends after episode_length steps."""
+        with socket.create_connection(("localhost", mock_simulator.port)) as connection:
+            MessageFramingService.send_message(connection, {"Type": "RESET"})
+            assert MessageFramingService.receive_message(connection)["IsResetFrame"]
+
+            observations = []
+            for _ in range(3):
+                MessageFramingService.send_message(
+                    connection, {"Type": "STEP", "Actions": [1.0, -2.0, 0.0, 0.0, 0.0], "Axis6Orientation": 0.5})
+                observations.append(MessageFramingService.receive_message(connection))
+
+        assert observations[-1]["JointAngles"] == [3.0, -6.0, 0.0, 0.0, 0.0, 45.0]
+        assert [observation["CollisionDetected"] for observation in observations] == [False, False, True]
+
+    def test_counts_busy_time_including_latency(self, mock_simulator) -> None:
+        """Test every answered command adds at least the injected latency to the busy time."""
+        with socket.create_connection(("localhost", mock_simulator.port)) as connection:
+            for _ in range(4):
+                MessageFramingService.send_message(connection, {"Type": "RESET"})
+                MessageFramingService.receive_message(connection)
+
+        # The counters are updated just after the response is sent
+        time.sleep(0.05)
+        assert mock_simulator.command_count == 4
+        assert mock_simulator.busy_seconds >= 4 * 0.005
+
+    def test_counts_target_commands_and_omits_optional_fields(self) -> None:
+        """Test resets and target changes are recorded and optional fields can be left out."""
+        simulator = MockSimulatorService(steps_to_target=2, include_optional_fields=False)
+
+        try:
+            with socket.create_connection(("localhost", simulator.port)) as connection:
+                for command in [
+                        {"Type": "RESET"}, {"Type": "STEP"}, {"Type": "NEW_TARGET"},
+                        {"Type": "SET_TARGET", "TargetPosition": [1.0, 0.5, 0.0]}, {"Type": "STEP"}]:
+                    MessageFramingService.send_message(connection, command)
+                    observation = MessageFramingService.receive_message(connection)
+        finally:
+            simulator.close()
+
+        assert simulator.reset_count == 1
+        assert simulator.new_target_count == 1
+        assert simulator.set_target_positions == [[1.0, 0.5, 0.0]]
+        assert observation["DistanceToTarget"] == pytest.approx(0.6)
+        assert not set(MockSimulatorService.OPTIONAL_FIELD_NAMES) & set(observation)
+
+
+class TestThroughputBenchmarkController:
+    """Tests for ThroughputBenchmarkController."""
+
+    def test_measures_every_setting(self, tmp_path) -> None:
+        """Test a tiny sweep reports plausible throughput for each setting and saves it."""
+        benchmark_controller = ThroughputBenchmarkController(
+            environment_counts=[1, 2],
+            vectorized_environment_types=[VectorizedEnvironmentType.DUMMY],
+            steps_per_update_values=[16],
+            response_latencies_seconds=[0.0],
+            batch_size=16,
+            measured_rollouts=1
+        )
+
+        results = benchmark_controller.run()
+
+        assert [result["environment_count"] for result in results] == [1, 2]
+        for result in results:
+            assert result["measured_steps"] == 16 * result["environment_count"]
+            assert result["collection_steps_per_second"] > 0.0
+            assert 0.0 < result["update_time_fraction"] < 1.0
+            assert 0.0 < result["simulator_utilization"] <= 1.0
+
+        json_path = ThroughputBenchmarkController.save_results(results, str(tmp_path / "throughput.json"))
+        assert os.path.exists(json_path)
+
+    def test_rejects_empty_measurement(self) -> None:
+        """Test zero measured rollouts is refused."""
+        with pytest.raises(ValueError):
+            ThroughputBenchmarkController(measured_rollouts=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
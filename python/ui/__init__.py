@@ -1,3 +0,0 @@
-from ui.control_panel import RobotControlPanel
-
-__all__ = ["RobotControlPanel"]